@@ -5,7 +5,10 @@ A cognitive memory system for Large Language Models implementing true cognitive
 processing through associative thinking, serendipitous connections, and emergent insights.
 """
 
-from . import core, encoding, retrieval, storage
+import importlib
+from types import ModuleType
+
+from . import core
 from .core import (
     ActivationResult,
     CognitiveMemory,
@@ -15,33 +18,27 @@ from .core import (
     setup_logging,
 )
 
-# Git analysis module (when available)
-try:
-    from . import git_analysis
-
-    __all__ = [
-        "ActivationResult",
-        "CognitiveMemory",
-        "SearchResult",
-        "get_config",
-        "log_cognitive_event",
-        "setup_logging",
-        "core",
-        "encoding",
-        "retrieval",
-        "storage",
-        "git_analysis",
-    ]
-except ImportError:
-    __all__ = [
-        "ActivationResult",
-        "CognitiveMemory",
-        "SearchResult",
-        "get_config",
-        "log_cognitive_event",
-        "setup_logging",
-        "core",
-        "encoding",
-        "retrieval",
-        "storage",
-    ]
+# Subsystems pull in heavy dependencies (ONNX Runtime, Qdrant client, GitPython),
+# so they are imported on first attribute access rather than with the package
+_LAZY_SUBMODULES = ("encoding", "retrieval", "storage", "git_analysis")
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "ActivationResult",
+    "CognitiveMemory",
+    "SearchResult",
+    "get_config",
+    "log_cognitive_event",
+    "setup_logging",
+    "core",
+    "encoding",
+    "retrieval",
+    "storage",
+    "git_analysis",
+]
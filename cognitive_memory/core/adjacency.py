@@ -0,0 +1,100 @@
+"""
+Compact adjacency structure for the memory connection graph.
+
+This module provides a CSR-style (compressed sparse row) representation of
+memory connections so that spreading activation can look up neighbours with
+array slicing instead of a database query per node.
+"""
+
+from collections.abc import Iterable
+
+import numpy as np
+
+
+class ConnectionAdjacency:
+    """
+    Immutable CSR adjacency of memory connections.
+
+    Connections are treated as undirected, matching how the connection graph
+    is queried. Neighbours of each node are stored contiguously and sorted by
+    strength (highest first). When the same pair is connected more than once
+    (for example in both directions or with different connection types) the
+    strongest connection is kept.
+    """
+
+    def __init__(self, edges: Iterable[tuple[str, str, float]] = ()) -> None:
+        """
+        Build the adjacency from connection edges.
+
+        Args:
+            edges: (source_id, target_id, strength) tuples
+        """
+        pair_strengths: dict[tuple[str, str], float] = {}
+        for source_id, target_id, strength in edges:
+            if source_id == target_id:
+                continue
+            pair = (
+                (source_id, target_id)
+                if source_id < target_id
+                else (target_id, source_id)
+            )
+            if strength > pair_strengths.get(pair, -1.0):
+                pair_strengths[pair] = float(strength)
+
+        self.node_ids: list[str] = sorted(
+            {node for pair in pair_strengths for node in pair}
+        )
+        self.node_index: dict[str, int] = {
+            node_id: i for i, node_id in enumerate(self.node_ids)
+        }
+
+        edge_count = len(pair_strengths)
+        rows = np.empty(2 * edge_count, dtype=np.int32)
+        cols = np.empty(2 * edge_count, dtype=np.int32)
+        weights = np.empty(2 * edge_count, dtype=np.float32)
+        for i, ((a, b), strength) in enumerate(pair_strengths.items()):
+            rows[2 * i], cols[2 * i] = self.node_index[a], self.node_index[b]
+            rows[2 * i + 1], cols[2 * i + 1] = self.node_index[b], self.node_index[a]
+            weights[2 * i] = weights[2 * i + 1] = strength
+
+        # Group by row, strongest neighbour first within each row
+        order = np.lexsort((-weights, rows))
+        self.indices = cols[order]
+        self.strengths = weights[order]
+        self.indptr = np.zeros(len(self.node_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(self.node_ids)), out=self.indptr[1:])
+
+    @property
+    def edge_count(self) -> int:
+        """Get the number of undirected connections."""
+        return int(len(self.indices) // 2)
+
+    def neighbors(
+        self, memory_id: str, min_strength: float = 0.0
+    ) -> list[tuple[str, float]]:
+        """
+        Get connected memory IDs at or above a strength threshold.
+
+        Args:
+            memory_id: Memory to look up
+            min_strength: Minimum connection strength
+
+        Returns:
+            List of (memory_id, strength) tuples, strongest first
+        """
+        node = self.node_index.get(memory_id)
+        if node is None:
+            return []
+
+        start, end = self.indptr[node], self.indptr[node + 1]
+        strengths = self.strengths[start:end]
+        # Strengths are sorted descending, so matches form a prefix
+        count = int(np.count_nonzero(strengths >= min_strength))
+        return [
+            (self.node_ids[neighbor], float(strength))
+            for neighbor, strength in zip(
+                self.indices[start : start + count],
+                strengths[:count],
+                strict=True,
+            )
+        ]
@@ -6,11 +6,14 @@ between encoding, storage, and retrieval subsystems through their abstract inter
 All dependencies are injected through interfaces to enable testing and component swapping.
 """
 
+import hashlib
 import time
 import uuid
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
+import numpy as np
 from loguru import logger
 
 from .config import SystemConfig
@@ -23,7 +26,8 @@ from .interfaces import (
     MemoryStorage,
     VectorStorage,
 )
-from .memory import CognitiveMemory
+from .memory import ActivationResult, CognitiveMemory
+from .query_cache import ConnectionTraversal, QueryCache
 
 
 class CognitiveMemorySystem(CognitiveSystem):
@@ -61,6 +65,10 @@ class CognitiveMemorySystem(CognitiveSystem):
         self.connection_graph = connection_graph
         self.activation_engine = activation_engine
         self.config = config
+        self.query_cache = QueryCache(
+            max_results=config.cognitive.query_cache_size,
+            max_embeddings=config.cognitive.query_embedding_cache_size,
+        )
 
         logger.info(
             "Cognitive memory system initialized",
@@ -124,13 +132,19 @@ class CognitiveMemorySystem(CognitiveSystem):
             memory = CognitiveMemory(
                 id=memory_id,
                 content=text.strip(),
-                memory_type=context.get("memory_type", "episodic" if hierarchy_level == 2 else "semantic") if context else "episodic",
+                memory_type=context.get(
+                    "memory_type", "episodic" if hierarchy_level == 2 else "semantic"
+                )
+                if context
+                else "episodic",
                 hierarchy_level=hierarchy_level,
                 dimensions=context.get("dimensions", {}) if context else {},
                 timestamp=current_time,
                 strength=context.get("importance_score", 1.0) if context else 1.0,
                 access_count=context.get("access_count", 0) if context else 0,
-                importance_score=context.get("importance_score", 0.5) if context else 0.5,
+                importance_score=context.get("importance_score", 0.5)
+                if context
+                else 0.5,
                 metadata=memory_metadata,
                 tags=context.get("tags") if context else None,
             )
@@ -164,6 +178,8 @@ class CognitiveMemorySystem(CognitiveSystem):
                         vector_metadata[key] = value
 
             self.vector_storage.store_vector(memory_id, embedding, vector_metadata)
+            self.activation_engine.notify_memories_stored([memory])
+            self.query_cache.invalidate()
 
             logger.info(
                 "Experience stored successfully",
@@ -207,21 +223,48 @@ class CognitiveMemorySystem(CognitiveSystem):
         if types is None:
             types = ["core", "peripheral"]
 
+        start_time = time.perf_counter()
+        cache_key = QueryCache.make_key(query, types, max_results)
+        generation = self._cache_generation()
+        cached = self.query_cache.get_results(cache_key, generation)
+        if cached is not None:
+            logger.debug("Serving memory retrieval from query cache")
+            cached_results, cached_traversal, cached_accesses = cached
+            if cached_traversal is not None:
+                # Repeated recalls keep reinforcing the traversed connections
+                self.connection_graph.record_activations(
+                    list(cached_traversal[0]), cached_traversal[1]
+                )
+            if cached_accesses:
+                # and keep counting as accesses towards consolidation
+                self.memory_storage.record_memory_accesses(list(cached_accesses))
+            return cached_results
+
         try:
-            # Encode the query
-            query_embedding = self.embedding_provider.encode(query.strip())
+            # Encode the query, reusing the embedding of repeated queries
+            query_embedding = self.query_cache.get_embedding(query)
+            if query_embedding is None:
+                query_embedding = self.embedding_provider.encode(query.strip())
+                self.query_cache.put_embedding(query, query_embedding)
 
             results: dict[str, list[CognitiveMemory]] = {
                 "core": [],
                 "peripheral": [],
             }
+            traversal: ConnectionTraversal | None = None
+            accessed_ids: list[str] = []
 
             # Add tag-based memories first, then activation-based memories
             if "core" in types or "peripheral" in types:
                 self._add_tag_memories(query, types, results, max_results)
-                self._add_activation_memories(
+                activation_result = self._add_activation_memories(
                     query_embedding, types, results, max_results
                 )
+                if activation_result.expanded_ids:
+                    traversal = (
+                        tuple(activation_result.expanded_ids),
+                        activation_result.expansion_threshold,
+                    )
 
             # Fallback to direct vector similarity search if no core/peripheral memories found
             if (
@@ -269,6 +312,7 @@ class CognitiveMemorySystem(CognitiveSystem):
                             result.memory.id
                         )
                         if complete_memory:
+                            accessed_ids.append(complete_memory.id)
                             # Store similarity score in metadata for display
                             complete_memory.metadata["similarity_score"] = (
                                 result.similarity_score
@@ -289,6 +333,7 @@ class CognitiveMemorySystem(CognitiveSystem):
                             result.memory.id
                         )
                         if complete_memory:
+                            accessed_ids.append(complete_memory.id)
                             # Store similarity score in metadata for display
                             complete_memory.metadata["similarity_score"] = (
                                 result.similarity_score
@@ -316,6 +361,14 @@ class CognitiveMemorySystem(CognitiveSystem):
                 peripheral_count=len(results["peripheral"]),
             )
 
+            self.query_cache.put_results(
+                cache_key,
+                generation,
+                results,
+                time.perf_counter() - start_time,
+                traversal,
+                tuple(accessed_ids),
+            )
             return results
 
         except Exception as e:
@@ -502,6 +555,9 @@ class CognitiveMemorySystem(CognitiveSystem):
                     )
                     consolidation_stats["failed"] += 1
 
+            if consolidation_stats["consolidated"]:
+                self.query_cache.invalidate()
+
             logger.info("Memory consolidation completed", **consolidation_stats)
 
             return consolidation_stats
@@ -531,15 +587,21 @@ class CognitiveMemorySystem(CognitiveSystem):
                 },
                 "memory_counts": memory_counts,
                 "storage_stats": storage_stats,
+                "query_cache": self.query_cache.get_stats(),
                 "error": None,
             }
 
-            # Get memory counts by level
+            # Get memory counts by level from aggregate queries
             try:
-                for level in [0, 1, 2]:
-                    memories = self.memory_storage.get_memories_by_level(level)
-                    level_name = ["concepts", "contexts", "episodes"][level]
-                    memory_counts[f"level_{level}_{level_name}"] = len(memories)
+                counts = self.memory_storage.get_memory_counts()
+                by_level = counts.get("by_level", {})
+                level_names = ["concepts", "contexts", "episodes"]
+                for level, level_name in enumerate(level_names):
+                    count = by_level.get(level, 0)
+                    memory_counts[f"level_{level}_{level_name}"] = count
+                stats["memory_breakdown"] = {
+                    key: value for key, value in counts.items() if key != "by_level"
+                }
             except Exception as e:
                 logger.warning("Failed to get memory counts", error=str(e))
                 memory_counts["error"] = str(e)
@@ -608,73 +670,18 @@ class CognitiveMemorySystem(CognitiveSystem):
             memories = loader.load_from_source(source_path, **kwargs)
             logger.info(f"Loaded {len(memories)} raw memories from source")
 
-            # Store memories in the system
-            stored_count = 0
-            failed_count = 0
-
-            for memory in memories:
-                try:
-                    # Encode the memory content
-                    embedding = self.embedding_provider.encode(memory.content)
-                    memory.cognitive_embedding = embedding
-
-                    # Store in memory persistence
-                    if self.memory_storage.store_memory(memory):
-                        # Store in vector storage with metadata
-                        vector_metadata = {
-                            "memory_id": memory.id,
-                            "content": memory.content,
-                            "memory_type": memory.memory_type,
-                            "hierarchy_level": memory.hierarchy_level,
-                            "timestamp": memory.timestamp.timestamp()
-                            if memory.timestamp
-                            else time.time(),
-                            "source_type": "loaded",
-                            **memory.metadata,
-                        }
-
-                        self.vector_storage.store_vector(
-                            memory.id, embedding, vector_metadata
-                        )
-                        stored_count += 1
-
-                        logger.debug(
-                            f"Stored memory L{memory.hierarchy_level}: {memory.metadata.get('title', 'Untitled')[:50]}"
-                        )
-                    else:
-                        failed_count += 1
-                        logger.warning(f"Failed to store memory: {memory.id}")
-
-                except Exception as e:
-                    failed_count += 1
-                    logger.error(f"Error storing memory {memory.id}: {e}")
+            vector_ids = self._store_loaded_memories(memories)
+            stored_count = len(vector_ids)
+            failed_count = len(memories) - stored_count
 
             # Extract and store connections
             connections_created = 0
             connections_failed = 0
 
             if stored_count > 0:
-                try:
-                    logger.info("Parsing connections between memories...")
-                    connections = loader.extract_connections(memories)
-                    logger.info(f"Extracted {len(connections)} potential connections")
-
-                    for source_id, target_id, strength, connection_type in connections:
-                        try:
-                            if self.connection_graph.add_connection(
-                                source_id, target_id, strength, connection_type
-                            ):
-                                connections_created += 1
-                            else:
-                                connections_failed += 1
-                        except Exception as e:
-                            connections_failed += 1
-                            logger.debug(
-                                f"Failed to store connection {source_id} -> {target_id}: {e}"
-                            )
-
-                except Exception as e:
-                    logger.error(f"Failed to extract connections: {e}")
+                connections_created, connections_failed = self._store_connections(
+                    loader, memories
+                )
 
             processing_time = time.time() - start_time
 
@@ -691,12 +698,17 @@ class CognitiveMemorySystem(CognitiveSystem):
                 "hierarchy_distribution": self._calculate_hierarchy_distribution(
                     memories
                 ),
+                "memory_ids": [
+                    memory.id for memory in memories if memory.id in vector_ids
+                ],
                 "error": None,
             }
 
             logger.info(
                 "Memory loading completed successfully",
-                **{k: v for k, v in results.items() if k != "error"},
+                **{
+                    k: v for k, v in results.items() if k not in ("error", "memory_ids")
+                },
             )
 
             return results
@@ -716,6 +728,158 @@ class CognitiveMemorySystem(CognitiveSystem):
                 "processing_time": processing_time,
             }
 
+    def _store_loaded_memories(self, memories: list[CognitiveMemory]) -> set[str]:
+        """
+        Embed loaded memories in batches and bulk-write metadata and vectors.
+
+        Args:
+            memories: Memories created by a loader
+
+        Returns:
+            IDs of the memories whose metadata and vector were both stored
+        """
+        if not memories:
+            return set()
+
+        # Stage 1: encode chunk texts in batches, unless embedded already
+        missing = [memory for memory in memories if memory.cognitive_embedding is None]
+        if missing:
+            encoded = self._encode_in_batches([memory.content for memory in missing])
+            for memory, embedding in zip(missing, encoded, strict=True):
+                memory.cognitive_embedding = embedding
+
+        # Stage 2: bulk-write memory metadata to persistence
+        stored_ids = set(self.memory_storage.store_memories_batch(memories))
+
+        # Stage 3: bulk-write vectors for the memories that were persisted
+        vector_items = [
+            (memory.id, memory.cognitive_embedding, self._loaded_vector_payload(memory))
+            for memory in memories
+            if memory.id in stored_ids and memory.cognitive_embedding is not None
+        ]
+        vector_ids = set(self.vector_storage.store_vectors_batch(vector_items))
+        self.activation_engine.notify_memories_stored(
+            [memory for memory in memories if memory.id in stored_ids]
+        )
+        self.query_cache.invalidate()
+
+        for memory in memories:
+            if memory.id not in stored_ids:
+                logger.warning(f"Failed to store memory: {memory.id}")
+            elif memory.id not in vector_ids:
+                logger.error(f"Error storing vector for memory {memory.id}")
+
+        return vector_ids
+
+    @staticmethod
+    def _loaded_vector_payload(memory: CognitiveMemory) -> dict[str, Any]:
+        """Build the vector storage payload of a memory created by a loader."""
+        return {
+            "memory_id": memory.id,
+            "content": memory.content,
+            "memory_type": memory.memory_type,
+            "hierarchy_level": memory.hierarchy_level,
+            "timestamp": memory.timestamp.timestamp()
+            if memory.timestamp
+            else time.time(),
+            "source_type": "loaded",
+            **memory.metadata,
+        }
+
+    def _refresh_loaded_metadata(self, memories: list[CognitiveMemory]) -> int:
+        """
+        Persist new metadata of loaded memories whose content is unchanged.
+
+        Writes the metadata columns and the vector payloads without
+        re-embedding, so dates, positions and section paths stay current.
+
+        Args:
+            memories: Memories with the IDs and embeddings of their stored
+                counterparts and freshly loaded metadata
+
+        Returns:
+            Number of memories whose metadata could not be fully written
+        """
+        if not memories:
+            return 0
+
+        updated_ids = set(self.memory_storage.update_memories_metadata(memories))
+        refreshed_ids = set(
+            self.vector_storage.update_metadata_batch(
+                [
+                    (memory.id, self._loaded_vector_payload(memory))
+                    for memory in memories
+                    if memory.id in updated_ids
+                ]
+            )
+        )
+        self.activation_engine.notify_memories_stored(
+            [memory for memory in memories if memory.id in updated_ids]
+        )
+        self.query_cache.invalidate()
+
+        failed = [memory.id for memory in memories if memory.id not in refreshed_ids]
+        if failed:
+            logger.warning(
+                "Failed to refresh metadata of unchanged memories",
+                failed_count=len(failed),
+                failed_ids=failed[:5],
+            )
+        return len(failed)
+
+    def _store_connections(
+        self,
+        loader: MemoryLoader,
+        memories: list[CognitiveMemory],
+        touched_ids: set[str] | None = None,
+    ) -> tuple[int, int]:
+        """
+        Extract connections between loaded memories and store them.
+
+        Args:
+            loader: Loader that created the memories
+            memories: Memories to extract connections between
+            touched_ids: If given, only connections involving one of these
+                memory IDs are stored
+
+        Returns:
+            (connections created, connections failed)
+        """
+        connections_created = 0
+        connections_failed = 0
+
+        try:
+            logger.info("Parsing connections between memories...")
+            connections = loader.extract_connections(memories)
+            logger.info(f"Extracted {len(connections)} potential connections")
+
+            for source_id, target_id, strength, connection_type in connections:
+                if touched_ids is not None and not (
+                    source_id in touched_ids or target_id in touched_ids
+                ):
+                    continue
+
+                try:
+                    if self.connection_graph.add_connection(
+                        source_id, target_id, strength, connection_type
+                    ):
+                        connections_created += 1
+                    else:
+                        connections_failed += 1
+                except Exception as e:
+                    connections_failed += 1
+                    logger.debug(
+                        f"Failed to store connection {source_id} -> {target_id}: {e}"
+                    )
+
+        except Exception as e:
+            logger.error(f"Failed to extract connections: {e}")
+
+        if connections_created:
+            self.query_cache.invalidate()
+
+        return connections_created, connections_failed
+
     def upsert_memories(self, memories: list[CognitiveMemory]) -> dict[str, Any]:
         """
         Update existing memories or insert new ones using deterministic IDs.
@@ -735,7 +899,15 @@ class CognitiveMemorySystem(CognitiveSystem):
 
             logger.info("Starting memory upsert operation", memory_count=len(memories))
 
-            for memory in memories:
+            embeddings = self._encode_in_batches(
+                [memory.content for memory in memories]
+            )
+
+            updated_ids: set[str] = set()
+            inserted_ids: set[str] = set()
+            vector_items = []
+
+            for memory, embedding in zip(memories, embeddings, strict=True):
                 try:
                     # Check if memory already exists using its ID
                     existing_memory = self.memory_storage.retrieve_memory(memory.id)
@@ -743,55 +915,63 @@ class CognitiveMemorySystem(CognitiveSystem):
                     if existing_memory:
                         # Update existing memory
                         if self.memory_storage.update_memory(memory):
-                            # Update vector storage as well
-                            embedding = self.embedding_provider.encode(memory.content)
-
-                            # Delete old vector first
-                            self.vector_storage.delete_vector(memory.id)
-
-                            # Store updated vector
-                            self.vector_storage.store_vector(
-                                memory.id,
-                                embedding,
-                                {
-                                    "hierarchy_level": memory.hierarchy_level,
-                                    "memory_type": memory.memory_type,
-                                    "timestamp": memory.timestamp.isoformat(),
-                                    "strength": memory.strength,
-                                    **memory.metadata,
-                                },
-                            )
-                            updated_count += 1
-                            logger.debug(f"Updated memory: {memory.id}")
+                            updated_ids.add(memory.id)
                         else:
                             failed_count += 1
                             logger.warning(f"Failed to update memory: {memory.id}")
+                            continue
                     else:
-                        # Insert new memory - store in both memory storage and vector storage
+                        # Insert new memory
                         if self.memory_storage.store_memory(memory):
-                            # Also store in vector storage
-                            embedding = self.embedding_provider.encode(memory.content)
-                            self.vector_storage.store_vector(
-                                memory.id,
-                                embedding,
-                                {
-                                    "hierarchy_level": memory.hierarchy_level,
-                                    "memory_type": memory.memory_type,
-                                    "timestamp": memory.timestamp.isoformat(),
-                                    "strength": memory.strength,
-                                    **memory.metadata,
-                                },
-                            )
-                            inserted_count += 1
-                            logger.debug(f"Inserted new memory: {memory.id}")
+                            inserted_ids.add(memory.id)
                         else:
                             failed_count += 1
                             logger.warning(f"Failed to insert memory: {memory.id}")
+                            continue
+
+                    vector_items.append(
+                        (
+                            memory.id,
+                            embedding,
+                            {
+                                "hierarchy_level": memory.hierarchy_level,
+                                "memory_type": memory.memory_type,
+                                "timestamp": memory.timestamp.isoformat(),
+                                "strength": memory.strength,
+                                **memory.metadata,
+                            },
+                        )
+                    )
 
                 except Exception as e:
                     failed_count += 1
                     logger.error(f"Error upserting memory {memory.id}: {e}")
 
+            # Delete old vectors first, since the hierarchy level may have changed
+            if updated_ids:
+                self.vector_storage.delete_vectors_by_ids(list(updated_ids))
+
+            vector_ids = set(self.vector_storage.store_vectors_batch(vector_items))
+            self.activation_engine.notify_memories_stored(
+                [
+                    memory
+                    for memory in memories
+                    if memory.id in updated_ids or memory.id in inserted_ids
+                ]
+            )
+            self.query_cache.invalidate()
+
+            for id, _, _ in vector_items:
+                if id not in vector_ids:
+                    failed_count += 1
+                    logger.error(f"Error storing vector for memory {id}")
+                elif id in updated_ids:
+                    updated_count += 1
+                    logger.debug(f"Updated memory: {id}")
+                else:
+                    inserted_count += 1
+                    logger.debug(f"Inserted new memory: {id}")
+
             processing_time = time.time() - start_time
 
             results = {
@@ -862,19 +1042,8 @@ class CognitiveMemorySystem(CognitiveSystem):
                     "processing_time": time.time() - start_time,
                 }
 
-            # Delete vectors from Qdrant
-            vector_deletion_failures = 0
-            for memory in memories_to_delete:
-                try:
-                    success = self.vector_storage.delete_vector(memory.id)
-                    if not success:
-                        vector_deletion_failures += 1
-                        logger.warning("Failed to delete vector", memory_id=memory.id)
-                except Exception as e:
-                    vector_deletion_failures += 1
-                    logger.error(
-                        "Error deleting vector", memory_id=memory.id, error=str(e)
-                    )
+            # Delete vectors from Qdrant, one request per hierarchy level
+            vector_deletion_failures = self._delete_memory_vectors(memories_to_delete)
 
             # Delete memory connections if connection graph exists
             if hasattr(self, "connection_graph") and self.connection_graph:
@@ -895,6 +1064,10 @@ class CognitiveMemorySystem(CognitiveSystem):
             deleted_count = self.memory_storage.delete_memories_by_source_path(
                 source_path
             )
+            self.activation_engine.notify_memories_deleted(
+                [memory.id for memory in memories_to_delete]
+            )
+            self.query_cache.invalidate()
 
             processing_time = time.time() - start_time
 
@@ -959,19 +1132,14 @@ class CognitiveMemorySystem(CognitiveSystem):
                 }
 
             # Delete vector from Qdrant
-            vector_deletion_failures = 0
-            try:
-                success = self.vector_storage.delete_vector(memory_id)
-                if not success:
-                    vector_deletion_failures = 1
-                    logger.warning("Failed to delete vector", memory_id=memory_id)
-            except Exception as e:
-                vector_deletion_failures = 1
-                logger.error("Error deleting vector", memory_id=memory_id, error=str(e))
+            vector_deletion_failures = self._delete_memory_vectors([memory])
 
             # Delete metadata from SQLite
             success = self.memory_storage.delete_memory(memory_id)
             deleted_count = 1 if success else 0
+            if success:
+                self.activation_engine.notify_memories_deleted([memory_id])
+                self.query_cache.invalidate()
 
             processing_time = time.time() - start_time
 
@@ -1036,24 +1204,15 @@ class CognitiveMemorySystem(CognitiveSystem):
                     "processing_time": time.time() - start_time,
                 }
 
-            # Delete vectors from Qdrant
-            memory_ids = [memory.id for memory in memories_to_delete]
-            successfully_deleted_vectors = self.vector_storage.delete_vectors_by_ids(
-                memory_ids
-            )
-            vector_deletion_failures = len(memory_ids) - len(
-                successfully_deleted_vectors
-            )
-
-            if vector_deletion_failures > 0:
-                logger.warning(
-                    "Some vectors failed to delete",
-                    total_vectors=len(memory_ids),
-                    failed_count=vector_deletion_failures,
-                )
+            # Delete vectors from Qdrant, one request per hierarchy level
+            vector_deletion_failures = self._delete_memory_vectors(memories_to_delete)
 
             # Delete metadata from SQLite
             deleted_count = self.memory_storage.delete_memories_by_tags(tags)
+            self.activation_engine.notify_memories_deleted(
+                [memory.id for memory in memories_to_delete]
+            )
+            self.query_cache.invalidate()
 
             processing_time = time.time() - start_time
 
@@ -1097,17 +1256,33 @@ class CognitiveMemorySystem(CognitiveSystem):
         return self.memory_storage.get_memories_by_tags(tags)
 
     def atomic_reload_memories_from_source(
-        self, loader: Any, source_path: str, **kwargs: Any
+        self,
+        loader: Any,
+        source_path: str,
+        force: bool = False,
+        fingerprint: tuple[int, float, str] | None = None,
+        existing: list[CognitiveMemory] | None = None,
+        **kwargs: Any,
     ) -> dict[str, Any]:
         """
-        Atomically reload memories from a source by deleting existing ones first.
+        Reload memories from a source so that they match its current content.
 
-        This method ensures consistency by treating delete+reload as a single operation.
-        It first deletes all existing memories from the source path, then loads new ones.
+        Source files whose content matches the recorded manifest entry are
+        skipped. Modified files that already have memories are reloaded chunk
+        by chunk (see ``_reload_changed_chunks``). With ``force``, or when the
+        source has no stored memories or cannot be fingerprinted, existing
+        memories are deleted first and the source is loaded from scratch,
+        treating delete+reload as a single operation.
 
         Args:
             loader: MemoryLoader instance to use for loading
             source_path: Path to the source file
+            force: Reload even if the file is unchanged since the last load
+            fingerprint: Fingerprint of the file taken before it was parsed,
+                recorded in the manifest instead of one taken now so that
+                edits made while parsing are picked up by the next reload
+            existing: Memories currently stored for the source, if the caller
+                has already loaded them; if None they are read from storage
             **kwargs: Additional loader parameters
 
         Returns:
@@ -1118,11 +1293,27 @@ class CognitiveMemorySystem(CognitiveSystem):
             - connections_created: int - Number of connections created
             - processing_time: float - Total time for both operations
             - hierarchy_distribution: dict - Distribution of new memories by level
+            - skipped: bool - True if the file was unchanged and not reloaded
             - error: str | None - Error message if operation failed
         """
         start_time = time.time()
 
         try:
+            if fingerprint is None:
+                fingerprint = self._source_fingerprint(source_path)
+            if not force and self._source_unchanged(source_path, fingerprint):
+                return self._skipped_source_result(loader, source_path, start_time)
+
+            if fingerprint is not None and not force:
+                if existing is None:
+                    existing = self.memory_storage.get_memories_by_source_path(
+                        source_path
+                    )
+                if existing:
+                    return self._reload_changed_chunks(
+                        loader, source_path, existing, fingerprint, start_time, **kwargs
+                    )
+
             logger.info(f"Starting atomic reload for source: {source_path}")
 
             # Step 1: Delete existing memories
@@ -1145,8 +1336,15 @@ class CognitiveMemorySystem(CognitiveSystem):
                     f"loaded {load_result.get('memories_loaded', 0)} memories from {source_path}"
                 )
 
+                # Partially stored sources are retried on the next reload
+                if fingerprint is not None and not load_result.get("memories_failed"):
+                    self._record_source_manifest(
+                        source_path, fingerprint, load_result.get("memory_ids", [])
+                    )
+
                 return {
                     "success": True,
+                    "skipped": False,
                     "deleted_count": deleted_count,
                     "memories_loaded": load_result.get("memories_loaded", 0),
                     "connections_created": load_result.get("connections_created", 0),
@@ -1198,6 +1396,492 @@ class CognitiveMemorySystem(CognitiveSystem):
                 "error": error_msg,
             }
 
+    def reload_sources(
+        self,
+        loader: Any,
+        source_paths: list[str],
+        force: bool = False,
+        workers: int = 1,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Reload several source files through a parse, embed and write pipeline.
+
+        Unchanged sources are skipped before parsing. The others are parsed
+        and chunked by ``workers`` processes. As their results arrive, the
+        chunks of sources that are loaded from scratch are embedded in
+        batches spanning several sources. Each source is then written by
+        ``atomic_reload_memories_from_source`` in this process, the single
+        writer. Sources that already have memories are reloaded chunk by
+        chunk and only embed their changed chunks while being written.
+
+        Args:
+            loader: MemoryLoader whose type and config the workers replicate
+            source_paths: Source files to reload
+            force: Reload sources even if they are unchanged
+            workers: Number of parsing processes
+            **kwargs: Additional loader parameters
+
+        Returns:
+            Dictionary with ``results``, the atomic reload result of each
+            source in the order of ``source_paths``, and ``stage_timings``,
+            the seconds spent parsing (summed over workers), embedding and
+            writing
+        """
+        from ..loaders.parallel import ParsedSource, parse_sources
+
+        results: dict[str, dict[str, Any]] = {}
+        stage_timings = {"parse": 0.0, "embed": 0.0, "write": 0.0}
+
+        # Fingerprints are taken before parsing so that a file edited while
+        # it is parsed does not match its manifest entry on the next reload
+        to_parse: dict[str, tuple[int, float, str] | None] = {}
+        for source_path in source_paths:
+            start_time = time.time()
+            fingerprint = self._source_fingerprint(source_path)
+            if not force and self._source_unchanged(source_path, fingerprint):
+                results[source_path] = self._skipped_source_result(
+                    loader, source_path, start_time
+                )
+            else:
+                to_parse[source_path] = fingerprint
+
+        batch_size = max(1, self.config.embedding.load_batch_size)
+        ready: list[ParsedSource] = []
+        for parsed in parse_sources(loader, list(to_parse), workers, **kwargs):
+            parsed.fingerprint = to_parse[parsed.source_path]
+            stage_timings["parse"] += parsed.parse_time
+            ready.append(parsed)
+            if sum(len(source.memories) for source in ready) >= batch_size:
+                self._write_parsed_sources(
+                    loader, ready, force, stage_timings, results, **kwargs
+                )
+                ready = []
+        self._write_parsed_sources(
+            loader, ready, force, stage_timings, results, **kwargs
+        )
+
+        return {
+            "results": [results[source_path] for source_path in source_paths],
+            "stage_timings": stage_timings,
+        }
+
+    def _write_parsed_sources(
+        self,
+        loader: Any,
+        parsed_sources: list[Any],
+        force: bool,
+        stage_timings: dict[str, float],
+        results: dict[str, dict[str, Any]],
+        **kwargs: Any,
+    ) -> None:
+        """
+        Embed and store sources parsed by worker processes.
+
+        Args:
+            loader: Loader the sources were parsed with
+            parsed_sources: ParsedSource results to store
+            force: Rebuild the memories of every source from scratch
+            stage_timings: Embed and write timings to add to
+            results: Atomic reload results by source path to add to
+            **kwargs: Additional loader parameters
+        """
+        from ..loaders.parallel import ParsedSourceLoader
+
+        # Stored memories are read once per source and handed to the reload,
+        # which diffs against them; sources without any are embedded here
+        start_time = time.time()
+        existing: dict[str, list[CognitiveMemory]] = {}
+        if not force:
+            for parsed in parsed_sources:
+                if parsed.error is None:
+                    existing[parsed.source_path] = (
+                        self.memory_storage.get_memories_by_source_path(
+                            parsed.source_path
+                        )
+                    )
+        stage_timings["write"] += time.time() - start_time
+
+        start_time = time.time()
+        fresh = [
+            memory
+            for parsed in parsed_sources
+            if parsed.error is None and not existing.get(parsed.source_path)
+            for memory in parsed.memories
+        ]
+        if fresh:
+            embeddings = self._encode_in_batches([memory.content for memory in fresh])
+            for memory, embedding in zip(fresh, embeddings, strict=True):
+                memory.cognitive_embedding = embedding
+        stage_timings["embed"] += time.time() - start_time
+
+        for parsed in parsed_sources:
+            start_time = time.time()
+            if parsed.error is not None:
+                logger.error(
+                    "Failed to parse source",
+                    source_path=parsed.source_path,
+                    error=parsed.error,
+                )
+                result = {
+                    "success": False,
+                    "deleted_count": 0,
+                    "memories_loaded": 0,
+                    "connections_created": 0,
+                    "memories_failed": 0,
+                    "connections_failed": 0,
+                    "processing_time": parsed.parse_time,
+                    "hierarchy_distribution": {},
+                    "source_path": parsed.source_path,
+                    "error": f"Parsing failed: {parsed.error}",
+                }
+            else:
+                result = self.atomic_reload_memories_from_source(
+                    ParsedSourceLoader(loader, parsed),
+                    parsed.source_path,
+                    force=force,
+                    fingerprint=parsed.fingerprint,
+                    existing=existing.get(parsed.source_path),
+                    **kwargs,
+                )
+            result["loader_type"] = loader.__class__.__name__
+            results[parsed.source_path] = result
+            stage_timings["write"] += time.time() - start_time
+
+    def _reload_changed_chunks(
+        self,
+        loader: Any,
+        source_path: str,
+        existing: list[CognitiveMemory],
+        fingerprint: tuple[int, float, str],
+        start_time: float,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Reload a modified source file by diffing its chunks against stored memories.
+
+        New chunks are matched to existing memories first by identical content
+        and then by section identity (hierarchical path and chunk type).
+        Unchanged chunks keep their memory, embedding and connections, and only
+        their metadata (dates, positions, section paths) is rewritten. Changed
+        chunks keep the ID and access count of the memory they replace and are
+        re-embedded; unchanged chunks that moved to another hierarchy level
+        are stored again with their existing embedding. Unmatched memories are
+        deleted and unmatched chunks are added. Only connections involving
+        changed or added memories are re-created.
+
+        Args:
+            loader: MemoryLoader instance to use for loading
+            source_path: Path to the source file
+            existing: Memories currently stored for the source
+            fingerprint: Current (size, mtime, content hash) of the file
+            start_time: Start time of the reload
+            **kwargs: Additional loader parameters
+
+        Returns:
+            Dictionary in the format of atomic_reload_memories_from_source with
+            ``incremental``, ``memories_unchanged``, ``memories_updated`` and
+            ``memories_added`` counts
+        """
+        logger.info(
+            "Starting incremental reload",
+            source_path=source_path,
+            existing_memories=len(existing),
+        )
+
+        if not loader.validate_source(source_path):
+            raise ValueError(f"Source validation failed for {source_path}")
+
+        memories = loader.load_from_source(source_path, **kwargs)
+
+        def section_key(memory: CognitiveMemory) -> tuple[Any, ...]:
+            path = memory.metadata.get("hierarchical_path") or [
+                memory.metadata.get("title", "")
+            ]
+            return (tuple(path), memory.metadata.get("chunk_type", ""))
+
+        # Pass 1: identical content, preferring a memory of the same section
+        by_content: dict[str, list[CognitiveMemory]] = {}
+        for old in existing:
+            by_content.setdefault(old.content, []).append(old)
+
+        unchanged: list[CognitiveMemory] = []
+        pending: list[CognitiveMemory] = []
+        updated: list[CognitiveMemory] = []
+        replaced: list[CognitiveMemory] = []
+        for memory in memories:
+            candidates = by_content.get(memory.content)
+            if not candidates:
+                pending.append(memory)
+                continue
+            key = section_key(memory)
+            old = next((c for c in candidates if section_key(c) == key), candidates[0])
+            candidates.remove(old)
+            memory.id = old.id
+            memory.cognitive_embedding = old.cognitive_embedding
+            if memory.hierarchy_level == old.hierarchy_level:
+                unchanged.append(memory)
+            else:
+                # The vector lives in another level's collection
+                memory.access_count = old.access_count
+                memory.last_accessed = old.last_accessed
+                updated.append(memory)
+                replaced.append(old)
+
+        # Pass 2: same section, changed content
+        by_section: dict[tuple[Any, ...], list[CognitiveMemory]] = {}
+        for candidates in by_content.values():
+            for old in candidates:
+                by_section.setdefault(section_key(old), []).append(old)
+
+        added: list[CognitiveMemory] = []
+        for memory in pending:
+            candidates = by_section.get(section_key(memory))
+            if not candidates:
+                added.append(memory)
+                continue
+            old = candidates.pop(0)
+            memory.id = old.id
+            memory.access_count = old.access_count
+            memory.last_accessed = old.last_accessed
+            updated.append(memory)
+            replaced.append(old)
+
+        removed = [old for candidates in by_section.values() for old in candidates]
+
+        # Delete memories whose sections disappeared, then stale vectors
+        deleted_count = 0
+        if removed:
+            self._delete_memory_vectors(removed)
+            removed_ids = [old.id for old in removed]
+            deleted_count = self.memory_storage.delete_memories_by_ids(removed_ids)
+            self.activation_engine.notify_memories_deleted(removed_ids)
+            self.query_cache.invalidate()
+        if replaced:
+            # Hierarchy levels can change with the content
+            self._delete_memory_vectors(replaced)
+
+        # Re-embed and store changed and new chunks. Replacing a memory row
+        # drops its connections, which are re-created below.
+        touched = updated + added
+        vector_ids = self._store_loaded_memories(touched)
+        failed_count = len(touched) - len(vector_ids)
+        refresh_failed = self._refresh_loaded_metadata(unchanged)
+
+        connections_created = 0
+        connections_failed = 0
+        if vector_ids:
+            connections_created, connections_failed = self._store_connections(
+                loader, memories, touched_ids=vector_ids
+            )
+
+        if failed_count:
+            # Drop half-stored chunks so the next reload adds them again
+            self.memory_storage.delete_memories_by_ids(
+                [memory.id for memory in touched if memory.id not in vector_ids]
+            )
+        elif not refresh_failed:
+            # Without a manifest entry the next load refreshes stale metadata
+            self._record_source_manifest(
+                source_path, fingerprint, [memory.id for memory in memories]
+            )
+
+        processing_time = time.time() - start_time
+
+        logger.info(
+            "Incremental reload completed",
+            source_path=source_path,
+            unchanged=len(unchanged),
+            updated=len(updated),
+            added=len(added),
+            deleted=deleted_count,
+            failed=failed_count,
+            processing_time=processing_time,
+        )
+
+        return {
+            "success": True,
+            "skipped": False,
+            "incremental": True,
+            "deleted_count": deleted_count,
+            "memories_loaded": len(vector_ids),
+            "memories_unchanged": len(unchanged),
+            "memories_updated": len(updated),
+            "memories_added": len(added),
+            "connections_created": connections_created,
+            "memories_failed": failed_count,
+            "connections_failed": connections_failed,
+            "processing_time": processing_time,
+            "hierarchy_distribution": self._calculate_hierarchy_distribution(touched),
+            "source_path": source_path,
+            "loader_type": loader.__class__.__name__,
+            "error": None,
+        }
+
+    @staticmethod
+    def _skipped_source_result(
+        loader: Any, source_path: str, start_time: float
+    ) -> dict[str, Any]:
+        """Get the atomic reload result of a source that is unchanged."""
+        logger.debug("Source unchanged, skipping reload", source_path=source_path)
+        return {
+            "success": True,
+            "skipped": True,
+            "deleted_count": 0,
+            "memories_loaded": 0,
+            "connections_created": 0,
+            "memories_failed": 0,
+            "connections_failed": 0,
+            "processing_time": time.time() - start_time,
+            "hierarchy_distribution": {},
+            "source_path": source_path,
+            "loader_type": loader.__class__.__name__,
+            "error": None,
+        }
+
+    def _record_source_manifest(
+        self,
+        source_path: str,
+        fingerprint: tuple[int, float, str],
+        memory_ids: list[str],
+    ) -> None:
+        """Record the fingerprint and memory IDs of a loaded source file."""
+        size, mtime, content_hash = fingerprint
+        self.memory_storage.record_source_manifest(
+            source_path, size, mtime, content_hash, memory_ids
+        )
+
+    @staticmethod
+    def _source_fingerprint(source_path: str) -> tuple[int, float, str] | None:
+        """
+        Get the size, modification time and content hash of a source file.
+
+        Args:
+            source_path: Path to the source
+
+        Returns:
+            (size, mtime, sha256 hex digest), or None if the source is not a
+            regular file (for example a git repository)
+        """
+        path = Path(source_path)
+        if not path.is_file():
+            return None
+
+        stat = path.stat()
+        content_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+        return stat.st_size, stat.st_mtime, content_hash
+
+    def _source_unchanged(
+        self, source_path: str, fingerprint: tuple[int, float, str] | None
+    ) -> bool:
+        """
+        Check a source file against its manifest entry.
+
+        A file only counts as unchanged if its content hash matches and all
+        memories recorded for it still exist. When only the modification
+        time differs (the file was touched) the entry is refreshed.
+
+        Args:
+            source_path: Path to the source file
+            fingerprint: Current (size, mtime, content hash) of the file, or
+                None if the source is not a regular file
+
+        Returns:
+            True if the stored memories are up to date with the file
+        """
+        if fingerprint is None:
+            return False
+
+        manifest = self.memory_storage.get_source_manifest(source_path)
+        if manifest is None:
+            return False
+
+        size, mtime, content_hash = fingerprint
+        if manifest["content_hash"] != content_hash or manifest[
+            "memories_present"
+        ] != len(manifest["memory_ids"]):
+            return False
+
+        if manifest["mtime"] != mtime or manifest["size"] != size:
+            self.memory_storage.record_source_manifest(
+                source_path, size, mtime, content_hash, manifest["memory_ids"]
+            )
+
+        return True
+
+    def _delete_memory_vectors(self, memories: list[CognitiveMemory]) -> int:
+        """
+        Delete the vectors of the given memories grouped by hierarchy level.
+
+        Args:
+            memories: Memories whose vectors should be deleted
+
+        Returns:
+            Number of vectors that failed to delete
+        """
+        ids_by_level: dict[int, list[str]] = {}
+        for memory in memories:
+            ids_by_level.setdefault(memory.hierarchy_level, []).append(memory.id)
+
+        try:
+            deleted = set(self.vector_storage.delete_vectors_by_level(ids_by_level))
+        except Exception as e:
+            logger.error(
+                "Error deleting vectors", memory_count=len(memories), error=str(e)
+            )
+            return len(memories)
+
+        failures = [memory.id for memory in memories if memory.id not in deleted]
+        if failures:
+            logger.warning(
+                "Some vectors failed to delete",
+                total_vectors=len(memories),
+                failed_count=len(failures),
+                failed_ids=failures[:5],
+            )
+
+        return len(failures)
+
+    def _cache_generation(self) -> tuple[Any, ...]:
+        """
+        Get the generation that cached retrieval results must match.
+
+        Combines the local write counter with the storage change version, so
+        writes to memories or connections made by other processes (for
+        example the file monitor) also invalidate cached results. Storage
+        without a change version falls back to the level signatures.
+
+        Returns:
+            Comparable generation tuple
+        """
+        version = self.memory_storage.get_change_version()
+        if version is None:
+            version = tuple(
+                self.memory_storage.get_level_signature(level) for level in (0, 1, 2)
+            )
+        return (self.query_cache.generation, version)
+
+    def _encode_in_batches(self, texts: list[str]) -> np.ndarray:
+        """
+        Encode texts through the embedding provider in configured batch sizes.
+
+        Args:
+            texts: Texts to encode
+
+        Returns:
+            np.ndarray: Embeddings aligned with ``texts``
+        """
+        batch_size = max(1, self.config.embedding.load_batch_size)
+        batches = [
+            self.embedding_provider.encode_batch(texts[start : start + batch_size])
+            for start in range(0, len(texts), batch_size)
+        ]
+
+        if not batches:
+            return np.zeros((0, self.config.embedding.embedding_dimension))
+
+        return np.concatenate(batches, axis=0)
+
     def _calculate_hierarchy_distribution(
         self, memories: list[CognitiveMemory]
     ) -> dict[str, int]:
@@ -1303,8 +1987,13 @@ class CognitiveMemorySystem(CognitiveSystem):
         types: list[str],
         results: dict[str, list[CognitiveMemory]],
         max_results: int,
-    ) -> None:
-        """Add memories from activation engine (only fill remaining slots)."""
+    ) -> ActivationResult:
+        """
+        Add memories from activation engine (only fill remaining slots).
+
+        Returns:
+            The activation result, including the traversed connections
+        """
         activation_result = self.activation_engine.activate_memories(
             context=query_embedding,
             threshold=self.config.cognitive.activation_threshold,
@@ -1325,6 +2014,8 @@ class CognitiveMemorySystem(CognitiveSystem):
                     activation_result.peripheral_memories[:remaining_slots]
                 )
 
+        return activation_result
+
 
 def create_cognitive_system(
     embedding_provider: EmbeddingProvider,
@@ -19,6 +19,8 @@ from loguru import logger
 if TYPE_CHECKING:
     from .memory import CognitiveMemory
 
+HEALTH_CHECK_MODES = ("cached", "fast", "deep")
+
 
 def get_project_id(path: str | Path | None = None) -> str:
     """
@@ -69,6 +71,7 @@ class ProjectPaths:
         self.config_file = self.heimdall_dir / "config.yaml"
         self.pid_file = self.heimdall_dir / "monitor.pid"
         self.log_file = self.heimdall_dir / "monitor.log"
+        self.commit_queue_dir = self.heimdall_dir / "commit_queue"
 
         # Ensure .heimdall directory exists
         self.heimdall_dir.mkdir(exist_ok=True)
@@ -165,7 +168,10 @@ def get_monitoring_config(project_root: Path | None = None) -> dict[str, Any]:
         project_root: Root directory of the project. If None, uses current working directory.
 
     Returns:
-        dict: Monitoring configuration with target_path, interval_seconds, ignore_patterns
+        dict: Monitoring configuration with target_path, interval_seconds,
+        ignore_patterns, watch_backend, debounce_seconds and ingestion worker
+        settings. batch_size is only present when set in .heimdall/config.yaml;
+        otherwise CognitiveConfig.monitoring_batch_size applies.
     """
     paths = get_project_paths(project_root)
 
@@ -174,6 +180,11 @@ def get_monitoring_config(project_root: Path | None = None) -> dict[str, Any]:
         "target_path": get_monitoring_target_path(project_root),
         "interval_seconds": 5.0,
         "ignore_patterns": [".git", "node_modules", "__pycache__", ".pytest_cache"],
+        "debounce_seconds": 1.0,
+        "watch_backend": "auto",
+        "persistent_worker": False,
+        "worker_max_requests": 500,
+        "worker_idle_timeout": 300.0,
     }
 
     # Environment overrides (highest priority)
@@ -188,6 +199,39 @@ def get_monitoring_config(project_root: Path | None = None) -> dict[str, Any]:
     if env_patterns:
         config["ignore_patterns"] = [p.strip() for p in env_patterns.split(",")]
 
+    env_backend = os.getenv("MONITORING_WATCH_BACKEND")
+    if env_backend:
+        config["watch_backend"] = env_backend.lower()
+
+    env_worker = os.getenv("MONITORING_PERSISTENT_WORKER")
+    if env_worker:
+        config["persistent_worker"] = env_worker.lower() == "true"
+
+    env_debounce = os.getenv("MONITORING_DEBOUNCE_SECONDS")
+    if env_debounce:
+        try:
+            config["debounce_seconds"] = float(env_debounce)
+        except (ValueError, TypeError):
+            logger.warning("Invalid MONITORING_DEBOUNCE_SECONDS value, using default")
+
+    env_max_requests = os.getenv("MONITORING_WORKER_MAX_REQUESTS")
+    if env_max_requests:
+        try:
+            config["worker_max_requests"] = int(env_max_requests)
+        except (ValueError, TypeError):
+            logger.warning(
+                "Invalid MONITORING_WORKER_MAX_REQUESTS value, using default"
+            )
+
+    env_idle_timeout = os.getenv("MONITORING_WORKER_IDLE_TIMEOUT")
+    if env_idle_timeout:
+        try:
+            config["worker_idle_timeout"] = float(env_idle_timeout)
+        except (ValueError, TypeError):
+            logger.warning(
+                "Invalid MONITORING_WORKER_IDLE_TIMEOUT value, using default"
+            )
+
     # Check .heimdall/config.yaml for additional settings
     if paths.config_file.exists():
         try:
@@ -212,11 +256,59 @@ def get_monitoring_config(project_root: Path | None = None) -> dict[str, Any]:
                         patterns = monitoring["ignore_patterns"]
                         if isinstance(patterns, list):
                             config["ignore_patterns"] = patterns
+
+                    if "watch_backend" in monitoring and not env_backend:
+                        config["watch_backend"] = str(
+                            monitoring["watch_backend"]
+                        ).lower()
+
+                    if "persistent_worker" in monitoring and not env_worker:
+                        config["persistent_worker"] = bool(
+                            monitoring["persistent_worker"]
+                        )
+
+                    if "batch_size" in monitoring and not os.getenv(
+                        "MONITORING_BATCH_SIZE"
+                    ):
+                        try:
+                            config["batch_size"] = int(monitoring["batch_size"])
+                        except (ValueError, TypeError):
+                            logger.warning("Invalid batch_size in config.yaml")
+
+                    if "debounce_seconds" in monitoring and not env_debounce:
+                        try:
+                            config["debounce_seconds"] = float(
+                                monitoring["debounce_seconds"]
+                            )
+                        except (ValueError, TypeError):
+                            logger.warning("Invalid debounce_seconds in config.yaml")
+
+                    if "worker_max_requests" in monitoring and not env_max_requests:
+                        try:
+                            config["worker_max_requests"] = int(
+                                monitoring["worker_max_requests"]
+                            )
+                        except (ValueError, TypeError):
+                            logger.warning("Invalid worker_max_requests in config.yaml")
+
+                    if "worker_idle_timeout" in monitoring and not env_idle_timeout:
+                        try:
+                            config["worker_idle_timeout"] = float(
+                                monitoring["worker_idle_timeout"]
+                            )
+                        except (ValueError, TypeError):
+                            logger.warning("Invalid worker_idle_timeout in config.yaml")
         except Exception as e:
             logger.warning(
                 f"Failed to parse monitoring config from .heimdall/config.yaml: {e}"
             )
 
+    if config["watch_backend"] not in ("auto", "inotify", "polling"):
+        logger.warning(
+            f"Invalid watch backend {config['watch_backend']!r}, using 'auto'"
+        )
+        config["watch_backend"] = "auto"
+
     return config
 
 
@@ -352,6 +444,9 @@ class QdrantConfig:
     api_key: str | None = None
     timeout: int = 30
     prefer_grpc: bool = False
+    upsert_batch_size: int = 256
+    upsert_parallel: int = 1
+    upsert_wait: bool = True
 
     def get_port(self) -> int:
         """Extract port number from URL."""
@@ -375,6 +470,13 @@ class QdrantConfig:
             api_key=os.getenv("QDRANT_API_KEY"),
             timeout=int(os.getenv("QDRANT_TIMEOUT", str(cls.timeout))),
             prefer_grpc=os.getenv("QDRANT_PREFER_GRPC", "false").lower() == "true",
+            upsert_batch_size=int(
+                os.getenv("QDRANT_UPSERT_BATCH_SIZE", str(cls.upsert_batch_size))
+            ),
+            upsert_parallel=int(
+                os.getenv("QDRANT_UPSERT_PARALLEL", str(cls.upsert_parallel))
+            ),
+            upsert_wait=os.getenv("QDRANT_UPSERT_WAIT", "true").lower() == "true",
         )
 
 
@@ -385,6 +487,8 @@ class DatabaseConfig:
     path: str = "./data/cognitive_memory.db"
     backup_interval_hours: int = 24
     enable_wal_mode: bool = True
+    mmap_size: int = 268435456  # 256 MiB; 0 disables memory-mapped I/O
+    statement_cache_size: int = 256
 
     @classmethod
     def from_env(cls) -> "DatabaseConfig":
@@ -395,6 +499,10 @@ class DatabaseConfig:
                 os.getenv("DB_BACKUP_INTERVAL", str(cls.backup_interval_hours))
             ),
             enable_wal_mode=os.getenv("DB_ENABLE_WAL", "true").lower() == "true",
+            mmap_size=int(os.getenv("DB_MMAP_SIZE", str(cls.mmap_size))),
+            statement_cache_size=int(
+                os.getenv("DB_STATEMENT_CACHE_SIZE", str(cls.statement_cache_size))
+            ),
         )
 
 
@@ -422,7 +530,12 @@ class EmbeddingConfig:
     model_cache_dir: str = field(default_factory=_get_default_model_cache_dir)
     embedding_dimension: int = 384  # Sentence-BERT semantic embedding dimension
     batch_size: int = 32
+    load_batch_size: int = 256  # Texts per encode_batch call when loading sources
     device: str = "auto"  # auto, cpu, cuda
+    dynamic_padding: bool = True  # Pad batches to their longest input, not max_length
+    cache_enabled: bool = True
+    cache_path: str = ""  # Empty means <model_cache_dir>/embedding_cache.db
+    cache_max_entries: int = 100_000
 
     @classmethod
     def from_env(cls) -> "EmbeddingConfig":
@@ -436,9 +549,26 @@ class EmbeddingConfig:
                 os.getenv("EMBEDDING_DIMENSION", str(cls.embedding_dimension))
             ),
             batch_size=int(os.getenv("EMBEDDING_BATCH_SIZE", str(cls.batch_size))),
+            load_batch_size=int(
+                os.getenv("EMBEDDING_LOAD_BATCH_SIZE", str(cls.load_batch_size))
+            ),
             device=os.getenv("EMBEDDING_DEVICE", cls.device),
+            dynamic_padding=os.getenv("EMBEDDING_DYNAMIC_PADDING", "true").lower()
+            == "true",
+            cache_enabled=os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower()
+            == "true",
+            cache_path=os.getenv("EMBEDDING_CACHE_PATH", cls.cache_path),
+            cache_max_entries=int(
+                os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", str(cls.cache_max_entries))
+            ),
         )
 
+    def get_cache_path(self) -> Path:
+        """Get the embedding cache file path, defaulting to the model cache dir."""
+        if self.cache_path:
+            return Path(self.cache_path)
+        return Path(self.model_cache_dir) / "embedding_cache.db"
+
 
 @dataclass
 class CognitiveConfig:
@@ -448,6 +578,8 @@ class CognitiveConfig:
     activation_threshold: float = 0.7
     max_activations: int = 50
     consolidation_threshold: int = 100
+    query_cache_size: int = 256  # Cached recall results, 0 disables
+    query_embedding_cache_size: int = 1024  # Cached query embeddings, 0 disables
 
     # Activity tracking parameters for context-aware decay
     activity_window_days: int = 30
@@ -519,6 +651,11 @@ class CognitiveConfig:
     max_merge_children: int = 5
     max_hierarchical_depth: int = 4
     max_connections_per_memory: int = 10
+    associative_candidates_per_memory: int = 20  # Pairs scored per memory, 0 = all
+    spacy_model: str = "en_core_web_md"  # en_core_web_sm is smaller and faster
+    spacy_batch_size: int = 64  # Chunk texts per nlp.pipe batch
+    spacy_n_process: int = 1  # Worker processes for nlp.pipe
+    load_workers: int = 0  # Parsing processes for directory loads, 0 = auto
 
     # Base connection weights
     hierarchical_weight: float = 0.80
@@ -542,6 +679,14 @@ class CognitiveConfig:
             consolidation_threshold=int(
                 os.getenv("CONSOLIDATION_THRESHOLD", str(cls.consolidation_threshold))
             ),
+            query_cache_size=int(
+                os.getenv("QUERY_CACHE_SIZE", str(cls.query_cache_size))
+            ),
+            query_embedding_cache_size=int(
+                os.getenv(
+                    "QUERY_EMBEDDING_CACHE_SIZE", str(cls.query_embedding_cache_size)
+                )
+            ),
             similarity_closeness_threshold=float(
                 os.getenv(
                     "SIMILARITY_CLOSENESS_THRESHOLD",
@@ -595,6 +740,18 @@ class CognitiveConfig:
             associative_weight=float(
                 os.getenv("ASSOCIATIVE_WEIGHT", str(cls.associative_weight))
             ),
+            associative_candidates_per_memory=int(
+                os.getenv(
+                    "ASSOCIATIVE_CANDIDATES_PER_MEMORY",
+                    str(cls.associative_candidates_per_memory),
+                )
+            ),
+            spacy_model=os.getenv("SPACY_MODEL", cls.spacy_model),
+            spacy_batch_size=int(
+                os.getenv("SPACY_BATCH_SIZE", str(cls.spacy_batch_size))
+            ),
+            spacy_n_process=int(os.getenv("SPACY_N_PROCESS", str(cls.spacy_n_process))),
+            load_workers=int(os.getenv("LOAD_WORKERS", str(cls.load_workers))),
             semantic_alpha=float(os.getenv("SEMANTIC_ALPHA", str(cls.semantic_alpha))),
             lexical_beta=float(os.getenv("LEXICAL_BETA", str(cls.lexical_beta))),
             structural_gamma=float(
@@ -770,6 +927,30 @@ class LoggingConfig:
         )
 
 
+@dataclass
+class MCPServerConfig:
+    """Configuration for dispatching MCP tool calls to worker threads."""
+
+    max_workers: int = 4  # Threads running blocking cognitive operations
+    tool_timeout: float = 60.0  # Seconds a tool call may queue and run
+    max_concurrent_reads: int = 4  # Concurrent calls per read-only tool
+    max_concurrent_writes: int = 1  # Concurrent calls per writing tool
+
+    @classmethod
+    def from_env(cls) -> "MCPServerConfig":
+        """Create configuration from environment variables."""
+        return cls(
+            max_workers=int(os.getenv("MCP_MAX_WORKERS", str(cls.max_workers))),
+            tool_timeout=float(os.getenv("MCP_TOOL_TIMEOUT", str(cls.tool_timeout))),
+            max_concurrent_reads=int(
+                os.getenv("MCP_MAX_CONCURRENT_READS", str(cls.max_concurrent_reads))
+            ),
+            max_concurrent_writes=int(
+                os.getenv("MCP_MAX_CONCURRENT_WRITES", str(cls.max_concurrent_writes))
+            ),
+        )
+
+
 @dataclass
 class SystemConfig:
     """Master configuration for the cognitive memory system."""
@@ -785,6 +966,12 @@ class SystemConfig:
     max_memory_usage_mb: int = 1024
     cleanup_interval_hours: int = 24
 
+    # Startup health check: "cached" runs reachability checks and repeats the
+    # deep store/retrieve/delete check once per TTL, "fast" only checks
+    # reachability and "deep" always runs the deep check
+    health_check_mode: str = "cached"
+    health_check_ttl_seconds: int = 86400
+
     # Project identification
     project_id: str = ""
 
@@ -820,6 +1007,10 @@ class SystemConfig:
             debug=os.getenv("DEBUG", "false").lower() == "true",
             max_memory_usage_mb=int(os.getenv("MAX_MEMORY_USAGE_MB", "1024")),
             cleanup_interval_hours=int(os.getenv("CLEANUP_INTERVAL_HOURS", "24")),
+            health_check_mode=os.getenv("HEALTH_CHECK_MODE", "cached").lower(),
+            health_check_ttl_seconds=int(
+                os.getenv("HEALTH_CHECK_TTL_SECONDS", "86400")
+            ),
             project_id=project_id,
         )
 
@@ -845,6 +1036,11 @@ class SystemConfig:
             except Exception as e:
                 errors.append(f"Cannot create model cache directory {model_dir}: {e}")
 
+        if self.health_check_mode not in HEALTH_CHECK_MODES:
+            errors.append(
+                f"Health check mode must be one of {', '.join(HEALTH_CHECK_MODES)}"
+            )
+
         # Validate cognitive parameters
         if not 0.0 <= self.cognitive.activation_threshold <= 1.0:
             errors.append("Activation threshold must be between 0.0 and 1.0")
@@ -978,7 +1174,11 @@ class SystemConfig:
                 "model_cache_dir": self.embedding.model_cache_dir,
                 "embedding_dimension": self.embedding.embedding_dimension,
                 "batch_size": self.embedding.batch_size,
+                "load_batch_size": self.embedding.load_batch_size,
                 "device": self.embedding.device,
+                "dynamic_padding": self.embedding.dynamic_padding,
+                "cache_enabled": self.embedding.cache_enabled,
+                "cache_max_entries": self.embedding.cache_max_entries,
             },
             "cognitive": {
                 "activation_threshold": self.cognitive.activation_threshold,
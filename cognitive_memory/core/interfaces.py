@@ -6,10 +6,12 @@ testing, and scaling as outlined in the technical specification.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Hashable
 from typing import Any
 
 import numpy as np
 
+from .adjacency import ConnectionAdjacency
 from .memory import ActivationResult, CognitiveMemory, SearchResult
 
 
@@ -37,6 +39,47 @@ class VectorStorage(ABC):
         """Store a vector with associated metadata."""
         pass
 
+    def store_vectors_batch(
+        self, items: list[tuple[str, np.ndarray, dict[str, Any]]]
+    ) -> list[str]:
+        """
+        Store multiple vectors with their metadata.
+
+        The default implementation stores vectors one at a time. Override
+        this method to send the batch in as few round trips as possible.
+
+        Args:
+            items: (id, vector, metadata) tuples to store
+
+        Returns:
+            IDs of the vectors that were stored successfully
+        """
+        stored_ids = []
+        for id, vector, metadata in items:
+            try:
+                self.store_vector(id, vector, metadata)
+                stored_ids.append(id)
+            except Exception:
+                continue
+        return stored_ids
+
+    def update_metadata_batch(
+        self, items: list[tuple[str, dict[str, Any]]]
+    ) -> list[str]:
+        """
+        Replace the metadata of stored vectors without sending the vectors.
+
+        The default implementation cannot update metadata on its own and
+        updates nothing. Override this method to rewrite payloads in place.
+
+        Args:
+            items: (id, metadata) tuples; metadata includes hierarchy_level
+
+        Returns:
+            IDs of the vectors whose metadata was updated
+        """
+        return []
+
     @abstractmethod
     def search_similar(
         self, query_vector: np.ndarray, k: int, filters: dict | None = None
@@ -61,6 +104,25 @@ class VectorStorage(ABC):
         """Delete vectors by their IDs. Returns list of successfully deleted memory IDs."""
         pass
 
+    def delete_vectors_by_level(self, ids_by_level: dict[int, list[str]]) -> list[str]:
+        """
+        Delete vectors whose hierarchy levels are already known.
+
+        The default implementation ignores the levels and delegates to
+        delete_vectors_by_ids. Override this method to restrict deletion to
+        the matching level collections.
+
+        Args:
+            ids_by_level: Mapping of hierarchy level to vector IDs at that level
+
+        Returns:
+            List of successfully deleted memory IDs
+        """
+        memory_ids = list(
+            dict.fromkeys(id for ids in ids_by_level.values() for id in ids)
+        )
+        return self.delete_vectors_by_ids(memory_ids)
+
 
 class ActivationEngine(ABC):
     """Abstract interface for memory activation."""
@@ -72,6 +134,29 @@ class ActivationEngine(ABC):
         """Activate memories based on context with spreading activation."""
         pass
 
+    def notify_memories_stored(self, memories: list[CognitiveMemory]) -> None:
+        """
+        Inform the engine that memories were stored or updated.
+
+        The default implementation does nothing. Engines that cache memory
+        state override this to refresh their caches incrementally.
+
+        Args:
+            memories: Memories that were written to storage
+        """
+        return None
+
+    def notify_memories_deleted(self, memory_ids: list[str]) -> None:
+        """
+        Inform the engine that memories were deleted.
+
+        The default implementation does nothing.
+
+        Args:
+            memory_ids: IDs of memories that were removed from storage
+        """
+        return None
+
 
 class DimensionExtractor(ABC):
     """Abstract interface for multi-dimensional feature extraction."""
@@ -90,16 +175,87 @@ class MemoryStorage(ABC):
         """Store a cognitive memory."""
         pass
 
+    def store_memories_batch(self, memories: list[CognitiveMemory]) -> list[str]:
+        """
+        Store multiple cognitive memories.
+
+        The default implementation stores memories one at a time. Override
+        this method to write the whole batch in a single transaction.
+
+        Args:
+            memories: Memories to store
+
+        Returns:
+            IDs of the memories that were stored successfully
+        """
+        return [memory.id for memory in memories if self.store_memory(memory)]
+
     @abstractmethod
     def retrieve_memory(self, memory_id: str) -> CognitiveMemory | None:
         """Retrieve a memory by ID."""
         pass
 
+    def get_memories_by_ids(self, memory_ids: list[str]) -> list[CognitiveMemory]:
+        """
+        Get memories by ID without recording an access.
+
+        The default implementation scans every hierarchy level. Override this
+        method to look the memories up directly.
+
+        Args:
+            memory_ids: IDs of memories to fetch
+
+        Returns:
+            Found memories in the order of ``memory_ids``; missing IDs are skipped
+        """
+        wanted = set(memory_ids)
+        found = {
+            memory.id: memory
+            for level in (0, 1, 2)
+            for memory in self.get_memories_by_level(level)
+            if memory.id in wanted
+        }
+        return [found[memory_id] for memory_id in memory_ids if memory_id in found]
+
     @abstractmethod
     def update_memory(self, memory: CognitiveMemory) -> bool:
         """Update an existing memory."""
         pass
 
+    def update_memories_metadata(self, memories: list[CognitiveMemory]) -> list[str]:
+        """
+        Rewrite the metadata of stored memories, keeping content and embeddings.
+
+        The default implementation updates memories one at a time with
+        update_memory. Override this method to write the metadata columns of
+        the whole batch in a single transaction.
+
+        Args:
+            memories: Memories whose metadata, timestamp and tags changed
+
+        Returns:
+            IDs of the memories that were updated
+        """
+        return [memory.id for memory in memories if self.update_memory(memory)]
+
+    def record_memory_accesses(self, memory_ids: list[str]) -> int:
+        """
+        Count accesses to memories that were served without retrieving them.
+
+        The default implementation retrieves each memory, which counts the
+        access. Override this method to update the access statistics of the
+        whole batch in one statement.
+
+        Args:
+            memory_ids: Memories that were accessed
+
+        Returns:
+            Number of memories updated
+        """
+        return sum(
+            1 for memory_id in memory_ids if self.retrieve_memory(memory_id) is not None
+        )
+
     @abstractmethod
     def delete_memory(self, memory_id: str) -> bool:
         """Delete a memory by ID."""
@@ -110,6 +266,108 @@ class MemoryStorage(ABC):
         """Get all memories at a specific hierarchy level."""
         pass
 
+    def get_level_signature(self, level: int) -> tuple[Any, ...] | None:
+        """
+        Get a cheap fingerprint that changes when memories at a level change.
+
+        Callers that cache memories of a level compare signatures to detect
+        writes made elsewhere, including by other processes. The default
+        implementation returns None, meaning changes cannot be detected.
+
+        Args:
+            level: Hierarchy level to fingerprint
+
+        Returns:
+            Opaque comparable signature, or None if unsupported
+        """
+        return None
+
+    def get_change_version(self) -> Hashable | None:
+        """
+        Get a cheap version that changes when memories or connections change.
+
+        Callers that cache retrieval results compare versions to detect
+        writes made elsewhere, including by other processes. The default
+        implementation returns None, meaning changes cannot be detected.
+
+        Returns:
+            Opaque comparable version, or None if unsupported
+        """
+        return None
+
+    def get_memory_counts(self) -> dict[str, Any]:
+        """
+        Get aggregate memory counts without loading memories.
+
+        The default implementation loads every level and counts in Python.
+        Override this method to compute the counts in storage.
+
+        Returns:
+            Dictionary with ``total`` and ``by_level`` (level -> count),
+            ``by_type`` and ``by_source_type`` breakdowns. Implementations
+            may add further breakdowns and size totals.
+        """
+        by_level: dict[int, int] = {}
+        by_type: dict[str, int] = {}
+        by_source_type: dict[str, int] = {}
+        for level in (0, 1, 2):
+            memories = self.get_memories_by_level(level)
+            by_level[level] = len(memories)
+            for memory in memories:
+                by_type[memory.memory_type] = by_type.get(memory.memory_type, 0) + 1
+                source_type = str(memory.metadata.get("source_type", "unknown"))
+                by_source_type[source_type] = by_source_type.get(source_type, 0) + 1
+
+        return {
+            "total": sum(by_level.values()),
+            "by_level": by_level,
+            "by_type": by_type,
+            "by_source_type": by_source_type,
+        }
+
+    def get_source_manifest(self, source_path: str) -> dict[str, Any] | None:
+        """
+        Get the recorded state of a loaded source file.
+
+        The default implementation keeps no manifest, so every reload
+        processes the source again.
+
+        Args:
+            source_path: Source file path as passed to the loader
+
+        Returns:
+            Dictionary with ``size``, ``mtime``, ``content_hash``,
+            ``memory_ids`` and ``memories_present`` (how many of those
+            memories still exist), or None if the source is not tracked
+        """
+        return None
+
+    def record_source_manifest(
+        self,
+        source_path: str,
+        size: int,
+        mtime: float,
+        content_hash: str,
+        memory_ids: list[str],
+    ) -> bool:
+        """
+        Record the state of a source file after it was loaded.
+
+        Implementations should drop the entry when the memories of the source
+        path are deleted. The default implementation records nothing.
+
+        Args:
+            source_path: Source file path as passed to the loader
+            size: File size in bytes
+            mtime: File modification time
+            content_hash: SHA-256 hex digest of the file content
+            memory_ids: IDs of the memories loaded from the file
+
+        Returns:
+            True if the manifest entry was stored
+        """
+        return False
+
     @abstractmethod
     def get_memories_by_source_path(self, source_path: str) -> list[CognitiveMemory]:
         """Get memories by source file path from metadata."""
@@ -169,6 +427,34 @@ class ConnectionGraph(ABC):
         """Remove a connection between memories."""
         pass
 
+    def get_adjacency(self) -> ConnectionAdjacency | None:
+        """
+        Get an in-memory adjacency of the whole connection graph.
+
+        The default implementation returns None, in which case callers fall
+        back to get_connections for each node.
+
+        Returns:
+            Current connection adjacency, or None if unsupported
+        """
+        return None
+
+    def record_activations(
+        self, memory_ids: list[str], min_strength: float = 0.0
+    ) -> None:
+        """
+        Record that the connections of memories were traversed.
+
+        Callers that traverse get_adjacency instead of get_connections use
+        this to keep connection activation statistics. The default
+        implementation does nothing.
+
+        Args:
+            memory_ids: Memories whose connections were traversed
+            min_strength: Strength threshold used for the traversal
+        """
+        return None
+
 
 class MemoryLoader(ABC):
     """Abstract interface for loading external content into cognitive memory."""
@@ -322,16 +608,23 @@ class CognitiveSystem(ABC):
 
     @abstractmethod
     def atomic_reload_memories_from_source(
-        self, loader: MemoryLoader, source_path: str, **kwargs: Any
+        self,
+        loader: MemoryLoader,
+        source_path: str,
+        force: bool = False,
+        **kwargs: Any,
     ) -> dict[str, Any]:
         """
         Atomically reload memories from a source by deleting existing ones first.
 
         This ensures consistency by treating delete+reload as a single operation.
+        Implementations may skip sources that are unchanged since their last
+        load unless ``force`` is set.
 
         Args:
             loader: MemoryLoader instance to use
             source_path: Path to the source content
+            force: Reload even if the source is unchanged
             **kwargs: Additional parameters for the loader
 
         Returns:
@@ -339,6 +632,42 @@ class CognitiveSystem(ABC):
         """
         pass
 
+    def reload_sources(
+        self,
+        loader: MemoryLoader,
+        source_paths: list[str],
+        force: bool = False,
+        workers: int = 1,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Atomically reload several sources.
+
+        Implementations may parse sources in parallel using up to ``workers``
+        processes. The default implementation reloads them one by one.
+
+        Args:
+            loader: MemoryLoader instance to use
+            source_paths: Paths to the source content
+            force: Reload sources even if they are unchanged
+            workers: Maximum number of parsing processes
+            **kwargs: Additional parameters for the loader
+
+        Returns:
+            Dictionary with ``results``, the atomic reload result of each
+            source in order, and ``stage_timings``, seconds spent per
+            pipeline stage (empty if not tracked)
+        """
+        return {
+            "results": [
+                self.atomic_reload_memories_from_source(
+                    loader, source_path, force=force, **kwargs
+                )
+                for source_path in source_paths
+            ],
+            "stage_timings": {},
+        }
+
     @abstractmethod
     def retrieve_memory(self, memory_id: str) -> CognitiveMemory | None:
         """Retrieve a memory by ID."""
@@ -0,0 +1,198 @@
+"""
+Lazily constructed components for the cognitive memory system.
+
+Loading the ONNX embedding model and connecting to Qdrant dominate system
+start-up, yet many commands (deleting memories, skipping unchanged files,
+reading counts) never need one or both of them. The proxies in this module
+implement the component interfaces and build the real component on first use.
+"""
+
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+from .interfaces import EmbeddingProvider, VectorStorage
+from .memory import SearchResult
+
+
+class _LazyComponent:
+    """Thread-safe holder that builds a component once, on first access."""
+
+    def __init__(self, name: str, factory: Callable[[], Any]) -> None:
+        self._name = name
+        self._factory = factory
+        self._component: Any = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the component has been built."""
+        return self._component is not None
+
+    @property
+    def peek(self) -> Any:
+        """The component if it has been built, without building it."""
+        return self._component
+
+    def get(self) -> Any:
+        """Get the component, building it if necessary."""
+        if self._component is None:
+            with self._lock:
+                if self._component is None:
+                    logger.debug(
+                        "Building component on first use", component=self._name
+                    )
+                    self._component = self._factory()
+        return self._component
+
+
+class LazyEmbeddingProvider(EmbeddingProvider):
+    """
+    EmbeddingProvider that loads the underlying model on the first encode.
+
+    Attributes not defined here are delegated to the loaded provider.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], EmbeddingProvider],
+        model_name: str,
+        embedding_dimension: int,
+        model_path: str | Path | None = None,
+    ) -> None:
+        """
+        Initialize the proxy.
+
+        Args:
+            factory: Builds the real provider
+            model_name: Model identifier, reported without loading the model
+            embedding_dimension: Embedding dimension, reported without loading
+            model_path: Model file the factory will load, if known
+        """
+        self._lazy = _LazyComponent("embedding_provider", factory)
+        self.model_name = model_name
+        self.embedding_dimension = embedding_dimension
+        self.model_path = model_path
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the model has been loaded."""
+        return self._lazy.loaded
+
+    def _provider(self) -> EmbeddingProvider:
+        provider: EmbeddingProvider = self._lazy.get()
+        return provider
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate unknown attributes to the loaded provider."""
+        if name == "_lazy":
+            raise AttributeError(name)
+        return getattr(self._provider(), name)
+
+    def encode(self, text: str) -> np.ndarray:
+        """Encode a single text, loading the model if necessary."""
+        return self._provider().encode(text)
+
+    def encode_batch(self, texts: list[str]) -> np.ndarray:
+        """Encode multiple texts, loading the model if necessary."""
+        return self._provider().encode_batch(texts)
+
+    def get_embedding_dimension(self) -> int:
+        """Get the embedding dimension without loading the model."""
+        return self.embedding_dimension
+
+    def get_model_info(self) -> dict[str, Any]:
+        """Get model information, loading nothing if the model is not loaded."""
+        provider = self._lazy.peek
+        if provider is not None and hasattr(provider, "get_model_info"):
+            info: dict[str, Any] = provider.get_model_info()
+            return info
+        return {
+            "model_name": self.model_name,
+            "embedding_dimension": self.embedding_dimension,
+            "loaded": False,
+        }
+
+    def close(self) -> None:
+        """Close the provider if it was loaded; never loads just to close."""
+        provider = self._lazy.peek
+        if provider is not None and hasattr(provider, "close"):
+            provider.close()
+
+
+class LazyVectorStorage(VectorStorage):
+    """
+    VectorStorage that connects to the underlying store on first use.
+
+    Attributes not defined here are delegated to the connected storage.
+    """
+
+    def __init__(self, factory: Callable[[], VectorStorage]) -> None:
+        """
+        Initialize the proxy.
+
+        Args:
+            factory: Builds the real vector storage
+        """
+        self._lazy = _LazyComponent("vector_storage", factory)
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the storage has been connected."""
+        return self._lazy.loaded
+
+    def _storage(self) -> VectorStorage:
+        storage: VectorStorage = self._lazy.get()
+        return storage
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate unknown attributes to the connected storage."""
+        if name == "_lazy":
+            raise AttributeError(name)
+        return getattr(self._storage(), name)
+
+    def store_vector(
+        self, id: str, vector: np.ndarray, metadata: dict[str, Any]
+    ) -> None:
+        """Store a vector with associated metadata."""
+        self._storage().store_vector(id, vector, metadata)
+
+    def store_vectors_batch(
+        self, items: list[tuple[str, np.ndarray, dict[str, Any]]]
+    ) -> list[str]:
+        """Store multiple vectors with their metadata."""
+        return self._storage().store_vectors_batch(items)
+
+    def search_similar(
+        self, query_vector: np.ndarray, k: int, filters: dict | None = None
+    ) -> list[SearchResult]:
+        """Search for similar vectors."""
+        return self._storage().search_similar(query_vector, k, filters)
+
+    def delete_vector(self, id: str) -> bool:
+        """Delete a vector by ID."""
+        return self._storage().delete_vector(id)
+
+    def update_vector(
+        self, id: str, vector: np.ndarray, metadata: dict[str, Any]
+    ) -> bool:
+        """Update an existing vector and its metadata."""
+        return self._storage().update_vector(id, vector, metadata)
+
+    def delete_vectors_by_ids(self, memory_ids: list[str]) -> list[str]:
+        """Delete vectors by their IDs."""
+        return self._storage().delete_vectors_by_ids(memory_ids)
+
+    def delete_vectors_by_level(self, ids_by_level: dict[int, list[str]]) -> list[str]:
+        """Delete vectors whose hierarchy levels are already known."""
+        return self._storage().delete_vectors_by_level(ids_by_level)
+
+    def close(self) -> None:
+        """Close the storage if it was connected; never connects just to close."""
+        storage = self._lazy.peek
+        if storage is not None and hasattr(storage, "close"):
+            storage.close()
@@ -164,6 +164,10 @@ class ActivationResult:
     activation_strengths: dict[str, float] = field(default_factory=dict)
     total_activated: int = 0
     activation_time_ms: float = 0.0
+    # Memories whose connections were traversed, and the strength threshold
+    # used for the traversal
+    expanded_ids: list[str] = field(default_factory=list)
+    expansion_threshold: float = 0.0
 
     def __post_init__(self) -> None:
         self.total_activated = len(self.core_memories) + len(self.peripheral_memories)
@@ -0,0 +1,259 @@
+"""
+In-memory caches for repeated recall queries.
+
+Assistants often repeat the same recall query within a session. This module
+provides an LRU cache of retrieval results, invalidated whenever the stored
+memories change, and a separate LRU cache of query embeddings that survives
+invalidation because embeddings do not depend on stored memories.
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+import numpy as np
+
+from .memory import CognitiveMemory
+
+ResultKey = tuple[str, tuple[str, ...], int]
+
+# Memories whose connections a recall traversed, and the strength threshold
+ConnectionTraversal = tuple[tuple[str, ...], float]
+
+# Cached results, their connection traversal and the memories retrieved from
+# storage while computing them
+CachedRecall = tuple[
+    dict[str, list[CognitiveMemory]], ConnectionTraversal | None, tuple[str, ...]
+]
+
+
+def copy_results(
+    results: dict[str, list[CognitiveMemory]],
+) -> dict[str, list[CognitiveMemory]]:
+    """
+    Copy retrieval results so that callers cannot modify cached entries.
+
+    Memories are copied along with their metadata, dimensions and tags.
+    Embedding arrays are shared and must not be modified in place.
+
+    Args:
+        results: Retrieval results by memory type
+
+    Returns:
+        Results with copied lists and memories
+    """
+    copied: dict[str, list[CognitiveMemory]] = {}
+    for memory_type, memories in results.items():
+        copied[memory_type] = []
+        for memory in memories:
+            memory_copy = copy.copy(memory)
+            memory_copy.metadata = dict(memory.metadata)
+            memory_copy.dimensions = dict(memory.dimensions)
+            if memory.tags is not None:
+                memory_copy.tags = list(memory.tags)
+            copied[memory_type].append(memory_copy)
+    return copied
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize query text for cache lookups.
+
+    Runs of whitespace are collapsed, which does not change tokenization.
+    Case is preserved because embedding models may be case sensitive.
+
+    Args:
+        query: Raw query text
+
+    Returns:
+        Normalized query text
+    """
+    return " ".join(query.split())
+
+
+class QueryCache:
+    """
+    Thread-safe LRU caches for recall results and query embeddings.
+
+    Result entries are tagged with the generation they were computed at and
+    are only served while the caller's current generation matches. Bumping
+    the local generation with ``invalidate`` drops all results at once.
+    Entries also keep the connection traversal of the recall and the memories
+    it retrieved from storage, so a cache hit can record the same connection
+    activations and memory accesses as the original recall.
+    """
+
+    def __init__(self, max_results: int = 256, max_embeddings: int = 1024) -> None:
+        """
+        Initialize the caches.
+
+        Args:
+            max_results: Maximum number of cached results, 0 disables the cache
+            max_embeddings: Maximum number of cached query embeddings, 0
+                disables the cache
+        """
+        self.max_results = max(0, max_results)
+        self.max_embeddings = max(0, max_embeddings)
+
+        self._results: OrderedDict[
+            ResultKey,
+            tuple[
+                Hashable,
+                dict[str, list[CognitiveMemory]],
+                float,
+                ConnectionTraversal | None,
+                tuple[str, ...],
+            ],
+        ] = OrderedDict()
+        self._embeddings: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+        self.result_hits = 0
+        self.result_misses = 0
+        self.embedding_hits = 0
+        self.embedding_misses = 0
+        self.invalidations = 0
+        self.time_saved = 0.0
+
+    @property
+    def generation(self) -> int:
+        """Local generation counter, bumped by every invalidation."""
+        return self._generation
+
+    @staticmethod
+    def make_key(query: str, types: list[str], max_results: int) -> ResultKey:
+        """Build the result cache key for a recall request."""
+        return (normalize_query(query), tuple(sorted(types)), max_results)
+
+    def get_results(self, key: ResultKey, generation: Hashable) -> CachedRecall | None:
+        """
+        Look up cached results computed at the given generation.
+
+        Args:
+            key: Key from make_key
+            generation: Current generation of the stored memories
+
+        Returns:
+            Copy of the cached results (see copy_results), the connection
+            traversal of the original recall and the IDs of the memories it
+            retrieved from storage, or None on a miss
+        """
+        if not self.max_results:
+            return None
+
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None or entry[0] != generation:
+                if entry is not None:
+                    del self._results[key]
+                self.result_misses += 1
+                return None
+
+            self._results.move_to_end(key)
+            self.result_hits += 1
+            self.time_saved += entry[2]
+            return copy_results(entry[1]), entry[3], entry[4]
+
+    def put_results(
+        self,
+        key: ResultKey,
+        generation: Hashable,
+        results: dict[str, list[CognitiveMemory]],
+        elapsed: float,
+        traversal: ConnectionTraversal | None = None,
+        accessed_ids: tuple[str, ...] = (),
+    ) -> None:
+        """
+        Cache results computed at the given generation.
+
+        Args:
+            key: Key from make_key
+            generation: Generation the results were computed at
+            results: Retrieval results
+            elapsed: Seconds it took to compute the results
+            traversal: Connection traversal to replay on cache hits
+            accessed_ids: Memories retrieved from storage, whose accesses
+                are counted again on cache hits
+        """
+        if not self.max_results:
+            return
+
+        with self._lock:
+            self._results[key] = (
+                generation,
+                copy_results(results),
+                elapsed,
+                traversal,
+                accessed_ids,
+            )
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_results:
+                self._results.popitem(last=False)
+
+    def get_embedding(self, query: str) -> np.ndarray | None:
+        """Get a cached query embedding, or None on a miss."""
+        if not self.max_embeddings:
+            return None
+
+        key = normalize_query(query)
+        with self._lock:
+            embedding = self._embeddings.get(key)
+            if embedding is None:
+                self.embedding_misses += 1
+                return None
+
+            self._embeddings.move_to_end(key)
+            self.embedding_hits += 1
+            return embedding
+
+    def put_embedding(self, query: str, embedding: np.ndarray) -> None:
+        """Cache a query embedding."""
+        if not self.max_embeddings:
+            return
+
+        key = normalize_query(query)
+        with self._lock:
+            self._embeddings[key] = embedding
+            self._embeddings.move_to_end(key)
+            while len(self._embeddings) > self.max_embeddings:
+                self._embeddings.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop all cached results after memories were written or deleted."""
+        with self._lock:
+            self._generation += 1
+            self._results.clear()
+            self.invalidations += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache usage statistics.
+
+        Returns:
+            Dictionary with entry counts, hit rates and the retrieval time
+            saved by result cache hits
+        """
+        with self._lock:
+            result_lookups = self.result_hits + self.result_misses
+            embedding_lookups = self.embedding_hits + self.embedding_misses
+            return {
+                "result_entries": len(self._results),
+                "result_hits": self.result_hits,
+                "result_misses": self.result_misses,
+                "result_hit_rate": (
+                    self.result_hits / result_lookups if result_lookups else 0.0
+                ),
+                "embedding_entries": len(self._embeddings),
+                "embedding_hits": self.embedding_hits,
+                "embedding_misses": self.embedding_misses,
+                "embedding_hit_rate": (
+                    self.embedding_hits / embedding_lookups
+                    if embedding_lookups
+                    else 0.0
+                ),
+                "invalidations": self.invalidations,
+                "time_saved_seconds": self.time_saved,
+            }
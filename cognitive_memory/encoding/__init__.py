@@ -19,6 +19,11 @@ from .dimensions import (
     SocialExtractor,
     TemporalExtractor,
 )
+from .embedding_cache import (
+    CachedEmbeddingProvider,
+    EmbeddingCache,
+    create_cached_provider,
+)
 from .sentence_bert import SentenceBERTProvider, create_sentence_bert_provider
 
 __all__ = [
@@ -36,4 +41,8 @@ __all__ = [
     # Semantic embeddings
     "SentenceBERTProvider",
     "create_sentence_bert_provider",
+    # Embedding cache
+    "EmbeddingCache",
+    "CachedEmbeddingProvider",
+    "create_cached_provider",
 ]
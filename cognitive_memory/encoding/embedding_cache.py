@@ -0,0 +1,425 @@
+"""
+Persistent content-addressed cache for semantic embeddings.
+
+This module provides a SQLite-backed embedding cache keyed by a hash of the
+model name and normalized text, plus an EmbeddingProvider wrapper that
+consults the cache before running the underlying model. Unchanged content
+(for example chunks of a markdown file that is reloaded after an edit
+elsewhere in the file) is served from disk instead of being re-embedded.
+"""
+
+import atexit
+import hashlib
+import sqlite3
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+from ..core.interfaces import EmbeddingProvider
+from ..storage.sqlite_persistence import iter_in_chunks
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed embedding store with size-bounded LRU eviction.
+
+    Vectors are stored as raw float32 blobs. Lookups record access times in
+    memory; they are written in one batch before the next eviction, on close
+    or interpreter exit, or at most once per ``access_flush_interval``
+    seconds, so reads do not commit a write each. The least recently used
+    entries are evicted once the cache grows beyond ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        max_entries: int = 100_000,
+        access_flush_interval: float = 300.0,
+    ) -> None:
+        """
+        Initialize the embedding cache.
+
+        Args:
+            db_path: Path to the SQLite cache file
+            max_entries: Maximum number of cached vectors before eviction
+            access_flush_interval: Seconds between writes of access times
+                recorded by lookups
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max(1, max_entries)
+        self.access_flush_interval = access_flush_interval
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._pending_access: dict[str, float] = {}
+        self._last_access_flush = time.monotonic()
+        self._conn = sqlite3.connect(
+            str(self.db_path), timeout=30.0, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                key TEXT PRIMARY KEY,
+                dimension INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                last_accessed REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_embedding_cache_accessed "
+            "ON embedding_cache (last_accessed)"
+        )
+        self._conn.commit()
+        self._closed = False
+
+        # The exit hook holds a weak reference so an unused cache can still
+        # be garbage collected
+        atexit.register(_close_cache_at_exit, weakref.ref(self))
+
+        logger.debug(
+            "Embedding cache initialized",
+            db_path=str(self.db_path),
+            max_entries=self.max_entries,
+        )
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """Collapse whitespace runs so formatting-only edits share a key."""
+        return " ".join(text.split())
+
+    @classmethod
+    def make_key(cls, model_name: str, text: str) -> str:
+        """Build the content-addressed cache key for a model and text."""
+        payload = f"{model_name}\x00{cls.normalize_text(text)}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: list[str]) -> dict[str, np.ndarray]:
+        """
+        Look up cached vectors and record their access time.
+
+        Args:
+            keys: Cache keys to look up
+
+        Returns:
+            Mapping of found keys to float32 vectors
+        """
+        if not keys:
+            return {}
+
+        unique_keys = list(dict.fromkeys(keys))
+        found: dict[str, np.ndarray] = {}
+
+        with self._lock:
+            for chunk, placeholders in iter_in_chunks(unique_keys):
+                rows = self._conn.execute(
+                    f"SELECT key, dimension, vector FROM embedding_cache "
+                    f"WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+
+                for key, dimension, blob in rows:
+                    vector = np.frombuffer(blob, dtype="<f4")
+                    if vector.shape[0] == dimension:
+                        found[key] = vector.astype(np.float32)
+
+            if found:
+                now = time.time()
+                self._pending_access.update(dict.fromkeys(found, now))
+                if (
+                    time.monotonic() - self._last_access_flush
+                    >= self.access_flush_interval
+                ):
+                    self._flush_access_times()
+                    self._conn.commit()
+
+            self.hits += len(found)
+            self.misses += len(unique_keys) - len(found)
+
+        return found
+
+    def put_many(self, entries: dict[str, np.ndarray]) -> None:
+        """
+        Store vectors in the cache, evicting least recently used entries.
+
+        Args:
+            entries: Mapping of cache keys to embedding vectors
+        """
+        if not entries:
+            return
+
+        now = time.time()
+        rows = [
+            (
+                key,
+                int(vector.shape[-1]),
+                np.ascontiguousarray(vector, dtype="<f4").tobytes(),
+                now,
+            )
+            for key, vector in entries.items()
+        ]
+
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT OR REPLACE INTO embedding_cache (
+                    key, dimension, vector, last_accessed
+                ) VALUES (?, ?, ?, ?)
+            """,
+                rows,
+            )
+            self._flush_access_times()
+            self._evict_if_needed()
+            self._conn.commit()
+
+    def _flush_access_times(self) -> None:
+        """Write access times recorded by lookups, without committing."""
+        self._last_access_flush = time.monotonic()
+        if not self._pending_access:
+            return
+
+        self._conn.executemany(
+            "UPDATE embedding_cache SET last_accessed = MAX(last_accessed, ?) "
+            "WHERE key = ?",
+            [(accessed, key) for key, accessed in self._pending_access.items()],
+        )
+        self._pending_access.clear()
+
+    def _evict_if_needed(self) -> None:
+        """Evict least recently used entries beyond ``max_entries``."""
+        count = self._conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow <= 0:
+            return
+
+        self._conn.execute(
+            """
+            DELETE FROM embedding_cache WHERE key IN (
+                SELECT key FROM embedding_cache
+                ORDER BY last_accessed ASC
+                LIMIT ?
+            )
+        """,
+            (overflow,),
+        )
+        self.evictions += overflow
+
+        logger.debug("Evicted embedding cache entries", count=overflow)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache size and hit/miss counters."""
+        with self._lock:
+            entries = self._conn.execute(
+                "SELECT COUNT(*) FROM embedding_cache"
+            ).fetchone()[0]
+
+        lookups = self.hits + self.misses
+        return {
+            "db_path": str(self.db_path),
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Remove all cached vectors."""
+        with self._lock:
+            self._pending_access.clear()
+            self._conn.execute("DELETE FROM embedding_cache")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Write pending access times and close the database connection."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            try:
+                self._flush_access_times()
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(
+                    "Failed to write embedding cache access times", error=str(e)
+                )
+            self._conn.close()
+
+
+def _close_cache_at_exit(cache_ref: "weakref.ref[EmbeddingCache]") -> None:
+    """Write a cache's pending access times at interpreter exit."""
+    cache = cache_ref()
+    if cache is not None:
+        cache.close()
+
+
+class CachedEmbeddingProvider(EmbeddingProvider):
+    """
+    EmbeddingProvider wrapper that serves repeated content from an EmbeddingCache.
+
+    Only texts missing from the cache are passed to the wrapped provider, and
+    misses within a batch are encoded together in a single call. Attributes
+    not defined here are delegated to the wrapped provider.
+    """
+
+    def __init__(
+        self,
+        provider: EmbeddingProvider,
+        cache: EmbeddingCache,
+        model_name: str | None = None,
+    ) -> None:
+        """
+        Initialize the caching wrapper.
+
+        Args:
+            provider: Embedding provider used for cache misses
+            cache: Cache to read from and write to
+            model_name: Model identifier used in cache keys. If None, taken
+                from the provider's model info.
+        """
+        self.provider = provider
+        self.cache = cache
+        self.model_name = model_name or self._resolve_model_name(provider)
+
+    @staticmethod
+    def _resolve_model_name(provider: EmbeddingProvider) -> str:
+        """Determine a stable model identifier for cache keys."""
+        if hasattr(provider, "get_model_info"):
+            try:
+                return str(provider.get_model_info()["model_name"])
+            except Exception:
+                pass
+        return str(getattr(provider, "model_name", type(provider).__name__))
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate unknown attributes to the wrapped provider."""
+        if name == "provider":
+            raise AttributeError(name)
+        return getattr(self.provider, name)
+
+    def encode(self, text: str) -> np.ndarray:
+        """
+        Encode a single text, using the cache when possible.
+
+        Args:
+            text: Input text to encode
+
+        Returns:
+            np.ndarray: Semantic embedding vector
+        """
+        if not text or not text.strip():
+            return self.provider.encode(text)
+
+        key = self.cache.make_key(self.model_name, text)
+        cached = self.cache.get_many([key])
+        if key in cached:
+            return cached[key]
+
+        embedding = self.provider.encode(text)
+        self._store({key: embedding})
+        return embedding
+
+    def encode_batch(self, texts: list[str]) -> np.ndarray:
+        """
+        Encode multiple texts, running the model only for cache misses.
+
+        Args:
+            texts: List of input texts to encode
+
+        Returns:
+            np.ndarray: Batch of semantic embedding vectors in input order
+        """
+        if not texts:
+            return self.provider.encode_batch(texts)
+
+        keys = [
+            (
+                self.cache.make_key(self.model_name, text)
+                if text and text.strip()
+                else None
+            )
+            for text in texts
+        ]
+        found = self.cache.get_many([key for key in keys if key is not None])
+
+        # Encode each distinct missing key once
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key is not None and key not in found and key not in missing:
+                missing[key] = text
+
+        if missing:
+            encoded = self.provider.encode_batch(list(missing.values()))
+            new_entries = dict(zip(missing, encoded, strict=True))
+            found.update(new_entries)
+            self._store(new_entries)
+
+        dimension = self._get_dimension(found)
+        embeddings = np.zeros((len(texts), dimension), dtype=np.float32)
+        for i, key in enumerate(keys):
+            if key is not None:
+                embeddings[i] = found[key]
+
+        return embeddings
+
+    def _store(self, entries: dict[str, np.ndarray]) -> None:
+        """Cache embeddings, skipping the provider's zero-vector failure fallback."""
+        valid = {key: vector for key, vector in entries.items() if np.any(vector)}
+        if not valid:
+            return
+        try:
+            self.cache.put_many(valid)
+        except Exception as e:
+            logger.warning("Failed to write embedding cache entries", error=str(e))
+
+    def _get_dimension(self, found: dict[str, np.ndarray]) -> int:
+        """Get the embedding dimension from results or the wrapped provider."""
+        if found:
+            return int(next(iter(found.values())).shape[-1])
+        if hasattr(self.provider, "get_embedding_dimension"):
+            return int(self.provider.get_embedding_dimension())
+        return int(self.provider.encode_batch([""]).shape[-1])
+
+    def get_model_info(self) -> dict[str, Any]:
+        """Get information about the wrapped model and cache statistics."""
+        info: dict[str, Any] = {}
+        if hasattr(self.provider, "get_model_info"):
+            info = dict(self.provider.get_model_info())
+        info["embedding_cache"] = self.cache.get_stats()
+        return info
+
+    def close(self) -> None:
+        """Close the cache, writing pending access times, and the provider."""
+        self.cache.close()
+        if hasattr(self.provider, "close"):
+            self.provider.close()
+
+
+def create_cached_provider(
+    provider: EmbeddingProvider,
+    cache_path: str | Path,
+    max_entries: int = 100_000,
+) -> CachedEmbeddingProvider:
+    """
+    Factory function to wrap a provider with a persistent embedding cache.
+
+    Args:
+        provider: Embedding provider to wrap
+        cache_path: Path to the SQLite cache file
+        max_entries: Maximum number of cached vectors
+
+    Returns:
+        CachedEmbeddingProvider: Provider that consults the cache first
+    """
+    cache = EmbeddingCache(cache_path, max_entries=max_entries)
+    return CachedEmbeddingProvider(provider, cache)
@@ -118,6 +118,10 @@ class ONNXEmbeddingProvider(EmbeddingProvider):
             self.max_length = config["max_length"]
             self.embedding_dimension = int(config["embedding_dimension"])
 
+            # Batching behaviour comes from the environment, not the model config
+            self.batch_size = max(1, self.embedding_config.batch_size)
+            self.dynamic_padding = self.embedding_config.dynamic_padding
+
             logger.debug("Model configuration loaded", config=config)
 
         except Exception as e:
@@ -161,12 +165,41 @@ class ONNXEmbeddingProvider(EmbeddingProvider):
 
             self.tokenizer = Tokenizer.from_file(str(tokenizer_file))
 
+            # Padding is applied by the provider so batches can be length-bucketed
+            self.tokenizer.no_padding()
+
             logger.debug("Tokenizer loaded successfully")
 
         except Exception as e:
             logger.error("Failed to load tokenizer", error=str(e))
             raise
 
+    def _truncate_ids(self, input_ids: list[int]) -> list[int]:
+        """Truncate token IDs to the model's maximum sequence length."""
+        return input_ids[: self.max_length]
+
+    def _pad_batch(
+        self, id_lists: list[list[int]], pad_to: int
+    ) -> dict[str, np.ndarray]:
+        """
+        Pad token ID lists to a common length and build attention masks.
+
+        Args:
+            id_lists: Truncated token ID lists
+            pad_to: Target sequence length for every row
+
+        Returns:
+            Dictionary with input_ids and attention_mask as numpy arrays
+        """
+        input_ids = np.zeros((len(id_lists), pad_to), dtype=np.int64)
+        attention_mask = np.zeros((len(id_lists), pad_to), dtype=np.int64)
+
+        for row, ids in enumerate(id_lists):
+            input_ids[row, : len(ids)] = ids  # 0 is typically the pad token
+            attention_mask[row, : len(ids)] = 1
+
+        return {"input_ids": input_ids, "attention_mask": attention_mask}
+
     def _tokenize_text(self, text: str) -> dict[str, np.ndarray]:
         """
         Tokenize text using the loaded tokenizer.
@@ -177,26 +210,12 @@ class ONNXEmbeddingProvider(EmbeddingProvider):
         Returns:
             Dictionary with input_ids and attention_mask as numpy arrays
         """
-        # Tokenize the text
-        encoding = self.tokenizer.encode(text)
+        input_ids = self._truncate_ids(self.tokenizer.encode(text).ids)
 
-        # Get token IDs and create attention mask
-        input_ids = encoding.ids
-        attention_mask = [1] * len(input_ids)
+        # A single sequence never needs padding when dynamic padding is enabled
+        pad_to = len(input_ids) if self.dynamic_padding else self.max_length
 
-        # Pad or truncate to max_length
-        if len(input_ids) > self.max_length:
-            input_ids = input_ids[: self.max_length]
-            attention_mask = attention_mask[: self.max_length]
-        else:
-            padding_length = self.max_length - len(input_ids)
-            input_ids.extend([0] * padding_length)  # 0 is typically the pad token
-            attention_mask.extend([0] * padding_length)
-
-        return {
-            "input_ids": np.array([input_ids], dtype=np.int64),
-            "attention_mask": np.array([attention_mask], dtype=np.int64),
-        }
+        return self._pad_batch([input_ids], pad_to)
 
     def _tokenize_batch(self, texts: list[str]) -> dict[str, np.ndarray]:
         """
@@ -208,31 +227,49 @@ class ONNXEmbeddingProvider(EmbeddingProvider):
         Returns:
             Dictionary with input_ids and attention_mask as numpy arrays
         """
-        all_input_ids = []
-        all_attention_masks = []
-
-        for text in texts:
-            # Tokenize individual text
-            encoding = self.tokenizer.encode(text)
-            input_ids = encoding.ids
-            attention_mask = [1] * len(input_ids)
-
-            # Pad or truncate to max_length
-            if len(input_ids) > self.max_length:
-                input_ids = input_ids[: self.max_length]
-                attention_mask = attention_mask[: self.max_length]
-            else:
-                padding_length = self.max_length - len(input_ids)
-                input_ids.extend([0] * padding_length)
-                attention_mask.extend([0] * padding_length)
+        id_lists = [
+            self._truncate_ids(self.tokenizer.encode(text).ids) for text in texts
+        ]
 
-            all_input_ids.append(input_ids)
-            all_attention_masks.append(attention_mask)
+        if self.dynamic_padding:
+            pad_to = max(len(ids) for ids in id_lists)
+        else:
+            pad_to = self.max_length
 
-        return {
-            "input_ids": np.array(all_input_ids, dtype=np.int64),
-            "attention_mask": np.array(all_attention_masks, dtype=np.int64),
-        }
+        return self._pad_batch(id_lists, pad_to)
+
+    def _encode_bucketed(self, texts: list[str]) -> np.ndarray:
+        """
+        Encode texts in length buckets, padding each bucket to its longest member.
+
+        Texts are sorted by token count and split into buckets of
+        ``batch_size`` so short inputs are never padded up to long ones.
+        Embeddings are returned in the original input order. Mean pooling
+        in the model ignores padded positions, so results match full padding.
+
+        Args:
+            texts: Non-empty, stripped input texts
+
+        Returns:
+            np.ndarray: Embeddings aligned with ``texts``
+        """
+        id_lists = [
+            self._truncate_ids(enc.ids) for enc in self.tokenizer.encode_batch(texts)
+        ]
+        order = sorted(range(len(id_lists)), key=lambda i: len(id_lists[i]))
+
+        embeddings = np.zeros((len(texts), self.embedding_dimension), dtype=np.float32)
+
+        for start in range(0, len(order), self.batch_size):
+            bucket = order[start : start + self.batch_size]
+            bucket_ids = [id_lists[i] for i in bucket]
+            tokens = self._pad_batch(bucket_ids, len(bucket_ids[-1]))
+
+            embeddings[bucket] = self._run_inference(
+                tokens["input_ids"], tokens["attention_mask"]
+            )
+
+        return embeddings
 
     def _run_inference(
         self, input_ids: np.ndarray, attention_mask: np.ndarray
@@ -335,13 +372,17 @@ class ONNXEmbeddingProvider(EmbeddingProvider):
             return np.zeros((len(texts), self.embedding_dimension), dtype=np.float32)
 
         try:
-            # Tokenize the batch
-            tokens = self._tokenize_batch(filtered_texts)
+            if self.dynamic_padding:
+                # Group by length so each inference call pads minimally
+                embeddings = self._encode_bucketed(filtered_texts)
+            else:
+                # Tokenize the batch
+                tokens = self._tokenize_batch(filtered_texts)
 
-            # Run ONNX inference
-            embeddings = self._run_inference(
-                tokens["input_ids"], tokens["attention_mask"]
-            )
+                # Run ONNX inference
+                embeddings = self._run_inference(
+                    tokens["input_ids"], tokens["attention_mask"]
+                )
 
             # If we had empty texts, we need to reconstruct the full batch
             if len(valid_indices) != len(texts):
@@ -381,6 +422,8 @@ class ONNXEmbeddingProvider(EmbeddingProvider):
             "model_name": self.model_name,
             "embedding_dimension": self.embedding_dimension,
             "max_sequence_length": self.max_length,
+            "batch_size": self.batch_size,
+            "dynamic_padding": self.dynamic_padding,
             "model_path": str(self.model_path),
             "tokenizer_path": str(self.tokenizer_path),
             "onnx_providers": self.ort_session.get_providers(),
@@ -6,7 +6,11 @@ with proper dependency injection and validation. Supports default configurations
 test overrides, and configuration-driven component selection.
 """
 
+import hashlib
+import json
 import os
+import time
+from pathlib import Path
 from typing import Any, cast
 
 from loguru import logger
@@ -22,6 +26,7 @@ from .core.interfaces import (
     VectorStorage,
 )
 from .core.logging_setup import setup_logging
+from .core.version import get_version_string
 
 # Global flag to track logging configuration
 _logging_configured = False
@@ -38,12 +43,15 @@ def create_default_system(config: SystemConfig | None = None) -> CognitiveMemory
     Create system with default implementations and sensible defaults.
 
     Uses the most stable and well-tested implementations for production use:
-    - SentenceBERTProvider for embeddings
+    - SentenceBERTProvider for embeddings, wrapped in a persistent embedding cache
     - HierarchicalMemoryStorage for vector storage
     - MemoryMetadataStore and ConnectionGraphStore for persistence
     - BasicActivationEngine for memory activation
     - CognitiveDimensionExtractor for multi-dimensional encoding
 
+    The embedding model and the Qdrant connection are built on first use, so
+    commands that need neither do not pay for loading them.
+
     Args:
         config: Optional system configuration. If None, loads from environment.
 
@@ -71,16 +79,34 @@ def create_default_system(config: SystemConfig | None = None) -> CognitiveMemory
 
     try:
         # Import factory functions
-        from .encoding.sentence_bert import create_sentence_bert_provider
+        from .core.lazy import LazyEmbeddingProvider, LazyVectorStorage
         from .retrieval.basic_activation import BasicActivationEngine
-        from .storage.qdrant_storage import create_hierarchical_storage
         from .storage.sqlite_persistence import create_sqlite_persistence
 
-        # Create embedding provider
-        embedding_provider = create_sentence_bert_provider(
-            model_name=config.embedding.model_name
+        # Create embedding provider, loading the model on the first encode
+        def build_embedding_provider() -> EmbeddingProvider:
+            from .encoding.sentence_bert import create_sentence_bert_provider
+
+            return create_sentence_bert_provider(model_name=config.embedding.model_name)
+
+        model_path = _default_model_path(config.embedding.model_name)
+        embedding_provider: EmbeddingProvider = LazyEmbeddingProvider(
+            build_embedding_provider,
+            model_name=_model_config_name(model_path, config.embedding.model_name),
+            embedding_dimension=config.embedding.embedding_dimension,
+            model_path=model_path,
         )
 
+        # Serve previously embedded content from the persistent cache
+        if config.embedding.cache_enabled:
+            from .encoding.embedding_cache import create_cached_provider
+
+            embedding_provider = create_cached_provider(
+                embedding_provider,
+                cache_path=config.embedding.get_cache_path(),
+                max_entries=config.embedding.cache_max_entries,
+            )
+
         # Validate embedding provider
         if not isinstance(embedding_provider, EmbeddingProvider):
             raise InitializationError(
@@ -95,13 +121,22 @@ def create_default_system(config: SystemConfig | None = None) -> CognitiveMemory
         host = parsed_url.hostname or "localhost"
         port = parsed_url.port or 6333
 
-        vector_storage = create_hierarchical_storage(
-            vector_size=config.embedding.embedding_dimension,
-            project_id=config.project_id,
-            host=host,
-            port=port,
-            prefer_grpc=config.qdrant.prefer_grpc,
-        )
+        def build_vector_storage() -> VectorStorage:
+            from .storage.qdrant_storage import create_hierarchical_storage
+
+            return create_hierarchical_storage(
+                vector_size=config.embedding.embedding_dimension,
+                project_id=config.project_id,
+                host=host,
+                port=port,
+                prefer_grpc=config.qdrant.prefer_grpc,
+                upsert_batch_size=config.qdrant.upsert_batch_size,
+                upsert_parallel=config.qdrant.upsert_parallel,
+                upsert_wait=config.qdrant.upsert_wait,
+            )
+
+        # Connect to Qdrant on first use
+        vector_storage: VectorStorage = LazyVectorStorage(build_vector_storage)
 
         # Validate vector storage
         if not isinstance(vector_storage, VectorStorage):
@@ -111,7 +146,9 @@ def create_default_system(config: SystemConfig | None = None) -> CognitiveMemory
 
         # Create memory and connection storage
         memory_storage, connection_graph = create_sqlite_persistence(
-            db_path=config.database.path
+            db_path=config.database.path,
+            mmap_size=config.database.mmap_size,
+            statement_cache_size=config.database.statement_cache_size,
         )
 
         # Validate storage components
@@ -367,3 +404,203 @@ def validate_system_health(
     logger.info("System health check completed", healthy=health_status["healthy"])
 
     return health_status
+
+
+def check_system_reachability(system: CognitiveSystem) -> dict[str, Any]:
+    """
+    Check that the components of a system are reachable without touching memories.
+
+    Opens a read connection to SQLite, verifies that the project's Qdrant
+    collections exist and that the embedding model file is present. None of
+    these checks encode text or write to storage.
+
+    Args:
+        system: CognitiveSystem instance to check
+
+    Returns:
+        Dict with health check results in the format of validate_system_health
+    """
+    health_status: dict[str, Any] = {"healthy": True, "checks": {}, "errors": []}
+
+    def fail(check: str, message: str) -> None:
+        health_status["healthy"] = False
+        health_status["checks"][check] = f"✗ {message}"
+        health_status["errors"].append(message)
+
+    memory_storage = getattr(system, "memory_storage", None)
+    db_manager = getattr(memory_storage, "db_manager", None)
+    if db_manager is not None:
+        try:
+            with db_manager.get_read_connection() as conn:
+                conn.execute("SELECT 1").fetchone()
+            health_status["checks"]["database"] = "✓ SQLite database reachable"
+        except Exception as e:
+            fail("database", f"SQLite database unreachable: {e}")
+
+    vector_storage = getattr(system, "vector_storage", None)
+    config = getattr(system, "config", None)
+    if getattr(vector_storage, "loaded", None) is False and config is not None:
+        # Connecting would create the collections, so only probe the server
+        try:
+            _probe_qdrant(config)
+            health_status["checks"]["vector_storage"] = "✓ Qdrant server reachable"
+        except Exception as e:
+            fail("vector_storage", f"Qdrant unreachable: {e}")
+
+    collection_manager = (
+        getattr(vector_storage, "collection_manager", None)
+        if getattr(vector_storage, "loaded", None) is not False
+        else None
+    )
+    if collection_manager is not None:
+        try:
+            existing = set(collection_manager.list_project_collections())
+            missing = [
+                name
+                for name in (
+                    collection_manager.get_collection_name(level) for level in (0, 1, 2)
+                )
+                if name not in existing
+            ]
+            if missing:
+                fail("vector_storage", f"Qdrant collections missing: {missing}")
+            else:
+                health_status["checks"]["vector_storage"] = (
+                    "✓ Qdrant collections present"
+                )
+        except Exception as e:
+            fail("vector_storage", f"Qdrant unreachable: {e}")
+
+    model_path = _find_model_path(getattr(system, "embedding_provider", None))
+    if model_path is not None:
+        if os.path.exists(model_path):
+            health_status["checks"]["embedding_model"] = "✓ Embedding model present"
+        else:
+            fail("embedding_model", f"Embedding model file missing: {model_path}")
+
+    return health_status
+
+
+def _probe_qdrant(config: SystemConfig) -> None:
+    """Check that the Qdrant server answers without creating a client."""
+    import urllib.request
+
+    request = urllib.request.Request(f"{config.qdrant.url.rstrip('/')}/collections")
+    if config.qdrant.api_key:
+        request.add_header("api-key", config.qdrant.api_key)
+    with urllib.request.urlopen(request, timeout=min(config.qdrant.timeout, 5)):
+        pass
+
+
+def _find_model_path(provider: Any) -> str | os.PathLike[str] | None:
+    """Find the model file of an embedding provider, unwrapping cache wrappers."""
+    for _ in range(3):
+        model_path = getattr(provider, "model_path", None)
+        if isinstance(model_path, str | os.PathLike):
+            return model_path
+        if getattr(provider, "loaded", None) is False:
+            # Unwrapping a lazy provider would load the model
+            return None
+        provider = getattr(provider, "onnx_provider", None) or getattr(
+            provider, "provider", None
+        )
+    return None
+
+
+def _default_model_path(model_name: str) -> Path | None:
+    """Get the ONNX model file the embedding provider loads by default."""
+    try:
+        from heimdall.cognitive_system.data_dirs import get_models_data_dir
+    except ImportError:
+        return None
+    return get_models_data_dir() / f"{model_name}.onnx"
+
+
+def _model_config_name(model_path: Path | None, default: str) -> str:
+    """
+    Read the model name the provider will report from the model config.
+
+    The name is part of the embedding cache keys, so it must match what the
+    loaded provider reports even while the model is not loaded yet.
+    """
+    if model_path is None:
+        return default
+    try:
+        with open(model_path.parent / "model_config.json") as f:
+            return str(json.load(f)["model_name"])
+    except (OSError, ValueError, KeyError):
+        return default
+
+
+def _health_check_marker_path(config: SystemConfig) -> Path:
+    """Get the file recording the last successful deep health check."""
+    return Path(config.database.path).parent / "health_check.json"
+
+
+def _health_check_fingerprint(config: SystemConfig) -> str:
+    """Identify the components a deep health check was run against."""
+    parts = [
+        get_version_string(),
+        config.project_id,
+        str(Path(config.database.path).resolve()),
+        config.qdrant.url,
+        config.embedding.model_name,
+    ]
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def validate_startup_health(system: CognitiveMemorySystem) -> dict[str, Any]:
+    """
+    Perform the health check configured for system startup.
+
+    Depending on ``config.health_check_mode``:
+
+    - ``"deep"``: always run validate_system_health
+    - ``"fast"``: only run check_system_reachability
+    - ``"cached"``: run check_system_reachability, and the deep check only if
+      no successful deep check against the same components was recorded
+      within ``config.health_check_ttl_seconds``
+
+    Args:
+        system: System to validate
+
+    Returns:
+        Dict with health check results in the format of validate_system_health
+    """
+    config = system.config
+    if config.health_check_mode == "deep":
+        return validate_system_health(system)
+
+    health_status = check_system_reachability(system)
+    if not health_status["healthy"] or config.health_check_mode == "fast":
+        return health_status
+
+    marker_path = _health_check_marker_path(config)
+    fingerprint = _health_check_fingerprint(config)
+    try:
+        marker = json.loads(marker_path.read_text())
+        age = time.time() - float(marker["checked_at"])
+        if marker["fingerprint"] == fingerprint and 0 <= age < (
+            config.health_check_ttl_seconds
+        ):
+            health_status["checks"]["deep"] = (
+                f"✓ Deep health check passed {int(age)}s ago"
+            )
+            return health_status
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    deep_status = validate_system_health(system)
+    health_status["healthy"] = deep_status["healthy"]
+    health_status["checks"].update(deep_status["checks"])
+    health_status["errors"].extend(deep_status["errors"])
+
+    if deep_status["healthy"]:
+        try:
+            marker_path.write_text(
+                json.dumps({"checked_at": time.time(), "fingerprint": fingerprint})
+            )
+        except OSError as e:
+            logger.debug("Failed to record deep health check", error=str(e))
+
+    return health_status
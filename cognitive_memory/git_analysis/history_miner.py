@@ -10,9 +10,14 @@ Security Features:
 - Comprehensive error handling and logging
 - Resource cleanup and connection management
 - Input validation for all git data
+
+History is extracted in bulk by default: a single ``git log`` run through
+GitPython's command interface streams the metadata and file changes of all
+commits, instead of one diff and one stats subprocess per commit.
 """
 
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -36,6 +41,101 @@ from .security import (
     validate_repository_path,
 )
 
+# Separators of the git log header fields; commit messages never contain NUL,
+# which separates everything else in ``-z`` output
+_RECORD_START = "\x1e"
+_FIELD_SEPARATOR = "\x1f"
+_LOG_FORMAT = _RECORD_START + _FIELD_SEPARATOR.join(
+    ["%H", "%P", "%an", "%ae", "%ct", "%B", ""]
+)
+
+# Bytes read from the git log process at a time
+_LOG_READ_SIZE = 1 << 20
+
+
+@dataclass
+class _LogRecord:
+    """Fields of one commit parsed from git log output."""
+
+    hash: str
+    parent_hashes: list[str]
+    author_name: str
+    author_email: str
+    timestamp: datetime
+    message: str
+    # Change type and line counts by file path, in diff order
+    changes: dict[str, list[Any]] = field(default_factory=dict)
+
+
+def _split_nul(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Split a stream of byte chunks into decoded NUL-terminated tokens."""
+    pending = b""
+    for chunk in chunks:
+        pending += chunk
+        *tokens, pending = pending.split(b"\0")
+        for token in tokens:
+            yield token.decode("utf-8", errors="replace")
+    if pending:
+        yield pending.decode("utf-8", errors="replace")
+
+
+def _parse_log_records(tokens: Iterable[str]) -> Iterator[_LogRecord]:
+    """
+    Parse ``git log -z --raw --numstat`` output with the ``_LOG_FORMAT`` header.
+
+    Each commit is a header token followed by raw entries (``:<modes>
+    <blobs> <status>`` then one path, or source and destination path for
+    renames and copies) and numstat entries (``<added>\\t<deleted>\\t<path>``,
+    or an empty path followed by source and destination path).
+
+    Args:
+        tokens: NUL-separated tokens of the git log output
+
+    Yields:
+        One record per commit, in log order
+    """
+    record: _LogRecord | None = None
+    token_iter = iter(tokens)
+
+    for token in token_iter:
+        token = token.lstrip("\n")
+        if not token:
+            continue
+
+        if token.startswith(_RECORD_START):
+            if record is not None:
+                yield record
+            fields = token[1:].split(_FIELD_SEPARATOR)
+            commit_hash, parents, author_name, author_email, committed = fields[:5]
+            record = _LogRecord(
+                hash=commit_hash,
+                parent_hashes=parents.split(),
+                author_name=author_name,
+                author_email=author_email,
+                timestamp=datetime.fromtimestamp(int(committed)),
+                message=_FIELD_SEPARATOR.join(fields[5:-1]).strip(),
+            )
+        elif record is None:
+            raise ValueError("Unexpected git log output before first commit")
+        elif token.startswith(":"):
+            status = token.rsplit(" ", 1)[-1]
+            file_path = next(token_iter)
+            if status[0] in "RC":
+                file_path = next(token_iter)
+            record.changes.setdefault(file_path, [status[0], 0, 0])
+        else:
+            added, deleted, file_path = token.split("\t", 2)
+            if not file_path:
+                next(token_iter)
+                file_path = next(token_iter)
+            change = record.changes.setdefault(file_path, ["M", 0, 0])
+            # Binary files have no line counts
+            change[1] = int(added) if added.isdigit() else 0
+            change[2] = int(deleted) if deleted.isdigit() else 0
+
+    if record is not None:
+        yield record
+
 
 class GitHistoryMiner:
     """Secure git history mining with comprehensive security controls.
@@ -155,6 +255,7 @@ class GitHistoryMiner:
         until_date: datetime | None = None,
         branch: str | None = None,
         since_commit: str | None = None,
+        bulk: bool = True,
     ) -> Iterator[Commit]:
         """Extract commit history with security controls.
 
@@ -164,6 +265,8 @@ class GitHistoryMiner:
             until_date: Extract commits until this date
             branch: Branch to extract from (defaults to current branch)
             since_commit: Extract commits since this commit hash (incremental mode)
+            bulk: Stream all commits from a single git log process instead of
+                diffing every commit separately
 
         Yields:
             Commit: Validated commit objects
@@ -175,6 +278,10 @@ class GitHistoryMiner:
         if not self.validate_repository():
             raise ValueError("Repository validation failed")
 
+        # Security: a revision starting with a dash would be parsed as an option
+        if branch is not None and branch.startswith("-"):
+            raise ValueError(f"Invalid branch name: {branch}")
+
         try:
             # Security: limit max_commits to prevent memory exhaustion
             if max_commits is not None and max_commits > 10000:
@@ -227,24 +334,18 @@ class GitHistoryMiner:
             # Extract commits using GitPython API
             if self.repo is None:
                 raise ValueError("Repository not initialized")
-            for commit in self.repo.iter_commits(**kwargs):
-                try:
-                    commit_obj = self._convert_commit_to_object(commit)
-                    if commit_obj:
-                        yield commit_obj
-                        commit_count += 1
-
-                        # Log progress periodically
-                        if commit_count % 100 == 0:
-                            logger.debug("Processed commits", count=commit_count)
-
-                except Exception as e:
-                    logger.warning(
-                        "Failed to process commit",
-                        commit_hash=commit.hexsha,
-                        error=str(e),
-                    )
-                    continue
+            commits = (
+                self._extract_commits_bulk(kwargs)
+                if bulk
+                else self._extract_commits_individually(kwargs)
+            )
+            for commit_obj in commits:
+                yield commit_obj
+                commit_count += 1
+
+                # Log progress periodically
+                if commit_count % 100 == 0:
+                    logger.debug("Processed commits", count=commit_count)
 
             logger.info(
                 "Commit history extraction completed", total_commits=commit_count
@@ -257,6 +358,137 @@ class GitHistoryMiner:
             logger.error("Unexpected error during history extraction", error=str(e))
             raise
 
+    def _extract_commits_individually(self, kwargs: dict[str, Any]) -> Iterator[Commit]:
+        """Convert commits one by one, running diff and stats for each.
+
+        Args:
+            kwargs: Revision and filters for ``Repo.iter_commits``
+
+        Yields:
+            Commit: Validated commit objects
+        """
+        if self.repo is None:
+            raise ValueError("Repository not initialized")
+
+        for commit in self.repo.iter_commits(**kwargs):
+            try:
+                commit_obj = self._convert_commit_to_object(commit)
+                if commit_obj:
+                    yield commit_obj
+
+            except Exception as e:
+                logger.warning(
+                    "Failed to process commit",
+                    commit_hash=commit.hexsha,
+                    error=str(e),
+                )
+                continue
+
+    def _extract_commits_bulk(self, kwargs: dict[str, Any]) -> Iterator[Commit]:
+        """Stream commits and their file changes from a single git log process.
+
+        Merge commits are diffed against their first parent, like in
+        ``_convert_commit_to_object``. Renames are detected, and binary
+        files are reported without line counts.
+
+        Args:
+            kwargs: Revision and filters as passed to ``Repo.iter_commits``
+
+        Yields:
+            Commit: Validated commit objects
+
+        Raises:
+            GitCommandError: If git log fails
+        """
+        if self.repo is None:
+            raise ValueError("Repository not initialized")
+
+        options = dict(kwargs)
+        revision = options.pop("rev", None)
+        if self.repo.git.version_info >= (2, 31):
+            options["diff_merges"] = "first-parent"
+        else:
+            # Diffs merges against every parent; repeated records are skipped
+            options["m"] = True
+
+        # GitPython runs git without a shell; "--" ends the revision arguments
+        process = self.repo.git.log(
+            *([revision] if revision else []),
+            "--",
+            z=True,
+            format=_LOG_FORMAT,
+            raw=True,
+            numstat=True,
+            find_renames=True,
+            no_color=True,
+            no_show_signature=True,
+            as_process=True,
+            **options,
+        )
+        stdout = process.stdout
+        if stdout is None:
+            raise ValueError("git log produced no output stream")
+
+        seen: set[str] = set()
+        chunks = iter(lambda: stdout.read(_LOG_READ_SIZE), b"")
+        for record in _parse_log_records(_split_nul(chunks)):
+            if record.hash in seen:
+                continue
+            seen.add(record.hash)
+
+            try:
+                yield self._convert_record_to_object(record)
+            except Exception as e:
+                logger.warning(
+                    "Failed to process commit", commit_hash=record.hash, error=str(e)
+                )
+
+        process.wait()
+
+    def _convert_record_to_object(self, record: _LogRecord) -> Commit:
+        """Convert a parsed git log record to a Commit object with validation.
+
+        Args:
+            record: Commit fields parsed from git log output
+
+        Returns:
+            Validated Commit object
+
+        Raises:
+            ValueError: If the commit fails validation
+        """
+        file_changes = []
+        for file_path, (
+            change_type,
+            lines_added,
+            lines_deleted,
+        ) in record.changes.items():
+            try:
+                file_changes.append(
+                    FileChange(
+                        file_path=file_path,
+                        change_type=change_type,
+                        lines_added=lines_added,
+                        lines_deleted=lines_deleted,
+                    )
+                )
+            except Exception as e:
+                logger.debug(
+                    "Failed to process diff",
+                    commit_hash=record.hash,
+                    error=str(e),
+                )
+
+        return Commit(
+            hash=record.hash,
+            message=record.message,
+            author_name=record.author_name or "Unknown",
+            author_email=record.author_email or "unknown@example.com",
+            timestamp=record.timestamp,
+            file_changes=file_changes,
+            parent_hashes=record.parent_hashes,
+        )
+
     def _convert_commit_to_object(self, commit: GitCommit) -> Commit | None:
         """Convert GitPython commit to Commit object with validation.
 
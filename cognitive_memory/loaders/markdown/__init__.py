@@ -7,11 +7,13 @@ This package contains specialized components for processing markdown documents:
 - MemoryFactory: Memory creation and assembly
 - ConnectionExtractor: Relationship analysis
 - ChunkProcessor: Document chunking logic
+- DocumentAnalysis: Shared spaCy parsing of chunk texts
 """
 
 from .chunk_processor import ChunkProcessor
 from .connection_extractor import ConnectionExtractor
 from .content_analyzer import ContentAnalyzer
+from .document_analysis import DocumentAnalysis
 from .document_parser import DocumentParser
 from .memory_factory import MemoryFactory
 
@@ -21,4 +23,5 @@ __all__ = [
     "MemoryFactory",
     "ConnectionExtractor",
     "ChunkProcessor",
+    "DocumentAnalysis",
 ]
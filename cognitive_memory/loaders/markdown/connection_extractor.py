@@ -7,12 +7,23 @@ CognitiveMemory objects derived from markdown content.
 
 import re
 from collections import defaultdict
+from dataclasses import dataclass
 
+import numpy as np
 import spacy
 from loguru import logger
 
 from ...core.config import CognitiveConfig
 from ...core.memory import CognitiveMemory
+from .document_analysis import DocumentAnalysis
+
+
+@dataclass(frozen=True)
+class _ParsedMemory:
+    """Linguistic features of a memory, computed once per extraction."""
+
+    vector: np.ndarray  # Unit-normalized doc vector, zero if the doc has none
+    lemmas: frozenset[str]
 
 
 class ConnectionExtractor:
@@ -23,16 +34,24 @@ class ConnectionExtractor:
     linguistic analysis, structural proximity, and explicit references.
     """
 
-    def __init__(self, config: CognitiveConfig, nlp: spacy.Language):
+    def __init__(
+        self,
+        config: CognitiveConfig,
+        nlp: spacy.Language,
+        analysis: DocumentAnalysis | None = None,
+    ):
         """
         Initialize the connection extractor.
 
         Args:
             config: Cognitive configuration parameters
             nlp: Pre-loaded spaCy language model
+            analysis: Shared document analysis; a private one is created if
+                not given
         """
         self.config = config
         self.nlp = nlp
+        self.analysis = analysis or DocumentAnalysis(config, nlp)
 
         # Precompiled regex patterns for efficiency
         self.link_pattern = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
@@ -51,16 +70,23 @@ class ConnectionExtractor:
         """
         connections = []
 
+        # Parse every memory once and share the features between all passes
+        parsed = self._parse_memories(memories)
+
         # Extract hierarchical connections (header -> subsection)
-        hierarchical_connections = self._extract_hierarchical_connections(memories)
+        hierarchical_connections = self._extract_hierarchical_connections(
+            memories, parsed
+        )
         connections.extend(hierarchical_connections)
 
         # Extract sequential connections (step-by-step procedures)
-        sequential_connections = self._extract_sequential_connections(memories)
+        sequential_connections = self._extract_sequential_connections(memories, parsed)
         connections.extend(sequential_connections)
 
         # Extract associative connections (semantic similarity)
-        associative_connections = self._extract_associative_connections(memories)
+        associative_connections = self._extract_associative_connections(
+            memories, parsed
+        )
         connections.extend(associative_connections)
 
         # Filter by strength floor
@@ -78,8 +104,30 @@ class ConnectionExtractor:
 
         return limited_connections
 
-    def _extract_hierarchical_connections(
+    def _parse_memories(
         self, memories: list[CognitiveMemory]
+    ) -> dict[str, _ParsedMemory]:
+        """Run the spaCy pipeline once per memory and keep what scoring needs."""
+        # Memories created by this load were analyzed already; batch the rest
+        self.analysis.analyze(memory.content for memory in memories)
+        parsed = {}
+        for memory in memories:
+            if memory.id not in parsed:
+                parsed[memory.id] = self._parse(memory.content)
+        return parsed
+
+    def _parse(self, text: str) -> _ParsedMemory:
+        """Extract the normalized doc vector and lemma set of a text."""
+        doc = self.analysis.doc(text)
+        vector = np.asarray(doc.vector, dtype=np.float32)
+        norm = float(doc.vector_norm)
+        return _ParsedMemory(
+            vector=vector / norm if norm else np.zeros_like(vector),
+            lemmas=frozenset(token.lemma_.lower() for token in doc if token.is_alpha),
+        )
+
+    def _extract_hierarchical_connections(
+        self, memories: list[CognitiveMemory], parsed: dict[str, _ParsedMemory]
     ) -> list[tuple[str, str, float, str]]:
         """Extract hierarchical connections (header contains subsection)."""
         connections = []
@@ -107,9 +155,8 @@ class ConnectionExtractor:
 
                     if child_level > parent_level:
                         # This is a child section
-                        strength = (
-                            self.config.hierarchical_weight
-                            * self.calculate_relevance_score(parent, child)
+                        strength = self.config.hierarchical_weight * self._score(
+                            parent, child, parsed
                         )
 
                         if strength >= self.config.strength_floor:
@@ -123,7 +170,7 @@ class ConnectionExtractor:
         return connections
 
     def _extract_sequential_connections(
-        self, memories: list[CognitiveMemory]
+        self, memories: list[CognitiveMemory], parsed: dict[str, _ParsedMemory]
     ) -> list[tuple[str, str, float, str]]:
         """Extract sequential connections (step-by-step procedures)."""
         connections = []
@@ -145,9 +192,8 @@ class ConnectionExtractor:
 
                 # Check if they form a logical sequence
                 if self.are_sequential(current, next_memory):
-                    strength = (
-                        self.config.sequential_weight
-                        * self.calculate_relevance_score(current, next_memory)
+                    strength = self.config.sequential_weight * self._score(
+                        current, next_memory, parsed
                     )
 
                     if strength >= self.config.strength_floor:
@@ -158,27 +204,68 @@ class ConnectionExtractor:
         return connections
 
     def _extract_associative_connections(
-        self, memories: list[CognitiveMemory]
+        self, memories: list[CognitiveMemory], parsed: dict[str, _ParsedMemory]
     ) -> list[tuple[str, str, float, str]]:
-        """Extract associative connections (semantic similarity)."""
+        """
+        Extract associative connections (semantic similarity).
+
+        Semantic similarities of all pairs come from one matrix product of the
+        normalized doc vectors. Only each memory's most similar memories are
+        then scored in full, as configured by
+        ``associative_candidates_per_memory`` (0 scores every pair).
+        """
         connections: list[tuple[str, str, float, str]] = []
+        count = len(memories)
+        if count < 2:
+            return connections
+
+        vectors = np.stack([parsed[memory.id].vector for memory in memories])
+        similarities = vectors @ vectors.T
+
+        for i, j in self._associative_candidates(similarities):
+            memory1, memory2 = memories[i], memories[j]
+            relevance_score = self._combine_scores(
+                memory1,
+                memory2,
+                float(similarities[i, j]),
+                self._lexical_jaccard(parsed[memory1.id], parsed[memory2.id]),
+            )
+            strength = self.config.associative_weight * relevance_score
+
+            if strength >= self.config.strength_floor:
+                connections.append((memory1.id, memory2.id, strength, "associative"))
 
-        # Compare all pairs for semantic similarity
-        for i, memory1 in enumerate(memories):
-            for memory2 in memories[i + 1 :]:
-                # Skip if already connected hierarchically or sequentially
-                if self._already_connected(memory1, memory2, connections):
-                    continue
+        return connections
 
-                relevance_score = self.calculate_relevance_score(memory1, memory2)
-                strength = self.config.associative_weight * relevance_score
+    def _associative_candidates(
+        self, similarities: np.ndarray
+    ) -> list[tuple[int, int]]:
+        """
+        Select the memory pairs worth scoring for associative connections.
 
-                if strength >= self.config.strength_floor:
-                    connections.append(
-                        (memory1.id, memory2.id, strength, "associative")
-                    )
+        Args:
+            similarities: Pairwise semantic similarity matrix
 
-        return connections
+        Returns:
+            Index pairs (i, j) with i < j, in row-major order
+        """
+        count = similarities.shape[0]
+        top_k = self.config.associative_candidates_per_memory
+
+        if top_k <= 0 or top_k >= count - 1:
+            candidates = np.triu(np.ones((count, count), dtype=bool), k=1)
+        else:
+            # Keep each row's top k neighbours, excluding the memory itself
+            ranked = similarities.copy()
+            np.fill_diagonal(ranked, -np.inf)
+            top = np.argpartition(-ranked, top_k - 1, axis=1)[:, :top_k]
+
+            candidates = np.zeros((count, count), dtype=bool)
+            candidates[np.repeat(np.arange(count), top_k), top.ravel()] = True
+            candidates = np.triu(candidates | candidates.T, k=1)
+
+        rows, columns = np.nonzero(candidates)
+        return list(zip(rows.tolist(), columns.tolist(), strict=True))
 
     def calculate_relevance_score(
         self, memory1: CognitiveMemory, memory2: CognitiveMemory
@@ -189,26 +276,41 @@ class ConnectionExtractor:
         Uses weighted combination of semantic similarity, lexical overlap,
         structural proximity, and explicit references.
         """
-        # Semantic similarity using spaCy vectors
-        doc1 = self.nlp(memory1.content)
-        doc2 = self.nlp(memory2.content)
-
-        if doc1.vector_norm == 0 or doc2.vector_norm == 0:
-            semantic_similarity = 0.0
-        else:
-            semantic_similarity = doc1.similarity(doc2)
+        parsed = {memory1.id: self._parse(memory1.content)}
+        parsed.setdefault(memory2.id, self._parse(memory2.content))
+        return self._score(memory1, memory2, parsed)
 
-        # Lexical overlap (Jaccard coefficient)
-        words1 = {token.lemma_.lower() for token in doc1 if token.is_alpha}
-        words2 = {token.lemma_.lower() for token in doc2 if token.is_alpha}
+    def _score(
+        self,
+        memory1: CognitiveMemory,
+        memory2: CognitiveMemory,
+        parsed: dict[str, _ParsedMemory],
+    ) -> float:
+        """Calculate the relevance score of two already parsed memories."""
+        parsed1, parsed2 = parsed[memory1.id], parsed[memory2.id]
+        return self._combine_scores(
+            memory1,
+            memory2,
+            float(np.dot(parsed1.vector, parsed2.vector)),
+            self._lexical_jaccard(parsed1, parsed2),
+        )
 
-        if len(words1) == 0 and len(words2) == 0:
-            lexical_jaccard = 0.0
-        else:
-            intersection = len(words1.intersection(words2))
-            union = len(words1.union(words2))
-            lexical_jaccard = intersection / union if union > 0 else 0.0
+    @staticmethod
+    def _lexical_jaccard(parsed1: _ParsedMemory, parsed2: _ParsedMemory) -> float:
+        """Calculate the lexical overlap (Jaccard coefficient) of two memories."""
+        union = len(parsed1.lemmas | parsed2.lemmas)
+        if union == 0:
+            return 0.0
+        return len(parsed1.lemmas & parsed2.lemmas) / union
 
+    def _combine_scores(
+        self,
+        memory1: CognitiveMemory,
+        memory2: CognitiveMemory,
+        semantic_similarity: float,
+        lexical_jaccard: float,
+    ) -> float:
+        """Combine the relevance components into a score between 0 and 1."""
         # Structural proximity (based on document position)
         structural_proximity = self.calculate_structural_proximity(memory1, memory2)
 
@@ -12,6 +12,7 @@ import spacy
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
 from ...core.config import CognitiveConfig
+from .document_analysis import DocumentAnalysis
 
 
 class ContentAnalyzer:
@@ -22,16 +23,24 @@ class ContentAnalyzer:
     hierarchy level classification, and linguistic feature extraction.
     """
 
-    def __init__(self, config: CognitiveConfig, nlp: spacy.Language):
+    def __init__(
+        self,
+        config: CognitiveConfig,
+        nlp: spacy.Language,
+        analysis: DocumentAnalysis | None = None,
+    ):
         """
         Initialize the content analyzer.
 
         Args:
             config: Cognitive configuration parameters
             nlp: Pre-loaded spaCy language model
+            analysis: Shared document analysis; a private one is created if
+                not given
         """
         self.config = config
         self.nlp = nlp
+        self.analysis = analysis or DocumentAnalysis(config, nlp)
         self.sentiment_analyzer = SentimentIntensityAnalyzer()
 
         # Precompiled regex patterns for efficiency
@@ -202,7 +211,7 @@ class ContentAnalyzer:
         Returns:
             Dictionary of linguistic features
         """
-        doc = self.nlp(text)
+        doc = self.analysis.doc(text)
 
         if len(doc) == 0:
             return {
@@ -338,7 +347,7 @@ class ContentAnalyzer:
 
     def count_tokens(self, text: str) -> int:
         """Count tokens in text using spaCy tokenizer."""
-        doc = self.nlp(text)
+        doc = self.analysis.tokens(text)
         return len([token for token in doc if not token.is_space])
 
     def extract_sentiment(self, text: str) -> dict[str, float]:
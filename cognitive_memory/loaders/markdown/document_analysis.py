@@ -0,0 +1,83 @@
+"""
+Shared spaCy document analysis for markdown loading.
+
+Content analysis, memory creation and connection extraction all inspect the
+same chunk texts. This module parses those texts once per load with
+``nlp.pipe`` and hands the resulting Doc objects to every component, instead
+of each component running the full pipeline on its own.
+"""
+
+from collections.abc import Iterable
+
+import spacy
+from loguru import logger
+from spacy.tokens import Doc
+
+from ...core.config import CognitiveConfig
+
+# Components whose output no consumer reads: POS tags, lemmas, token
+# attributes and vectors come from the tagger, attribute ruler and lemmatizer
+UNUSED_COMPONENTS = ("parser", "ner")
+
+
+class DocumentAnalysis:
+    """
+    Caches spaCy Docs for the chunk texts of the document being loaded.
+
+    ``analyze`` batch-parses texts ahead of their consumers. ``doc`` returns
+    the tagged Doc of a text, and ``tokens`` returns a Doc suitable for token
+    counting and truncation, which only needs the tokenizer when the text was
+    not analyzed.
+    """
+
+    def __init__(self, config: CognitiveConfig, nlp: spacy.Language):
+        """
+        Initialize the document analysis.
+
+        Args:
+            config: Cognitive configuration parameters
+            nlp: Pre-loaded spaCy language model
+        """
+        self.config = config
+        self.nlp = nlp
+        self.disabled = [name for name in UNUSED_COMPONENTS if name in nlp.pipe_names]
+        self._docs: dict[str, Doc] = {}
+
+    def analyze(self, texts: Iterable[str]) -> None:
+        """
+        Parse texts in batches and cache their Docs.
+
+        Args:
+            texts: Texts to parse; texts that are already cached are skipped
+        """
+        pending = list(dict.fromkeys(text for text in texts if text not in self._docs))
+        if not pending:
+            return
+
+        docs = self.nlp.pipe(
+            pending,
+            batch_size=self.config.spacy_batch_size,
+            n_process=self.config.spacy_n_process,
+            disable=self.disabled,
+        )
+        self._docs.update(zip(pending, docs, strict=True))
+        logger.debug(
+            "Analyzed chunk texts",
+            texts=len(pending),
+            n_process=self.config.spacy_n_process,
+        )
+
+    def doc(self, text: str) -> Doc:
+        """Get the tagged Doc of a text, parsing it if it was not analyzed."""
+        if text not in self._docs:
+            self._docs[text] = self.nlp(text, disable=self.disabled)
+        return self._docs[text]
+
+    def tokens(self, text: str) -> Doc:
+        """Get a Doc of a text for token-level work, without tagging it."""
+        doc = self._docs.get(text)
+        return doc if doc is not None else self.nlp.make_doc(text)
+
+    def clear(self) -> None:
+        """Drop the cached Docs of the previous document."""
+        self._docs.clear()
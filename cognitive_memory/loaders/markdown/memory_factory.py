@@ -61,14 +61,8 @@ class MemoryFactory:
         Returns:
             CognitiveMemory object with proper L0/L1/L2 classification
         """
-        content = chunk_data["content"]
         title = chunk_data["title"]
-
-        # Add document name as first line if not already present
-        content = self._add_document_name_prefix(content, source_path)
-
-        # Filter ASCII art if present
-        content = self._filter_ascii_art(content)
+        content = self.prepare_content(chunk_data, source_path)
 
         # Perform linguistic analysis
         linguistic_features = self.content_analyzer.extract_linguistic_features(content)
@@ -97,6 +91,7 @@ class MemoryFactory:
                 f"Memory '{title}' has {token_count} tokens, truncating to {self.config.max_tokens_per_chunk}"
             )
             content = self.truncate_content(content, self.config.max_tokens_per_chunk)
+            token_count = self.content_analyzer.count_tokens(content)
 
         # Extract sentiment for emotional dimension
         sentiment = self.content_analyzer.extract_sentiment(content)
@@ -121,7 +116,7 @@ class MemoryFactory:
                 "hierarchical_path": chunk_data.get("hierarchical_path", [title]),
                 "has_children": chunk_data.get("has_children", False),
                 "node_position": chunk_data.get("node_position", {}),
-                "token_count": self.content_analyzer.count_tokens(content),
+                "token_count": token_count,
                 "linguistic_features": linguistic_features,
                 "sentiment": sentiment,
                 "loader_type": "markdown",
@@ -133,12 +128,28 @@ class MemoryFactory:
         )
 
         logger.debug(
-            f"Created L{hierarchy_level} memory: {title[:50]}... "
-            f"({self.content_analyzer.count_tokens(content)} tokens)"
+            f"Created L{hierarchy_level} memory: {title[:50]}... ({token_count} tokens)"
         )
 
         return memory
 
+    def prepare_content(self, chunk_data: dict[str, Any], source_path: str) -> str:
+        """
+        Get the final memory text of a chunk, before any truncation.
+
+        Args:
+            chunk_data: Structured chunk information
+            source_path: Source file path
+
+        Returns:
+            Chunk content with the document name prefix and without ASCII art
+        """
+        # Add document name as first line if not already present
+        content = self._add_document_name_prefix(chunk_data["content"], source_path)
+
+        # Filter ASCII art if present
+        return self._filter_ascii_art(content)
+
     def assemble_contextual_content(self, node: DocumentNode) -> str:
         """
         Assemble contextual content that includes hierarchical path and content.
@@ -269,7 +280,7 @@ class MemoryFactory:
 
     def truncate_content(self, content: str, max_tokens: int) -> str:
         """Truncate content to fit within token limit while preserving structure."""
-        doc = self.nlp(content)
+        doc = self.content_analyzer.analysis.tokens(content)
         tokens = [token for token in doc if not token.is_space]
 
         if len(tokens) <= max_tokens:
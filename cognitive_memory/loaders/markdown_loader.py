@@ -10,7 +10,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import spacy
 from loguru import logger
 
 from ..core.config import CognitiveConfig
@@ -20,9 +19,11 @@ from .markdown import (
     ChunkProcessor,
     ConnectionExtractor,
     ContentAnalyzer,
+    DocumentAnalysis,
     DocumentParser,
     MemoryFactory,
 )
+from .spacy_models import spacy_models
 
 
 class MarkdownMemoryLoader(MemoryLoader):
@@ -43,13 +44,18 @@ class MarkdownMemoryLoader(MemoryLoader):
         """
         self.config = config
         self.cognitive_system = cognitive_system
-        self.nlp = spacy.load("en_core_web_md")
+        self.nlp = spacy_models.get(config.spacy_model)
 
-        # Initialize specialized components
-        self.content_analyzer = ContentAnalyzer(config, self.nlp)
+        # Initialize specialized components, sharing one parse per chunk text
+        self.document_analysis = DocumentAnalysis(config, self.nlp)
+        self.content_analyzer = ContentAnalyzer(
+            config, self.nlp, self.document_analysis
+        )
         self.document_parser = DocumentParser(config)
         self.memory_factory = MemoryFactory(config, self.content_analyzer, self.nlp)
-        self.connection_extractor = ConnectionExtractor(config, self.nlp)
+        self.connection_extractor = ConnectionExtractor(
+            config, self.nlp, self.document_analysis
+        )
         self.chunk_processor = ChunkProcessor(
             config, self.content_analyzer, self.memory_factory
         )
@@ -83,9 +89,17 @@ class MarkdownMemoryLoader(MemoryLoader):
         )
 
         # Extract chunks using header-based splitting
+        self.document_analysis.clear()
         chunks = list(self._chunk_markdown(content, source_path))
         logger.info(f"Extracted {len(chunks)} chunks from markdown")
 
+        # Parse all chunks in one batch; the Docs are reused for memory
+        # creation and for the connection extraction that follows the load
+        self.document_analysis.analyze(
+            self.memory_factory.prepare_content(chunk_data, source_path)
+            for chunk_data in chunks
+        )
+
         # Create CognitiveMemory objects with L0/L1/L2 classification
         memories = []
         for chunk_data in chunks:
@@ -0,0 +1,190 @@
+"""
+Parallel parsing of source files for bulk loading.
+
+Parsing, chunking and linguistic analysis are CPU-bound and independent per
+file, so bulk loads run them in a pool of worker processes. Each worker
+builds its own loader of the same type and configuration, parses the files
+it is given and extracts their connections. Loads with a single worker parse
+in the calling process instead. The parsed memories are then replayed into
+the normal storage path through ``ParsedSourceLoader``, so embedding and
+writing stay in the parent process.
+"""
+
+import multiprocessing
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any
+
+from loguru import logger
+
+from ..core.config import CognitiveConfig
+from ..core.interfaces import MemoryLoader
+from ..core.memory import CognitiveMemory
+
+# Loader of the current worker process, created by _init_worker
+_worker_loader: MemoryLoader | None = None
+
+
+@dataclass
+class ParsedSource:
+    """Memories and connections parsed from one source file."""
+
+    source_path: str
+    memories: list[CognitiveMemory] = field(default_factory=list)
+    connections: list[tuple[str, str, float, str]] = field(default_factory=list)
+    parse_time: float = 0.0
+    error: str | None = None
+    fingerprint: tuple[int, float, str] | None = None
+
+
+class ParsedSourceLoader(MemoryLoader):
+    """
+    Loader that returns the result of parsing a source in a worker process.
+
+    Storage may reassign memory IDs, e.g. when a changed chunk replaces an
+    existing memory. The precomputed connections refer to the IDs assigned
+    by the worker and are translated to the current IDs on extraction.
+    """
+
+    def __init__(self, loader: MemoryLoader, parsed: ParsedSource):
+        """
+        Initialize the loader.
+
+        Args:
+            loader: Loader that the source would otherwise be loaded with
+            parsed: Parse result of the source
+        """
+        self.loader = loader
+        self.parsed = parsed
+        self._parsed_ids = [memory.id for memory in parsed.memories]
+
+    def load_from_source(
+        self, source_path: str, **kwargs: Any
+    ) -> list[CognitiveMemory]:
+        """Get the memories parsed from the source."""
+        if source_path != self.parsed.source_path:
+            raise ValueError(f"No parse result for {source_path}")
+        return self.parsed.memories
+
+    def extract_connections(
+        self, memories: list[CognitiveMemory]
+    ) -> list[tuple[str, str, float, str]]:
+        """Get the parsed connections, using the current memory IDs."""
+        current_ids = {
+            parsed_id: memory.id
+            for parsed_id, memory in zip(
+                self._parsed_ids, self.parsed.memories, strict=True
+            )
+        }
+        return [
+            (current_ids[source_id], current_ids[target_id], strength, kind)
+            for source_id, target_id, strength, kind in self.parsed.connections
+            if source_id in current_ids and target_id in current_ids
+        ]
+
+    def validate_source(self, source_path: str) -> bool:
+        """Validate the source with the original loader."""
+        return self.loader.validate_source(source_path)
+
+    def get_supported_extensions(self) -> list[str]:
+        """Get the extensions supported by the original loader."""
+        return self.loader.get_supported_extensions()
+
+
+def _init_worker(loader_class: type, config: CognitiveConfig) -> None:
+    """Create the loader used by this worker process."""
+    global _worker_loader
+    _worker_loader = loader_class(config)
+
+
+def _parse_source(source_path: str, kwargs: dict[str, Any]) -> ParsedSource:
+    """Parse a source file and extract its connections in a worker process."""
+    if _worker_loader is None:
+        raise RuntimeError("Worker process was not initialized")
+    return parse_source(_worker_loader, source_path, **kwargs)
+
+
+def parse_source(loader: MemoryLoader, source_path: str, **kwargs: Any) -> ParsedSource:
+    """
+    Parse a source file and extract its connections.
+
+    Args:
+        loader: Loader to parse the source with
+        source_path: Source file to parse
+        **kwargs: Additional loader parameters
+
+    Returns:
+        Parse result, with ``error`` set if parsing failed
+    """
+    start_time = time.time()
+    try:
+        memories = loader.load_from_source(source_path, **kwargs)
+        connections = loader.extract_connections(memories)
+    except Exception as e:
+        return ParsedSource(
+            source_path=source_path,
+            parse_time=time.time() - start_time,
+            error=str(e),
+        )
+    return ParsedSource(
+        source_path=source_path,
+        memories=memories,
+        connections=connections,
+        parse_time=time.time() - start_time,
+    )
+
+
+def parse_sources(
+    loader: Any,
+    source_paths: list[str],
+    workers: int,
+    **kwargs: Any,
+) -> Iterator[ParsedSource]:
+    """
+    Parse source files in worker processes, yielding results as they finish.
+
+    Workers are started with the ``spawn`` method: the parent process
+    usually holds database connections and runtime thread pools, which are
+    not safe to fork. With a single worker, sources are parsed in order by
+    ``loader`` in the calling process.
+
+    Args:
+        loader: Loader whose type and ``config`` the workers replicate
+        source_paths: Source files to parse
+        workers: Maximum number of worker processes, 1 to parse in process
+        **kwargs: Additional loader parameters
+
+    Yields:
+        One ParsedSource per source path, in completion order
+    """
+    if not source_paths:
+        return
+
+    workers = max(1, min(workers, len(source_paths)))
+    if workers == 1:
+        for source_path in source_paths:
+            yield parse_source(loader, source_path, **kwargs)
+        return
+
+    logger.info(
+        "Parsing sources in parallel", sources=len(source_paths), workers=workers
+    )
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(type(loader), loader.config),
+    ) as executor:
+        futures = {
+            executor.submit(_parse_source, source_path, kwargs): source_path
+            for source_path in source_paths
+        }
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                # The worker died, e.g. because its loader failed to initialize
+                yield ParsedSource(source_path=futures[future], error=str(e))
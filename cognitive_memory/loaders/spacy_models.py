@@ -0,0 +1,94 @@
+"""
+Process-wide registry of loaded spaCy pipelines.
+
+Loading a spaCy model takes seconds and tens of megabytes, and a new markdown
+loader is created for every load operation. Loaders therefore get their
+pipeline from this registry, which loads each model once per process on
+first use. Long-lived processes can pre-warm a model before the first load
+and release it again to bound their memory.
+"""
+
+import threading
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    import spacy
+
+DEFAULT_SPACY_MODEL = "en_core_web_md"
+
+
+class SpacyModelRegistry:
+    """Thread-safe cache of spaCy pipelines by model name."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._models: dict[str, spacy.Language] = {}
+        self._lock = threading.Lock()
+
+    def get(self, model_name: str = DEFAULT_SPACY_MODEL) -> "spacy.Language":
+        """
+        Get a pipeline, loading it on first use.
+
+        Args:
+            model_name: Installed spaCy model package or path
+
+        Returns:
+            The shared pipeline for the model
+
+        Raises:
+            OSError: If the model is not installed
+        """
+        nlp = self._models.get(model_name)
+        if nlp is not None:
+            return nlp
+
+        with self._lock:
+            nlp = self._models.get(model_name)
+            if nlp is None:
+                import spacy
+
+                logger.info("Loading spaCy model", model=model_name)
+                nlp = spacy.load(model_name)
+                self._models[model_name] = nlp
+            return nlp
+
+    def preload(self, model_name: str = DEFAULT_SPACY_MODEL) -> None:
+        """Load a model ahead of its first use."""
+        self.get(model_name)
+
+    def release(self, model_name: str | None = None) -> int:
+        """
+        Drop loaded pipelines so their memory can be reclaimed.
+
+        Loaders created before the release keep their own reference to the
+        pipeline; later loaders load the model again.
+
+        Args:
+            model_name: Model to release, or None to release all models
+
+        Returns:
+            Number of released models
+        """
+        with self._lock:
+            if model_name is None:
+                released = list(self._models)
+                self._models.clear()
+            else:
+                released = (
+                    [model_name]
+                    if self._models.pop(model_name, None) is not None
+                    else []
+                )
+
+        if released:
+            logger.info("Released spaCy models", models=released)
+        return len(released)
+
+    def loaded_models(self) -> list[str]:
+        """Get the names of the currently loaded models."""
+        return list(self._models)
+
+
+spacy_models = SpacyModelRegistry()
@@ -17,6 +17,7 @@ from .factory import (
     InitializationError,
     create_default_system,
     create_system_from_config,
+    validate_startup_health,
     validate_system_health,
 )
 
@@ -90,7 +91,7 @@ def initialize_system(profile: str = "default") -> CognitiveMemorySystem:
             raise InitializationError(f"Unknown initialization profile: {profile}")
 
         # Perform health check
-        health_status = validate_system_health(system)
+        health_status = validate_startup_health(system)
         if not health_status["healthy"]:
             error_summary = "; ".join(health_status["errors"])
             raise InitializationError(f"System health check failed: {error_summary}")
@@ -139,7 +140,7 @@ def initialize_with_config(config_path: str) -> CognitiveMemorySystem:
         system = create_system_from_config(config_path)
 
         # Perform health check
-        health_status = validate_system_health(system)
+        health_status = validate_startup_health(system)
         if not health_status["healthy"]:
             error_summary = "; ".join(health_status["errors"])
             raise InitializationError(f"System health check failed: {error_summary}")
@@ -216,6 +217,15 @@ def graceful_shutdown(system: CognitiveMemorySystem) -> bool:
     try:
         shutdown_status = True
 
+        # Close the embedding provider, writing embedding cache access times
+        if hasattr(system.embedding_provider, "close"):
+            try:
+                system.embedding_provider.close()
+                logger.debug("Embedding provider closed successfully")
+            except Exception as e:
+                logger.warning("Failed to close embedding provider", error=str(e))
+                shutdown_status = False
+
         # Close vector storage connections if applicable
         if hasattr(system.vector_storage, "close"):
             try:
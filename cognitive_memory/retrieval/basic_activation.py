@@ -6,14 +6,18 @@ that activates memories through breadth-first search traversal of the
 memory connection graph.
 """
 
+import threading
 import time
 from collections import deque
+from typing import Any
 
 import numpy as np
 from loguru import logger
 
+from ..core.adjacency import ConnectionAdjacency
 from ..core.interfaces import ActivationEngine, ConnectionGraph, MemoryStorage
 from ..core.memory import ActivationResult, CognitiveMemory
+from .embedding_index import EmbeddingIndex
 
 
 class BasicActivationEngine(ActivationEngine):
@@ -23,6 +27,14 @@ class BasicActivationEngine(ActivationEngine):
     Implements context-driven activation spreading that starts with high-similarity
     memories at L0 (concepts) and spreads activation through the connection graph
     using breadth-first search with threshold-based filtering.
+
+    L0 embeddings are kept in a resident EmbeddingIndex. The index is updated
+    incrementally through the notify_* hooks and rebuilt from storage when the
+    storage level signature shows changes made elsewhere.
+
+    When the connection graph provides a cached adjacency, spreading activation
+    walks it in memory and fetches the memories of each BFS layer in a single
+    storage call instead of querying connections per node.
     """
 
     def __init__(
@@ -46,6 +58,11 @@ class BasicActivationEngine(ActivationEngine):
         self.core_threshold = core_threshold
         self.peripheral_threshold = peripheral_threshold
 
+        self._l0_index = EmbeddingIndex()
+        self._l0_index_loaded = False
+        self._l0_signature: tuple[Any, ...] | None = None
+        self._l0_lock = threading.Lock()
+
     def activate_memories(
         self, context: np.ndarray, threshold: float, max_activations: int = 50
     ) -> ActivationResult:
@@ -70,9 +87,8 @@ class BasicActivationEngine(ActivationEngine):
 
         try:
             # Phase 1: Find high-similarity L0 concepts as starting points
-            l0_memories = self.memory_storage.get_memories_by_level(0)
             starting_memories = self._find_starting_memories(
-                context, l0_memories, threshold
+                context, None, threshold, max_results=max_activations
             )
 
             if not starting_memories:
@@ -108,47 +124,95 @@ class BasicActivationEngine(ActivationEngine):
     def _find_starting_memories(
         self,
         context: np.ndarray,
-        l0_memories: list[CognitiveMemory],
+        l0_memories: list[CognitiveMemory] | None,
         threshold: float,
+        max_results: int | None = None,
     ) -> list[CognitiveMemory]:
         """
         Find L0 memories with high similarity to context as starting points.
 
         Args:
             context: Context vector for similarity computation
-            l0_memories: List of L0 (concept) memories
+            l0_memories: L0 (concept) memories to search, or None to use the
+                resident L0 index
             threshold: Minimum similarity threshold
+            max_results: Maximum number of starting memories (None for all)
 
         Returns:
-            List of starting memories for activation
+            List of starting memories for activation, most similar first
         """
-        starting_memories = []
-
-        for memory in l0_memories:
-            if memory.cognitive_embedding is not None:
-                similarity = self._compute_cosine_similarity(
-                    context, memory.cognitive_embedding
-                )
-                logger.debug(
-                    f"L0 memory similarity: {similarity:.3f} vs threshold {threshold:.3f} for: {memory.content[:50]}"
+        if l0_memories is None:
+            with self._l0_lock:
+                self._refresh_l0_index()
+                matches = self._l0_index.search(context, threshold, max_results)
+                indexed_count = len(self._l0_index)
+
+            # The index only tracks embeddings; reload rows so access counts
+            # and recency used for activation strength are current
+            fresh = {
+                memory.id: memory
+                for memory in self.memory_storage.get_memories_by_ids(
+                    [memory.id for memory, _ in matches]
                 )
-                if similarity >= threshold:
-                    starting_memories.append(memory)
-
-        # Sort by similarity (highest first)
-        starting_memories.sort(
-            key=lambda m: self._compute_cosine_similarity(
-                context, m.cognitive_embedding
-            )
-            if m.cognitive_embedding is not None
-            else 0.0,
-            reverse=True,
-        )
+            }
+            matches = [
+                (fresh.get(memory.id, memory), similarity)
+                for memory, similarity in matches
+            ]
+        else:
+            index = EmbeddingIndex(l0_memories)
+            matches = index.search(context, threshold, max_results)
+            indexed_count = len(index)
 
         logger.debug(
-            f"Found {len(starting_memories)} starting memories from {len(l0_memories)} L0 concepts"
+            f"Found {len(matches)} starting memories from {indexed_count} L0 concepts"
         )
-        return starting_memories
+        return [memory for memory, _ in matches]
+
+    def _refresh_l0_index(self) -> None:
+        """Rebuild the L0 index if it was never loaded or storage changed."""
+        signature = self.memory_storage.get_level_signature(0)
+        if (
+            self._l0_index_loaded
+            and signature is not None
+            and signature == self._l0_signature
+        ):
+            return
+
+        self._l0_index.rebuild(self.memory_storage.get_memories_by_level(0))
+        self._l0_signature = signature
+        self._l0_index_loaded = True
+
+        logger.debug("L0 similarity index rebuilt", size=len(self._l0_index))
+
+    def notify_memories_stored(self, memories: list[CognitiveMemory]) -> None:
+        """
+        Apply stored or updated memories to the resident L0 index.
+
+        Args:
+            memories: Memories that were written to storage
+        """
+        with self._l0_lock:
+            if not self._l0_index_loaded:
+                return
+
+            self._l0_index.add([m for m in memories if m.hierarchy_level == 0])
+            self._l0_index.remove([m.id for m in memories if m.hierarchy_level != 0])
+            self._l0_signature = self.memory_storage.get_level_signature(0)
+
+    def notify_memories_deleted(self, memory_ids: list[str]) -> None:
+        """
+        Remove deleted memories from the resident L0 index.
+
+        Args:
+            memory_ids: IDs of memories that were removed from storage
+        """
+        with self._l0_lock:
+            if not self._l0_index_loaded:
+                return
+
+            self._l0_index.remove(memory_ids)
+            self._l0_signature = self.memory_storage.get_level_signature(0)
 
     def _bfs_activation(
         self,
@@ -192,6 +256,21 @@ class BasicActivationEngine(ActivationEngine):
 
                 activated_ids.add(memory.id)
 
+        expanded_ids: list[str] = []
+        adjacency = self.connection_graph.get_adjacency()
+        if adjacency is not None:
+            expanded_ids = self._bfs_adjacency(
+                context,
+                adjacency,
+                queue,
+                threshold,
+                max_activations,
+                activated_ids,
+                core_memories,
+                peripheral_memories,
+                activation_strengths,
+            )
+
         # BFS traversal through connection graph
         while queue and len(activated_ids) < max_activations:
             current_memory = queue.popleft()
@@ -201,6 +280,8 @@ class BasicActivationEngine(ActivationEngine):
                 connected_memories = self.connection_graph.get_connections(
                     current_memory.id, min_strength=self.peripheral_threshold
                 )
+                if connected_memories:
+                    expanded_ids.append(current_memory.id)
 
                 for connected_memory in connected_memories:
                     if connected_memory.id not in activated_ids:
@@ -251,7 +332,112 @@ class BasicActivationEngine(ActivationEngine):
             core_memories=core_memories,
             peripheral_memories=peripheral_memories,
             activation_strengths=activation_strengths,
+            expanded_ids=expanded_ids,
+            expansion_threshold=self.peripheral_threshold,
+        )
+
+    def _bfs_adjacency(
+        self,
+        context: np.ndarray,
+        adjacency: ConnectionAdjacency,
+        queue: deque[CognitiveMemory],
+        threshold: float,
+        max_activations: int,
+        activated_ids: set[str],
+        core_memories: list[CognitiveMemory],
+        peripheral_memories: list[CognitiveMemory],
+        activation_strengths: dict[str, float],
+    ) -> list[str]:
+        """
+        Spread activation over a cached adjacency, one BFS layer at a time.
+
+        Visits memories in the same order as per-node traversal, but looks up
+        neighbours in memory and loads each layer's memories in one call.
+        Drains ``queue`` and updates the activation collections in place.
+
+        Args:
+            context: Context vector for similarity computation
+            adjacency: Cached connection adjacency
+            queue: BFS queue holding the starting memories
+            threshold: Minimum activation threshold
+            max_activations: Maximum number of memories to activate
+            activated_ids: IDs of already activated memories
+            core_memories: Core memories collected so far
+            peripheral_memories: Peripheral memories collected so far
+            activation_strengths: Activation strength by memory ID
+
+        Returns:
+            IDs of the memories whose connections were traversed
+        """
+        expanded_ids: list[str] = []
+
+        while queue and len(activated_ids) < max_activations:
+            layer = list(queue)
+            queue.clear()
+
+            layer_neighbors = [
+                [
+                    neighbor_id
+                    for neighbor_id, _ in adjacency.neighbors(
+                        memory.id, self.peripheral_threshold
+                    )
+                ]
+                for memory in layer
+            ]
+            candidate_ids = list(
+                dict.fromkeys(
+                    neighbor_id
+                    for neighbor_ids in layer_neighbors
+                    for neighbor_id in neighbor_ids
+                    if neighbor_id not in activated_ids
+                )
+            )
+            candidates = {
+                memory.id: memory
+                for memory in self.memory_storage.get_memories_by_ids(candidate_ids)
+            }
+
+            for memory, neighbor_ids in zip(layer, layer_neighbors, strict=True):
+                if len(activated_ids) >= max_activations:
+                    break
+
+                expanded_ids.append(memory.id)
+
+                for neighbor_id in neighbor_ids:
+                    connected_memory = candidates.get(neighbor_id)
+                    if (
+                        connected_memory is None
+                        or connected_memory.id in activated_ids
+                        or connected_memory.cognitive_embedding is None
+                    ):
+                        continue
+
+                    similarity = self._compute_cosine_similarity(
+                        context, connected_memory.cognitive_embedding
+                    )
+                    strength = connected_memory.calculate_activation_strength(
+                        similarity
+                    )
+
+                    if strength >= threshold:
+                        activation_strengths[connected_memory.id] = strength
+                        activated_ids.add(connected_memory.id)
+
+                        if strength >= self.core_threshold:
+                            core_memories.append(connected_memory)
+                        elif strength >= self.peripheral_threshold:
+                            peripheral_memories.append(connected_memory)
+
+                        queue.append(connected_memory)
+
+                        if len(activated_ids) >= max_activations:
+                            break
+
+        queue.clear()
+        self.connection_graph.record_activations(
+            expanded_ids, self.peripheral_threshold
         )
+        return expanded_ids
 
     def _compute_cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
         """
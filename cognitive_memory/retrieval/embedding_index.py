@@ -0,0 +1,202 @@
+"""
+Resident embedding index for vectorized similarity scans.
+
+This module keeps memory embeddings in a single pre-normalized float32 matrix
+so that a query can be scored against every indexed memory with one
+matrix-vector product, instead of one Python-level cosine computation per
+memory. Rows are added, replaced and removed incrementally.
+"""
+
+import numpy as np
+from loguru import logger
+
+from ..core.memory import CognitiveMemory
+
+
+class EmbeddingIndex:
+    """
+    In-memory matrix of normalized memory embeddings.
+
+    The matrix grows geometrically as rows are appended, and removal swaps the
+    last row into the freed slot, so incremental updates never rebuild the
+    whole matrix. Memories without an embedding are not indexed.
+    """
+
+    def __init__(self, memories: list[CognitiveMemory] | None = None) -> None:
+        """
+        Initialize the index.
+
+        Args:
+            memories: Optional memories to index immediately
+        """
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._memories: list[CognitiveMemory] = []
+        self._positions: dict[str, int] = {}
+
+        if memories:
+            self.rebuild(memories)
+
+    def __len__(self) -> int:
+        """Get the number of indexed memories."""
+        return len(self._memories)
+
+    def __contains__(self, memory_id: object) -> bool:
+        """Check whether a memory ID is indexed."""
+        return memory_id in self._positions
+
+    @property
+    def dimension(self) -> int:
+        """Get the embedding dimension of the index (0 if never populated)."""
+        return int(self._matrix.shape[1])
+
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> np.ndarray:
+        """Flatten a vector to float32 and scale it to unit length."""
+        row = np.asarray(vector, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(row)
+        return row / norm if norm > 0 else np.zeros_like(row)
+
+    def rebuild(self, memories: list[CognitiveMemory]) -> None:
+        """
+        Replace the index contents with the given memories.
+
+        Args:
+            memories: Memories to index
+        """
+        indexed: list[CognitiveMemory] = []
+        rows: list[np.ndarray] = []
+        for memory in memories:
+            if memory.cognitive_embedding is not None:
+                indexed.append(memory)
+                rows.append(self._normalize(memory.cognitive_embedding))
+
+        if rows and len({row.shape[0] for row in rows}) > 1:
+            dimension = rows[0].shape[0]
+            kept = [i for i, row in enumerate(rows) if row.shape[0] == dimension]
+            logger.warning(
+                "Skipping embeddings with mismatched dimensions",
+                skipped=len(rows) - len(kept),
+                dimension=dimension,
+            )
+            indexed = [indexed[i] for i in kept]
+            rows = [rows[i] for i in kept]
+
+        self._memories = indexed
+        self._positions = {memory.id: i for i, memory in enumerate(indexed)}
+        self._matrix = (
+            np.ascontiguousarray(np.vstack(rows))
+            if rows
+            else np.zeros((0, self.dimension), dtype=np.float32)
+        )
+
+    def add(self, memories: list[CognitiveMemory]) -> None:
+        """
+        Add memories to the index, replacing rows for already indexed IDs.
+
+        Args:
+            memories: Memories to add or refresh
+        """
+        for memory in memories:
+            if memory.cognitive_embedding is None:
+                self.remove([memory.id])
+                continue
+
+            row = self._normalize(memory.cognitive_embedding)
+            if self._memories and row.shape[0] != self.dimension:
+                logger.warning(
+                    "Skipping embedding with mismatched dimension",
+                    memory_id=memory.id,
+                    expected=self.dimension,
+                    actual=row.shape[0],
+                )
+                continue
+
+            position = self._positions.get(memory.id)
+            if position is None:
+                position = len(self._memories)
+                self._ensure_capacity(position + 1, row.shape[0])
+                self._memories.append(memory)
+                self._positions[memory.id] = position
+            else:
+                self._memories[position] = memory
+
+            self._matrix[position] = row
+
+    def remove(self, memory_ids: list[str]) -> None:
+        """
+        Remove memories from the index.
+
+        Args:
+            memory_ids: IDs of memories to remove; unknown IDs are ignored
+        """
+        for memory_id in memory_ids:
+            position = self._positions.pop(memory_id, None)
+            if position is None:
+                continue
+
+            last = len(self._memories) - 1
+            if position != last:
+                moved = self._memories[last]
+                self._memories[position] = moved
+                self._matrix[position] = self._matrix[last]
+                self._positions[moved.id] = position
+            self._memories.pop()
+
+    def _ensure_capacity(self, size: int, dimension: int) -> None:
+        """Grow the backing matrix geometrically to hold ``size`` rows."""
+        if not self._memories:
+            self._matrix = np.zeros((max(size, 16), dimension), dtype=np.float32)
+            return
+
+        if size <= self._matrix.shape[0]:
+            return
+
+        grown = np.zeros(
+            (max(size, self._matrix.shape[0] * 2), dimension), dtype=np.float32
+        )
+        grown[: len(self._memories)] = self._matrix[: len(self._memories)]
+        self._matrix = grown
+
+    def search(
+        self,
+        query: np.ndarray,
+        threshold: float = 0.0,
+        max_results: int | None = None,
+    ) -> list[tuple[CognitiveMemory, float]]:
+        """
+        Find indexed memories whose cosine similarity meets a threshold.
+
+        Similarities are clipped to the [0, 1] range.
+
+        Args:
+            query: Query vector
+            threshold: Minimum similarity for a match
+            max_results: Maximum number of matches to return (None for all)
+
+        Returns:
+            List of (memory, similarity) tuples sorted by similarity, highest first
+        """
+        size = len(self._memories)
+        if size == 0:
+            return []
+
+        query_row = self._normalize(query)
+        if query_row.shape[0] != self.dimension:
+            logger.warning(
+                "Query dimension does not match index",
+                expected=self.dimension,
+                actual=query_row.shape[0],
+            )
+            return []
+
+        similarities = np.clip(self._matrix[:size] @ query_row, 0.0, 1.0)
+        candidates = np.flatnonzero(similarities >= threshold)
+
+        if max_results is not None and len(candidates) > max_results:
+            if max_results <= 0:
+                return []
+            top = np.argpartition(-similarities[candidates], max_results - 1)
+            candidates = candidates[top[:max_results]]
+
+        order = candidates[np.argsort(-similarities[candidates], kind="stable")]
+        return [(self._memories[i], float(similarities[i])) for i in order]
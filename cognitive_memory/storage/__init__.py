@@ -8,6 +8,9 @@ This package provides the complete storage architecture including:
 - Memory consolidation and lifecycle management
 """
 
+import importlib
+from typing import Any
+
 from .dual_memory import (
     DualMemorySystem,
     EpisodicMemoryStore,
@@ -17,12 +20,6 @@ from .dual_memory import (
     SemanticMemoryStore,
     create_dual_memory_system,
 )
-from .qdrant_storage import (
-    HierarchicalMemoryStorage,
-    QdrantCollectionManager,
-    VectorSearchEngine,
-    create_hierarchical_storage,
-)
 from .sqlite_persistence import (
     ConnectionGraphStore,
     DatabaseManager,
@@ -47,3 +44,18 @@ __all__ = [
     "MemoryAccessPattern",
     "create_dual_memory_system",
 ]
+
+# Importing the Qdrant client takes most of a second, so its storage classes
+# are only imported once they are used
+_QDRANT_EXPORTS = (
+    "HierarchicalMemoryStorage",
+    "QdrantCollectionManager",
+    "VectorSearchEngine",
+    "create_hierarchical_storage",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _QDRANT_EXPORTS:
+        return getattr(importlib.import_module(".qdrant_storage", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
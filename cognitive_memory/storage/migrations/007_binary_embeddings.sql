@@ -0,0 +1,9 @@
+-- 007_binary_embeddings.sql
+-- Store cognitive_embedding as binary float32 BLOBs instead of JSON arrays
+
+-- Each value is an 8-byte header (magic, dtype code, dimension) followed by the
+-- little-endian float32 vector. SQLite keeps BLOB values as-is in the existing
+-- TEXT-affinity column, so no table rebuild is needed.
+
+-- Existing JSON rows are converted in place by
+-- DatabaseManager._convert_json_embeddings when this migration is applied.
@@ -0,0 +1,15 @@
+-- 008_source_manifest.sql
+-- Track the loaded state of each source file so unchanged files can be skipped
+
+-- One row per loaded source file: the size, modification time and SHA-256
+-- content hash the file had when it was loaded, and the IDs of the memories
+-- created from it (JSON array). Rows are replaced on every successful reload
+-- and removed together with the memories of the source path.
+CREATE TABLE IF NOT EXISTS source_manifest (
+    source_path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    content_hash TEXT NOT NULL,
+    memory_ids TEXT NOT NULL DEFAULT '[]',
+    updated_at REAL NOT NULL DEFAULT (julianday('now'))
+)
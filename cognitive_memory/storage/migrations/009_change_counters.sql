@@ -0,0 +1,61 @@
+-- 009_change_counters.sql
+-- Count writes to memories and connections so in-process caches can detect
+-- changes, including changes made by other processes, with one small lookup
+
+CREATE TABLE IF NOT EXISTS change_counters (
+    table_name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO change_counters (table_name)
+VALUES ('memories'), ('memory_connections');
+
+CREATE TRIGGER IF NOT EXISTS memories_insert_counter
+AFTER INSERT ON memories
+BEGIN
+    UPDATE change_counters SET version = version + 1
+    WHERE table_name = 'memories';
+END;
+
+-- Access statistics written by reads are not counted as changes
+CREATE TRIGGER IF NOT EXISTS memories_update_counter
+AFTER UPDATE OF
+    content, memory_type, hierarchy_level, dimensions, timestamp, strength,
+    created_at, updated_at, decay_rate, importance_score, consolidation_status,
+    tags, context_metadata, cognitive_embedding
+ON memories
+BEGIN
+    UPDATE change_counters SET version = version + 1
+    WHERE table_name = 'memories';
+END;
+
+CREATE TRIGGER IF NOT EXISTS memories_delete_counter
+AFTER DELETE ON memories
+BEGIN
+    UPDATE change_counters SET version = version + 1
+    WHERE table_name = 'memories';
+END;
+
+CREATE TRIGGER IF NOT EXISTS connections_insert_counter
+AFTER INSERT ON memory_connections
+BEGIN
+    UPDATE change_counters SET version = version + 1
+    WHERE table_name = 'memory_connections';
+END;
+
+-- Activation statistics written by traversals are not counted as changes
+CREATE TRIGGER IF NOT EXISTS connections_update_counter
+AFTER UPDATE OF source_id, target_id, strength, connection_type
+ON memory_connections
+BEGIN
+    UPDATE change_counters SET version = version + 1
+    WHERE table_name = 'memory_connections';
+END;
+
+-- Also fires for connections removed by ON DELETE CASCADE
+CREATE TRIGGER IF NOT EXISTS connections_delete_counter
+AFTER DELETE ON memory_connections
+BEGIN
+    UPDATE change_counters SET version = version + 1
+    WHERE table_name = 'memory_connections';
+END;
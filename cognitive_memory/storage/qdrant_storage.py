@@ -5,6 +5,7 @@ This module implements hierarchical memory storage using Qdrant vector database
 with 3-tier collections: L0 (concepts), L1 (contexts), L2 (episodes).
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 
@@ -390,6 +391,9 @@ class HierarchicalMemoryStorage(VectorStorage):
         grpc_port: int | None = None,
         prefer_grpc: bool = True,
         timeout: int | None = None,
+        upsert_batch_size: int | None = None,
+        upsert_parallel: int | None = None,
+        upsert_wait: bool | None = None,
     ):
         """
         Initialize hierarchical memory storage.
@@ -402,6 +406,10 @@ class HierarchicalMemoryStorage(VectorStorage):
             grpc_port: Qdrant gRPC port (defaults to config port + 1)
             prefer_grpc: Whether to prefer gRPC connection
             timeout: Connection timeout in seconds (defaults to config)
+            upsert_batch_size: Points per batched upsert request (defaults to config)
+            upsert_parallel: Concurrent batched upsert requests (defaults to config)
+            upsert_wait: Whether batched upserts wait for the write to be applied
+                (defaults to config)
         """
         # Use defaults from config if not provided
         default_config = QdrantConfig()
@@ -411,6 +419,11 @@ class HierarchicalMemoryStorage(VectorStorage):
         self.timeout = timeout or default_config.timeout
         self.vector_size = vector_size
         self.project_id = project_id
+        self.upsert_batch_size = upsert_batch_size or default_config.upsert_batch_size
+        self.upsert_parallel = upsert_parallel or default_config.upsert_parallel
+        self.upsert_wait = (
+            default_config.upsert_wait if upsert_wait is None else upsert_wait
+        )
 
         # Initialize Qdrant client
         try:
@@ -442,16 +455,22 @@ class HierarchicalMemoryStorage(VectorStorage):
         if not self.collection_manager.initialize_collections():
             raise RuntimeError("Failed to initialize Qdrant collections")
 
-    def store_vector(
+    def _build_point(
         self, id: str, vector: np.ndarray | list[float], metadata: dict[str, Any]
-    ) -> None:
+    ) -> tuple[str, PointStruct]:
         """
-        Store a vector with associated metadata in appropriate hierarchy level.
+        Validate a vector and build its point for the matching hierarchy level.
 
         Args:
             id: Unique identifier for the vector
-            vector: Cognitive embedding vector (dimension must match configured vector_size)
+            vector: Cognitive embedding vector
             metadata: Associated metadata including hierarchy_level
+
+        Returns:
+            Tuple of (collection name, point structure)
+
+        Raises:
+            ValueError: If the vector dimension or hierarchy level is invalid
         """
         if not isinstance(vector, np.ndarray):
             vector = np.array(vector, dtype=np.float32)
@@ -473,8 +492,20 @@ class HierarchicalMemoryStorage(VectorStorage):
         # Convert vector to list
         vector_list = vector.tolist() if vector.ndim == 1 else vector.flatten().tolist()
 
-        # Create point structure
-        point = PointStruct(id=id, vector=vector_list, payload=metadata)
+        return collection_name, PointStruct(id=id, vector=vector_list, payload=metadata)
+
+    def store_vector(
+        self, id: str, vector: np.ndarray | list[float], metadata: dict[str, Any]
+    ) -> None:
+        """
+        Store a vector with associated metadata in appropriate hierarchy level.
+
+        Args:
+            id: Unique identifier for the vector
+            vector: Cognitive embedding vector (dimension must match configured vector_size)
+            metadata: Associated metadata including hierarchy_level
+        """
+        collection_name, point = self._build_point(id, vector, metadata)
 
         try:
             # Store in Qdrant
@@ -483,7 +514,7 @@ class HierarchicalMemoryStorage(VectorStorage):
             logger.debug(
                 "Vector stored successfully",
                 id=id,
-                level=hierarchy_level,
+                level=metadata.get("hierarchy_level", 2),
                 collection=collection_name,
                 metadata_keys=list(metadata.keys()),
             )
@@ -492,12 +523,179 @@ class HierarchicalMemoryStorage(VectorStorage):
             logger.error(
                 "Failed to store vector",
                 id=id,
-                level=hierarchy_level,
+                level=metadata.get("hierarchy_level", 2),
                 collection=collection_name,
                 error=str(e),
             )
             raise
 
+    def store_vectors_batch(
+        self,
+        items: list[tuple[str, np.ndarray, dict[str, Any]]],
+        batch_size: int | None = None,
+        wait: bool | None = None,
+        parallel: int | None = None,
+    ) -> list[str]:
+        """
+        Store multiple vectors using chunked upserts per hierarchy level.
+
+        Points are grouped by collection and sent in chunks of ``batch_size``,
+        so a large load costs one round trip per chunk instead of one per
+        vector. Invalid vectors and failed chunks are reported by omission
+        from the returned IDs.
+
+        Args:
+            items: (id, vector, metadata) tuples to store
+            batch_size: Points per upsert request (defaults to configuration)
+            wait: Whether Qdrant should apply each chunk before responding.
+                With False, errors raised after the request is acknowledged
+                are not reported (defaults to configuration).
+            parallel: Number of chunks to upsert concurrently (defaults to
+                configuration)
+
+        Returns:
+            IDs of the vectors that were stored successfully, in input order
+        """
+        if not items:
+            return []
+
+        batch_size = max(1, batch_size or self.upsert_batch_size)
+        wait = self.upsert_wait if wait is None else wait
+        parallel = max(1, parallel or self.upsert_parallel)
+
+        # Group valid points by collection, preserving input order
+        points_by_collection: dict[str, list[tuple[str, PointStruct]]] = {}
+        failed_ids: list[str] = []
+        for id, vector, metadata in items:
+            try:
+                collection_name, point = self._build_point(id, vector, metadata)
+            except ValueError as e:
+                failed_ids.append(id)
+                logger.warning("Skipping invalid vector", id=id, error=str(e))
+                continue
+            points_by_collection.setdefault(collection_name, []).append((id, point))
+
+        chunks = [
+            (collection_name, points[start : start + batch_size])
+            for collection_name, points in points_by_collection.items()
+            for start in range(0, len(points), batch_size)
+        ]
+
+        def upsert_chunk(chunk: tuple[str, list[tuple[str, PointStruct]]]) -> bool:
+            collection_name, points = chunk
+            try:
+                self.client.upsert(
+                    collection_name=collection_name,
+                    points=[point for _, point in points],
+                    wait=wait,
+                )
+                return True
+            except Exception as e:
+                logger.error(
+                    "Failed to store vector chunk",
+                    collection=collection_name,
+                    chunk_size=len(points),
+                    error=str(e),
+                )
+                return False
+
+        if parallel > 1 and len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=min(parallel, len(chunks))) as executor:
+                chunk_results = list(executor.map(upsert_chunk, chunks))
+        else:
+            chunk_results = [upsert_chunk(chunk) for chunk in chunks]
+
+        stored: set[str] = set()
+        for (_, points), succeeded in zip(chunks, chunk_results, strict=True):
+            if succeeded:
+                stored.update(id for id, _ in points)
+            else:
+                failed_ids.extend(id for id, _ in points)
+
+        stored_ids = [id for id, _, _ in items if id in stored]
+
+        logger.info(
+            "Batch vector storage completed",
+            requested_count=len(items),
+            stored_count=len(stored_ids),
+            chunk_count=len(chunks),
+            failed_ids=failed_ids[:5],
+        )
+
+        return stored_ids
+
+    def update_metadata_batch(
+        self, items: list[tuple[str, dict[str, Any]]]
+    ) -> list[str]:
+        """
+        Overwrite the payloads of stored points without re-sending vectors.
+
+        Payload overwrites are batched per hierarchy level collection in
+        chunks of the configured upsert batch size.
+
+        Args:
+            items: (id, metadata) tuples; metadata includes hierarchy_level
+
+        Returns:
+            IDs of the points whose payload was overwritten, in input order
+        """
+        if not items:
+            return []
+
+        payloads_by_collection: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+        for id, metadata in items:
+            hierarchy_level = metadata.get("hierarchy_level", 2)
+            if hierarchy_level not in [0, 1, 2]:
+                logger.warning(
+                    "Skipping payload with invalid hierarchy level",
+                    id=id,
+                    level=hierarchy_level,
+                )
+                continue
+            collection_name = self.collection_manager.get_collection_name(
+                hierarchy_level
+            )
+            payloads_by_collection.setdefault(collection_name, []).append(
+                (id, metadata)
+            )
+
+        batch_size = max(1, self.upsert_batch_size)
+        updated: set[str] = set()
+        for collection_name, payloads in payloads_by_collection.items():
+            for start in range(0, len(payloads), batch_size):
+                chunk = payloads[start : start + batch_size]
+                try:
+                    self.client.batch_update_points(
+                        collection_name=collection_name,
+                        update_operations=[
+                            models.OverwritePayloadOperation(
+                                overwrite_payload=models.SetPayload(
+                                    payload=metadata, points=[id]
+                                )
+                            )
+                            for id, metadata in chunk
+                        ],
+                        wait=self.upsert_wait,
+                    )
+                    updated.update(id for id, _ in chunk)
+                except Exception as e:
+                    logger.error(
+                        "Failed to overwrite payload chunk",
+                        collection=collection_name,
+                        chunk_size=len(chunk),
+                        error=str(e),
+                    )
+
+        updated_ids = [id for id, _ in items if id in updated]
+
+        logger.debug(
+            "Batch payload update completed",
+            requested_count=len(items),
+            updated_count=len(updated_ids),
+        )
+
+        return updated_ids
+
     def search_similar(
         self, query_vector: np.ndarray, k: int, filters: dict | None = None
     ) -> list[SearchResult]:
@@ -539,6 +737,32 @@ class HierarchicalMemoryStorage(VectorStorage):
             level=level, query_vector=query_vector, k=k, filters=filters
         )
 
+    def _delete_points(self, collection_name: str, ids: list[str]) -> bool:
+        """
+        Delete a list of point IDs from one collection in a single request.
+
+        Args:
+            collection_name: Collection to delete from
+            ids: Point IDs to delete
+
+        Returns:
+            True if Qdrant completed the deletion, False otherwise
+        """
+        try:
+            result = self.client.delete(
+                collection_name=collection_name,
+                points_selector=models.PointIdsList(points=list(ids)),
+            )
+            return bool(result.status == models.UpdateStatus.COMPLETED)
+        except Exception as e:
+            logger.debug(
+                "Failed to delete points from collection",
+                collection=collection_name,
+                count=len(ids),
+                error=str(e),
+            )
+            return False
+
     def delete_vector(self, id: str) -> bool:
         """
         Delete a vector by ID across all collections.
@@ -549,32 +773,15 @@ class HierarchicalMemoryStorage(VectorStorage):
         Returns:
             True if deleted, False otherwise
         """
-        success = False
-
-        for level in [0, 1, 2]:
-            collection_name = self.collection_manager.get_collection_name(level)
-            try:
-                result = self.client.delete(
-                    collection_name=collection_name,
-                    points_selector=models.PointIdsList(points=[id]),
-                )
-                if result.status == models.UpdateStatus.COMPLETED:
-                    success = True
-                    logger.debug("Vector deleted", id=id, collection=collection_name)
-            except Exception as e:
-                logger.debug(
-                    "Vector not found in collection (expected)",
-                    id=id,
-                    collection=collection_name,
-                    error=str(e),
-                )
-
-        return success
+        return bool(self.delete_vectors_by_ids([id]))
 
     def delete_vectors_by_ids(self, memory_ids: list[str]) -> list[str]:
         """
         Delete vectors by their IDs across all collections.
 
+        Issues one delete request per collection regardless of the number
+        of IDs. Use delete_vectors_by_level when the levels are known.
+
         Args:
             memory_ids: List of vector IDs to delete
 
@@ -584,20 +791,39 @@ class HierarchicalMemoryStorage(VectorStorage):
         if not memory_ids:
             return []
 
-        successfully_deleted = []
+        return self.delete_vectors_by_level(dict.fromkeys([0, 1, 2], memory_ids))
+
+    def delete_vectors_by_level(self, ids_by_level: dict[int, list[str]]) -> list[str]:
+        """
+        Delete vectors with one request per hierarchy level collection.
+
+        Args:
+            ids_by_level: Mapping of hierarchy level to vector IDs at that level
+
+        Returns:
+            List of successfully deleted memory IDs
+        """
+        deleted: set[str] = set()
+        requested: dict[str, None] = {}
+
+        for level, ids in ids_by_level.items():
+            if not ids:
+                continue
+            requested.update(dict.fromkeys(ids))
+            collection_name = self.collection_manager.get_collection_name(level)
+            if self._delete_points(collection_name, ids):
+                deleted.update(ids)
+                logger.debug(
+                    "Vectors deleted", count=len(ids), collection=collection_name
+                )
 
-        for memory_id in memory_ids:
-            success = self.delete_vector(memory_id)
-            if success:
-                successfully_deleted.append(memory_id)
+        successfully_deleted = [id for id in requested if id in deleted]
 
         logger.info(
             "Batch vector deletion completed",
-            requested_count=len(memory_ids),
+            requested_count=len(requested),
             deleted_count=len(successfully_deleted),
-            deleted_ids=successfully_deleted[:5]
-            if len(successfully_deleted) > 5
-            else successfully_deleted,
+            deleted_ids=successfully_deleted[:5],
         )
 
         return successfully_deleted
@@ -689,6 +915,9 @@ def create_hierarchical_storage(
     port: int | None = None,
     grpc_port: int | None = None,
     prefer_grpc: bool = True,
+    upsert_batch_size: int | None = None,
+    upsert_parallel: int | None = None,
+    upsert_wait: bool | None = None,
 ) -> HierarchicalMemoryStorage:
     """
     Factory function to create hierarchical memory storage.
@@ -700,6 +929,9 @@ def create_hierarchical_storage(
         port: Qdrant HTTP port (defaults to config)
         grpc_port: Qdrant gRPC port (defaults to config port + 1)
         prefer_grpc: Whether to prefer gRPC connection
+        upsert_batch_size: Points per batched upsert request (defaults to config)
+        upsert_parallel: Concurrent batched upsert requests (defaults to config)
+        upsert_wait: Whether batched upserts wait for the write to be applied
 
     Returns:
         HierarchicalMemoryStorage: Configured storage instance
@@ -711,4 +943,7 @@ def create_hierarchical_storage(
         port=port,
         grpc_port=grpc_port,
         prefer_grpc=prefer_grpc,
+        upsert_batch_size=upsert_batch_size,
+        upsert_parallel=upsert_parallel,
+        upsert_wait=upsert_wait,
     )
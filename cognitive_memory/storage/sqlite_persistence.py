@@ -6,34 +6,171 @@ database schema for memory metadata, connection graphs, and
 retrieval statistics to support the cognitive memory system.
 """
 
+import atexit
 import json
 import sqlite3
+import struct
+import threading
 import time
-from collections.abc import Iterator
+import weakref
+from collections import Counter
+from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 import numpy as np
 from loguru import logger
 
+from ..core.adjacency import ConnectionAdjacency
 from ..core.interfaces import ConnectionGraph, MemoryStorage
 from ..core.memory import CognitiveMemory
 
+# Values bound per "IN (...)" query, well below SQLite's host parameter limit
+SQLITE_IN_CHUNK_SIZE = 500
+
+_T = TypeVar("_T")
+
+
+def iter_in_chunks(values: Sequence[_T]) -> Iterator[tuple[list[_T], str]]:
+    """
+    Split values for "IN (...)" queries that stay below the parameter limit.
+
+    Args:
+        values: Values to bind
+
+    Yields:
+        Chunks of at most SQLITE_IN_CHUNK_SIZE values and their placeholders
+    """
+    for start in range(0, len(values), SQLITE_IN_CHUNK_SIZE):
+        chunk = list(values[start : start + SQLITE_IN_CHUNK_SIZE])
+        yield chunk, ", ".join("?" * len(chunk))
+
+
+# Binary embedding layout: magic, dtype code, padding byte, dimension (uint32)
+_EMBEDDING_HEADER = struct.Struct("<2sBxI")
+_EMBEDDING_MAGIC = b"CE"
+_EMBEDDING_DTYPES = {1: np.dtype("<f4")}
+_FLOAT32_CODE = 1
+
+
+def _serialize_embedding(embedding: np.ndarray) -> bytes:
+    """Serialize an embedding to a headered little-endian float32 BLOB."""
+    vector = np.ascontiguousarray(embedding, dtype="<f4").reshape(-1)
+    header = _EMBEDDING_HEADER.pack(_EMBEDDING_MAGIC, _FLOAT32_CODE, vector.shape[0])
+    return header + vector.tobytes()
+
+
+def _deserialize_embedding(value: bytes | str) -> np.ndarray:
+    """
+    Deserialize an embedding stored as a binary BLOB or legacy JSON array.
+
+    Binary values are returned as a read-only view over the BLOB without
+    copying the vector data.
+
+    Raises:
+        ValueError: If the value is not a valid embedding
+    """
+    if isinstance(value, str):
+        return np.array(json.loads(value), dtype=np.float32)
+
+    if len(value) < _EMBEDDING_HEADER.size:
+        raise ValueError("Embedding BLOB is shorter than its header")
+
+    magic, dtype_code, dimension = _EMBEDDING_HEADER.unpack_from(value)
+    if magic != _EMBEDDING_MAGIC or dtype_code not in _EMBEDDING_DTYPES:
+        raise ValueError("Unrecognized embedding BLOB header")
+
+    return np.frombuffer(
+        value,
+        dtype=_EMBEDDING_DTYPES[dtype_code],
+        count=dimension,
+        offset=_EMBEDDING_HEADER.size,
+    )
+
+
+def _connections_version(conn: sqlite3.Connection) -> int:
+    """Get the change counter of the memory_connections table."""
+    row = conn.execute(
+        "SELECT version FROM change_counters WHERE table_name = 'memory_connections'"
+    ).fetchone()
+    return int(row[0])
+
+
+def _split_sql_statements(sql: str) -> list[str]:
+    """Split a migration script into statements, keeping trigger bodies whole."""
+    statements = []
+    current = ""
+    for part in sql.split(";"):
+        current += part + ";"
+        if sqlite3.complete_statement(current):
+            statement = current.strip().rstrip(";").strip()
+            if statement:
+                statements.append(statement)
+            current = ""
+    return statements
+
+
+class _ReaderSlot:
+    """Holder of a thread's reader connection, collected when the thread exits."""
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+
+def _close_reader(
+    connections: dict[int, sqlite3.Connection], lock: threading.Lock, key: int
+) -> None:
+    """Close a reader connection whose thread has exited."""
+    with lock:
+        conn = connections.pop(key, None)
+    if conn is not None:
+        conn.close()
+
 
 class DatabaseManager:
-    """SQLite database manager with schema management and migrations."""
+    """
+    SQLite database manager with schema management and migrations.
 
-    def __init__(self, db_path: str = "data/cognitive_memory.db"):
+    Connections are long-lived: one shared writer connection serialized by a
+    lock, plus one read-only connection per thread that is closed when the
+    thread exits. PRAGMAs are applied once when a connection is opened, and
+    each connection keeps its own cache of prepared statements across
+    operations.
+    """
+
+    # Python data conversions run right after the SQL migration of the same version
+    _DATA_MIGRATIONS = {"007_binary_embeddings": "_convert_json_embeddings"}
+
+    def __init__(
+        self,
+        db_path: str = "data/cognitive_memory.db",
+        mmap_size: int = 268435456,
+        statement_cache_size: int = 256,
+    ):
         """
         Initialize database manager.
 
         Args:
             db_path: Path to SQLite database file
+            mmap_size: Bytes of the database file to memory-map (0 disables)
+            statement_cache_size: Prepared statements cached per connection
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.mmap_size = mmap_size
+        self.statement_cache_size = statement_cache_size
+
+        # Connection pool: a single writer and per-thread readers
+        self._writer: sqlite3.Connection | None = None
+        self._writer_lock = threading.RLock()
+        self._readers = threading.local()
+        # Open reader connections by the id of their thread's _ReaderSlot
+        self._reader_connections: dict[int, sqlite3.Connection] = {}
+        self._readers_lock = threading.Lock()
 
         # Path to migration files
         self.migrations_path = Path(__file__).parent / "migrations"
@@ -87,12 +224,12 @@ class DatabaseManager:
                 # Read and execute migration SQL
                 sql_content = migration_file.read_text()
                 # Split and execute individual statements to avoid auto-commit issues
-                statements = [
-                    stmt.strip() for stmt in sql_content.split(";") if stmt.strip()
-                ]
-                for statement in statements:
+                for statement in _split_sql_statements(sql_content):
                     cursor.execute(statement)
 
+                if version in self._DATA_MIGRATIONS:
+                    getattr(self, self._DATA_MIGRATIONS[version])(cursor)
+
                 # Record migration as applied
                 cursor.execute(
                     "INSERT INTO schema_migrations (version) VALUES (?)", (version,)
@@ -102,33 +239,134 @@ class DatabaseManager:
 
         logger.info(f"All migrations applied. Total: {len(migration_files)}")
 
+    def _convert_json_embeddings(self, cursor: sqlite3.Cursor) -> None:
+        """Convert JSON-encoded cognitive embeddings to binary BLOBs in place."""
+        cursor.execute(
+            "SELECT id, cognitive_embedding FROM memories "
+            "WHERE typeof(cognitive_embedding) = 'text'"
+        )
+        rows = cursor.fetchall()
+
+        updates = []
+        for memory_id, embedding_json in rows:
+            try:
+                embedding = _deserialize_embedding(embedding_json)
+            except (json.JSONDecodeError, ValueError, TypeError) as e:
+                logger.warning(
+                    "Leaving unreadable embedding as JSON",
+                    memory_id=memory_id,
+                    error=str(e),
+                )
+                continue
+            updates.append((_serialize_embedding(embedding), memory_id))
+
+        cursor.executemany(
+            "UPDATE memories SET cognitive_embedding = ? WHERE id = ?", updates
+        )
+
+        logger.info(
+            "Converted JSON embeddings to binary",
+            converted=len(updates),
+            skipped=len(rows) - len(updates),
+        )
+
+    def _open_connection(self, readonly: bool) -> sqlite3.Connection:
+        """Open a pooled connection and apply the connection PRAGMAs once."""
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=30.0,
+            check_same_thread=False,
+            cached_statements=self.statement_cache_size,
+        )
+        conn.row_factory = sqlite3.Row  # Enable dict-like access
+
+        # Enable foreign key constraints
+        conn.execute("PRAGMA foreign_keys = ON")
+
+        # Set performance optimizations
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA cache_size = 10000")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+
+        if readonly:
+            conn.execute("PRAGMA query_only = ON")
+
+        return conn
+
     @contextmanager
     def get_connection(self) -> Iterator[sqlite3.Connection]:
-        """Get database connection with proper context management."""
-        conn = None
-        try:
-            conn = sqlite3.connect(str(self.db_path), timeout=30.0)
-            conn.row_factory = sqlite3.Row  # Enable dict-like access
+        """
+        Get the shared writer connection with proper context management.
+
+        The writer is held exclusively for the duration of the context.
+        Changes that are not committed when the context exits are rolled back.
+        """
+        with self._writer_lock:
+            try:
+                if self._writer is None:
+                    self._writer = self._open_connection(readonly=False)
+                conn = self._writer
 
-            # Enable foreign key constraints
-            conn.execute("PRAGMA foreign_keys = ON")
+                yield conn
 
-            # Set performance optimizations
-            conn.execute("PRAGMA journal_mode = WAL")
-            conn.execute("PRAGMA synchronous = NORMAL")
-            conn.execute("PRAGMA cache_size = 10000")
-            conn.execute("PRAGMA temp_store = MEMORY")
+            except Exception as e:
+                if self._writer is not None:
+                    self._writer.rollback()
+                logger.error("Database operation failed", error=str(e))
+                raise
+            finally:
+                if self._writer is not None and self._writer.in_transaction:
+                    self._writer.rollback()
+
+    @contextmanager
+    def get_read_connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Get this thread's read-only connection with proper context management.
+
+        Readers see every change committed by the writer, and in WAL mode do
+        not wait for it.
+        """
+        slot: _ReaderSlot | None = getattr(self._readers, "slot", None)
+        conn = slot.conn if slot is not None else None
+        try:
+            if slot is None:
+                conn = self._open_connection(readonly=True)
+                slot = _ReaderSlot(conn)
+                self._readers.slot = slot
+                with self._readers_lock:
+                    self._reader_connections[id(slot)] = conn
+                # The thread-local slot is released when its thread exits
+                weakref.finalize(
+                    slot,
+                    _close_reader,
+                    self._reader_connections,
+                    self._readers_lock,
+                    id(slot),
+                )
 
             yield conn
 
         except Exception as e:
-            if conn:
-                conn.rollback()
             logger.error("Database operation failed", error=str(e))
             raise
         finally:
-            if conn:
+            if conn is not None and conn.in_transaction:
+                conn.rollback()
+
+    def close(self) -> None:
+        """Close all pooled connections; they are reopened on next use."""
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+        with self._readers_lock:
+            for conn in self._reader_connections.values():
                 conn.close()
+            self._reader_connections.clear()
+        self._readers = threading.local()
 
     def vacuum_database(self) -> bool:
         """Vacuum database to reclaim space and optimize performance."""
@@ -144,7 +382,7 @@ class DatabaseManager:
     def get_database_stats(self) -> dict[str, Any]:
         """Get database statistics."""
         try:
-            with self.get_connection() as conn:
+            with self.get_read_connection() as conn:
                 cursor = conn.cursor()
 
                 stats = {}
@@ -176,62 +414,62 @@ class MemoryMetadataStore(MemoryStorage):
         """Initialize memory metadata store."""
         self.db_manager = db_manager
 
+    _STORE_MEMORY_SQL = """
+        INSERT OR REPLACE INTO memories (
+            id, content, memory_type, hierarchy_level,
+            dimensions, timestamp, strength, access_count,
+            last_accessed, created_at, updated_at,
+            decay_rate, importance_score, consolidation_status,
+            tags, context_metadata, cognitive_embedding
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    def _memory_to_row(self, memory: CognitiveMemory, now: float) -> tuple[Any, ...]:
+        """Serialize a memory into parameters for the memories INSERT."""
+        # Serialize dimensions and tags
+        dimensions_json = json.dumps(memory.dimensions)
+        tags_json = json.dumps(memory.tags) if memory.tags else None
+
+        # Convert datetime to timestamp if needed
+        timestamp_val = (
+            memory.timestamp.timestamp()
+            if hasattr(memory.timestamp, "timestamp")
+            else memory.timestamp
+        )
+
+        # Serialize cognitive embedding to a float32 BLOB if present
+        embedding_blob = None
+        if memory.cognitive_embedding is not None:
+            embedding_blob = _serialize_embedding(memory.cognitive_embedding)
+
+        return (
+            memory.id,
+            memory.content,
+            memory.memory_type,
+            memory.hierarchy_level,
+            dimensions_json,
+            timestamp_val,
+            memory.strength,
+            memory.access_count,
+            now,  # last_accessed
+            now,  # created_at (will be ignored if record exists)
+            now,  # updated_at
+            memory.decay_rate,  # Use memory's decay rate
+            memory.importance_score,  # Use memory's importance score
+            "none",  # consolidation_status
+            tags_json,
+            json.dumps(memory.metadata) if memory.metadata else None,
+            embedding_blob,  # cognitive_embedding
+        )
+
     def store_memory(self, memory: CognitiveMemory) -> bool:
         """Store a cognitive memory with full metadata."""
         try:
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
 
-                # Serialize dimensions and tags
-                dimensions_json = json.dumps(memory.dimensions)
-                tags_json = json.dumps(memory.tags) if memory.tags else None
-
-                # Current timestamp
-                now = time.time()
-
-                # Convert datetime to timestamp if needed
-                timestamp_val = (
-                    memory.timestamp.timestamp()
-                    if hasattr(memory.timestamp, "timestamp")
-                    else memory.timestamp
-                )
-
-                # Serialize cognitive embedding to JSON if present
-                embedding_json = None
-                if memory.cognitive_embedding is not None:
-                    embedding_json = json.dumps(memory.cognitive_embedding.tolist())
-
                 cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO memories (
-                        id, content, memory_type, hierarchy_level,
-                        dimensions, timestamp, strength, access_count,
-                        last_accessed, created_at, updated_at,
-                        decay_rate, importance_score, consolidation_status,
-                        tags, context_metadata, cognitive_embedding
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        memory.id,
-                        memory.content,
-                        memory.memory_type,
-                        memory.hierarchy_level,
-                        dimensions_json,
-                        timestamp_val,
-                        memory.strength,
-                        memory.access_count,
-                        now,  # last_accessed
-                        now,  # created_at (will be ignored if record exists)
-                        now,  # updated_at
-                        memory.decay_rate,  # Use memory's decay rate
-                        memory.importance_score,  # Use memory's importance score
-                        "none",  # consolidation_status
-                        tags_json,
-                        json.dumps(memory.metadata)
-                        if memory.metadata
-                        else None,  # context_metadata
-                        embedding_json,  # cognitive_embedding
-                    ),
+                    self._STORE_MEMORY_SQL, self._memory_to_row(memory, time.time())
                 )
 
                 conn.commit()
@@ -249,6 +487,41 @@ class MemoryMetadataStore(MemoryStorage):
             logger.error("Failed to store memory", memory_id=memory.id, error=str(e))
             return False
 
+    def store_memories_batch(self, memories: list[CognitiveMemory]) -> list[str]:
+        """
+        Store multiple memories in a single transaction.
+
+        Falls back to storing memories one at a time if the batch insert
+        fails, so a single bad memory does not prevent the rest being stored.
+
+        Args:
+            memories: Memories to store
+
+        Returns:
+            IDs of the memories that were stored successfully
+        """
+        if not memories:
+            return []
+
+        try:
+            now = time.time()
+            rows = [self._memory_to_row(memory, now) for memory in memories]
+
+            with self.db_manager.get_connection() as conn:
+                conn.executemany(self._STORE_MEMORY_SQL, rows)
+                conn.commit()
+
+            logger.debug("Memory batch stored successfully", count=len(memories))
+            return [memory.id for memory in memories]
+
+        except Exception as e:
+            logger.warning(
+                "Batch memory insert failed, storing individually",
+                count=len(memories),
+                error=str(e),
+            )
+            return [memory.id for memory in memories if self.store_memory(memory)]
+
     def retrieve_memory(self, memory_id: str) -> CognitiveMemory | None:
         """Retrieve a memory by ID."""
         try:
@@ -286,6 +559,49 @@ class MemoryMetadataStore(MemoryStorage):
             logger.error("Failed to retrieve memory", memory_id=memory_id, error=str(e))
             return None
 
+    def record_memory_accesses(self, memory_ids: list[str]) -> int:
+        """
+        Count accesses to memories in a single transaction.
+
+        Updates the access count and last access time like retrieve_memory,
+        without reading the memories.
+
+        Args:
+            memory_ids: Memories that were accessed
+
+        Returns:
+            Number of memories updated
+        """
+        if not memory_ids:
+            return 0
+
+        try:
+            updated = 0
+            with self.db_manager.get_connection() as conn:
+                for chunk, placeholders in iter_in_chunks(memory_ids):
+                    cursor = conn.execute(
+                        f"""
+                        UPDATE memories
+                        SET access_count = access_count + 1,
+                            last_accessed = julianday('now')
+                        WHERE id IN ({placeholders})
+                    """,
+                        chunk,
+                    )
+                    updated += cursor.rowcount
+
+                conn.commit()
+
+            return updated
+
+        except Exception as e:
+            logger.error(
+                "Failed to record memory accesses",
+                memory_count=len(memory_ids),
+                error=str(e),
+            )
+            return 0
+
     def update_memory(self, memory: CognitiveMemory) -> bool:
         """Update an existing memory."""
         try:
@@ -334,6 +650,60 @@ class MemoryMetadataStore(MemoryStorage):
             logger.error("Failed to update memory", memory_id=memory.id, error=str(e))
             return False
 
+    def update_memories_metadata(self, memories: list[CognitiveMemory]) -> list[str]:
+        """
+        Rewrite the metadata of stored memories in a single transaction.
+
+        Only the context metadata, timestamp and tags are written. Content,
+        embeddings, access statistics and connections are left untouched.
+
+        Args:
+            memories: Memories whose metadata, timestamp and tags changed
+
+        Returns:
+            IDs of the memories that were updated
+        """
+        if not memories:
+            return []
+
+        try:
+            updated_ids = []
+            with self.db_manager.get_connection() as conn:
+                for memory in memories:
+                    timestamp_val = (
+                        memory.timestamp.timestamp()
+                        if hasattr(memory.timestamp, "timestamp")
+                        else memory.timestamp
+                    )
+                    cursor = conn.execute(
+                        """
+                        UPDATE memories SET
+                            context_metadata = ?, timestamp = ?, tags = ?,
+                            updated_at = julianday('now')
+                        WHERE id = ?
+                    """,
+                        (
+                            json.dumps(memory.metadata) if memory.metadata else None,
+                            timestamp_val,
+                            json.dumps(memory.tags) if memory.tags else None,
+                            memory.id,
+                        ),
+                    )
+                    if cursor.rowcount:
+                        updated_ids.append(memory.id)
+
+                conn.commit()
+
+            return updated_ids
+
+        except Exception as e:
+            logger.error(
+                "Failed to update memory metadata",
+                memory_count=len(memories),
+                error=str(e),
+            )
+            return []
+
     def delete_memory(self, memory_id: str) -> bool:
         """Delete a memory by ID."""
         try:
@@ -358,7 +728,7 @@ class MemoryMetadataStore(MemoryStorage):
     def get_memories_by_level(self, level: int) -> list[CognitiveMemory]:
         """Get all memories at a specific hierarchy level."""
         try:
-            with self.db_manager.get_connection() as conn:
+            with self.db_manager.get_read_connection() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute(
@@ -377,12 +747,138 @@ class MemoryMetadataStore(MemoryStorage):
             logger.error("Failed to get memories by level", level=level, error=str(e))
             return []
 
+    def get_memories_by_ids(self, memory_ids: list[str]) -> list[CognitiveMemory]:
+        """
+        Get memories by ID in one query per chunk without recording an access.
+
+        Args:
+            memory_ids: IDs of memories to fetch
+
+        Returns:
+            Found memories in the order of ``memory_ids``; missing IDs are skipped
+        """
+        if not memory_ids:
+            return []
+
+        unique_ids = list(dict.fromkeys(memory_ids))
+        found: dict[str, CognitiveMemory] = {}
+
+        try:
+            with self.db_manager.get_read_connection() as conn:
+                for chunk, placeholders in iter_in_chunks(unique_ids):
+                    rows = conn.execute(
+                        f"SELECT * FROM memories WHERE id IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                    for row in rows:
+                        found[row["id"]] = self._row_to_memory(row)
+
+        except Exception as e:
+            logger.error(
+                "Failed to get memories by IDs", count=len(unique_ids), error=str(e)
+            )
+            return []
+
+        return [found[memory_id] for memory_id in memory_ids if memory_id in found]
+
+    def get_memory_counts(self) -> dict[str, Any]:
+        """
+        Get aggregate memory counts and sizes with GROUP BY queries.
+
+        Returns:
+            Dictionary with ``total``, ``content_bytes``, ``embedding_bytes``
+            and ``by_level``, ``by_type``, ``by_source_type`` and
+            ``by_consolidation_status`` breakdowns
+        """
+        with self.db_manager.get_read_connection() as conn:
+            total, content_bytes, embedding_bytes = conn.execute(
+                """
+                SELECT COUNT(*),
+                       TOTAL(LENGTH(CAST(content AS BLOB))),
+                       TOTAL(LENGTH(cognitive_embedding))
+                FROM memories
+            """
+            ).fetchone()
+
+            def grouped(expression: str) -> dict[Any, int]:
+                rows = conn.execute(
+                    f"SELECT {expression} AS grp, COUNT(*) FROM memories GROUP BY grp"
+                ).fetchall()
+                return {row[0]: row[1] for row in rows}
+
+            by_level: dict[Any, int] = dict.fromkeys((0, 1, 2), 0)
+            by_level.update(grouped("hierarchy_level"))
+
+            return {
+                "total": total,
+                "content_bytes": int(content_bytes),
+                "embedding_bytes": int(embedding_bytes),
+                "by_level": by_level,
+                "by_type": grouped("memory_type"),
+                "by_source_type": grouped(
+                    "COALESCE(JSON_EXTRACT(context_metadata, '$.source_type'), "
+                    "'unknown')"
+                ),
+                "by_consolidation_status": grouped("consolidation_status"),
+            }
+
+    def get_level_signature(self, level: int) -> tuple[Any, ...] | None:
+        """
+        Get a fingerprint of the memories stored at a hierarchy level.
+
+        Inserts and replacements change the count or maximum rowid, and
+        updates change the updated_at total. Access-count bumps from reads do
+        not change the signature.
+
+        Args:
+            level: Hierarchy level to fingerprint
+
+        Returns:
+            Signature tuple, or None if it could not be computed
+        """
+        try:
+            with self.db_manager.get_read_connection() as conn:
+                row = conn.execute(
+                    """
+                    SELECT COUNT(*), MAX(rowid), TOTAL(updated_at)
+                    FROM memories WHERE hierarchy_level = ?
+                """,
+                    (level,),
+                ).fetchone()
+                return tuple(row)
+
+        except Exception as e:
+            logger.error("Failed to get level signature", level=level, error=str(e))
+            return None
+
+    def get_change_version(self) -> tuple[int, ...] | None:
+        """
+        Get the change counters of the memories and connections tables.
+
+        The counters are maintained by triggers on every write, including
+        writes by other processes. Access-count bumps from reads do not
+        change them.
+
+        Returns:
+            Counter tuple, or None if it could not be read
+        """
+        try:
+            with self.db_manager.get_read_connection() as conn:
+                rows = conn.execute(
+                    "SELECT version FROM change_counters ORDER BY table_name"
+                ).fetchall()
+                return tuple(row[0] for row in rows)
+
+        except Exception as e:
+            logger.error("Failed to get change version", error=str(e))
+            return None
+
     def get_memories_by_type(
         self, memory_type: str, limit: int | None = None
     ) -> list[CognitiveMemory]:
         """Get memories by type with optional limit."""
         try:
-            with self.db_manager.get_connection() as conn:
+            with self.db_manager.get_read_connection() as conn:
                 cursor = conn.cursor()
 
                 sql = """
@@ -410,7 +906,7 @@ class MemoryMetadataStore(MemoryStorage):
     def get_memories_by_source_path(self, source_path: str) -> list[CognitiveMemory]:
         """Get memories by source file path from metadata."""
         try:
-            with self.db_manager.get_connection() as conn:
+            with self.db_manager.get_read_connection() as conn:
                 cursor = conn.cursor()
 
                 # Use JSON_EXTRACT to query source_path from context_metadata
@@ -459,6 +955,12 @@ class MemoryMetadataStore(MemoryStorage):
             with self.db_manager.get_connection() as conn:
                 cursor = conn.cursor()
 
+                # The manifest entry no longer describes what is stored
+                cursor.execute(
+                    "DELETE FROM source_manifest WHERE source_path = ?",
+                    (source_path,),
+                )
+
                 # First, get the memory IDs to be deleted for logging
                 cursor.execute(
                     """
@@ -471,6 +973,7 @@ class MemoryMetadataStore(MemoryStorage):
                 memory_ids = [row["id"] for row in cursor.fetchall()]
 
                 if not memory_ids:
+                    conn.commit()
                     logger.debug(
                         "No memories found for source path", source_path=source_path
                     )
@@ -507,13 +1010,91 @@ class MemoryMetadataStore(MemoryStorage):
             )
             return 0
 
+    def get_source_manifest(self, source_path: str) -> dict[str, Any] | None:
+        """
+        Get the recorded state of a loaded source file.
+
+        Args:
+            source_path: Source file path as passed to the loader
+
+        Returns:
+            Manifest entry with ``memories_present`` counted in the same
+            query, or None if the source is not tracked
+        """
+        try:
+            with self.db_manager.get_read_connection() as conn:
+                row = conn.execute(
+                    """
+                    SELECT size, mtime, content_hash, memory_ids,
+                           (SELECT COUNT(*) FROM memories
+                            WHERE id IN (SELECT value FROM json_each(m.memory_ids))
+                           ) AS memories_present
+                    FROM source_manifest m WHERE source_path = ?
+                """,
+                    (source_path,),
+                ).fetchone()
+
+        except Exception as e:
+            logger.error(
+                "Failed to get source manifest", source_path=source_path, error=str(e)
+            )
+            return None
+
+        if row is None:
+            return None
+
+        return {
+            "size": row["size"],
+            "mtime": row["mtime"],
+            "content_hash": row["content_hash"],
+            "memory_ids": json.loads(row["memory_ids"]),
+            "memories_present": row["memories_present"],
+        }
+
+    def record_source_manifest(
+        self,
+        source_path: str,
+        size: int,
+        mtime: float,
+        content_hash: str,
+        memory_ids: list[str],
+    ) -> bool:
+        """Record the state of a source file after it was loaded."""
+        try:
+            with self.db_manager.get_connection() as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO source_manifest (
+                        source_path, size, mtime, content_hash, memory_ids, updated_at
+                    ) VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                    (
+                        source_path,
+                        size,
+                        mtime,
+                        content_hash,
+                        json.dumps(memory_ids),
+                        time.time(),
+                    ),
+                )
+                conn.commit()
+                return True
+
+        except Exception as e:
+            logger.error(
+                "Failed to record source manifest",
+                source_path=source_path,
+                error=str(e),
+            )
+            return False
+
     def get_memories_by_tags(self, tags: list[str]) -> list[CognitiveMemory]:
         """Get memories that have any of the specified tags."""
         if not tags:
             return []
 
         try:
-            with self.db_manager.get_connection() as conn:
+            with self.db_manager.get_read_connection() as conn:
                 cursor = conn.cursor()
 
                 # Build a query that checks if any of the provided tags are in the memory's tags array
@@ -680,12 +1261,11 @@ class MemoryMetadataStore(MemoryStorage):
             else datetime.now()
         )
 
-        # Deserialize cognitive embedding from JSON if present
+        # Deserialize cognitive embedding if present
         cognitive_embedding = None
         if "cognitive_embedding" in row.keys() and row["cognitive_embedding"]:
             try:
-                embedding_list = json.loads(row["cognitive_embedding"])
-                cognitive_embedding = np.array(embedding_list)
+                cognitive_embedding = _deserialize_embedding(row["cognitive_embedding"])
             except (json.JSONDecodeError, ValueError) as e:
                 logger.warning(
                     f"Failed to deserialize cognitive embedding for memory {row['id']}: {e}"
@@ -727,11 +1307,40 @@ class MemoryMetadataStore(MemoryStorage):
 
 
 class ConnectionGraphStore(ConnectionGraph):
-    """SQLite-based connection graph storage implementing ConnectionGraph interface."""
+    """
+    SQLite-based connection graph storage implementing ConnectionGraph interface.
 
-    def __init__(self, db_manager: DatabaseManager):
-        """Initialize connection graph store."""
+    Keeps an in-process copy of all connections that is loaded once, updated
+    by this store's own writes, and reloaded when the table changes elsewhere.
+    Activation-count updates are batched and flushed by a background thread.
+    """
+
+    def __init__(
+        self, db_manager: DatabaseManager, activation_flush_interval: float = 5.0
+    ):
+        """
+        Initialize connection graph store.
+
+        Args:
+            db_manager: Database manager for connections
+            activation_flush_interval: Seconds between background flushes of
+                batched activation-count updates
+        """
         self.db_manager = db_manager
+        self.activation_flush_interval = activation_flush_interval
+
+        # In-process connection copy keyed by row id, plus its CSR adjacency
+        self._adjacency_lock = threading.Lock()
+        self._edges: dict[int, tuple[str, str, float]] | None = None
+        self._edge_ids: dict[tuple[str, str, str], int] = {}
+        self._edges_version: int | None = None
+        self._adjacency: ConnectionAdjacency | None = None
+
+        # Pending activation-count increments keyed by (memory_id, min_strength)
+        self._activation_lock = threading.Lock()
+        self._pending_activations: Counter[tuple[str, float]] = Counter()
+        self._flush_event = threading.Event()
+        self._flush_thread: threading.Thread | None = None
 
     def add_connection(
         self,
@@ -754,9 +1363,20 @@ class ConnectionGraphStore(ConnectionGraph):
                 """,
                     (source_id, target_id, strength, connection_type, strength),
                 )
+                version = _connections_version(conn)
 
                 conn.commit()
 
+                if cursor.lastrowid is not None:
+                    self._apply_added_edge(
+                        cursor.lastrowid,
+                        source_id,
+                        target_id,
+                        strength,
+                        connection_type,
+                        version,
+                    )
+
                 logger.debug(
                     "Connection added successfully",
                     source_id=source_id,
@@ -781,7 +1401,7 @@ class ConnectionGraphStore(ConnectionGraph):
     ) -> list[CognitiveMemory]:
         """Get connected memories above minimum strength threshold."""
         try:
-            with self.db_manager.get_connection() as conn:
+            with self.db_manager.get_read_connection() as conn:
                 cursor = conn.cursor()
 
                 # Get connections where memory_id is either source or target
@@ -803,16 +1423,7 @@ class ConnectionGraphStore(ConnectionGraph):
 
                 # Update activation count for accessed connections
                 if rows:
-                    cursor.execute(
-                        """
-                        UPDATE memory_connections
-                        SET activation_count = activation_count + 1,
-                            last_activated = julianday('now')
-                        WHERE (source_id = ? OR target_id = ?) AND strength >= ?
-                    """,
-                        (memory_id, memory_id, min_strength),
-                    )
-                    conn.commit()
+                    self.record_activations([memory_id], min_strength)
 
                 # Convert to CognitiveMemory objects
                 memories = []
@@ -866,7 +1477,11 @@ class ConnectionGraphStore(ConnectionGraph):
                     )
                     return False
 
+                version = _connections_version(conn)
                 conn.commit()
+                self._apply_pair_change(
+                    source_id, target_id, new_strength, version, cursor.rowcount
+                )
                 return True
 
         except Exception as e:
@@ -901,7 +1516,11 @@ class ConnectionGraphStore(ConnectionGraph):
                     )
                     return False
 
+                version = _connections_version(conn)
                 conn.commit()
+                self._apply_pair_change(
+                    source_id, target_id, None, version, cursor.rowcount
+                )
 
                 logger.debug(
                     "Connection removed successfully",
@@ -920,10 +1539,214 @@ class ConnectionGraphStore(ConnectionGraph):
             )
             return False
 
+    def get_adjacency(self) -> ConnectionAdjacency | None:
+        """
+        Get the CSR adjacency of all connections.
+
+        The adjacency is built from the in-process connection copy. The copy is
+        reloaded from SQLite only when the connections change counter differs
+        from the version this store's own writes account for.
+
+        Returns:
+            Current connection adjacency, or None if it could not be loaded
+        """
+        with self._adjacency_lock:
+            try:
+                with self.db_manager.get_read_connection() as conn:
+                    version = _connections_version(conn)
+                    if self._edges is None or version != self._edges_version:
+                        self._load_edges(conn, version)
+
+                if self._adjacency is None and self._edges is not None:
+                    self._adjacency = ConnectionAdjacency(self._edges.values())
+                    logger.debug(
+                        "Connection adjacency built",
+                        nodes=len(self._adjacency.node_ids),
+                        edges=self._adjacency.edge_count,
+                    )
+
+                return self._adjacency
+
+            except Exception as e:
+                logger.error("Failed to load connection adjacency", error=str(e))
+                return None
+
+    def _load_edges(self, conn: sqlite3.Connection, version: int) -> None:
+        """Reload the in-process connection copy from SQLite."""
+        rows = conn.execute(
+            "SELECT id, source_id, target_id, strength, connection_type "
+            "FROM memory_connections"
+        ).fetchall()
+
+        self._edges = {
+            row["id"]: (row["source_id"], row["target_id"], row["strength"])
+            for row in rows
+        }
+        self._edge_ids = {
+            (row["source_id"], row["target_id"], row["connection_type"]): row["id"]
+            for row in rows
+        }
+        # The counter was read first, so a concurrent write only causes a
+        # redundant reload on the next call
+        self._edges_version = version
+        self._adjacency = None
+
+    def _advance_version(self, version: int, changes: int) -> None:
+        """
+        Account for an own write in the version of the connection copy.
+
+        The copy stays current only if no other write happened between the
+        version it reflects and this write. Otherwise the next get_adjacency
+        reloads it.
+        """
+        if self._edges_version == version - changes:
+            self._edges_version = version
+
+    def _apply_added_edge(
+        self,
+        edge_id: int,
+        source_id: str,
+        target_id: str,
+        strength: float,
+        connection_type: str,
+        version: int,
+    ) -> None:
+        """Mirror an INSERT OR REPLACE in the in-process connection copy."""
+        with self._adjacency_lock:
+            if self._edges is None:
+                return
+
+            key = (source_id, target_id, connection_type)
+            replaced_id = self._edge_ids.get(key)
+            if replaced_id is not None:
+                self._edges.pop(replaced_id, None)
+
+            self._edges[edge_id] = (source_id, target_id, strength)
+            self._edge_ids[key] = edge_id
+            # A replacing insert counts once, like a plain insert
+            self._advance_version(version, 1)
+            self._adjacency = None
+
+    def _apply_pair_change(
+        self,
+        source_id: str,
+        target_id: str,
+        new_strength: float | None,
+        version: int,
+        changes: int,
+    ) -> None:
+        """Mirror an update (or removal, if None) of a memory pair's connections."""
+        with self._adjacency_lock:
+            if self._edges is None:
+                return
+
+            pair = {source_id, target_id}
+            for key, edge_id in list(self._edge_ids.items()):
+                if {key[0], key[1]} != pair:
+                    continue
+                if new_strength is None:
+                    del self._edge_ids[key]
+                    self._edges.pop(edge_id, None)
+                else:
+                    self._edges[edge_id] = (key[0], key[1], new_strength)
+
+            self._advance_version(version, changes)
+            self._adjacency = None
+
+    def record_activations(
+        self, memory_ids: list[str], min_strength: float = 0.0
+    ) -> None:
+        """
+        Queue activation-count increments for the connections of memories.
+
+        Increments are written in one batch by a background thread every
+        ``activation_flush_interval`` seconds, or by flush_activation_counts.
+
+        Args:
+            memory_ids: Memories whose connections were traversed
+            min_strength: Strength threshold used for the traversal
+        """
+        if not memory_ids:
+            return
+
+        with self._activation_lock:
+            for memory_id in memory_ids:
+                self._pending_activations[(memory_id, min_strength)] += 1
+
+            if self._flush_thread is None:
+                # The thread and exit hook hold weak references so an unused
+                # store can still be garbage collected
+                store_ref = weakref.ref(self)
+                self._flush_event = threading.Event()
+                self._flush_thread = threading.Thread(
+                    target=_flush_activations_periodically,
+                    args=(store_ref, self._flush_event),
+                    name="connection-activation-flush",
+                    daemon=True,
+                )
+                self._flush_thread.start()
+                atexit.register(_flush_activations_at_exit, store_ref)
+
+    def close(self) -> None:
+        """Flush pending activation counts and stop the background flusher."""
+        self.flush_activation_counts()
+        with self._activation_lock:
+            if self._flush_thread is not None:
+                self._flush_event.set()
+                self._flush_thread = None
+
+    def flush_activation_counts(self) -> int:
+        """
+        Write pending activation-count increments in a single transaction.
+
+        Returns:
+            Number of (memory, threshold) updates written
+        """
+        with self._activation_lock:
+            pending = self._pending_activations
+            self._pending_activations = Counter()
+
+        if not pending:
+            return 0
+
+        if not self.db_manager.db_path.exists():
+            # Connecting would recreate a database that was removed
+            logger.debug(
+                "Dropping activation counts for missing database",
+                pending=len(pending),
+            )
+            return 0
+
+        try:
+            with self.db_manager.get_connection() as conn:
+                conn.executemany(
+                    """
+                    UPDATE memory_connections
+                    SET activation_count = activation_count + ?,
+                        last_activated = julianday('now')
+                    WHERE (source_id = ? OR target_id = ?) AND strength >= ?
+                """,
+                    [
+                        (count, memory_id, memory_id, min_strength)
+                        for (memory_id, min_strength), count in pending.items()
+                    ],
+                )
+                conn.commit()
+
+            return len(pending)
+
+        except Exception as e:
+            logger.warning(
+                "Failed to flush connection activation counts",
+                pending=len(pending),
+                error=str(e),
+            )
+            return 0
+
     def get_connection_strength(self, source_id: str, target_id: str) -> float | None:
         """Get the strength of a connection between two memories."""
         try:
-            with self.db_manager.get_connection() as conn:
+            with self.db_manager.get_read_connection() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute(
@@ -960,12 +1783,11 @@ class ConnectionGraphStore(ConnectionGraph):
             else datetime.now()
         )
 
-        # Deserialize cognitive embedding from JSON if present
+        # Deserialize cognitive embedding if present
         cognitive_embedding = None
         if "cognitive_embedding" in row.keys() and row["cognitive_embedding"]:
             try:
-                embedding_list = json.loads(row["cognitive_embedding"])
-                cognitive_embedding = np.array(embedding_list)
+                cognitive_embedding = _deserialize_embedding(row["cognitive_embedding"])
             except (json.JSONDecodeError, ValueError) as e:
                 logger.warning(
                     f"Failed to deserialize cognitive embedding for memory {row['id']}: {e}"
@@ -1006,19 +1828,56 @@ class ConnectionGraphStore(ConnectionGraph):
         return memory
 
 
+def _flush_activations_periodically(
+    store_ref: "weakref.ref[ConnectionGraphStore]", stop_event: threading.Event
+) -> None:
+    """Flush a store's activation counts until it is closed or collected."""
+    while True:
+        store = store_ref()
+        if store is None:
+            return
+        interval = store.activation_flush_interval
+        del store
+
+        stopped = stop_event.wait(interval)
+
+        store = store_ref()
+        if store is None:
+            return
+        store.flush_activation_counts()
+        if stopped:
+            return
+        del store
+
+
+def _flush_activations_at_exit(
+    store_ref: "weakref.ref[ConnectionGraphStore]",
+) -> None:
+    """Flush a store's pending activation counts at interpreter exit."""
+    store = store_ref()
+    if store is not None:
+        store.flush_activation_counts()
+
+
 def create_sqlite_persistence(
     db_path: str = "data/cognitive_memory.db",
+    mmap_size: int = 268435456,
+    statement_cache_size: int = 256,
 ) -> tuple[MemoryMetadataStore, ConnectionGraphStore]:
     """
     Factory function to create SQLite persistence components.
 
     Args:
         db_path: Path to SQLite database file
+        mmap_size: Bytes of the database file to memory-map (0 disables)
+        statement_cache_size: Prepared statements cached per connection
 
     Returns:
         Tuple of (MemoryMetadataStore, ConnectionGraphStore)
     """
-    db_manager = DatabaseManager(db_path)
+    db_manager = DatabaseManager(
+        db_path, mmap_size=mmap_size, statement_cache_size=statement_cache_size
+    )
     memory_store = MemoryMetadataStore(db_manager)
     connection_store = ConnectionGraphStore(db_manager)
 
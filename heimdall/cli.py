@@ -8,58 +8,19 @@ This module provides a clean command-line interface that consolidates:
 - Interactive shell and health checking
 
 Uses the operations layer for cognitive commands and imports service management
-components for infrastructure operations.
+components for infrastructure operations. Command modules are imported when
+their command is dispatched, keeping start-up fast.
 """
 
+import importlib
 import sys
+from collections.abc import Callable
+from typing import Any
 
 import typer
 from loguru import logger
 from rich.console import Console
 
-# Import command functions from separate modules
-from heimdall.cli_commands.cognitive_commands import (
-    delete_memories_by_tags_cmd,
-    delete_memory_cmd,
-    load_git_patterns,
-    load_memories,
-    recall_memories,
-    remove_file_cmd,
-    store_experience,
-    system_status,
-)
-from heimdall.cli_commands.git_hook_commands import (
-    git_hook_install,
-    git_hook_status,
-    git_hook_uninstall,
-)
-from heimdall.cli_commands.health_commands import health_check, interactive_shell
-from heimdall.cli_commands.mcp_commands import (
-    generate_mcp,
-    install_mcp,
-    list_mcp,
-    remove_mcp,
-    status_mcp,
-)
-from heimdall.cli_commands.monitor_commands import (
-    monitor_health,
-    monitor_restart,
-    monitor_start,
-    monitor_status,
-    monitor_stop,
-)
-from heimdall.cli_commands.project_commands import (
-    project_clean,
-    project_init,
-    project_list,
-)
-from heimdall.cli_commands.qdrant_commands import (
-    qdrant_logs,
-    qdrant_start,
-    qdrant_status,
-    qdrant_stop,
-)
-
 # Set default Loguru log level to WARNING to prevent early DEBUG messages
 # This will be reconfigured by early logging setup based on project config
 logger.remove()
@@ -82,72 +43,124 @@ app = typer.Typer(
     add_completion=False,
 )
 
+# Command modules pull in the memory system and service management
+# dependencies, so commands are registered from these tables on dispatch and
+# only the module of the invoked command is imported.
+
+# Top-level commands: name -> (module in heimdall.cli_commands, function)
+_COMMANDS: dict[str, tuple[str, str]] = {
+    # Cognitive memory commands
+    "store": ("cognitive_commands", "store_experience"),
+    "recall": ("cognitive_commands", "recall_memories"),
+    "load": ("cognitive_commands", "load_memories"),
+    "git-load": ("cognitive_commands", "load_git_patterns"),
+    "status": ("cognitive_commands", "system_status"),
+    "remove-file": ("cognitive_commands", "remove_file_cmd"),
+    "delete-memory": ("cognitive_commands", "delete_memory_cmd"),
+    "delete-memories-by-tags": ("cognitive_commands", "delete_memories_by_tags_cmd"),
+    # Health and shell commands
+    "doctor": ("health_commands", "health_check"),
+    "shell": ("health_commands", "interactive_shell"),
+}
+
+# Command groups: name -> (help, module in heimdall.cli_commands, commands)
+_GROUPS: dict[str, tuple[str, str, dict[str, str]]] = {
+    "qdrant": (
+        "Qdrant vector database management",
+        "qdrant_commands",
+        {
+            "start": "qdrant_start",
+            "stop": "qdrant_stop",
+            "status": "qdrant_status",
+            "logs": "qdrant_logs",
+        },
+    ),
+    "monitor": (
+        "File monitoring service management",
+        "monitor_commands",
+        {
+            "start": "monitor_start",
+            "stop": "monitor_stop",
+            "restart": "monitor_restart",
+            "status": "monitor_status",
+            "health": "monitor_health",
+        },
+    ),
+    "project": (
+        "Project memory management",
+        "project_commands",
+        {"init": "project_init", "list": "project_list", "clean": "project_clean"},
+    ),
+    "git-hook": (
+        "Git hook management for automatic memory processing",
+        "git_hook_commands",
+        {
+            "install": "git_hook_install",
+            "uninstall": "git_hook_uninstall",
+            "status": "git_hook_status",
+        },
+    ),
+    "mcp": (
+        "🔗 MCP integration management",
+        "mcp_commands",
+        {
+            "install": "install_mcp",
+            "list": "list_mcp",
+            "remove": "remove_mcp",
+            "status": "status_mcp",
+            "generate": "generate_mcp",
+        },
+    ),
+    "serve": ("Start interface servers", "", {}),
+    # Legacy git loading commands for compatibility
+    "load-git": ("Git history loading commands", "", {}),
+}
+
 # Service management command groups
-qdrant_app = typer.Typer(help="Qdrant vector database management")
-app.add_typer(qdrant_app, name="qdrant")
-
-monitor_app = typer.Typer(help="File monitoring service management")
-app.add_typer(monitor_app, name="monitor")
-
-project_app = typer.Typer(help="Project memory management")
-app.add_typer(project_app, name="project")
-
-git_hook_app = typer.Typer(help="Git hook management for automatic memory processing")
-app.add_typer(git_hook_app, name="git-hook")
-
-mcp_app = typer.Typer(help="🔗 MCP integration management")
-app.add_typer(mcp_app, name="mcp")
-
-serve_app = typer.Typer(help="Start interface servers")
-app.add_typer(serve_app, name="serve")
-
-# Legacy git loading commands for compatibility
-load_git_app = typer.Typer(help="Git history loading commands")
-app.add_typer(load_git_app, name="load-git")
-
-# Register cognitive memory commands
-app.command("store")(store_experience)
-app.command("recall")(recall_memories)
-app.command("load")(load_memories)
-app.command("git-load")(load_git_patterns)
-app.command("status")(system_status)
-app.command("remove-file")(remove_file_cmd)
-app.command("delete-memory")(delete_memory_cmd)
-app.command("delete-memories-by-tags")(delete_memories_by_tags_cmd)
-
-# Register health and shell commands
-app.command("doctor")(health_check)
-app.command("shell")(interactive_shell)
-
-# Register Qdrant commands
-qdrant_app.command("start")(qdrant_start)
-qdrant_app.command("stop")(qdrant_stop)
-qdrant_app.command("status")(qdrant_status)
-qdrant_app.command("logs")(qdrant_logs)
-
-# Register monitor commands
-monitor_app.command("start")(monitor_start)
-monitor_app.command("stop")(monitor_stop)
-monitor_app.command("restart")(monitor_restart)
-monitor_app.command("status")(monitor_status)
-monitor_app.command("health")(monitor_health)
-
-# Register project commands
-project_app.command("init")(project_init)
-project_app.command("list")(project_list)
-project_app.command("clean")(project_clean)
-
-# Register git hook commands
-git_hook_app.command("install")(git_hook_install)
-git_hook_app.command("uninstall")(git_hook_uninstall)
-git_hook_app.command("status")(git_hook_status)
-
-# Register MCP commands
-mcp_app.command("install")(install_mcp)
-mcp_app.command("list")(list_mcp)
-mcp_app.command("remove")(remove_mcp)
-mcp_app.command("status")(status_mcp)
-mcp_app.command("generate")(generate_mcp)
+_group_apps: dict[str, typer.Typer] = {}
+for _name, (_help, _module, _commands) in _GROUPS.items():
+    _group_apps[_name] = typer.Typer(help=_help)
+    app.add_typer(_group_apps[_name], name=_name)
+
+_registered: set[str] = set()
+
+
+def _load_command(module: str, function: str) -> Callable[..., Any]:
+    """Import a command function from its heimdall.cli_commands module."""
+    command: Callable[..., Any] = getattr(
+        importlib.import_module(f"heimdall.cli_commands.{module}"), function
+    )
+    return command
+
+
+def register_commands(name: str | None = None) -> None:
+    """
+    Register CLI commands, importing only the modules they are defined in.
+
+    Args:
+        name: Top-level command or group to register. If None or unknown,
+            all commands are registered, e.g. to render the full help text.
+    """
+    register_all = name not in _COMMANDS and name not in _GROUPS
+
+    for command, (module, function) in _COMMANDS.items():
+        if (register_all or command == name) and command not in _registered:
+            app.command(command)(_load_command(module, function))
+            _registered.add(command)
+
+    for group, (_help, module, commands) in _GROUPS.items():
+        if (register_all or group == name) and group not in _registered:
+            for command, function in commands.items():
+                _group_apps[group].command(command)(_load_command(module, function))
+            _registered.add(group)
+
+
+def _requested_command(argv: list[str]) -> str | None:
+    """Get the top-level command or group named on the command line."""
+    for arg in argv:
+        if not arg.startswith("-"):
+            return arg
+    return None
 
 
 def _setup_early_logging() -> None:
@@ -210,6 +223,7 @@ def main() -> int:
         # Set up early logging from project config before any operations
         _setup_early_logging()
 
+        register_commands(_requested_command(sys.argv[1:]))
         app()
         return 0
     except typer.Exit as e:
@@ -1,6 +1,7 @@
 """Cognitive memory commands: store, recall, load, git-load, status."""
 
 import json
+from typing import Any
 
 import typer
 from rich.console import Console
@@ -144,8 +145,8 @@ def recall_memories(
 
 
 def load_memories(
-    source_path: str = typer.Argument(
-        ..., help="Path to the source file or directory to load"
+    source_paths: list[str] = typer.Argument(
+        ..., help="Paths to the source files or directories to load"
     ),
     loader_type: str = typer.Option(
         "markdown", help="Type of loader to use (markdown, git)"
@@ -156,11 +157,14 @@ def load_memories(
     recursive: bool = typer.Option(
         False, "--recursive", help="Recursively process directories"
     ),
+    force: bool = typer.Option(
+        False, "--force", help="Reload files even if they are unchanged"
+    ),
     config: str | None = typer.Option(
         None, help="Path to .env configuration file to override default settings"
     ),
 ) -> None:
-    """Load memories from external source file or directory."""
+    """Load memories from external source files or directories."""
     try:
         # Initialize cognitive system
         if config:
@@ -168,21 +172,32 @@ def load_memories(
         else:
             cognitive_system = initialize_system("default")
 
-        # Create operations instance and load memories
+        # Create operations instance and load memories from each source
         ops = CognitiveOperations(cognitive_system)
-        result = ops.load_memories(
-            source_path=source_path,
-            loader_type=loader_type,
-            dry_run=dry_run,
-            recursive=recursive,
-        )
-
-        if not result["success"]:
-            console.print(
-                f"❌ Failed to load memories: {result['error']}", style="bold red"
+        results = []
+        for source_path in source_paths:
+            source_result = ops.load_memories(
+                source_path=source_path,
+                loader_type=loader_type,
+                dry_run=dry_run,
+                recursive=recursive,
+                force=force,
             )
+            if not source_result["success"]:
+                console.print(
+                    f"❌ Failed to load memories from {source_path}: "
+                    f"{source_result['error']}",
+                    style="bold red",
+                )
+                continue
+            results.append(source_result)
+
+        if len(results) < len(source_paths):
+            graceful_shutdown(cognitive_system)
             raise typer.Exit(1)
 
+        result = _combine_load_results(results)
+
         # Display results with terminal-specific formatting
         if dry_run:
             console.print(
@@ -212,6 +227,10 @@ def load_memories(
             results_table.add_row(
                 "Files Processed", str(len(result["files_processed"]))
             )
+        if result.get("files_skipped", 0) > 0:
+            results_table.add_row(
+                "Unchanged Files Skipped", str(result["files_skipped"])
+            )
 
         console.print(results_table)
 
@@ -232,6 +251,35 @@ def load_memories(
         raise typer.Exit(1) from e
 
 
+def _combine_load_results(results: list[dict[str, Any]]) -> dict[str, Any]:
+    """Merge load results from several sources into one summary."""
+    if len(results) == 1:
+        return results[0]
+
+    combined: dict[str, Any] = {
+        "files_processed": [],
+        "hierarchy_distribution": {},
+    }
+    for key in (
+        "memories_loaded",
+        "memories_deleted",
+        "files_skipped",
+        "connections_created",
+        "memories_failed",
+        "connections_failed",
+        "processing_time",
+    ):
+        combined[key] = sum(result.get(key, 0) for result in results)
+
+    for result in results:
+        combined["files_processed"].extend(result.get("files_processed") or [])
+        for level, count in (result.get("hierarchy_distribution") or {}).items():
+            distribution = combined["hierarchy_distribution"]
+            distribution[level] = distribution.get(level, 0) + count
+
+    return combined
+
+
 def load_git_patterns(
     repo_path: str = typer.Argument(".", help="Path to git repository"),
     max_commits: int = typer.Option(1000, help="Maximum commits to process"),
@@ -388,14 +436,14 @@ def system_status(
 
 
 def remove_file_cmd(
-    file_path: str = typer.Argument(
-        ..., help="Path to file whose memories should be removed"
+    file_paths: list[str] = typer.Argument(
+        ..., help="Paths to files whose memories should be removed"
     ),
     config: str | None = typer.Option(
         None, help="Path to .env configuration file to override default settings"
     ),
 ) -> None:
-    """Remove all memories associated with a deleted file."""
+    """Remove all memories associated with deleted files."""
     try:
         # Initialize cognitive system
         if config:
@@ -403,22 +451,30 @@ def remove_file_cmd(
         else:
             cognitive_system = initialize_system("default")
 
-        # Create operations instance and delete memories
+        # Create operations instance and delete memories for each file
         ops = CognitiveOperations(cognitive_system)
-        result = ops.delete_memories_by_source_path(file_path)
+        failed = False
+        for file_path in file_paths:
+            result = ops.delete_memories_by_source_path(file_path)
 
-        if result["success"]:
-            console.print(
-                f"✅ Removed {result['deleted_count']} memories for: {file_path}",
-                style="bold green",
-            )
-            if result["processing_time"] > 0:
-                console.print(f"⏱️  Processing time: {result['processing_time']:.3f}s")
-        else:
-            console.print(
-                f"❌ Failed to remove memories for {file_path}: {result['error']}",
-                style="bold red",
-            )
+            if result["success"]:
+                console.print(
+                    f"✅ Removed {result['deleted_count']} memories for: {file_path}",
+                    style="bold green",
+                )
+                if result["processing_time"] > 0:
+                    console.print(
+                        f"⏱️  Processing time: {result['processing_time']:.3f}s"
+                    )
+            else:
+                console.print(
+                    f"❌ Failed to remove memories for {file_path}: {result['error']}",
+                    style="bold red",
+                )
+                failed = True
+
+        if failed:
+            graceful_shutdown(cognitive_system)
             raise typer.Exit(1)
 
         # Cleanup
@@ -14,8 +14,10 @@ POST_COMMIT_HOOK_TEMPLATE = '''#!/usr/bin/env python3
 """
 Heimdall MCP Server - Post-Commit Hook (Python Implementation)
 
-Automatically processes the latest commit for memory storage using the
-shared Qdrant architecture and centralized configuration system.
+Queues the latest commit for memory storage and returns immediately. A
+background drainer (heimdall.monitoring.commit_queue) ingests queued commits
+using the shared Qdrant architecture and centralized configuration system,
+so commits never wait for the cognitive memory system to load.
 
 This hook replaces the bash implementation with cross-platform Python code
 that directly integrates with the cognitive memory system without Docker
@@ -36,8 +38,7 @@ except ImportError:
 
 try:
     from cognitive_memory.core.config import get_project_paths
-    from cognitive_memory.main import initialize_system
-    from heimdall.operations import CognitiveOperations
+    from heimdall.monitoring.commit_queue import CommitQueue, spawn_drainer
 except ImportError as e:
     print(f"Heimdall: WARNING: Cannot import cognitive memory system: {e}")
     sys.exit(0)
@@ -91,10 +92,10 @@ def main() -> None:
     """
     Main post-commit hook execution.
 
-    This function handles the complete post-commit processing workflow:
+    This function handles the post-commit workflow without loading models:
     1. Validate git repository and get latest commit info
-    2. Initialize cognitive memory system
-    3. Load the latest commit into memory via direct function call
+    2. Add the commit to the project's durable commit queue
+    3. Start the background drainer, which ingests all queued commits
     4. Log results appropriately
 
     Always exits with code 0 to prevent breaking git operations.
@@ -125,75 +126,17 @@ def main() -> None:
             log_message(paths, f"Failed to get latest commit info: {e}", is_error=True)
             sys.exit(0)
 
-        # Initialize cognitive memory system and execute git loading (suppress verbose output)
+        # Queue the commit; the drainer coalesces commits queued in bursts
         try:
-            import contextlib
-            import io
-            import os
-
-            # Suppress all logging during the operation
-            original_log_level = os.environ.get("LOG_LEVEL", "INFO")
-            os.environ["LOG_LEVEL"] = "ERROR"
-
-            # Also disable loguru directly
-            try:
-                from loguru import logger
-
-                logger.disable("")  # Disable all loguru logging
-            except ImportError:
-                pass
-
-            # Capture stdout to count memories loaded
-            captured_output = io.StringIO()
-
-            with contextlib.redirect_stdout(captured_output):
-                cognitive_system = initialize_system()
-                operations = CognitiveOperations(cognitive_system)
-
-                # Use load_git_patterns which handles incremental loading automatically
-                # with max_commits=1 to process only the latest commit
-                result = operations.load_git_patterns(
-                    repo_path=str(repo_root),
-                    dry_run=False,
-                    max_commits=1,  # Only process the latest commit
-                )
-                success = result.get("success", False)
-
-            # Restore original log level and re-enable loguru
-            os.environ["LOG_LEVEL"] = original_log_level
-            try:
-                from loguru import logger
-
-                logger.enable("")  # Re-enable loguru logging
-            except ImportError:
-                pass
-
-            # Extract memory count from operations result
-            memories_loaded = result.get("memories_loaded", 0) if success else 0
-
-            if success:
-                if memories_loaded > 0:
-                    memory_word = "memory" if memories_loaded == 1 else "memories"
-                    log_message(
-                        paths,
-                        f"Processed commit {commit_short}: {memories_loaded} {memory_word} loaded",
-                    )
-                else:
-                    log_message(
-                        paths,
-                        f"Processed commit {commit_short}: no new memories (incremental)",
-                    )
-            else:
-                log_message(
-                    paths,
-                    f"WARNING: Failed to process commit {commit_short}",
-                    is_error=True,
-                )
-
+            CommitQueue(paths.commit_queue_dir).enqueue(commit_hash)
+            spawn_drainer(repo_root, paths.heimdall_dir)
+            log_message(
+                paths, f"Queued commit {commit_short} for background memory loading"
+            )
         except Exception as e:
             log_message(
                 paths,
-                f"ERROR: Failed to process commit {commit_short}: {str(e)}",
+                f"ERROR: Failed to queue commit {commit_short}: {str(e)}",
                 is_error=True,
             )
 
@@ -99,6 +99,14 @@ class MonitoringService:
         # Load full system config for cognitive parameters
         system_config = SystemConfig.from_env()
         self.config = system_config.cognitive
+        # A batch size in .heimdall/config.yaml overrides the environment default
+        self.batch_size = self.monitoring_config.get(
+            "batch_size", self.config.monitoring_batch_size
+        )
+        # Relative database paths are resolved against the project root
+        self.database_path = self.project_paths.project_root / Path(
+            system_config.database.path
+        )
         self.status = ServiceStatus()
         self._shutdown_requested = False
         self._restart_attempts = 0
@@ -124,6 +132,9 @@ class MonitoringService:
         if not self.config.monitoring_enabled:
             raise MonitoringServiceError("Monitoring is disabled in configuration")
 
+        if self.batch_size <= 0:
+            raise MonitoringServiceError("Monitoring batch size must be positive")
+
         # Check target path from centralized configuration
         target_path = self.monitoring_config["target_path"]
         target_path_obj = Path(target_path)
@@ -508,8 +519,25 @@ class MonitoringService:
                 str(lock_file),
                 "--log-level",
                 "INFO",
+                "--batch-size",
+                str(self.batch_size),
+                "--debounce-seconds",
+                str(self.monitoring_config["debounce_seconds"]),
+                "--watch-backend",
+                str(self.monitoring_config["watch_backend"]),
+                "--database-path",
+                str(self.database_path),
             ]
 
+            if self.monitoring_config.get("persistent_worker"):
+                cmd += [
+                    "--persistent-worker",
+                    "--worker-max-requests",
+                    str(self.monitoring_config["worker_max_requests"]),
+                    "--worker-idle-timeout",
+                    str(self.monitoring_config["worker_idle_timeout"]),
+                ]
+
             logger.info(f"Starting lightweight monitoring subprocess: {' '.join(cmd)}")
 
             # Start subprocess with proper detaching
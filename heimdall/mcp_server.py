@@ -12,11 +12,14 @@ making it AI-agnostic and suitable for use with Claude Code, Cline, Continue, et
 """
 
 import asyncio
+import functools
 import json
 import logging
 import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any
+from typing import Any, TypeVar
 
 import uvicorn
 from mcp.server import Server
@@ -30,6 +33,7 @@ from starlette.applications import Starlette
 from starlette.responses import JSONResponse
 from starlette.routing import Route
 
+from cognitive_memory.core.config import MCPServerConfig
 from cognitive_memory.core.interfaces import CognitiveSystem
 from cognitive_memory.core.version import get_version_info
 from cognitive_memory.main import initialize_system, initialize_with_config
@@ -40,6 +44,17 @@ from heimdall.operations import CognitiveOperations
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Tools that only read memory state; all others write
+READ_ONLY_TOOLS = ("recall_memories", "memory_status", "health")
+WRITE_TOOLS = (
+    "store_memory",
+    "session_lessons",
+    "delete_memory",
+    "delete_memories_by_tags",
+)
+
 
 class HeimdallMCPServer:
     """
@@ -50,22 +65,101 @@ class HeimdallMCPServer:
     recalling memories, recording session lessons, and checking system status.
 
     This server uses the operations layer directly for clean separation of concerns.
+    Operations block on embedding inference and storage I/O, so tool handlers
+    run them on a bounded thread pool to keep the event loop responsive.
     """
 
-    def __init__(self, cognitive_system: CognitiveSystem):
+    def __init__(
+        self, cognitive_system: CognitiveSystem, config: MCPServerConfig | None = None
+    ):
         """
         Initialize MCP server with cognitive system.
 
         Args:
             cognitive_system: The cognitive system interface to wrap
+            config: Thread pool and concurrency settings, read from the
+                environment if omitted
         """
         self.cognitive_system = cognitive_system
         self.operations = CognitiveOperations(cognitive_system)
+        self.config = config or MCPServerConfig.from_env()
         self.server: Server = Server("heimdall-cognitive-memory")
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, self.config.max_workers),
+            thread_name_prefix="heimdall-mcp",
+        )
+        self._tool_semaphores = {
+            tool: asyncio.Semaphore(max(1, self.config.max_concurrent_reads))
+            for tool in READ_ONLY_TOOLS
+        }
+        self._tool_semaphores.update(
+            {
+                tool: asyncio.Semaphore(max(1, self.config.max_concurrent_writes))
+                for tool in WRITE_TOOLS
+            }
+        )
+
         self._register_handlers()
 
         logger.info("Heimdall MCP Server initialized")
 
+    async def _run_blocking(
+        self, tool: str, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Run a blocking operation on the thread pool.
+
+        The tool's concurrency slot is held until the operation finishes, even
+        if the caller gives up waiting, so timed-out calls cannot pile up.
+
+        Args:
+            tool: Tool name selecting the concurrency limit
+            func: Blocking callable to run
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            Result of ``func``
+
+        Raises:
+            TimeoutError: If the call did not finish within the tool timeout,
+                including time spent waiting for a free slot
+        """
+        loop = asyncio.get_running_loop()
+        timeout = self.config.tool_timeout
+        deadline = loop.time() + timeout
+        semaphore = self._tool_semaphores[tool]
+
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout)
+        # asyncio.TimeoutError is only an alias of TimeoutError from Python 3.11
+        except asyncio.TimeoutError:  # noqa: UP041
+            logger.warning(f"Tool {tool} timed out waiting for a free slot")
+            raise TimeoutError(f"{tool} timed out after {timeout:g}s") from None
+
+        try:
+            future = loop.run_in_executor(
+                self._executor, functools.partial(func, *args, **kwargs)
+            )
+        except BaseException:
+            semaphore.release()
+            raise
+
+        future.add_done_callback(lambda _: semaphore.release())
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(future), max(0.0, deadline - loop.time())
+            )
+        except asyncio.TimeoutError:  # noqa: UP041
+            logger.warning(f"Tool {tool} timed out after {timeout:g}s")
+            raise TimeoutError(f"{tool} timed out after {timeout:g}s") from None
+
+    def close(self) -> None:
+        """Stop the thread pool without waiting for running operations."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
     def _register_handlers(self) -> None:
         """Register MCP protocol handlers."""
 
@@ -275,7 +369,12 @@ class HeimdallMCPServer:
                 context["source_type"] = "store_memory"
 
             # Store the experience using operations layer
-            result = self.operations.store_experience(text=text, context=context)
+            result = await self._run_blocking(
+                "store_memory",
+                self.operations.store_experience,
+                text=text,
+                context=context,
+            )
 
             if result["success"]:
                 # Get hierarchy level, memory type, and memory ID from result
@@ -312,8 +411,12 @@ class HeimdallMCPServer:
 
         try:
             # Retrieve memories using operations layer
-            result = self.operations.retrieve_memories(
-                query=query, types=types_filter, limit=max_results
+            result = await self._run_blocking(
+                "recall_memories",
+                self.operations.retrieve_memories,
+                query=query,
+                types=types_filter,
+                limit=max_results,
             )
 
             if not result["success"]:
@@ -386,8 +489,11 @@ class HeimdallMCPServer:
             }
 
             # Store the lesson using operations layer
-            result = self.operations.store_experience(
-                text=lesson_content, context=context
+            result = await self._run_blocking(
+                "session_lessons",
+                self.operations.store_experience,
+                text=lesson_content,
+                context=context,
             )
 
             if result["success"]:
@@ -419,7 +525,9 @@ class HeimdallMCPServer:
 
         try:
             # Get status using operations layer
-            result = self.operations.get_system_status(detailed=detailed)
+            result = await self._run_blocking(
+                "memory_status", self.operations.get_system_status, detailed=detailed
+            )
 
             if not result["success"]:
                 return [
@@ -435,6 +543,7 @@ class HeimdallMCPServer:
                 "system_status": "healthy",
                 "version": version_info,
                 "memory_counts": result["memory_counts"],
+                "query_cache": result.get("query_cache", {}),
                 "timestamp": datetime.now().isoformat(),
             }
 
@@ -479,8 +588,11 @@ class HeimdallMCPServer:
 
         try:
             # Delete memory using operations layer
-            result = self.operations.delete_memory_by_id(
-                memory_id=memory_id.strip(), dry_run=dry_run
+            result = await self._run_blocking(
+                "delete_memory",
+                self.operations.delete_memory_by_id,
+                memory_id=memory_id.strip(),
+                dry_run=dry_run,
             )
 
             if not result["success"]:
@@ -536,7 +648,12 @@ class HeimdallMCPServer:
 
         try:
             # Delete memories using operations layer
-            result = self.operations.delete_memories_by_tags(tags=tags, dry_run=dry_run)
+            result = await self._run_blocking(
+                "delete_memories_by_tags",
+                self.operations.delete_memories_by_tags,
+                tags=tags,
+                dry_run=dry_run,
+            )
 
             if not result["success"]:
                 return [
@@ -591,10 +708,15 @@ class HeimdallMCPServer:
     async def run_stdio(self) -> None:
         """Run MCP server with stdio transport."""
         logger.info("Starting Heimdall MCP Server (stdio mode)")
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream, write_stream, self.server.create_initialization_options()
-            )
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options(),
+                )
+        finally:
+            self.close()
 
     async def run_http(self, host: str = "127.0.0.1", port: int = 8080) -> None:
         """Run MCP server with HTTP transport."""
@@ -605,7 +727,9 @@ class HeimdallMCPServer:
             """Health check endpoint for container monitoring."""
             try:
                 # Basic health check - verify cognitive system is responsive
-                status_result = self.operations.get_system_status()
+                status_result = await self._run_blocking(
+                    "health", self.operations.get_system_status
+                )
                 if status_result["success"]:
                     return JSONResponse(
                         {
@@ -655,7 +779,10 @@ class HeimdallMCPServer:
             app=app, host=host, port=port, log_level="info", access_log=True
         )
         server = uvicorn.Server(config)
-        await server.serve()
+        try:
+            await server.serve()
+        finally:
+            self.close()
 
 
 async def main() -> None:
@@ -0,0 +1,298 @@
+"""
+Durable queue of git commits awaiting ingestion into cognitive memory.
+
+The post-commit hook used to initialize the cognitive system and load the new
+commit inside ``git commit``, blocking the developer for several seconds per
+commit. Instead, the hook now records the commit in a spool directory and
+starts a background drainer, so ``git commit`` returns immediately.
+
+The drainer runs this module. At most one drainer runs per project, guarded by
+a lock file. It waits until no commits have been queued for a short settle
+period, which coalesces rebases and cherry-pick series into a single
+incremental git load. It stays warm for an idle period to pick up further
+commits without re-initializing the system. Entries are only removed once
+their commits were ingested, so a failed or interrupted drain is retried by
+the next drainer.
+
+Usage: ``python -m heimdall.monitoring.commit_queue --project-root <path>``
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import portalocker
+from loguru import logger
+
+DEFAULT_SETTLE_SECONDS = 2.0
+DEFAULT_IDLE_TIMEOUT = 30.0
+
+
+class CommitQueue:
+    """
+    Spool directory holding one file per commit awaiting ingestion.
+
+    Entry names start with the enqueue time in nanoseconds, so sorting them
+    gives the commit order. Entries are written to a temporary file and
+    renamed, so readers never see partial entries.
+    """
+
+    def __init__(self, queue_dir: Path) -> None:
+        """
+        Initialize the queue.
+
+        Args:
+            queue_dir: Spool directory, created on the first enqueue
+        """
+        self.queue_dir = queue_dir
+
+    def enqueue(self, commit_hash: str) -> Path:
+        """
+        Add a commit to the queue.
+
+        Args:
+            commit_hash: Hash of the commit to ingest
+
+        Returns:
+            Path of the queue entry
+        """
+        self.queue_dir.mkdir(parents=True, exist_ok=True)
+        entry = self.queue_dir / f"{time.time_ns():020d}-{commit_hash}"
+        temp_file = self.queue_dir / f".{entry.name}.tmp"
+        temp_file.write_text(commit_hash, encoding="utf-8")
+        os.replace(temp_file, entry)
+        return entry
+
+    def entries(self) -> list[Path]:
+        """Get the queue entries, oldest first."""
+        if not self.queue_dir.is_dir():
+            return []
+        return sorted(
+            path for path in self.queue_dir.iterdir() if not path.name.startswith(".")
+        )
+
+    @staticmethod
+    def commit_hashes(entries: list[Path]) -> list[str]:
+        """Get the distinct commit hashes of queue entries, in queue order."""
+        return list(dict.fromkeys(entry.name.split("-", 1)[1] for entry in entries))
+
+    def seconds_since_last_enqueue(self) -> float | None:
+        """Get the time since the newest entry was queued, or None if empty."""
+        entries = self.entries()
+        if not entries:
+            return None
+        enqueued_ns = int(entries[-1].name.split("-", 1)[0])
+        return max(0.0, (time.time_ns() - enqueued_ns) / 1e9)
+
+    def remove(self, entries: list[Path]) -> None:
+        """Remove ingested entries from the queue."""
+        for entry in entries:
+            entry.unlink(missing_ok=True)
+
+
+def drain(
+    commit_queue: CommitQueue,
+    ingest: Callable[[list[str]], dict[str, Any]],
+    settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    poll_interval: float = 0.5,
+) -> bool:
+    """
+    Ingest queued commits until the queue stays empty for ``idle_timeout``.
+
+    Args:
+        commit_queue: Queue to drain
+        ingest: Ingests the given commits and returns an operations result
+            dictionary with a ``success`` key
+        settle_seconds: Quiet period after the newest entry before ingesting,
+            so that commits created in quick succession are ingested together
+        idle_timeout: Seconds to wait for new entries once the queue is empty
+        poll_interval: Seconds between checks for new entries
+
+    Returns:
+        True if every queued commit was ingested, False if an ingestion failed
+        and its entries were left in the queue
+    """
+    idle_since = time.monotonic()
+
+    while True:
+        since_last = commit_queue.seconds_since_last_enqueue()
+        if since_last is None:
+            if time.monotonic() - idle_since >= idle_timeout:
+                return True
+            time.sleep(poll_interval)
+            continue
+
+        if since_last < settle_seconds:
+            time.sleep(settle_seconds - since_last)
+            continue
+
+        entries = commit_queue.entries()
+        commit_hashes = commit_queue.commit_hashes(entries)
+        try:
+            result = ingest(commit_hashes)
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
+
+        if not result.get("success"):
+            logger.error(
+                "Failed to ingest queued commits",
+                commits=len(commit_hashes),
+                error=result.get("error"),
+            )
+            return False
+
+        commit_queue.remove(entries)
+        logger.info(
+            "Ingested queued commits",
+            commits=len(commit_hashes),
+            memories_loaded=result.get("memories_loaded", 0),
+            processing_time=result.get("processing_time", 0.0),
+        )
+        idle_since = time.monotonic()
+
+
+def run_drainer(
+    commit_queue: CommitQueue,
+    lock_file: Path,
+    ingest: Callable[[list[str]], dict[str, Any]],
+    **drain_kwargs: Any,
+) -> bool:
+    """
+    Drain the queue unless another drainer is already running.
+
+    After releasing the lock the queue is checked once more: a hook may have
+    queued a commit while its own drainer found the lock still held.
+
+    Args:
+        commit_queue: Queue to drain
+        lock_file: Lock file ensuring a single drainer per project
+        ingest: Ingests the given commits, see ``drain``
+        **drain_kwargs: Timing parameters passed to ``drain``
+
+    Returns:
+        False if an ingestion failed, True otherwise
+    """
+    while commit_queue.entries():
+        try:
+            with portalocker.Lock(str(lock_file), mode="w", fail_when_locked=True):
+                if not drain(commit_queue, ingest, **drain_kwargs):
+                    return False
+        except portalocker.LockException:
+            logger.debug("Another drainer is running", lock_file=str(lock_file))
+            return True
+    return True
+
+
+def spawn_drainer(project_root: Path, heimdall_dir: Path) -> None:
+    """
+    Start a detached drainer for a project without waiting for it.
+
+    Args:
+        project_root: Root directory of the project
+        heimdall_dir: Project's .heimdall directory, holding the drainer log
+    """
+    subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "heimdall.monitoring.commit_queue",
+            "--project-root",
+            str(project_root),
+            "--log-file",
+            str(heimdall_dir / "commit_queue.log"),
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        cwd=project_root,
+        start_new_session=True,
+    )
+
+
+def main() -> int:
+    """Drain the project's commit queue, exiting once it stays empty."""
+    parser = argparse.ArgumentParser(
+        description="Ingest commits queued by the Heimdall post-commit hook"
+    )
+    parser.add_argument(
+        "--project-root", required=True, help="Root directory of the project"
+    )
+    parser.add_argument("--log-file", help="File to write drainer logs to")
+    parser.add_argument(
+        "--settle-seconds",
+        type=float,
+        default=DEFAULT_SETTLE_SECONDS,
+        help="Quiet period after the newest commit before ingesting",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT,
+        help="Seconds to wait for further commits before exiting",
+    )
+    args = parser.parse_args()
+
+    if args.log_file:
+        logger.remove()
+        logger.add(
+            args.log_file,
+            level="INFO",
+            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+            rotation="10 MB",
+            retention="7 days",
+        )
+        # System initialization reconfigures logging; keep writing to the file
+        os.environ.setdefault("LOG_FILE", args.log_file)
+
+    project_root = Path(args.project_root).resolve()
+    os.chdir(project_root)
+
+    from cognitive_memory.core.config import get_project_paths
+
+    paths = get_project_paths(project_root)
+    commit_queue = CommitQueue(paths.commit_queue_dir)
+    state: dict[str, Any] = {}
+
+    def ingest(commit_hashes: list[str]) -> dict[str, Any]:
+        # Initialize the system on the first batch and keep it warm afterwards
+        if "operations" not in state:
+            from cognitive_memory.main import initialize_system
+            from heimdall.operations import CognitiveOperations
+
+            state["system"] = initialize_system("default")
+            state["operations"] = CognitiveOperations(state["system"])
+
+        # Git loading is incremental since the last processed commit, so
+        # limiting it to the queued count covers every queued commit
+        result: dict[str, Any] = state["operations"].load_git_patterns(
+            repo_path=str(project_root),
+            dry_run=False,
+            max_commits=len(commit_hashes),
+        )
+        return result
+
+    try:
+        success = run_drainer(
+            commit_queue,
+            paths.heimdall_dir / "commit_queue.lock",
+            ingest,
+            settle_seconds=args.settle_seconds,
+            idle_timeout=args.idle_timeout,
+        )
+    finally:
+        if "system" in state:
+            from cognitive_memory.main import graceful_shutdown
+
+            graceful_shutdown(state["system"])
+
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,7 +6,13 @@ This module contains minimal file monitoring definitions that can be imported
 without heavy dependencies like ML models, ONNX runtime, etc.
 """
 
+import ctypes
+import ctypes.util
+import errno
 import os
+import select
+import struct
+import sys
 import threading
 import time
 from collections.abc import Callable
@@ -85,11 +91,157 @@ class FileState:
         return None
 
 
+# inotify(7) event flags
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+# Supported change detection backends
+WATCH_BACKENDS = ("auto", "inotify", "polling")
+
+
+class InotifyWatcher:
+    """
+    Minimal Linux inotify wrapper using ctypes.
+
+    Watches are per directory and not recursive; callers add a watch for every
+    directory they are interested in. Each watch remembers the path it was
+    added under so events can be reported with full paths, including paths
+    reached through symbolic links.
+    """
+
+    WATCH_MASK = (
+        IN_MODIFY
+        | IN_CLOSE_WRITE
+        | IN_MOVED_FROM
+        | IN_MOVED_TO
+        | IN_CREATE
+        | IN_DELETE
+        | IN_DELETE_SELF
+        | IN_MOVE_SELF
+        | IN_ONLYDIR
+    )
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self) -> None:
+        """
+        Create an inotify instance.
+
+        Raises:
+            OSError: If inotify is not available or the instance limit is reached
+        """
+        if not sys.platform.startswith("linux"):
+            raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError(errno.ENOSYS, "libc does not provide inotify")
+
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+        self.watches: dict[int, Path] = {}
+
+    def add_watch(self, path: Path) -> bool:
+        """
+        Watch a directory.
+
+        Args:
+            path: Directory to watch
+
+        Returns:
+            False if the directory is already watched under a different path
+            (for example through a symbolic link), True otherwise
+
+        Raises:
+            OSError: If the watch cannot be added (ENOSPC when the watch
+                limit is exhausted)
+        """
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), self.WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), str(path))
+
+        return self.watches.setdefault(wd, path) == path
+
+    def remove_watches_under(self, path: Path) -> None:
+        """Stop watching a directory and all watched directories below it."""
+        for wd, watched_path in list(self.watches.items()):
+            if watched_path == path or path in watched_path.parents:
+                self._libc.inotify_rm_watch(self.fd, wd)
+                del self.watches[wd]
+
+    def read_events(self, timeout: float) -> list[tuple[Path | None, int]]:
+        """
+        Wait for and read pending events.
+
+        Args:
+            timeout: Seconds to wait for the first event
+
+        Returns:
+            List of (path, mask) tuples. Path is None for queue overflow.
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+
+        events: list[tuple[Path | None, int]] = []
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                break
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, name_len = self.EVENT_HEADER.unpack_from(data, offset)
+                offset += self.EVENT_HEADER.size
+                name = data[offset : offset + name_len].rstrip(b"\0")
+                offset += name_len
+
+                if mask & IN_Q_OVERFLOW:
+                    events.append((None, mask))
+                    continue
+
+                directory = self.watches.get(wd)
+                if mask & IN_IGNORED:
+                    self.watches.pop(wd, None)
+                    continue
+                if directory is None:
+                    continue
+
+                events.append(
+                    (directory / os.fsdecode(name) if name else directory, mask)
+                )
+
+        return events
+
+    def close(self) -> None:
+        """Close the inotify instance and drop all watches."""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+        self.watches.clear()
+
+
 class FileMonitor:
     """
     Minimal file monitor with no heavy dependencies.
 
-    Monitors markdown files for changes using polling-based detection.
+    Monitors markdown files for changes using inotify on Linux, or
+    polling-based detection where inotify is unavailable or its watch limit
+    is exhausted.
     This implementation has minimal memory footprint and no ML dependencies.
     """
 
@@ -97,10 +249,28 @@ class FileMonitor:
     MARKDOWN_EXTENSIONS = {".md", ".markdown", ".mdown", ".mkd"}
 
     def __init__(
-        self, polling_interval: float = 5.0, ignore_patterns: set[str] | None = None
+        self,
+        polling_interval: float = 5.0,
+        ignore_patterns: set[str] | None = None,
+        backend: str = "auto",
     ):
-        """Initialize file monitor."""
+        """
+        Initialize file monitor.
+
+        Args:
+            polling_interval: Seconds between polling checks
+            ignore_patterns: Set of patterns to ignore
+            backend: Change detection backend: "auto" or "inotify" use inotify
+                and fall back to polling, "polling" always polls
+        """
+        if backend not in WATCH_BACKENDS:
+            raise ValueError(
+                f"Unknown watch backend: {backend} (expected one of {WATCH_BACKENDS})"
+            )
+
         self.polling_interval = polling_interval
+        self.backend = backend
+        self.active_backend: str | None = None
         self.ignore_patterns = ignore_patterns or {
             ".git",
             "__pycache__",
@@ -219,6 +389,12 @@ class FileMonitor:
         """Main monitoring loop."""
         logger.debug("File monitoring loop started")
 
+        if self.backend != "polling":
+            self._inotify_loop()
+
+        if self.monitoring:
+            self.active_backend = "polling"
+
         while self.monitoring:
             try:
                 self._scan_files()
@@ -228,6 +404,165 @@ class FileMonitor:
                 time.sleep(self.polling_interval)
 
         logger.debug("File monitoring loop ended")
+        self.active_backend = None
+
+    def _inotify_loop(self) -> None:
+        """
+        Event-driven monitoring loop.
+
+        Returns when monitoring stops, or early if inotify is unavailable or
+        runs out of watches, in which case the caller continues by polling.
+        """
+        watcher: InotifyWatcher | None = None
+        watched_roots: set[Path] = set()
+        try:
+            watcher = InotifyWatcher()
+            # Add watches before the baseline scan so no change is missed
+            for root in list(self.monitored_paths):
+                self._watch_tree(watcher, root)
+                watched_roots.add(root)
+            self._scan_files()
+            self.active_backend = "inotify"
+            logger.info(
+                f"Using inotify change detection ({len(watcher.watches)} watches)"
+            )
+
+            while self.monitoring:
+                if watched_roots != self.monitored_paths:
+                    for root in watched_roots - self.monitored_paths:
+                        watcher.remove_watches_under(root)
+                    for root in self.monitored_paths - watched_roots:
+                        self._watch_tree(watcher, root)
+                    watched_roots = set(self.monitored_paths)
+                    self._scan_files()
+
+                try:
+                    events = watcher.read_events(self.polling_interval)
+                    self._handle_inotify_events(watcher, events)
+                except OSError as e:
+                    if e.errno == errno.ENOSPC:
+                        raise
+                    logger.error(f"Error in monitoring loop: {e}")
+                except Exception as e:
+                    logger.error(f"Error in monitoring loop: {e}")
+
+        except OSError as e:
+            if e.errno == errno.ENOSPC:
+                logger.warning(
+                    "inotify watch limit exhausted (fs.inotify.max_user_watches), "
+                    "falling back to polling"
+                )
+            else:
+                log = logger.info if self.backend == "auto" else logger.warning
+                log(
+                    f"inotify change detection unavailable, falling back to polling: {e}"
+                )
+        finally:
+            if watcher is not None:
+                watcher.close()
+
+    def _watch_tree(self, watcher: InotifyWatcher, root: Path) -> set[Path]:
+        """
+        Watch a directory and its subdirectories, following symbolic links.
+
+        Args:
+            watcher: inotify watcher to add the watches to
+            root: Directory to watch
+
+        Returns:
+            Files found in the watched directories
+
+        Raises:
+            OSError: If the watch limit is exhausted
+        """
+        files: set[Path] = set()
+        for dir_root, dirs, filenames in os.walk(root, followlinks=True):
+            root_path = Path(dir_root)
+            try:
+                newly_watched = watcher.add_watch(root_path)
+            except OSError as e:
+                if e.errno in (errno.ENOENT, errno.ENOTDIR, errno.EACCES):
+                    dirs[:] = []
+                    continue
+                raise
+
+            # Already watched through another path, e.g. a symlink loop
+            if not newly_watched:
+                dirs[:] = []
+                continue
+
+            dirs[:] = [d for d in dirs if not self._should_ignore_path(root_path / d)]
+            files.update(root_path / filename for filename in filenames)
+
+        return files
+
+    def _handle_inotify_events(
+        self, watcher: InotifyWatcher, events: list[tuple[Path | None, int]]
+    ) -> None:
+        """Check the files affected by a batch of inotify events."""
+        paths_to_check: set[Path] = set()
+
+        for path, mask in events:
+            if path is None or (mask & IN_MOVE_SELF and path in self.monitored_paths):
+                # Events were lost or a monitored root moved: resynchronize
+                for root in list(self.monitored_paths):
+                    self._watch_tree(watcher, root)
+                self._scan_files()
+                return
+
+            # Subdirectory moves are handled through the parent's move events
+            if mask & IN_MOVE_SELF or self._should_ignore_path(path):
+                continue
+
+            if mask & (IN_DELETE | IN_MOVED_FROM | IN_DELETE_SELF):
+                if mask & IN_ISDIR or mask & IN_DELETE_SELF:
+                    watcher.remove_watches_under(path)
+                    paths_to_check.update(
+                        tracked
+                        for tracked in self.file_states
+                        if path in tracked.parents
+                    )
+                else:
+                    paths_to_check.add(path)
+            elif mask & (IN_CREATE | IN_MOVED_TO) and path.is_dir():
+                # New directory (or symlink to one): watch it and pick up its files
+                paths_to_check.update(self._watch_tree(watcher, path))
+            else:
+                paths_to_check.add(path)
+
+        for path in paths_to_check:
+            if path.suffix.lower() in self.MARKDOWN_EXTENSIONS and not (
+                self._should_ignore_path(path)
+            ):
+                self._check_file(path)
+
+    def _check_file(self, path: Path) -> None:
+        """Compare a single file with its last known state and emit changes."""
+        current_state = FileState.from_path(path)
+        previous_state = self.file_states.get(path)
+
+        if previous_state is None:
+            if current_state.exists:
+                self._emit_event(
+                    FileChangeEvent(
+                        path=path, change_type=ChangeType.ADDED, timestamp=time.time()
+                    )
+                )
+                self.file_states[path] = current_state
+            return
+
+        change_type = current_state.detect_change_type(previous_state)
+        if change_type:
+            self._emit_event(
+                FileChangeEvent(
+                    path=path, change_type=change_type, timestamp=time.time()
+                )
+            )
+
+        if current_state.exists:
+            self.file_states[path] = current_state
+        else:
+            del self.file_states[path]
 
     def _scan_files(self) -> None:
         """Scan files for changes and emit events."""
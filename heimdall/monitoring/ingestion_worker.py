@@ -0,0 +1,200 @@
+"""
+Long-lived ingestion worker for the lightweight file monitor.
+
+The lightweight monitor normally runs ``heimdall load`` or
+``heimdall remove-file`` in a fresh subprocess for every file change, so each
+event pays for model loading, system initialization and the startup health
+check. In persistent worker mode the monitor instead starts this module once
+and sends it file events over a pipe, keeping the initialized cognitive system
+warm between events.
+
+Protocol (one JSON object per line):
+
+- The worker writes ``{"ready": true}`` once initialized, or
+  ``{"ready": false, "error": "..."}`` before exiting if initialization fails.
+- Each request is ``{"id": <int>, "command": "load" | "remove-file",
+  "paths": ["<file path>", ...]}``; a single ``"path"`` is also accepted.
+  All paths of a request are handled in one call to the worker.
+- Each response is ``{"id": <int>, "success": <bool>, "error": <str | null>,
+  "result": {...}}``.
+
+The worker exits when its stdin is closed.
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import IO, Any
+
+from loguru import logger
+
+WORKER_COMMANDS = ("load", "remove-file")
+
+
+def handle_request(operations: Any, request: dict[str, Any]) -> dict[str, Any]:
+    """
+    Execute a single file event request.
+
+    Args:
+        operations: CognitiveOperations instance bound to a warm system
+        request: Request with ``id``, ``command`` and ``paths`` (or ``path``)
+
+    Returns:
+        Response dictionary for the request; ``success`` is True only if every
+        path was handled successfully
+    """
+    request_id = request.get("id")
+    command = request.get("command")
+    paths = request.get("paths")
+    if paths is None and isinstance(request.get("path"), str):
+        paths = [request["path"]]
+
+    if (
+        command not in WORKER_COMMANDS
+        or not isinstance(paths, list)
+        or not all(isinstance(path, str) for path in paths)
+    ):
+        return {
+            "id": request_id,
+            "success": False,
+            "error": f"Invalid request: command={command!r}, paths={paths!r}",
+            "result": {},
+        }
+
+    summary: dict[str, Any] = (
+        {"memories_loaded": 0, "memories_deleted": 0, "processing_time": 0.0}
+        if command == "load"
+        else {"deleted_count": 0, "processing_time": 0.0}
+    )
+    errors: list[str] = []
+
+    for path in paths:
+        try:
+            if command == "load":
+                result = operations.load_memories(
+                    source_path=path, loader_type="markdown", dry_run=False
+                )
+            else:
+                result = operations.delete_memories_by_source_path(path)
+        except Exception as e:
+            logger.error(
+                "Ingestion worker request failed",
+                command=command,
+                path=path,
+                error=str(e),
+            )
+            errors.append(f"{path}: {e}")
+            continue
+
+        if not result.get("success"):
+            errors.append(f"{path}: {result.get('error')}")
+            continue
+
+        for key in summary:
+            summary[key] += result.get(key) or 0
+
+    return {
+        "id": request_id,
+        "success": not errors,
+        "error": "; ".join(errors) if errors else None,
+        "result": summary,
+    }
+
+
+def serve(operations: Any, requests: IO[str], responses: IO[str]) -> int:
+    """
+    Answer requests until the request stream is closed.
+
+    Args:
+        operations: CognitiveOperations instance bound to a warm system
+        requests: Stream of JSON request lines
+        responses: Stream to write JSON response lines to
+
+    Returns:
+        Number of requests handled
+    """
+    handled = 0
+    for line in requests:
+        if not line.strip():
+            continue
+
+        response: dict[str, Any]
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            response = {"id": None, "success": False, "error": str(e), "result": {}}
+        else:
+            response = handle_request(operations, request)
+
+        responses.write(json.dumps(response) + "\n")
+        responses.flush()
+        handled += 1
+
+    return handled
+
+
+def main() -> int:
+    """Run the ingestion worker until stdin is closed."""
+    parser = argparse.ArgumentParser(
+        description="Persistent ingestion worker for the lightweight monitor"
+    )
+    parser.add_argument(
+        "--project-root", required=True, help="Root directory of the project"
+    )
+    parser.add_argument("--log-file", help="File to write worker logs to")
+    args = parser.parse_args()
+
+    if args.log_file:
+        logger.remove()
+        logger.add(
+            args.log_file,
+            level="DEBUG",
+            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+            rotation="10 MB",
+            retention="7 days",
+        )
+
+    # Keep stdout for the protocol; anything else printing to it goes to stderr
+    responses = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    os.chdir(Path(args.project_root))
+
+    try:
+        from cognitive_memory.main import graceful_shutdown, initialize_system
+        from heimdall.operations import CognitiveOperations
+
+        cognitive_system = initialize_system("default")
+        operations = CognitiveOperations(cognitive_system)
+    except Exception as e:
+        logger.error("Ingestion worker failed to initialize", error=str(e))
+        responses.write(json.dumps({"ready": False, "error": str(e)}) + "\n")
+        responses.flush()
+        return 1
+
+    # Load the spaCy model now rather than on the first file event
+    from cognitive_memory.core.config import get_config
+    from cognitive_memory.loaders.spacy_models import spacy_models
+
+    try:
+        spacy_models.preload(get_config().cognitive.spacy_model)
+    except OSError as e:
+        logger.warning("Could not pre-load spaCy model", error=str(e))
+
+    responses.write(json.dumps({"ready": True}) + "\n")
+    responses.flush()
+    logger.info("Ingestion worker ready", pid=os.getpid())
+
+    try:
+        handled = serve(operations, sys.stdin, responses)
+        logger.info("Ingestion worker exiting", requests_handled=handled)
+    finally:
+        graceful_shutdown(cognitive_system)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
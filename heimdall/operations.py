@@ -10,11 +10,18 @@ This is the single source of truth for cognitive memory operations.
 
 import json
 import os
+import time
 from pathlib import Path
 from typing import Any
 
 from cognitive_memory.core.interfaces import CognitiveSystem
 
+# Directories with fewer files are loaded sequentially
+PARALLEL_LOAD_MIN_FILES = 8
+
+# Parsing processes for directory loads unless configured otherwise
+DEFAULT_LOAD_WORKERS = 4
+
 
 class CognitiveOperations:
     """
@@ -187,6 +194,7 @@ class CognitiveOperations:
         Returns:
             Dict containing:
             - memory_counts: dict - Count of memories by type/level
+            - query_cache: dict - Recall cache hit rates and time saved
             - system_config: dict - System configuration (if detailed=True)
             - storage_stats: dict - Storage statistics (if detailed=True)
             - embedding_info: dict - Embedding model info (if detailed=True)
@@ -198,6 +206,7 @@ class CognitiveOperations:
 
             result = {
                 "memory_counts": stats.get("memory_counts", {}),
+                "query_cache": stats.get("query_cache", {}),
                 "success": True,
                 "error": None,
             }
@@ -216,6 +225,7 @@ class CognitiveOperations:
         except Exception as e:
             return {
                 "memory_counts": {},
+                "query_cache": {},
                 "system_config": {} if detailed else None,
                 "storage_stats": {} if detailed else None,
                 "embedding_info": {} if detailed else None,
@@ -272,16 +282,20 @@ class CognitiveOperations:
         loader_type: str = "markdown",
         dry_run: bool = False,
         recursive: bool = False,
+        force: bool = False,
         **kwargs: Any,
     ) -> dict[str, Any]:
         """
         Load memories from external source.
 
+        Files that are unchanged since they were last loaded are skipped.
+
         Args:
             source_path: Path to the source file or directory
             loader_type: Type of loader to use (markdown, git)
             dry_run: If True, validate and show what would be loaded
             recursive: If True and source_path is directory, recursively find files
+            force: If True, reload files even if they are unchanged
             **kwargs: Additional loader parameters
 
         Returns:
@@ -294,6 +308,7 @@ class CognitiveOperations:
             - memories_failed: int - Number of memories that failed to load
             - connections_failed: int - Number of connections that failed
             - files_processed: list - List of files processed (for directory loading)
+            - files_skipped: int - Number of unchanged files that were not reloaded
             - error: str | None - Error message if failed
             - dry_run: bool - Whether this was a dry run
         """
@@ -347,11 +362,11 @@ class CognitiveOperations:
                 loader_type == "git" and (source_path_obj / ".git").exists()
             ):
                 return self._process_directory(
-                    loader, source_path_obj, dry_run, recursive, **kwargs
+                    loader, source_path_obj, dry_run, recursive, force, **kwargs
                 )
             else:
                 return self._process_single_source(
-                    loader, source_path, dry_run, **kwargs
+                    loader, source_path, dry_run, force, **kwargs
                 )
 
         except Exception as e:
@@ -392,6 +407,7 @@ class CognitiveOperations:
         source_path_obj: Path,
         dry_run: bool,
         recursive: bool,
+        force: bool = False,
         **kwargs: Any,
     ) -> dict[str, Any]:
         """Process a directory of files."""
@@ -433,15 +449,18 @@ class CognitiveOperations:
             }
 
         # Process files
+        start_time = time.time()
         total_memories_loaded = 0
         total_memories_deleted = 0
         total_connections_created = 0
-        total_processing_time = 0.0
         hierarchy_dist_combined = {"L0": 0, "L1": 0, "L2": 0}
         total_memories_failed = 0
         total_connections_failed = 0
         files_processed = []
+        files_skipped = 0
         total_success = True
+        source_paths = []
+        stage_timings: dict[str, float] = {}
 
         for markdown_file in sorted(markdown_files):
             file_path_str = str(markdown_file)
@@ -453,8 +472,10 @@ class CognitiveOperations:
                 continue
 
             files_processed.append(relative_path)
+            source_paths.append(file_path_str)
 
-            if dry_run:
+        if dry_run:
+            for file_path_str in source_paths:
                 try:
                     # Load memories without storing them
                     memories = loader.load_from_source(file_path_str, **kwargs)
@@ -467,50 +488,100 @@ class CognitiveOperations:
 
                 except Exception:
                     total_success = False
-            else:
-                try:
-                    # Perform atomic reload (delete existing + load new)
-                    results = self.cognitive_system.atomic_reload_memories_from_source(
-                        loader, file_path_str, **kwargs
-                    )
-
-                    if results["success"]:
-                        total_memories_loaded += results["memories_loaded"]
-                        total_memories_deleted += results.get("deleted_count", 0)
-                        total_connections_created += results["connections_created"]
-                        total_processing_time += results["processing_time"]
-                        total_memories_failed += results["memories_failed"]
-                        total_connections_failed += results["connections_failed"]
-
-                        # Aggregate hierarchy distribution
-                        if "hierarchy_distribution" in results:
-                            for level, count in results[
-                                "hierarchy_distribution"
-                            ].items():
-                                if level in hierarchy_dist_combined:
-                                    hierarchy_dist_combined[level] += count
-                    else:
-                        total_success = False
+        else:
+            file_results: list[dict[str, Any]] = []
+            workers = self._directory_load_workers(loader, len(source_paths))
+            # Parse files (in parallel if workers > 1), then embed and write
+            # them in bulk
+            try:
+                reload = self.cognitive_system.reload_sources(
+                    loader, source_paths, force=force, workers=workers, **kwargs
+                )
+                file_results = reload["results"]
+                stage_timings = reload["stage_timings"]
+            except Exception:
+                total_success = False
 
-                except Exception:
+            for results in file_results:
+                if not results["success"]:
                     total_success = False
+                    continue
 
-        return {
+                if results.get("skipped"):
+                    files_skipped += 1
+                total_memories_loaded += results["memories_loaded"]
+                total_memories_deleted += results.get("deleted_count", 0)
+                total_connections_created += results["connections_created"]
+                total_memories_failed += results["memories_failed"]
+                total_connections_failed += results["connections_failed"]
+
+                # Aggregate hierarchy distribution
+                if "hierarchy_distribution" in results:
+                    for level, count in results["hierarchy_distribution"].items():
+                        if level in hierarchy_dist_combined:
+                            hierarchy_dist_combined[level] += count
+
+        processing_time = time.time() - start_time
+
+        result: dict[str, Any] = {
             "success": total_success,
             "memories_loaded": total_memories_loaded,
             "memories_deleted": total_memories_deleted,
             "connections_created": total_connections_created,
-            "processing_time": total_processing_time,
+            "processing_time": processing_time,
             "hierarchy_distribution": hierarchy_dist_combined,
             "memories_failed": total_memories_failed,
             "connections_failed": total_connections_failed,
             "files_processed": files_processed,
+            "files_skipped": files_skipped,
+            "files_per_second": len(files_processed) / processing_time
+            if processing_time > 0
+            else 0.0,
+            "chunks_per_second": total_memories_loaded / processing_time
+            if processing_time > 0
+            else 0.0,
             "error": None if total_success else "Some files failed to process",
             "dry_run": dry_run,
         }
+        # Only report stage timings that were actually measured
+        if stage_timings:
+            result["stage_timings"] = stage_timings
+        return result
+
+    def _directory_load_workers(self, loader: Any, file_count: int) -> int:
+        """
+        Get the number of parsing processes for loading a directory.
+
+        Starting worker processes costs a model load each, so small
+        directories and loaders without parallel support load sequentially.
+
+        Args:
+            loader: Loader the directory is loaded with
+            file_count: Number of files to load
+
+        Returns:
+            Number of parsing processes, 1 to parse in this process
+        """
+        if file_count < PARALLEL_LOAD_MIN_FILES:
+            return 1
+
+        from cognitive_memory.loaders import MarkdownMemoryLoader
+
+        if not isinstance(loader, MarkdownMemoryLoader):
+            return 1
+
+        workers = loader.config.load_workers or min(
+            DEFAULT_LOAD_WORKERS, os.cpu_count() or 1
+        )
+        return max(1, min(workers, file_count))
 
     def _process_single_source(
-        self, loader: Any, source_path: str, dry_run: bool, **kwargs: Any
+        self,
+        loader: Any,
+        source_path: str,
+        dry_run: bool,
+        force: bool = False,
+        **kwargs: Any,
     ) -> dict[str, Any]:
         """Process a single file or git repository."""
         # Validate source
@@ -571,7 +642,7 @@ class CognitiveOperations:
             try:
                 # Perform atomic reload (delete existing + load new)
                 results = self.cognitive_system.atomic_reload_memories_from_source(
-                    loader, source_path, **kwargs
+                    loader, source_path, force=force, **kwargs
                 )
 
                 return {
@@ -584,6 +655,7 @@ class CognitiveOperations:
                     "memories_failed": results["memories_failed"],
                     "connections_failed": results["connections_failed"],
                     "files_processed": [source_path],
+                    "files_skipped": 1 if results.get("skipped") else 0,
                     "error": results.get("error") if not results["success"] else None,
                     "dry_run": dry_run,
                 }
@@ -6,9 +6,17 @@ Provides file change detection and delegates cognitive operations to CLI subproc
 """
 
 import argparse
+import ctypes
+import ctypes.util
+import errno
+import hashlib
+import json
 import os
 import queue
+import select
 import signal
+import sqlite3
+import struct
 import subprocess
 import sys
 import threading
@@ -35,7 +43,7 @@ import time
 # - Achieves architecture goal of lightweight monitoring with subprocess delegation
 #
 # COPIED FROM: heimdall/monitoring/file_types.py
-# LAST SYNC: 2025-06-25
+# LAST SYNC: 2026-10-16
 # ================================================================================
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -115,11 +123,157 @@ class FileState:
         return None
 
 
+# inotify(7) event flags
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+# Supported change detection backends
+WATCH_BACKENDS = ("auto", "inotify", "polling")
+
+
+class InotifyWatcher:
+    """
+    Minimal Linux inotify wrapper using ctypes.
+
+    Watches are per directory and not recursive; callers add a watch for every
+    directory they are interested in. Each watch remembers the path it was
+    added under so events can be reported with full paths, including paths
+    reached through symbolic links.
+    """
+
+    WATCH_MASK = (
+        IN_MODIFY
+        | IN_CLOSE_WRITE
+        | IN_MOVED_FROM
+        | IN_MOVED_TO
+        | IN_CREATE
+        | IN_DELETE
+        | IN_DELETE_SELF
+        | IN_MOVE_SELF
+        | IN_ONLYDIR
+    )
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self) -> None:
+        """
+        Create an inotify instance.
+
+        Raises:
+            OSError: If inotify is not available or the instance limit is reached
+        """
+        if not sys.platform.startswith("linux"):
+            raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError(errno.ENOSYS, "libc does not provide inotify")
+
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+        self.watches: dict[int, Path] = {}
+
+    def add_watch(self, path: Path) -> bool:
+        """
+        Watch a directory.
+
+        Args:
+            path: Directory to watch
+
+        Returns:
+            False if the directory is already watched under a different path
+            (for example through a symbolic link), True otherwise
+
+        Raises:
+            OSError: If the watch cannot be added (ENOSPC when the watch
+                limit is exhausted)
+        """
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), self.WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), str(path))
+
+        return self.watches.setdefault(wd, path) == path
+
+    def remove_watches_under(self, path: Path) -> None:
+        """Stop watching a directory and all watched directories below it."""
+        for wd, watched_path in list(self.watches.items()):
+            if watched_path == path or path in watched_path.parents:
+                self._libc.inotify_rm_watch(self.fd, wd)
+                del self.watches[wd]
+
+    def read_events(self, timeout: float) -> list[tuple[Path | None, int]]:
+        """
+        Wait for and read pending events.
+
+        Args:
+            timeout: Seconds to wait for the first event
+
+        Returns:
+            List of (path, mask) tuples. Path is None for queue overflow.
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+
+        events: list[tuple[Path | None, int]] = []
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                break
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, name_len = self.EVENT_HEADER.unpack_from(data, offset)
+                offset += self.EVENT_HEADER.size
+                name = data[offset : offset + name_len].rstrip(b"\0")
+                offset += name_len
+
+                if mask & IN_Q_OVERFLOW:
+                    events.append((None, mask))
+                    continue
+
+                directory = self.watches.get(wd)
+                if mask & IN_IGNORED:
+                    self.watches.pop(wd, None)
+                    continue
+                if directory is None:
+                    continue
+
+                events.append(
+                    (directory / os.fsdecode(name) if name else directory, mask)
+                )
+
+        return events
+
+    def close(self) -> None:
+        """Close the inotify instance and drop all watches."""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+        self.watches.clear()
+
+
 class FileMonitor:
     """
     Minimal file monitor with no heavy dependencies.
 
-    Monitors markdown files for changes using polling-based detection.
+    Monitors markdown files for changes using inotify on Linux, or
+    polling-based detection where inotify is unavailable or its watch limit
+    is exhausted.
     This implementation has minimal memory footprint and no ML dependencies.
     """
 
@@ -127,10 +281,28 @@ class FileMonitor:
     MARKDOWN_EXTENSIONS = {".md", ".markdown", ".mdown", ".mkd"}
 
     def __init__(
-        self, polling_interval: float = 5.0, ignore_patterns: set[str] | None = None
+        self,
+        polling_interval: float = 5.0,
+        ignore_patterns: set[str] | None = None,
+        backend: str = "auto",
     ):
-        """Initialize file monitor."""
+        """
+        Initialize file monitor.
+
+        Args:
+            polling_interval: Seconds between polling checks
+            ignore_patterns: Set of patterns to ignore
+            backend: Change detection backend: "auto" or "inotify" use inotify
+                and fall back to polling, "polling" always polls
+        """
+        if backend not in WATCH_BACKENDS:
+            raise ValueError(
+                f"Unknown watch backend: {backend} (expected one of {WATCH_BACKENDS})"
+            )
+
         self.polling_interval = polling_interval
+        self.backend = backend
+        self.active_backend: str | None = None
         self.ignore_patterns = ignore_patterns or {
             ".git",
             "__pycache__",
@@ -249,6 +421,12 @@ class FileMonitor:
         """Main monitoring loop."""
         logger.debug("File monitoring loop started")
 
+        if self.backend != "polling":
+            self._inotify_loop()
+
+        if self.monitoring:
+            self.active_backend = "polling"
+
         while self.monitoring:
             try:
                 self._scan_files()
@@ -258,6 +436,165 @@ class FileMonitor:
                 time.sleep(self.polling_interval)
 
         logger.debug("File monitoring loop ended")
+        self.active_backend = None
+
+    def _inotify_loop(self) -> None:
+        """
+        Event-driven monitoring loop.
+
+        Returns when monitoring stops, or early if inotify is unavailable or
+        runs out of watches, in which case the caller continues by polling.
+        """
+        watcher: InotifyWatcher | None = None
+        watched_roots: set[Path] = set()
+        try:
+            watcher = InotifyWatcher()
+            # Add watches before the baseline scan so no change is missed
+            for root in list(self.monitored_paths):
+                self._watch_tree(watcher, root)
+                watched_roots.add(root)
+            self._scan_files()
+            self.active_backend = "inotify"
+            logger.info(
+                f"Using inotify change detection ({len(watcher.watches)} watches)"
+            )
+
+            while self.monitoring:
+                if watched_roots != self.monitored_paths:
+                    for root in watched_roots - self.monitored_paths:
+                        watcher.remove_watches_under(root)
+                    for root in self.monitored_paths - watched_roots:
+                        self._watch_tree(watcher, root)
+                    watched_roots = set(self.monitored_paths)
+                    self._scan_files()
+
+                try:
+                    events = watcher.read_events(self.polling_interval)
+                    self._handle_inotify_events(watcher, events)
+                except OSError as e:
+                    if e.errno == errno.ENOSPC:
+                        raise
+                    logger.error(f"Error in monitoring loop: {e}")
+                except Exception as e:
+                    logger.error(f"Error in monitoring loop: {e}")
+
+        except OSError as e:
+            if e.errno == errno.ENOSPC:
+                logger.warning(
+                    "inotify watch limit exhausted (fs.inotify.max_user_watches), "
+                    "falling back to polling"
+                )
+            else:
+                log = logger.info if self.backend == "auto" else logger.warning
+                log(
+                    f"inotify change detection unavailable, falling back to polling: {e}"
+                )
+        finally:
+            if watcher is not None:
+                watcher.close()
+
+    def _watch_tree(self, watcher: InotifyWatcher, root: Path) -> set[Path]:
+        """
+        Watch a directory and its subdirectories, following symbolic links.
+
+        Args:
+            watcher: inotify watcher to add the watches to
+            root: Directory to watch
+
+        Returns:
+            Files found in the watched directories
+
+        Raises:
+            OSError: If the watch limit is exhausted
+        """
+        files: set[Path] = set()
+        for dir_root, dirs, filenames in os.walk(root, followlinks=True):
+            root_path = Path(dir_root)
+            try:
+                newly_watched = watcher.add_watch(root_path)
+            except OSError as e:
+                if e.errno in (errno.ENOENT, errno.ENOTDIR, errno.EACCES):
+                    dirs[:] = []
+                    continue
+                raise
+
+            # Already watched through another path, e.g. a symlink loop
+            if not newly_watched:
+                dirs[:] = []
+                continue
+
+            dirs[:] = [d for d in dirs if not self._should_ignore_path(root_path / d)]
+            files.update(root_path / filename for filename in filenames)
+
+        return files
+
+    def _handle_inotify_events(
+        self, watcher: InotifyWatcher, events: list[tuple[Path | None, int]]
+    ) -> None:
+        """Check the files affected by a batch of inotify events."""
+        paths_to_check: set[Path] = set()
+
+        for path, mask in events:
+            if path is None or (mask & IN_MOVE_SELF and path in self.monitored_paths):
+                # Events were lost or a monitored root moved: resynchronize
+                for root in list(self.monitored_paths):
+                    self._watch_tree(watcher, root)
+                self._scan_files()
+                return
+
+            # Subdirectory moves are handled through the parent's move events
+            if mask & IN_MOVE_SELF or self._should_ignore_path(path):
+                continue
+
+            if mask & (IN_DELETE | IN_MOVED_FROM | IN_DELETE_SELF):
+                if mask & IN_ISDIR or mask & IN_DELETE_SELF:
+                    watcher.remove_watches_under(path)
+                    paths_to_check.update(
+                        tracked
+                        for tracked in self.file_states
+                        if path in tracked.parents
+                    )
+                else:
+                    paths_to_check.add(path)
+            elif mask & (IN_CREATE | IN_MOVED_TO) and path.is_dir():
+                # New directory (or symlink to one): watch it and pick up its files
+                paths_to_check.update(self._watch_tree(watcher, path))
+            else:
+                paths_to_check.add(path)
+
+        for path in paths_to_check:
+            if path.suffix.lower() in self.MARKDOWN_EXTENSIONS and not (
+                self._should_ignore_path(path)
+            ):
+                self._check_file(path)
+
+    def _check_file(self, path: Path) -> None:
+        """Compare a single file with its last known state and emit changes."""
+        current_state = FileState.from_path(path)
+        previous_state = self.file_states.get(path)
+
+        if previous_state is None:
+            if current_state.exists:
+                self._emit_event(
+                    FileChangeEvent(
+                        path=path, change_type=ChangeType.ADDED, timestamp=time.time()
+                    )
+                )
+                self.file_states[path] = current_state
+            return
+
+        change_type = current_state.detect_change_type(previous_state)
+        if change_type:
+            self._emit_event(
+                FileChangeEvent(
+                    path=path, change_type=change_type, timestamp=time.time()
+                )
+            )
+
+        if current_state.exists:
+            self.file_states[path] = current_state
+        else:
+            del self.file_states[path]
 
     def _scan_files(self) -> None:
         """Scan files for changes and emit events."""
@@ -394,67 +731,94 @@ class SingletonLock:
             self.lock_file = None
 
 
+def coalesce_change_types(previous: ChangeType, current: ChangeType) -> ChangeType:
+    """
+    Collapse two consecutive changes of the same file into their net change.
+
+    Deletion always wins, a file that was added stays added through later
+    modifications, and a file that reappears after a deletion is reloaded.
+
+    Args:
+        previous: Change already pending for the file
+        current: Newly observed change
+
+    Returns:
+        Single change type with the same net effect
+    """
+    if current == ChangeType.DELETED:
+        return ChangeType.DELETED
+    if previous == ChangeType.ADDED:
+        return ChangeType.ADDED
+    if previous == ChangeType.DELETED:
+        return ChangeType.MODIFIED
+    return current
+
+
 class EventQueue:
     """
-    Thread-safe queue for file change events with deduplication.
+    Thread-safe queue for file change events with per-path coalescing.
 
-    Provides event deduplication based on file path and change type within time windows.
+    Each path has at most one pending event. Further changes to the same path
+    are merged into it (see coalesce_change_types) and restart its debounce
+    window, so an event only becomes available once the file has been quiet
+    for ``debounce_seconds``. Ready events can be drained in batches.
     """
 
-    def __init__(self, max_size: int = 1000):
+    def __init__(self, max_size: int = 1000, debounce_seconds: float = 1.0):
         """
         Initialize event queue.
 
         Args:
-            max_size: Maximum queue size before blocking
+            max_size: Maximum number of distinct pending paths
+            debounce_seconds: Quiet period before a path's event is released
         """
-        self._queue: queue.Queue[FileChangeEvent] = queue.Queue(maxsize=max_size)
-        self._recent_events: dict[Path, FileChangeEvent] = {}
-        self._lock = threading.Lock()
+        self.max_size = max_size
+        self.debounce_seconds = debounce_seconds
+        # path -> (net event, monotonic time at which it becomes ready)
+        self._pending: dict[Path, tuple[FileChangeEvent, float]] = {}
+        self._condition = threading.Condition()
 
     def put(self, event: FileChangeEvent, deduplicate: bool = True) -> bool:
         """
-        Add event to queue with optional deduplication.
+        Add event to queue, merging it with a pending event for the same file.
 
         Args:
             event: FileChangeEvent to add
-            deduplicate: Whether to deduplicate recent events for same file
+            deduplicate: Whether to debounce the event; initial scan events are
+                released immediately
 
         Returns:
-            True if event was added, False if deduplicated
+            True if the event was queued or merged, False if the queue is full
         """
-        try:
-            with self._lock:
-                # Check for recent duplicate events
-                if deduplicate and event.path in self._recent_events:
-                    recent_event = self._recent_events[event.path]
-                    # Skip if same event type within 1 second
-                    if (
-                        event.change_type == recent_event.change_type
-                        and event.timestamp - recent_event.timestamp < 1.0
-                    ):
-                        logger.debug(f"Deduplicated event: {event}")
-                        return False
-
-                # Add to queue
-                self._queue.put_nowait(event)
-                self._recent_events[event.path] = event
-
-                # Clean old recent events (keep last 100)
-                if len(self._recent_events) > 100:
-                    oldest_paths = list(self._recent_events.keys())[:50]
-                    for path in oldest_paths:
-                        del self._recent_events[path]
+        with self._condition:
+            pending = self._pending.pop(event.path, None)
 
-                return True
+            if pending is None and len(self._pending) >= self.max_size:
+                logger.error("Event queue is full, dropping event")
+                return False
 
-        except queue.Full:
-            logger.error("Event queue is full, dropping event")
-            return False
+            if pending is not None:
+                previous = pending[0]
+                event = FileChangeEvent(
+                    path=event.path,
+                    change_type=coalesce_change_types(
+                        previous.change_type, event.change_type
+                    ),
+                    timestamp=event.timestamp,
+                )
+                logger.debug(f"Coalesced {previous} into {event}")
+
+            ready_at = time.monotonic()
+            if deduplicate:
+                ready_at += self.debounce_seconds
+
+            self._pending[event.path] = (event, ready_at)
+            self._condition.notify_all()
+            return True
 
     def get(self, timeout: float | None = None) -> FileChangeEvent | None:
         """
-        Get next event from queue.
+        Get next ready event from queue.
 
         Args:
             timeout: Maximum time to wait for event
@@ -462,18 +826,55 @@ class EventQueue:
         Returns:
             Next FileChangeEvent or None if timeout
         """
-        try:
-            return self._queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+        batch = self.get_batch(1, timeout=timeout)
+        return batch[0] if batch else None
+
+    def get_batch(
+        self, max_events: int, timeout: float | None = None
+    ) -> list[FileChangeEvent]:
+        """
+        Get up to ``max_events`` ready events, oldest first.
+
+        Args:
+            max_events: Maximum number of events to return
+            timeout: Maximum time to wait for the first ready event
+
+        Returns:
+            List of ready events (empty on timeout)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                ready = [
+                    path
+                    for path, (_, ready_at) in self._pending.items()
+                    if ready_at <= now
+                ][:max_events]
+                if ready:
+                    return [self._pending.pop(path)[0] for path in ready]
+
+                wait_until = min(
+                    (ready_at for _, ready_at in self._pending.values()),
+                    default=deadline,
+                )
+                if deadline is not None:
+                    if now >= deadline:
+                        return []
+                    wait_until = min(wait_until or deadline, deadline)
+
+                self._condition.wait(
+                    None if wait_until is None else max(wait_until - now, 0.0)
+                )
 
     def task_done(self) -> None:
-        """Mark a previously enqueued task as done."""
-        self._queue.task_done()
+        """Mark a previously returned event as processed (kept for API compatibility)."""
 
     def qsize(self) -> int:
-        """Get approximate queue size."""
-        return self._queue.qsize()
+        """Get number of pending paths."""
+        with self._condition:
+            return len(self._pending)
 
 
 class SignalHandler:
@@ -527,7 +928,11 @@ class MarkdownFileWatcher:
     """
 
     def __init__(
-        self, polling_interval: float = 5.0, ignore_patterns: set[str] | None = None
+        self,
+        polling_interval: float = 5.0,
+        ignore_patterns: set[str] | None = None,
+        debounce_seconds: float = 1.0,
+        backend: str = "auto",
     ):
         """
         Initialize file watcher.
@@ -535,6 +940,8 @@ class MarkdownFileWatcher:
         Args:
             polling_interval: Seconds between polling checks
             ignore_patterns: Set of patterns to ignore
+            debounce_seconds: Quiet period before a file's changes are processed
+            backend: Change detection backend ("auto", "inotify" or "polling")
         """
         self.polling_interval = polling_interval
         self.ignore_patterns = ignore_patterns or {
@@ -545,11 +952,13 @@ class MarkdownFileWatcher:
 
         # Create underlying monitor
         self.monitor = FileMonitor(
-            polling_interval=polling_interval, ignore_patterns=self.ignore_patterns
+            polling_interval=polling_interval,
+            ignore_patterns=self.ignore_patterns,
+            backend=backend,
         )
 
         # Event queue for processing
-        self.event_queue = EventQueue()
+        self.event_queue = EventQueue(debounce_seconds=debounce_seconds)
 
         # Register callbacks to forward events to queue
         for change_type in [ChangeType.ADDED, ChangeType.MODIFIED, ChangeType.DELETED]:
@@ -592,14 +1001,333 @@ class MarkdownFileWatcher:
             logger.debug(f"Queued file change event: {event}")
 
 
+class SourceManifest:
+    """
+    Read-only view of the source manifest in the memory database.
+
+    The cognitive system records the size, modification time and content hash
+    of every file it loads. Checking events against that record lets the
+    monitor skip unchanged files (for example on restart, or when a file is
+    only touched) without starting an ingestion call. Only the standard
+    library sqlite3 module is used, and the database is never written.
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize the manifest view.
+
+        Args:
+            db_path: Path to the SQLite memory database
+        """
+        self.db_path = db_path
+
+    def unchanged_paths(self, paths: list[Path]) -> set[Path]:
+        """
+        Find files whose loaded memories are up to date.
+
+        A file is unchanged if its size and modification time match the
+        manifest, or if only the modification time differs and the content
+        hash still matches. Files whose recorded memories were removed in the
+        meantime are reported as changed.
+
+        Args:
+            paths: File paths, as passed to the ingestion commands
+
+        Returns:
+            Subset of ``paths`` that do not need to be reloaded
+        """
+        if not paths or not self.db_path.exists():
+            return set()
+
+        unchanged: set[Path] = set()
+        try:
+            conn = sqlite3.connect(
+                f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True
+            )
+            try:
+                for path in paths:
+                    row = conn.execute(
+                        """
+                        SELECT size, mtime, content_hash,
+                               json_array_length(memory_ids),
+                               (SELECT COUNT(*) FROM memories WHERE id IN
+                                (SELECT value FROM json_each(m.memory_ids)))
+                        FROM source_manifest m WHERE source_path = ?
+                    """,
+                        (str(path),),
+                    ).fetchone()
+                    if row is not None and self._matches(path, *row):
+                        unchanged.add(path)
+            finally:
+                conn.close()
+
+        except sqlite3.Error as e:
+            # Older databases have no manifest yet; process everything
+            logger.debug(f"Source manifest unavailable: {e}")
+
+        return unchanged
+
+    @staticmethod
+    def _matches(
+        path: Path,
+        size: int,
+        mtime: float,
+        content_hash: str,
+        memory_count: int,
+        memories_present: int,
+    ) -> bool:
+        """Compare a file with its manifest entry."""
+        if memories_present != memory_count:
+            return False
+
+        try:
+            stat = path.stat()
+            if stat.st_size != size:
+                return False
+            if stat.st_mtime == mtime:
+                return True
+            return hashlib.sha256(path.read_bytes()).hexdigest() == content_hash
+        except OSError:
+            return False
+
+
+class IngestionWorker:
+    """
+    Client for a long-lived ingestion worker process.
+
+    The worker (heimdall.monitoring.ingestion_worker) initializes the cognitive
+    system once and then processes file events sent over its stdin/stdout pipe.
+    It is started lazily on the first request and recycled after a number of
+    file events or an idle period, which bounds its memory growth.
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        max_requests: int = 500,
+        idle_timeout: float = 300.0,
+        startup_timeout: float = 300.0,
+        request_timeout: float = 300.0,
+        worker_command: list[str] | None = None,
+    ):
+        """
+        Initialize worker client.
+
+        Args:
+            project_root: Root directory of the project (worker working directory)
+            max_requests: File events handled before the worker is recycled;
+                a request counts once for each of its paths
+            idle_timeout: Seconds without requests before the worker is stopped
+            startup_timeout: Seconds to wait for the worker to become ready
+            request_timeout: Seconds to wait for a single response
+            worker_command: Command that starts the worker (defaults to the
+                ingestion worker module run by the current interpreter)
+        """
+        self.project_root = project_root
+        self.max_requests = max_requests
+        self.idle_timeout = idle_timeout
+        self.startup_timeout = startup_timeout
+        self.request_timeout = request_timeout
+        self.worker_command = worker_command or [
+            sys.executable,
+            "-m",
+            "heimdall.monitoring.ingestion_worker",
+            "--project-root",
+            str(project_root),
+            "--log-file",
+            str(project_root / ".heimdall" / "ingestion_worker.log"),
+        ]
+
+        self._process: subprocess.Popen[str] | None = None
+        self._responses: queue.Queue[dict[str, Any] | None] = queue.Queue()
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._events_served = 0
+        self._last_used = 0.0
+        self.starts = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether a worker process is currently alive."""
+        return self._process is not None and self._process.poll() is None
+
+    def request(self, command: str, paths: list[Path]) -> dict[str, Any]:
+        """
+        Send file events to the worker and wait for its response.
+
+        Args:
+            command: Worker command ("load" or "remove-file")
+            paths: Files the events refer to, handled in one request
+
+        Returns:
+            Worker response with ``success``, ``error`` and ``result`` keys
+
+        Raises:
+            LightweightMonitorError: If the worker cannot be started, dies, or
+                does not answer in time. The worker is stopped in that case.
+        """
+        with self._lock:
+            if self._events_served >= self.max_requests:
+                logger.info(
+                    f"Recycling ingestion worker after {self._events_served} events"
+                )
+                self._stop_process()
+
+            if not self.is_running:
+                self._start_process()
+
+            process = self._process
+            assert process is not None and process.stdin is not None
+
+            self._next_id += 1
+            request_id = self._next_id
+            message = {
+                "id": request_id,
+                "command": command,
+                "paths": [str(path) for path in paths],
+            }
+
+            try:
+                process.stdin.write(json.dumps(message) + "\n")
+                process.stdin.flush()
+                response = self._read_response(self.request_timeout)
+            except (OSError, LightweightMonitorError) as e:
+                self._stop_process()
+                raise LightweightMonitorError(f"Ingestion worker failed: {e}") from e
+
+            if response.get("id") != request_id:
+                self._stop_process()
+                raise LightweightMonitorError(
+                    f"Ingestion worker answered request {response.get('id')} "
+                    f"instead of {request_id}"
+                )
+
+            self._events_served += len(paths)
+            self._last_used = time.time()
+            return response
+
+    def stop_if_idle(self) -> bool:
+        """
+        Stop the worker if it has not been used for ``idle_timeout`` seconds.
+
+        Returns:
+            True if the worker was stopped
+        """
+        with self._lock:
+            if self.is_running and time.time() - self._last_used >= self.idle_timeout:
+                logger.info("Stopping idle ingestion worker")
+                self._stop_process()
+                return True
+            return False
+
+    def stop(self) -> None:
+        """Stop the worker process if it is running."""
+        with self._lock:
+            self._stop_process()
+
+    def _start_process(self) -> None:
+        """Start the worker and wait until it reports ready."""
+        logger.info(f"Starting ingestion worker: {' '.join(self.worker_command)}")
+        self._responses = queue.Queue()
+        self._process = subprocess.Popen(
+            self.worker_command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+            cwd=self.project_root,
+        )
+        self.starts += 1
+        self._events_served = 0
+
+        reader = threading.Thread(
+            target=self._read_stdout,
+            args=(self._process, self._responses),
+            name="IngestionWorkerReader",
+            daemon=True,
+        )
+        reader.start()
+
+        try:
+            ready = self._read_response(self.startup_timeout)
+        except LightweightMonitorError:
+            self._stop_process()
+            raise
+
+        if not ready.get("ready"):
+            self._stop_process()
+            raise LightweightMonitorError(
+                f"Ingestion worker failed to initialize: {ready.get('error')}"
+            )
+
+        self._last_used = time.time()
+        logger.info(f"Ingestion worker ready (PID: {self._process.pid})")
+
+    @staticmethod
+    def _read_stdout(
+        process: "subprocess.Popen[str]",
+        responses: "queue.Queue[dict[str, Any] | None]",
+    ) -> None:
+        """Forward JSON lines from the worker's stdout until it closes."""
+        assert process.stdout is not None
+        for line in process.stdout:
+            try:
+                responses.put(json.loads(line))
+            except json.JSONDecodeError:
+                logger.debug(f"Ignoring non-protocol worker output: {line.strip()}")
+        responses.put(None)
+
+    def _read_response(self, timeout: float) -> dict[str, Any]:
+        """Wait for the next protocol message from the worker."""
+        try:
+            response = self._responses.get(timeout=timeout)
+        except queue.Empty as e:
+            raise LightweightMonitorError(
+                f"No response from ingestion worker within {timeout}s"
+            ) from e
+
+        if response is None:
+            raise LightweightMonitorError("Ingestion worker exited unexpectedly")
+        return response
+
+    def _stop_process(self) -> None:
+        """Close the worker's stdin and wait for it to exit."""
+        process = self._process
+        self._process = None
+        if process is None:
+            return
+
+        try:
+            if process.stdin:
+                process.stdin.close()
+            process.wait(timeout=30.0)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+
+
 class LightweightMonitor:
     """
     File monitoring process with subprocess delegation.
 
-    Monitors file changes and delegates cognitive operations to CLI subprocesses.
+    Monitors file changes and delegates cognitive operations to CLI subprocesses,
+    or, in persistent worker mode, to a single long-lived ingestion worker.
     """
 
-    def __init__(self, project_root: Path, target_path: Path, lock_file: Path):
+    def __init__(
+        self,
+        project_root: Path,
+        target_path: Path,
+        lock_file: Path,
+        persistent_worker: bool = False,
+        worker_max_requests: int = 500,
+        worker_idle_timeout: float = 300.0,
+        batch_size: int = 10,
+        debounce_seconds: float = 1.0,
+        watch_backend: str = "auto",
+        database_path: Path | None = None,
+    ):
         """
         Initialize lightweight monitor.
 
@@ -607,10 +1335,33 @@ class LightweightMonitor:
             project_root: Root directory of the project
             target_path: Path to monitor for file changes
             lock_file: Path to singleton lock file
+            persistent_worker: Send events to a long-lived ingestion worker
+                instead of starting a CLI subprocess per event
+            worker_max_requests: Events handled before the worker is recycled
+            worker_idle_timeout: Seconds without events before the worker is stopped
+            batch_size: Maximum number of file changes per ingestion call
+            debounce_seconds: Quiet period before a file's changes are processed
+            watch_backend: Change detection backend ("auto", "inotify" or
+                "polling"); inotify falls back to polling when unavailable
+            database_path: Memory database whose source manifest is used to
+                skip unchanged files; if None every change is ingested
         """
         self.project_root = project_root
+        self.batch_size = batch_size
+        self.debounce_seconds = debounce_seconds
+        self.watch_backend = watch_backend
+        self.source_manifest = SourceManifest(database_path) if database_path else None
         self.target_path = target_path
         self.lock_file_path = lock_file
+        self.ingestion_worker: IngestionWorker | None = (
+            IngestionWorker(
+                project_root,
+                max_requests=worker_max_requests,
+                idle_timeout=worker_idle_timeout,
+            )
+            if persistent_worker
+            else None
+        )
 
         # Components
         self.singleton_lock: SingletonLock | None = None
@@ -624,6 +1375,7 @@ class LightweightMonitor:
         self.stats: dict[str, Any] = {
             "started_at": None,
             "files_processed": 0,
+            "files_skipped": 0,
             "subprocess_calls": 0,
             "subprocess_errors": 0,
             "subprocess_retries": 0,
@@ -648,7 +1400,10 @@ class LightweightMonitor:
         self.retry_delay = 2.0  # seconds
         self.subprocess_timeout = 300  # 5 minutes
 
-        logger.info(f"LightweightMonitor initialized for project: {project_root}")
+        logger.info(
+            f"LightweightMonitor initialized for project: {project_root} "
+            f"(persistent worker: {persistent_worker})"
+        )
 
     def start(self) -> bool:
         """
@@ -668,7 +1423,11 @@ class LightweightMonitor:
             self.signal_handler.register_handlers()
 
             # Initialize file watcher
-            self.file_watcher = MarkdownFileWatcher(polling_interval=5.0)
+            self.file_watcher = MarkdownFileWatcher(
+                polling_interval=5.0,
+                debounce_seconds=self.debounce_seconds,
+                backend=self.watch_backend,
+            )
             self.file_watcher.add_path(self.target_path)
 
             # Start file monitoring
@@ -727,6 +1486,10 @@ class LightweightMonitor:
                 if self.processing_thread.is_alive():
                     logger.warning("Processing thread did not stop cleanly")
 
+            # Stop the ingestion worker
+            if self.ingestion_worker:
+                self.ingestion_worker.stop()
+
             # Release singleton lock
             if self.singleton_lock:
                 self.singleton_lock.__exit__(None, None, None)
@@ -774,25 +1537,32 @@ class LightweightMonitor:
                 if not self.file_watcher:
                     break
 
-                event = self.file_watcher.event_queue.get(timeout=1.0)
-                if event is None:
+                events = self.file_watcher.event_queue.get_batch(
+                    self.batch_size, timeout=1.0
+                )
+                if not events:
+                    if self.ingestion_worker:
+                        self.ingestion_worker.stop_if_idle()
                     continue
 
-                # Process event via subprocess delegation
-                success = self._handle_file_change_subprocess(event)
+                # Process the batch via subprocess delegation
+                failed = self._handle_file_changes(events)
 
                 # Update statistics
-                self.stats["files_processed"] = (self.stats["files_processed"] or 0) + 1
+                self.stats["files_processed"] = (
+                    self.stats["files_processed"] or 0
+                ) + len(events)
                 activity_time = time.time()
                 self.stats["last_activity"] = activity_time
 
-                if not success:
+                if failed:
                     self.stats["subprocess_errors"] = (
                         self.stats["subprocess_errors"] or 0
-                    ) + 1
+                    ) + failed
 
-                # Mark task as done
-                self.file_watcher.event_queue.task_done()
+                # Mark tasks as done
+                for _ in events:
+                    self.file_watcher.event_queue.task_done()
 
             except Exception as e:
                 logger.error(f"Error in event processing loop: {e}")
@@ -860,50 +1630,106 @@ class LightweightMonitor:
         Returns:
             True if subprocess completed successfully, False otherwise
         """
-        try:
-            logger.info(f"Processing file change via subprocess: {event}")
+        return self._handle_file_changes([event]) == 0
 
-            # Set current processing state
-            self.current_processing = {
-                "file_path": str(event.path),
-                "started_at": time.time(),
-                "change_type": event.change_type.value,
-            }
+    def _handle_file_changes(self, events: list[FileChangeEvent]) -> int:
+        """
+        Handle a batch of file changes with one ingestion call per action.
 
-            # Map change type to CLI command
-            cmd = self._build_subprocess_command(event)
-            if not cmd:
-                # Clear processing state on error
+        Deletions are sent as a single ``remove-file`` call and additions or
+        modifications as a single ``load`` call, either to a CLI subprocess or
+        to the persistent ingestion worker.
+
+        Args:
+            events: Coalesced file change events (one per path)
+
+        Returns:
+            Number of events whose ingestion call failed
+        """
+        failed = 0
+
+        if self.source_manifest:
+            unchanged = self.source_manifest.unchanged_paths(
+                [
+                    event.path
+                    for event in events
+                    if event.change_type != ChangeType.DELETED
+                ]
+            )
+            if unchanged:
+                logger.info(f"Skipping {len(unchanged)} unchanged file(s)")
+                self.stats["files_skipped"] += len(unchanged)
+                events = [
+                    event
+                    for event in events
+                    if event.change_type == ChangeType.DELETED
+                    or event.path not in unchanged
+                ]
+
+        for cmd, batch in self._build_batch_commands(events):
+            try:
+                logger.info(
+                    f"Processing {len(batch)} file change(s) via subprocess: "
+                    f"{', '.join(str(event) for event in batch)}"
+                )
+
+                # Set current processing state
                 self.current_processing = {
-                    "file_path": None,
-                    "started_at": None,
-                    "change_type": None,
+                    "file_path": str(batch[0].path),
+                    "started_at": time.time(),
+                    "change_type": batch[0].change_type.value,
+                    "batch_size": len(batch),
                 }
-                return False
 
-            # Execute subprocess with retry logic
-            success = self._execute_subprocess_with_retry(cmd, event)
+                # Execute in the persistent worker or a subprocess, with retry logic
+                if self.ingestion_worker:
+                    success = self._execute_worker_with_retry(cmd, batch[0])
+                else:
+                    success = self._execute_subprocess_with_retry(cmd, batch[0])
 
-            # Clear processing state when done
-            self.current_processing = {
-                "file_path": None,
-                "started_at": None,
-                "change_type": None,
-            }
+            except Exception as e:
+                logger.error(f"Error handling file changes {batch}: {e}")
+                success = False
 
-            return success
+            if not success:
+                failed += len(batch)
 
-        except Exception as e:
-            logger.error(
-                f"Error handling file change subprocess for event {event}: {e}"
-            )
-            # Clear processing state on error
-            self.current_processing = {
-                "file_path": None,
-                "started_at": None,
-                "change_type": None,
-            }
-            return False
+        # Clear processing state when done
+        self.current_processing = {
+            "file_path": None,
+            "started_at": None,
+            "change_type": None,
+        }
+
+        return failed
+
+    def _build_batch_commands(
+        self, events: list[FileChangeEvent]
+    ) -> list[tuple[list[str], list[FileChangeEvent]]]:
+        """
+        Group file change events into one CLI command per action.
+
+        Args:
+            events: File change events to process
+
+        Returns:
+            List of (CLI command, events handled by it); deletions come first
+        """
+        deleted = [e for e in events if e.change_type == ChangeType.DELETED]
+        loaded = [
+            e
+            for e in events
+            if e.change_type in [ChangeType.ADDED, ChangeType.MODIFIED]
+        ]
+
+        commands = []
+        for batch in (deleted, loaded):
+            if batch:
+                cmd = self._build_subprocess_command(batch[0])
+                if cmd:
+                    cmd += [str(event.path) for event in batch[1:]]
+                    commands.append((cmd, batch))
+        return commands
 
     def _build_subprocess_command(self, event: FileChangeEvent) -> list[str] | None:
         """
@@ -1032,6 +1858,74 @@ class LightweightMonitor:
         )
         return False
 
+    def _execute_worker_with_retry(
+        self, cmd: list[str], event: FileChangeEvent
+    ) -> bool:
+        """
+        Execute a CLI-equivalent command in the persistent ingestion worker.
+
+        Worker failures (crash, timeout, failed startup) are retried with a
+        freshly started worker. Failed operations reported by the worker are
+        not retried.
+
+        Args:
+            cmd: CLI command that would handle the event
+            event: File change event being processed
+
+        Returns:
+            True if the worker completed the operation successfully
+        """
+        assert self.ingestion_worker is not None
+        _, command, *paths = cmd
+        last_error = None
+
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                logger.info(
+                    f"Retrying ingestion worker request (attempt {attempt + 1}/{self.max_retries + 1}): {' '.join(cmd)}"
+                )
+                self.stats["subprocess_retries"] = (
+                    self.stats["subprocess_retries"] or 0
+                ) + 1
+                time.sleep(self.retry_delay * attempt)
+
+            start_time = time.time()
+            try:
+                response = self.ingestion_worker.request(
+                    command, [Path(path) for path in paths]
+                )
+            except LightweightMonitorError as e:
+                last_error = str(e)
+                self.stats["last_subprocess_error"] = last_error
+                logger.error(f"Ingestion worker error (attempt {attempt + 1}): {e}")
+                continue
+
+            execution_time = time.time() - start_time
+            self.stats["subprocess_calls"] = (self.stats["subprocess_calls"] or 0) + 1
+
+            if response.get("success"):
+                logger.info(
+                    f"Ingestion worker completed in {execution_time:.2f}s: {' '.join(cmd)} "
+                    f"{response.get('result', {})}"
+                )
+                self.stats["subprocess_execution_times"].append(execution_time)
+                if len(self.stats["subprocess_execution_times"]) > 100:
+                    self.stats["subprocess_execution_times"] = self.stats[
+                        "subprocess_execution_times"
+                    ][-100:]
+                return True
+
+            last_error = response.get("error") or "Unknown worker error"
+            self.stats["last_subprocess_error"] = last_error
+            logger.warning(f"Ingestion worker operation failed: {last_error}")
+            return False
+
+        logger.error(
+            f"Ingestion worker failed after {self.max_retries + 1} attempts. "
+            f"Last error: {last_error}. Command: {' '.join(cmd)}"
+        )
+        return False
+
     def _log_subprocess_output(
         self, result: subprocess.CompletedProcess, success: bool
     ) -> None:
@@ -1102,11 +1996,19 @@ class LightweightMonitor:
             "files_monitored": (
                 len(self.file_watcher.get_monitored_files()) if self.file_watcher else 0
             ),
+            "watch_backend": (
+                self.file_watcher.monitor.active_backend if self.file_watcher else None
+            ),
             "files_processed": self.stats["files_processed"],
+            "files_skipped": self.stats["files_skipped"],
             "subprocess_calls": self.stats["subprocess_calls"],
             "subprocess_errors": self.stats["subprocess_errors"],
             "subprocess_retries": self.stats["subprocess_retries"],
             "subprocess_timeouts": self.stats["subprocess_timeouts"],
+            "persistent_worker": self.ingestion_worker is not None,
+            "worker_starts": (
+                self.ingestion_worker.starts if self.ingestion_worker else 0
+            ),
             "last_activity": self.stats["last_activity"],
             "event_queue_size": (
                 self.file_watcher.event_queue.qsize() if self.file_watcher else 0
@@ -1150,6 +2052,11 @@ class LightweightMonitor:
                 self.stats["subprocess_errors"] or 0
             )
 
+            # Walk the monitored tree once for both the new and legacy fields
+            files_monitored = (
+                len(self.file_watcher.get_monitored_files()) if self.file_watcher else 0
+            )
+
             status_data = {
                 # Core service info
                 "service": {
@@ -1162,10 +2069,11 @@ class LightweightMonitor:
                 },
                 # File monitoring info
                 "monitoring": {
-                    "files_monitored": len(self.file_watcher.get_monitored_files())
-                    if self.file_watcher
-                    else 0,
+                    "files_monitored": files_monitored,
                     "target_paths": [str(self.target_path)],
+                    "watch_backend": self.file_watcher.monitor.active_backend
+                    if self.file_watcher
+                    else None,
                 },
                 # Processing queue info
                 "processing": {
@@ -1173,6 +2081,7 @@ class LightweightMonitor:
                     if self.file_watcher
                     else 0,
                     "files_processed": self.stats["files_processed"],
+                    "files_skipped": self.stats["files_skipped"],
                     "last_activity": self.stats["last_activity"],
                     "current_processing": self.current_processing.copy(),
                 },
@@ -1205,9 +2114,7 @@ class LightweightMonitor:
                     "last_subprocess_error"
                 ],  # Now meaningful instead of hardcoded None
                 "restart_count": 0,  # Service-level info, not available in monitor
-                "files_monitored": len(self.file_watcher.get_monitored_files())
-                if self.file_watcher
-                else 0,
+                "files_monitored": files_monitored,
                 "sync_operations": self.stats["subprocess_calls"],
                 "last_sync_time": self.stats["last_activity"],
                 "memory_usage_mb": self._get_memory_usage(),
@@ -1239,6 +2146,45 @@ def main() -> int:
     parser.add_argument(
         "--lock-file", required=True, help="Path to singleton lock file"
     )
+    parser.add_argument(
+        "--persistent-worker",
+        action="store_true",
+        help="Process events in one long-lived ingestion worker instead of a CLI subprocess per event",
+    )
+    parser.add_argument(
+        "--worker-max-requests",
+        type=int,
+        default=500,
+        help="Events handled before the ingestion worker is recycled",
+    )
+    parser.add_argument(
+        "--worker-idle-timeout",
+        type=float,
+        default=300.0,
+        help="Seconds without events before the ingestion worker is stopped",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=10,
+        help="Maximum number of file changes per ingestion call",
+    )
+    parser.add_argument(
+        "--debounce-seconds",
+        type=float,
+        default=1.0,
+        help="Quiet period before a file's changes are processed",
+    )
+    parser.add_argument(
+        "--database-path",
+        help="Memory database used to skip files that are unchanged since they were loaded",
+    )
+    parser.add_argument(
+        "--watch-backend",
+        default="auto",
+        choices=["auto", "inotify", "polling"],
+        help="File change detection backend (inotify falls back to polling)",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -1247,6 +2193,8 @@ def main() -> int:
     )
 
     args = parser.parse_args()
+    if args.batch_size < 1:
+        parser.error("--batch-size must be positive")
 
     # Configure logging
     logger.remove()  # Remove default handler
@@ -1279,6 +2227,13 @@ def main() -> int:
             project_root=Path(args.project_root),
             target_path=Path(args.target_path),
             lock_file=Path(args.lock_file),
+            persistent_worker=args.persistent_worker,
+            worker_max_requests=args.worker_max_requests,
+            worker_idle_timeout=args.worker_idle_timeout,
+            batch_size=args.batch_size,
+            debounce_seconds=args.debounce_seconds,
+            watch_backend=args.watch_backend,
+            database_path=Path(args.database_path) if args.database_path else None,
         )
 
         # Start monitoring
@@ -0,0 +1,66 @@
+"""
+Import-time regression tests for the heimdall CLI.
+"""
+
+import json
+import subprocess
+import sys
+
+# Modules that take a noticeable share of a second to import and are only
+# needed once a command that uses them is dispatched
+HEAVY_MODULES = ("qdrant_client", "onnxruntime", "tokenizers", "spacy", "mcp")
+
+# Generous bound; importing the CLI took over a second with eager imports
+MAX_IMPORT_SECONDS = 1.0
+
+
+def _run_importtime(statement: str) -> tuple[dict[str, float], set[str]]:
+    """
+    Run a statement under ``python -X importtime``.
+
+    Returns:
+        Cumulative import seconds by module and the names of all modules
+        loaded afterwards, which include modules loaded via importlib
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import json, sys; {statement}; print(json.dumps(list(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times: dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative) / 1_000_000
+    return times, set(json.loads(result.stdout.splitlines()[-1]))
+
+
+def test_cli_import_skips_heavy_dependencies() -> None:
+    """Importing the CLI does not import command dependencies or models."""
+    times, modules = _run_importtime("import heimdall.cli")
+
+    heavy = sorted(name for name in modules if name.split(".")[0] in HEAVY_MODULES)
+    assert heavy == []
+    assert not any(name.startswith("heimdall.cli_commands.") for name in modules)
+    assert times["heimdall.cli"] < MAX_IMPORT_SECONDS
+
+
+def test_command_dispatch_imports_only_its_module() -> None:
+    """Registering one command group imports only the module it is defined in."""
+    _, modules = _run_importtime(
+        "import heimdall.cli as cli; cli.register_commands('qdrant')"
+    )
+
+    command_modules = {
+        name for name in modules if name.startswith("heimdall.cli_commands.")
+    }
+    assert command_modules == {"heimdall.cli_commands.qdrant_commands"}
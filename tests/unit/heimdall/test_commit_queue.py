@@ -0,0 +1,57 @@
+"""
+Unit tests for the commit queue filled by the post-commit hook.
+"""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import portalocker
+import pytest
+
+from heimdall.monitoring.commit_queue import CommitQueue, drain, run_drainer
+
+
+@pytest.fixture
+def commit_queue(tmp_path: Path) -> CommitQueue:
+    """Empty commit queue in a temporary directory."""
+    return CommitQueue(tmp_path / "commit_queue")
+
+
+def test_burst_of_commits_is_ingested_together(commit_queue: CommitQueue) -> None:
+    """Commits queued in quick succession, e.g. by a rebase, share one load."""
+    for commit_hash in ("aaa", "bbb", "aaa", "ccc"):
+        commit_queue.enqueue(commit_hash)
+    ingest = Mock(return_value={"success": True, "memories_loaded": 3})
+
+    assert drain(commit_queue, ingest, settle_seconds=0.05, idle_timeout=0)
+
+    ingest.assert_called_once_with(["aaa", "bbb", "ccc"])
+    assert commit_queue.entries() == []
+
+
+def test_failed_ingestion_keeps_commits_queued(commit_queue: CommitQueue) -> None:
+    """Commits stay queued for the next drainer when ingestion fails."""
+    commit_queue.enqueue("aaa")
+    ingest = Mock(side_effect=RuntimeError("Qdrant unreachable"))
+
+    assert not drain(commit_queue, ingest, settle_seconds=0, idle_timeout=0)
+
+    assert commit_queue.commit_hashes(commit_queue.entries()) == ["aaa"]
+
+
+def test_only_one_drainer_runs_per_project(
+    commit_queue: CommitQueue, tmp_path: Path
+) -> None:
+    """A drainer exits immediately while another one holds the lock."""
+    commit_queue.enqueue("aaa")
+    lock_file = tmp_path / "commit_queue.lock"
+    ingest = Mock(return_value={"success": True})
+
+    with portalocker.Lock(str(lock_file), mode="w", fail_when_locked=True):
+        assert run_drainer(commit_queue, lock_file, ingest, idle_timeout=0)
+    ingest.assert_not_called()
+
+    assert run_drainer(
+        commit_queue, lock_file, ingest, settle_seconds=0, idle_timeout=0
+    )
+    ingest.assert_called_once_with(["aaa"])
@@ -0,0 +1,143 @@
+"""
+Unit tests for FileMonitor change detection backends.
+"""
+
+import errno
+import os
+import sys
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from heimdall.monitoring.file_types import (
+    ChangeType,
+    FileMonitor,
+    InotifyWatcher,
+)
+
+linux_only = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux only"
+)
+
+
+def wait_for(condition: Callable[[], bool], timeout: float = 5.0) -> bool:
+    """Poll a condition until it holds or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return condition()
+
+
+@pytest.fixture
+def events() -> list[tuple[ChangeType, Path]]:
+    """Collected (change type, path) pairs."""
+    return []
+
+
+@pytest.fixture
+def make_monitor(
+    events: list[tuple[ChangeType, Path]],
+) -> Iterator[Callable[[Path, str], FileMonitor]]:
+    """Create started monitors that record their events and stop them afterwards."""
+    monitors: list[FileMonitor] = []
+
+    def factory(root: Path, backend: str) -> FileMonitor:
+        monitor = FileMonitor(polling_interval=0.1, backend=backend)
+        for change_type in ChangeType:
+            monitor.register_callback(
+                change_type, lambda e: events.append((e.change_type, e.path))
+            )
+        monitor.add_path(root)
+        monitor.start_monitoring()
+        assert wait_for(lambda: monitor.active_backend is not None)
+        monitors.append(monitor)
+        return monitor
+
+    yield factory
+
+    for monitor in monitors:
+        monitor.stop_monitoring()
+
+
+def test_unknown_backend_rejected() -> None:
+    """Only the supported backends can be selected."""
+    with pytest.raises(ValueError):
+        FileMonitor(backend="fsevents")
+
+
+@linux_only
+def test_inotify_detects_changes(
+    tmp_path: Path,
+    events: list[tuple[ChangeType, Path]],
+    make_monitor: Callable[[Path, str], FileMonitor],
+) -> None:
+    """Changes in new subdirectories are reported without a full scan."""
+    (tmp_path / "existing.md").write_text("existing")
+    monitor = make_monitor(tmp_path, "inotify")
+
+    assert monitor.active_backend == "inotify"
+    assert wait_for(lambda: len(events) == 1)
+
+    with patch.object(monitor, "_scan_files") as scan:
+        (tmp_path / "docs" / "deep").mkdir(parents=True)
+        new_file = tmp_path / "docs" / "deep" / "new.md"
+        new_file.write_text("new")
+        assert wait_for(lambda: (ChangeType.ADDED, new_file) in events)
+
+        new_file.write_text("changed content")
+        assert wait_for(lambda: (ChangeType.MODIFIED, new_file) in events)
+
+        (tmp_path / "notes.txt").write_text("not markdown")
+        new_file.unlink()
+        assert wait_for(lambda: (ChangeType.DELETED, new_file) in events)
+
+    scan.assert_not_called()
+    assert all(path.suffix == ".md" for _, path in events)
+
+
+@linux_only
+def test_inotify_follows_symlinks(
+    tmp_path: Path,
+    events: list[tuple[ChangeType, Path]],
+    make_monitor: Callable[[Path, str], FileMonitor],
+) -> None:
+    """Directories reached through symbolic links are watched once."""
+    root = tmp_path / "root"
+    outside = tmp_path / "outside"
+    root.mkdir()
+    outside.mkdir()
+    os.symlink(outside, root / "link")
+    os.symlink(root, root / "loop")
+    monitor = make_monitor(root, "inotify")
+
+    linked_file = root / "link" / "linked.md"
+    (outside / "linked.md").write_text("linked")
+
+    assert wait_for(lambda: (ChangeType.ADDED, linked_file) in events)
+    assert monitor.active_backend == "inotify"
+
+
+def test_falls_back_to_polling_when_watches_exhausted(
+    tmp_path: Path,
+    events: list[tuple[ChangeType, Path]],
+    make_monitor: Callable[[Path, str], FileMonitor],
+) -> None:
+    """Running out of inotify watches switches the monitor to polling."""
+    exhausted = OSError(errno.ENOSPC, os.strerror(errno.ENOSPC))
+    with (
+        patch.object(InotifyWatcher, "__init__", return_value=None),
+        patch.object(InotifyWatcher, "add_watch", side_effect=exhausted),
+        patch.object(InotifyWatcher, "close"),
+    ):
+        monitor = make_monitor(tmp_path, "auto")
+
+    assert monitor.active_backend == "polling"
+
+    new_file = tmp_path / "polled.md"
+    new_file.write_text("polled")
+    assert wait_for(lambda: (ChangeType.ADDED, new_file) in events)
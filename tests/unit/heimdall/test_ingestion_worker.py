@@ -0,0 +1,160 @@
+"""
+Unit tests for the persistent ingestion worker and its monitor-side client.
+"""
+
+import io
+import json
+import sys
+import textwrap
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from heimdall.monitoring.ingestion_worker import handle_request, serve
+from lightweight_monitor import IngestionWorker, LightweightMonitorError
+
+# Minimal stand-in for the worker: reports ready and echoes requests back
+FAKE_WORKER = textwrap.dedent("""
+    import json, os, sys
+    print(json.dumps({"ready": True}), flush=True)
+    for line in sys.stdin:
+        request = json.loads(line)
+        if any(path.endswith("crash.md") for path in request["paths"]):
+            sys.exit(1)
+        print(json.dumps({
+            "id": request["id"],
+            "success": True,
+            "error": None,
+            "result": {"pid": os.getpid(), "paths": request["paths"]},
+        }), flush=True)
+    """)
+
+
+@pytest.fixture
+def worker(tmp_path: Path):
+    """Create a worker client running the fake worker script."""
+    client = IngestionWorker(
+        tmp_path,
+        max_requests=3,
+        idle_timeout=60.0,
+        startup_timeout=30.0,
+        request_timeout=30.0,
+        worker_command=[sys.executable, "-c", FAKE_WORKER],
+    )
+    yield client
+    client.stop()
+
+
+class TestWorkerRequests:
+    """Test request handling inside the worker."""
+
+    def test_load_and_remove_dispatch(self) -> None:
+        """Requests map to the same operations as the CLI commands."""
+        operations = Mock()
+        operations.load_memories.return_value = {
+            "success": True,
+            "memories_loaded": 4,
+            "processing_time": 0.1,
+        }
+        operations.delete_memories_by_source_path.return_value = {
+            "success": True,
+            "deleted_count": 2,
+        }
+
+        loaded = handle_request(
+            operations, {"id": 1, "command": "load", "path": "doc.md"}
+        )
+        removed = handle_request(
+            operations, {"id": 2, "command": "remove-file", "path": "doc.md"}
+        )
+
+        assert loaded["success"] and loaded["result"]["memories_loaded"] == 4
+        assert loaded["error"] is None
+        assert removed["success"] and removed["result"]["deleted_count"] == 2
+        operations.load_memories.assert_called_once_with(
+            source_path="doc.md", loader_type="markdown", dry_run=False
+        )
+
+    def test_serve_reports_failures(self) -> None:
+        """Bad requests and operation errors are answered, not raised."""
+        operations = Mock()
+        operations.load_memories.side_effect = RuntimeError("boom")
+        requests = io.StringIO(
+            "not json\n"
+            + json.dumps({"id": 1, "command": "unknown", "path": "x"})
+            + "\n"
+            + json.dumps({"id": 2, "command": "load", "path": "x"})
+            + "\n"
+        )
+        responses = io.StringIO()
+
+        assert serve(operations, requests, responses) == 3
+
+        answers = [json.loads(line) for line in responses.getvalue().splitlines()]
+        assert [answer["success"] for answer in answers] == [False, False, False]
+        assert answers[2]["error"] == "x: boom"
+
+    def test_batched_paths_are_summed(self) -> None:
+        """A request with several paths handles each and sums the results."""
+        operations = Mock()
+        operations.delete_memories_by_source_path.side_effect = [
+            {"success": True, "deleted_count": 2},
+            {"success": False, "error": "locked"},
+            {"success": True, "deleted_count": 3},
+        ]
+
+        response = handle_request(
+            operations,
+            {"id": 7, "command": "remove-file", "paths": ["a.md", "b.md", "c.md"]},
+        )
+
+        assert not response["success"]
+        assert response["error"] == "b.md: locked"
+        assert response["result"]["deleted_count"] == 5
+        assert operations.delete_memories_by_source_path.call_count == 3
+
+
+class TestIngestionWorkerClient:
+    """Test the monitor-side worker lifecycle."""
+
+    def test_worker_is_reused_and_recycled(self, worker: IngestionWorker) -> None:
+        """One process serves requests until max_requests is reached."""
+        pids = [
+            worker.request("load", [Path(f"doc{i}.md")])["result"]["pid"]
+            for i in range(4)
+        ]
+
+        assert len(set(pids[:3])) == 1
+        assert pids[3] != pids[0]
+        assert worker.starts == 2
+
+    def test_worker_recycling_counts_batched_paths(
+        self, worker: IngestionWorker
+    ) -> None:
+        """Each path of a batched request counts toward max_requests."""
+        first = worker.request("load", [Path("a.md"), Path("b.md"), Path("c.md")])
+        second = worker.request("load", [Path("d.md")])
+
+        assert second["result"]["pid"] != first["result"]["pid"]
+        assert worker.starts == 2
+
+    def test_worker_crash_raises_and_restarts(self, worker: IngestionWorker) -> None:
+        """A dead worker is reported and replaced on the next request."""
+        with pytest.raises(LightweightMonitorError):
+            worker.request("load", [Path("crash.md")])
+        assert not worker.is_running
+
+        response = worker.request("remove-file", [Path("a.md"), Path("b.md")])
+        assert response["success"]
+        assert response["result"]["paths"] == ["a.md", "b.md"]
+        assert worker.starts == 2
+
+    def test_stop_if_idle(self, worker: IngestionWorker) -> None:
+        """The worker is stopped once it has been idle long enough."""
+        worker.request("load", [Path("doc.md")])
+        assert not worker.stop_if_idle()
+
+        worker.idle_timeout = 0.0
+        assert worker.stop_if_idle()
+        assert not worker.is_running
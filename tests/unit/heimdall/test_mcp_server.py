@@ -0,0 +1,125 @@
+"""
+Unit tests for dispatching MCP tool calls to the thread pool.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections.abc import Iterator
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cognitive_memory.core.config import MCPServerConfig
+from heimdall.mcp_server import HeimdallMCPServer
+
+
+@pytest.fixture
+def server() -> Iterator[HeimdallMCPServer]:
+    """MCP server with mocked operations and a short tool timeout."""
+    config = MCPServerConfig(
+        max_workers=4,
+        tool_timeout=0.5,
+        max_concurrent_reads=2,
+        max_concurrent_writes=1,
+    )
+    # Protocol handler registration is not under test
+    with patch.object(HeimdallMCPServer, "_register_handlers"):
+        mcp_server = HeimdallMCPServer(Mock(), config=config)
+    mcp_server.operations = Mock()
+    mcp_server.operations.get_system_status.return_value = {
+        "success": True,
+        "memory_counts": {},
+    }
+    yield mcp_server
+    mcp_server.close()
+
+
+@pytest.mark.asyncio
+async def test_slow_recall_does_not_block_other_tools(
+    server: HeimdallMCPServer,
+) -> None:
+    """Status calls complete while a recall is still running in a worker."""
+    release = threading.Event()
+
+    def slow_recall(**kwargs):
+        release.wait(5)
+        return {"success": True, "query": kwargs["query"], "memories": {}}
+
+    server.operations.retrieve_memories.side_effect = slow_recall
+
+    recall = asyncio.create_task(server._recall_memories({"query": "slow"}))
+    status = await asyncio.wait_for(server._memory_status({}), timeout=2)
+
+    assert json.loads(status[0].text)["system_status"] == "healthy"
+    assert not recall.done()
+
+    release.set()
+    await recall
+    server.operations.retrieve_memories.assert_called_once_with(
+        query="slow", types=None, limit=10
+    )
+
+
+@pytest.mark.asyncio
+async def test_tool_timeout_holds_slot_until_operation_finishes(
+    server: HeimdallMCPServer,
+) -> None:
+    """Timed-out writes report an error and keep later writes queued."""
+    release = threading.Event()
+    running = []
+
+    def store_experience(**kwargs):
+        running.append(kwargs["text"])
+        if kwargs["text"] == "slow":
+            release.wait(5)
+        return {
+            "success": True,
+            "hierarchy_level": 2,
+            "memory_type": "episodic",
+            "memory_id": kwargs["text"],
+        }
+
+    server.operations.store_experience.side_effect = store_experience
+
+    result = await server._store_memory({"text": "slow"})
+    assert "timed out" in result[0].text
+
+    # The slow call still occupies the only write slot
+    result = await server._store_memory({"text": "fast"})
+    assert "timed out" in result[0].text
+    assert running == ["slow"]
+
+    release.set()
+    result = await server._store_memory({"text": "fast"})
+    assert result[0].text.endswith("ID: fast")
+
+
+@pytest.mark.asyncio
+async def test_read_concurrency_is_limited_per_tool(
+    server: HeimdallMCPServer,
+) -> None:
+    """No more recalls run at once than the configured read limit."""
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def recall(**kwargs):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return {"success": True, "query": kwargs["query"], "memories": {}}
+
+    server.operations.retrieve_memories.side_effect = recall
+
+    await asyncio.gather(
+        *(server._recall_memories({"query": f"q{i}"}) for i in range(6))
+    )
+
+    assert peak == 2
+    assert server.operations.retrieve_memories.call_count == 6
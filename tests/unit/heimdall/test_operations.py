@@ -628,8 +628,11 @@ class TestCognitiveOperations:
                 "memories_failed": 0,
                 "connections_failed": 0,
             }
-            mock_cognitive_system.atomic_reload_memories_from_source.return_value = (
-                mock_results
+            mock_cognitive_system.reload_sources.side_effect = (
+                lambda loader, source_paths, **kwargs: {
+                    "results": [mock_results] * len(source_paths),
+                    "stage_timings": {"parse": 0.2, "embed": 0.3, "write": 0.1},
+                }
             )
 
             # Act
@@ -679,6 +682,9 @@ class TestCognitiveOperations:
             assert (
                 result["connections_created"] == 2  # 2 files * 1 connection each = 2
             )
+            # Small directories are parsed in this process
+            assert mock_cognitive_system.reload_sources.call_args.kwargs["workers"] == 1
+            assert result["stage_timings"] == {"parse": 0.2, "embed": 0.3, "write": 0.1}
 
         @patch("cognitive_memory.core.config.get_config")
         @patch("cognitive_memory.loaders.MarkdownMemoryLoader")
@@ -878,7 +884,7 @@ class TestCognitiveOperations:
             mock_os.walk.return_value = [("/path", [], ["success.md", "failure.md"])]
 
             # Mock different results for different files
-            def mock_load_side_effect(loader, file_path, **kwargs):
+            def mock_result(file_path):
                 if "success.md" in str(file_path):
                     return {
                         "success": True,
@@ -900,8 +906,11 @@ class TestCognitiveOperations:
                         "connections_failed": 0,
                     }
 
-            mock_cognitive_system.atomic_reload_memories_from_source.side_effect = (
-                mock_load_side_effect
+            mock_cognitive_system.reload_sources.side_effect = (
+                lambda loader, source_paths, **kwargs: {
+                    "results": [mock_result(path) for path in source_paths],
+                    "stage_timings": {"parse": 0.5, "embed": 0.5, "write": 0.5},
+                }
             )
 
             source_path_obj = Path("/path")
@@ -918,3 +927,49 @@ class TestCognitiveOperations:
             assert result["connections_created"] == 2
             assert result["error"] == "Some files failed to process"
             assert len(result["files_processed"]) == 2
+
+        @patch.object(operations_module, "os")
+        def test_process_directory_parses_large_directories_in_parallel(
+            self, mock_os, operations, mock_cognitive_system
+        ):
+            """Large markdown directories go through the parallel pipeline."""
+            from cognitive_memory.core.config import CognitiveConfig
+            from cognitive_memory.loaders import MarkdownMemoryLoader
+
+            # Arrange
+            mock_loader = Mock(spec=MarkdownMemoryLoader)
+            mock_loader.config = CognitiveConfig(load_workers=3)
+            mock_loader.get_supported_extensions.return_value = [".md"]
+            mock_loader.validate_source.return_value = True
+            file_names = [f"doc{i}.md" for i in range(8)]
+            mock_os.walk.return_value = [("/path", [], file_names)]
+            mock_cognitive_system.reload_sources.return_value = {
+                "results": [
+                    {
+                        "success": True,
+                        "memories_loaded": 4,
+                        "connections_created": 1,
+                        "processing_time": 0.1,
+                        "hierarchy_distribution": {"L0": 0, "L1": 1, "L2": 3},
+                        "memories_failed": 0,
+                        "connections_failed": 0,
+                    }
+                ]
+                * 8,
+                "stage_timings": {"parse": 2.0, "embed": 1.0, "write": 0.5},
+            }
+
+            # Act
+            result = operations._process_directory(
+                mock_loader, Path("/path"), False, True
+            )
+
+            # Assert
+            mock_cognitive_system.atomic_reload_memories_from_source.assert_not_called()
+            assert mock_cognitive_system.reload_sources.call_args.kwargs["workers"] == 3
+            assert result["success"] is True
+            assert result["memories_loaded"] == 32
+            assert result["hierarchy_distribution"] == {"L0": 0, "L1": 8, "L2": 24}
+            assert result["stage_timings"]["parse"] == 2.0
+            assert result["files_per_second"] > 0
+            assert result["chunks_per_second"] > 0
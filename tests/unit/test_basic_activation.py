@@ -10,6 +10,7 @@ from unittest.mock import Mock
 import numpy as np
 import pytest
 
+from cognitive_memory.core.adjacency import ConnectionAdjacency
 from cognitive_memory.core.interfaces import ConnectionGraph, MemoryStorage
 from cognitive_memory.core.memory import (
     ActivationResult,
@@ -26,12 +27,14 @@ class TestBasicActivationEngine:
     def mock_memory_storage(self) -> Mock:
         """Create mock memory storage."""
         mock = Mock(spec=MemoryStorage)
+        mock.get_memories_by_ids.return_value = []
         return mock
 
     @pytest.fixture
     def mock_connection_graph(self) -> Mock:
         """Create mock connection graph."""
         mock = Mock(spec=ConnectionGraph)
+        mock.get_adjacency.return_value = None
         return mock
 
     @pytest.fixture
@@ -427,3 +430,91 @@ class TestBasicActivationEngine:
 
         assert isinstance(result, ActivationResult)
         assert result.total_activated <= max_activations + 1  # +1 for starting memory
+
+    def test_l0_index_reused_until_signature_changes(
+        self,
+        activation_engine: BasicActivationEngine,
+        mock_memory_storage: Mock,
+        mock_connection_graph: Mock,
+        sample_memories_with_embeddings: list[CognitiveMemory],
+    ) -> None:
+        """L0 memories are loaded once and reloaded only after storage changes."""
+        l0_memory = sample_memories_with_embeddings[0]
+        mock_memory_storage.get_memories_by_level.return_value = [l0_memory]
+        mock_memory_storage.get_level_signature.return_value = (1, 1)
+        mock_connection_graph.get_connections.return_value = []
+        context = l0_memory.cognitive_embedding
+
+        activation_engine.activate_memories(context=context, threshold=0.5)
+        activation_engine.activate_memories(context=context, threshold=0.5)
+        assert mock_memory_storage.get_memories_by_level.call_count == 1
+
+        mock_memory_storage.get_level_signature.return_value = (2, 2)
+        activation_engine.activate_memories(context=context, threshold=0.5)
+        assert mock_memory_storage.get_memories_by_level.call_count == 2
+
+    def test_notify_updates_l0_index_incrementally(
+        self,
+        activation_engine: BasicActivationEngine,
+        mock_memory_storage: Mock,
+        mock_connection_graph: Mock,
+        sample_memories_with_embeddings: list[CognitiveMemory],
+    ) -> None:
+        """Stored and deleted notifications update the index without a reload."""
+        first, second = sample_memories_with_embeddings[:2]
+        first.hierarchy_level = second.hierarchy_level = 0
+        mock_memory_storage.get_memories_by_level.return_value = [first]
+        mock_memory_storage.get_level_signature.return_value = (1, 1)
+        mock_connection_graph.get_connections.return_value = []
+
+        activation_engine.activate_memories(
+            context=second.cognitive_embedding, threshold=0.99
+        )
+        activation_engine.notify_memories_stored([second])
+        result = activation_engine.activate_memories(
+            context=second.cognitive_embedding, threshold=0.99
+        )
+        assert second.id in result.activation_strengths
+
+        activation_engine.notify_memories_deleted([second.id])
+        result = activation_engine.activate_memories(
+            context=second.cognitive_embedding, threshold=0.99
+        )
+        assert second.id not in result.activation_strengths
+        assert mock_memory_storage.get_memories_by_level.call_count == 1
+
+    def test_bfs_uses_cached_adjacency(
+        self,
+        activation_engine: BasicActivationEngine,
+        mock_memory_storage: Mock,
+        mock_connection_graph: Mock,
+        sample_memories_with_embeddings: list[CognitiveMemory],
+    ) -> None:
+        """A cached adjacency replaces per-node connection queries."""
+        start, neighbor, weak = sample_memories_with_embeddings[:3]
+        neighbor.cognitive_embedding = start.cognitive_embedding.copy()
+        weak.cognitive_embedding = start.cognitive_embedding.copy()
+        mock_connection_graph.get_adjacency.return_value = ConnectionAdjacency(
+            [(start.id, neighbor.id, 0.9), (start.id, weak.id, 0.1)]
+        )
+        by_id = {memory.id: memory for memory in (neighbor, weak)}
+        mock_memory_storage.get_memories_by_ids.side_effect = lambda ids: [
+            by_id[memory_id] for memory_id in ids if memory_id in by_id
+        ]
+
+        result = activation_engine._bfs_activation(
+            context=start.cognitive_embedding,
+            starting_memories=[start],
+            threshold=0.1,
+            max_activations=10,
+        )
+
+        assert neighbor.id in result.activation_strengths
+        assert weak.id not in result.activation_strengths
+        mock_memory_storage.get_memories_by_ids.assert_any_call([neighbor.id])
+        mock_connection_graph.get_connections.assert_not_called()
+        mock_connection_graph.record_activations.assert_called_once_with(
+            [start.id, neighbor.id], 0.5
+        )
+        assert result.expanded_ids == [start.id, neighbor.id]
+        assert result.expansion_threshold == 0.5
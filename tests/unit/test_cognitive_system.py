@@ -5,6 +5,7 @@ This module tests the CognitiveMemorySystem implementation to ensure
 proper coordination between subsystems through abstract interfaces.
 """
 
+import os
 from unittest.mock import Mock, patch
 
 import numpy as np
@@ -275,6 +276,138 @@ class TestCognitiveMemorySystem:
         mock_embedding_provider.encode.assert_called_with(query)
         mock_activation_engine.activate_memories.assert_called_once()
 
+    def test_retrieve_memories_uses_query_cache(
+        self,
+        cognitive_system,
+        mock_embedding_provider,
+        mock_activation_engine,
+        mock_memory_storage,
+        mock_connection_graph,
+    ):
+        """Repeated queries are served from cache until memories change."""
+        mock_memory_storage.get_change_version.return_value = (1, 1)
+        activation_result = mock_activation_engine.activate_memories.return_value
+        activation_result.expanded_ids = ["test-memory-1"]
+        activation_result.expansion_threshold = 0.5
+
+        first = cognitive_system.retrieve_memories("cache   me ", max_results=10)
+        second = cognitive_system.retrieve_memories("cache me", max_results=10)
+
+        assert second == first
+        assert second is not first
+        mock_activation_engine.activate_memories.assert_called_once()
+        # Cache hits still reinforce the connections the recall traversed
+        mock_connection_graph.record_activations.assert_called_once_with(
+            ["test-memory-1"], 0.5
+        )
+        mock_memory_storage.get_level_signature.assert_not_called()
+        mock_embedding_provider.encode.assert_called_once_with("cache   me")
+
+        # Different parameters are cached separately
+        cognitive_system.retrieve_memories("cache me", max_results=4)
+        assert mock_activation_engine.activate_memories.call_count == 2
+
+        # Local writes invalidate results but keep the query embedding
+        cognitive_system.store_experience("A new experience")
+        cognitive_system.retrieve_memories("cache me", max_results=10)
+        assert mock_activation_engine.activate_memories.call_count == 3
+        assert [call.args for call in mock_embedding_provider.encode.mock_calls] == [
+            ("cache   me",),
+            ("A new experience",),
+        ]
+
+        # Writes by other processes change the storage version
+        mock_memory_storage.get_change_version.return_value = (1, 2)
+        cognitive_system.retrieve_memories("cache me", max_results=10)
+        assert mock_activation_engine.activate_memories.call_count == 4
+
+        stats = cognitive_system.get_memory_stats()["query_cache"]
+        assert stats["result_hits"] == 1
+        assert stats["result_misses"] == 4
+        assert stats["embedding_hits"] == 3
+        assert stats["time_saved_seconds"] > 0
+
+    def test_query_cache_hits_count_fallback_accesses(
+        self,
+        cognitive_system,
+        mock_activation_engine,
+        mock_memory_storage,
+        mock_vector_storage,
+    ):
+        """Cache hits count accesses to memories the fallback search retrieved."""
+        from datetime import datetime
+
+        from cognitive_memory.core.memory import SearchResult
+
+        memories = [
+            CognitiveMemory(
+                id=f"similar-{i}",
+                content=f"Similar content {i}",
+                hierarchy_level=2,
+                timestamp=datetime(2024, 1, 1),
+            )
+            for i in range(2)
+        ]
+        mock_vector_storage.search_similar.return_value = [
+            SearchResult(memory=memory, similarity_score=0.5, metadata={})
+            for memory in memories
+        ]
+        mock_memory_storage.retrieve_memory.side_effect = lambda memory_id: next(
+            memory for memory in memories if memory.id == memory_id
+        )
+        mock_memory_storage.get_change_version.return_value = (1, 1)
+        mock_activation_engine.activate_memories.return_value = ActivationResult()
+
+        first = cognitive_system.retrieve_memories("similar", max_results=2)
+        mock_memory_storage.record_memory_accesses.assert_not_called()
+        second = cognitive_system.retrieve_memories("similar", max_results=2)
+
+        assert second == first
+        assert mock_memory_storage.retrieve_memory.call_count == 2
+        mock_memory_storage.record_memory_accesses.assert_called_once_with(
+            ["similar-0", "similar-1"]
+        )
+
+    def test_query_cache_hits_return_copies(
+        self,
+        cognitive_system,
+        mock_activation_engine,
+        mock_memory_storage,
+        mock_vector_storage,
+    ):
+        """Changing memories returned by a cache hit does not change later hits."""
+        from cognitive_memory.core.memory import SearchResult
+
+        memory = CognitiveMemory(
+            id="similar-0", content="Similar content", hierarchy_level=2
+        )
+        mock_vector_storage.search_similar.return_value = [
+            SearchResult(memory=memory, similarity_score=0.5, metadata={})
+        ]
+        mock_memory_storage.retrieve_memory.return_value = memory
+        mock_memory_storage.get_change_version.return_value = (1, 1)
+        mock_activation_engine.activate_memories.return_value = ActivationResult()
+
+        first = cognitive_system.retrieve_memories("similar", max_results=1)
+        expected = {
+            memory_type: [(m.metadata.copy(), m.importance_score) for m in memories]
+            for memory_type, memories in first.items()
+        }
+        assert any(expected.values())
+
+        second = cognitive_system.retrieve_memories("similar", max_results=1)
+        for memories in [*first.values(), *second.values()]:
+            for returned in memories:
+                returned.metadata["similarity_score"] = -1.0
+                returned.importance_score = 99.0
+
+        third = cognitive_system.retrieve_memories("similar", max_results=1)
+        assert {
+            memory_type: [(m.metadata, m.importance_score) for m in memories]
+            for memory_type, memories in third.items()
+        } == expected
+        mock_activation_engine.activate_memories.assert_called_once()
+
     def test_retrieve_memories_specific_types(
         self, cognitive_system, mock_activation_engine, mock_memory_storage
     ):
@@ -398,11 +531,11 @@ class TestCognitiveMemorySystem:
     def test_get_memory_stats(self, cognitive_system, mock_memory_storage):
         """Test system statistics retrieval."""
         # Mock memory counts
-        mock_memory_storage.get_memories_by_level.side_effect = [
-            [Mock(), Mock()],  # Level 0: 2 memories
-            [Mock()],  # Level 1: 1 memory
-            [Mock(), Mock(), Mock()],  # Level 2: 3 memories
-        ]
+        mock_memory_storage.get_memory_counts.return_value = {
+            "total": 6,
+            "by_level": {0: 2, 1: 1, 2: 3},
+            "by_type": {"episodic": 6},
+        }
 
         stats = cognitive_system.get_memory_stats()
 
@@ -411,6 +544,15 @@ class TestCognitiveMemorySystem:
         assert "system_config" in stats
         assert "memory_counts" in stats
 
+        # Counts come from the aggregate query, not from loading memories
+        assert stats["memory_counts"] == {
+            "level_0_concepts": 2,
+            "level_1_contexts": 1,
+            "level_2_episodes": 3,
+        }
+        assert stats["memory_breakdown"]["by_type"] == {"episodic": 6}
+        mock_memory_storage.get_memories_by_level.assert_not_called()
+
         # Verify config values
         config = stats["system_config"]
         assert "activation_threshold" in config
@@ -782,11 +924,8 @@ class TestCognitiveMemorySystem:
         mock_memory_storage.retrieve_memory.side_effect = mock_retrieve
 
         # Mock empty activation result to trigger fallback
-        mock_activation_result = Mock()
-        mock_activation_result.core_memories = []
-        mock_activation_result.peripheral_memories = []
         cognitive_system.activation_engine.activate_memories.return_value = (
-            mock_activation_result
+            ActivationResult()
         )
 
         # Search for exact tag
@@ -820,7 +959,7 @@ class TestCognitiveMemorySystem:
 
         # Mock the _add_activation_memories method to do nothing
         def mock_add_activation_memories(query_embedding, types, results, max_results):
-            pass  # Don't add any activation memories
+            return ActivationResult()  # Don't add any activation memories
 
         cognitive_system._add_activation_memories = mock_add_activation_memories
 
@@ -837,3 +976,488 @@ class TestCognitiveMemorySystem:
         )
         assert "banana-bread" in found_memory.tags
         assert "kitchen-recipe" in found_memory.tags
+
+    def _make_loader(self, memories):
+        """Create a mock loader that returns the given memories."""
+        loader = Mock()
+        loader.validate_source.return_value = True
+        loader.load_from_source.return_value = memories
+        loader.extract_connections.return_value = []
+        return loader
+
+    def _make_memories(self, count):
+        """Create simple memories for loading tests."""
+        return [
+            CognitiveMemory(
+                id=f"loaded-{i}",
+                content=f"Loaded chunk {i}",
+                memory_type="semantic",
+                hierarchy_level=i % 3,
+                metadata={"source_path": "/docs/file.md"},
+            )
+            for i in range(count)
+        ]
+
+    def test_load_memories_encodes_in_batches(
+        self,
+        cognitive_system,
+        mock_embedding_provider,
+        mock_memory_storage,
+        mock_vector_storage,
+    ):
+        """Loading encodes chunk texts in configured batches, never one by one."""
+        memories = self._make_memories(5)
+        cognitive_system.config.embedding.load_batch_size = 2
+        mock_embedding_provider.encode_batch.side_effect = lambda texts: np.ones(
+            (len(texts), 384)
+        )
+        mock_memory_storage.store_memories_batch.return_value = [
+            memory.id for memory in memories
+        ]
+        mock_vector_storage.store_vectors_batch.side_effect = lambda items: [
+            item[0] for item in items
+        ]
+
+        result = cognitive_system.load_memories_from_source(
+            self._make_loader(memories), "/docs/file.md"
+        )
+
+        assert result["success"] is True
+        assert result["memories_loaded"] == 5
+        mock_embedding_provider.encode.assert_not_called()
+        assert [
+            len(call.args[0])
+            for call in mock_embedding_provider.encode_batch.mock_calls
+        ] == [2, 2, 1]
+        mock_memory_storage.store_memories_batch.assert_called_once_with(memories)
+        mock_vector_storage.store_vector.assert_not_called()
+        (vector_items,) = mock_vector_storage.store_vectors_batch.call_args.args
+        assert [item[0] for item in vector_items] == [m.id for m in memories]
+        assert all(memory.cognitive_embedding is not None for memory in memories)
+
+    def test_load_memories_skips_vectors_for_failed_writes(
+        self,
+        cognitive_system,
+        mock_embedding_provider,
+        mock_memory_storage,
+        mock_vector_storage,
+    ):
+        """Memories that fail to persist are counted and get no vector."""
+        memories = self._make_memories(3)
+        mock_embedding_provider.encode_batch.side_effect = lambda texts: np.ones(
+            (len(texts), 384)
+        )
+        mock_memory_storage.store_memories_batch.return_value = ["loaded-0"]
+        mock_vector_storage.store_vectors_batch.return_value = ["loaded-0"]
+
+        result = cognitive_system.load_memories_from_source(
+            self._make_loader(memories), "/docs/file.md"
+        )
+
+        assert result["memories_loaded"] == 1
+        assert result["memories_failed"] == 2
+        (vector_items,) = mock_vector_storage.store_vectors_batch.call_args.args
+        assert [item[0] for item in vector_items] == ["loaded-0"]
+
+    def test_upsert_memories_bulk_stores_vectors(
+        self,
+        cognitive_system,
+        mock_embedding_provider,
+        mock_memory_storage,
+        mock_vector_storage,
+    ):
+        """Upsert encodes once per batch and writes all vectors in one call."""
+        memories = self._make_memories(3)
+        mock_embedding_provider.encode_batch.side_effect = lambda texts: np.ones(
+            (len(texts), 384)
+        )
+        mock_memory_storage.retrieve_memory.side_effect = lambda memory_id: (
+            memories[0] if memory_id == "loaded-0" else None
+        )
+        mock_vector_storage.store_vectors_batch.return_value = ["loaded-0", "loaded-1"]
+
+        result = cognitive_system.upsert_memories(memories)
+
+        assert result["updated_count"] == 1
+        assert result["inserted_count"] == 1
+        assert result["failed_count"] == 1
+        mock_embedding_provider.encode.assert_not_called()
+        mock_vector_storage.delete_vectors_by_ids.assert_called_once_with(["loaded-0"])
+        mock_vector_storage.store_vectors_batch.assert_called_once()
+
+    def test_delete_by_source_path_groups_vectors_by_level(
+        self, cognitive_system, mock_memory_storage, mock_vector_storage
+    ):
+        """Vectors are deleted in one batch call keyed by stored hierarchy level."""
+        memories = self._make_memories(4)
+        mock_memory_storage.get_memories_by_source_path.return_value = memories
+        mock_memory_storage.delete_memories_by_source_path.return_value = 4
+        mock_vector_storage.delete_vectors_by_level.return_value = [
+            "loaded-0",
+            "loaded-1",
+            "loaded-3",
+        ]
+
+        result = cognitive_system.delete_memories_by_source_path("/docs/file.md")
+
+        mock_vector_storage.delete_vectors_by_level.assert_called_once_with(
+            {0: ["loaded-0", "loaded-3"], 1: ["loaded-1"], 2: ["loaded-2"]}
+        )
+        mock_vector_storage.delete_vector.assert_not_called()
+        assert result["deleted_count"] == 4
+        assert result["vector_deletion_failures"] == 1
+
+    def test_atomic_reload_skips_unchanged_source(
+        self,
+        tmp_path,
+        cognitive_system,
+        mock_embedding_provider,
+        mock_memory_storage,
+        mock_vector_storage,
+    ):
+        """Reloads are skipped while the manifest matches the file content."""
+        source = tmp_path / "doc.md"
+        source.write_text("# Doc\n\nOriginal content")
+        memories = self._make_memories(2)
+        loader = self._make_loader(memories)
+        mock_embedding_provider.encode_batch.side_effect = lambda texts: np.ones(
+            (len(texts), 384)
+        )
+        mock_memory_storage.store_memories_batch.return_value = ["loaded-0", "loaded-1"]
+        mock_vector_storage.store_vectors_batch.return_value = ["loaded-0", "loaded-1"]
+        mock_memory_storage.get_memories_by_source_path.return_value = []
+        mock_memory_storage.get_source_manifest.return_value = None
+
+        def reload(**kwargs):
+            result = cognitive_system.atomic_reload_memories_from_source(
+                loader, str(source), **kwargs
+            )
+            assert result["success"]
+            return result
+
+        assert not reload()["skipped"]
+        path, size, mtime, content_hash, memory_ids = (
+            mock_memory_storage.record_source_manifest.call_args.args
+        )
+        assert (path, size, memory_ids) == (
+            str(source),
+            source.stat().st_size,
+            ["loaded-0", "loaded-1"],
+        )
+
+        mock_memory_storage.get_source_manifest.return_value = {
+            "size": size,
+            "mtime": mtime,
+            "content_hash": content_hash,
+            "memory_ids": memory_ids,
+            "memories_present": 2,
+        }
+        mock_memory_storage.record_source_manifest.reset_mock()
+        assert reload()["skipped"]
+        mock_memory_storage.record_source_manifest.assert_not_called()
+
+        # A touch only refreshes the manifest entry
+        os.utime(source, (mtime + 10, mtime + 10))
+        assert reload()["skipped"]
+        assert mock_memory_storage.record_source_manifest.call_args.args[2] == (
+            mtime + 10
+        )
+        assert loader.load_from_source.call_count == 1
+
+        # Forced reloads and missing memories bypass the manifest
+        assert not reload(force=True)["skipped"]
+        mock_memory_storage.get_source_manifest.return_value["memories_present"] = 1
+        assert not reload()["skipped"]
+
+        source.write_text("# Doc\n\nChanged content")
+        mock_memory_storage.get_source_manifest.return_value["memories_present"] = 2
+        assert not reload()["skipped"]
+        assert loader.load_from_source.call_count == 4
+
+    def test_atomic_reload_updates_only_changed_chunks(
+        self,
+        tmp_path,
+        cognitive_system,
+        mock_embedding_provider,
+        mock_memory_storage,
+        mock_vector_storage,
+    ):
+        """Modified files re-embed changed chunks and keep unchanged memories."""
+        source = tmp_path / "doc.md"
+        source.write_text("# Doc\n\nChanged content")
+
+        def chunk(memory_id, title, content, access_count=0, modified="2024-01-01"):
+            return CognitiveMemory(
+                id=memory_id,
+                content=content,
+                hierarchy_level=1,
+                access_count=access_count,
+                metadata={
+                    "title": title,
+                    "hierarchical_path": ["Doc", title],
+                    "chunk_type": "section",
+                    "file_modified_date": modified,
+                },
+            )
+
+        existing = [
+            chunk("old-intro", "Intro", "Intro text"),
+            chunk("old-usage", "Usage", "Usage text", access_count=3),
+            chunk("old-legacy", "Legacy", "Legacy text"),
+        ]
+        existing[0].cognitive_embedding = np.full(384, 0.5)
+        new_chunks = [
+            chunk("new-intro", "Introduction", "Intro text", modified="2024-02-01"),
+            chunk("new-usage", "Usage", "Usage text, edited", modified="2024-02-01"),
+            chunk("new-faq", "FAQ", "FAQ text", modified="2024-02-01"),
+        ]
+        loader = self._make_loader(new_chunks)
+        loader.extract_connections.return_value = [
+            ("old-intro", "old-usage", 0.5, "sequential"),
+            ("old-usage", "new-faq", 0.5, "sequential"),
+            ("old-intro", "new-faq", 0.3, "associative"),
+        ]
+        mock_memory_storage.get_source_manifest.return_value = None
+        mock_memory_storage.get_memories_by_source_path.return_value = existing
+        mock_memory_storage.delete_memories_by_ids.return_value = 1
+        mock_memory_storage.store_memories_batch.side_effect = lambda memories: [
+            memory.id for memory in memories
+        ]
+        mock_vector_storage.store_vectors_batch.side_effect = lambda items: [
+            item[0] for item in items
+        ]
+        mock_memory_storage.update_memories_metadata.side_effect = lambda memories: [
+            memory.id for memory in memories
+        ]
+        mock_vector_storage.update_metadata_batch.side_effect = lambda items: [
+            item[0] for item in items
+        ]
+        mock_vector_storage.delete_vectors_by_level.side_effect = lambda ids: [
+            memory_id for level_ids in ids.values() for memory_id in level_ids
+        ]
+        mock_embedding_provider.encode_batch.side_effect = lambda texts: np.ones(
+            (len(texts), 384)
+        )
+
+        result = cognitive_system.atomic_reload_memories_from_source(
+            loader, str(source)
+        )
+
+        assert result["success"] and result["incremental"]
+        assert (
+            result["memories_unchanged"],
+            result["memories_updated"],
+            result["memories_added"],
+            result["deleted_count"],
+        ) == (1, 1, 1, 1)
+        mock_memory_storage.delete_memories_by_source_path.assert_not_called()
+        mock_memory_storage.delete_memories_by_ids.assert_called_once_with(
+            ["old-legacy"]
+        )
+        (stored,) = mock_memory_storage.store_memories_batch.call_args.args
+        assert [memory.id for memory in stored] == ["old-usage", "new-faq"]
+        assert stored[0].access_count == 3
+        assert [
+            call.args[0] for call in mock_embedding_provider.encode_batch.mock_calls
+        ] == [["Usage text, edited", "FAQ text"]]
+        assert result["connections_created"] == 3
+
+        # Unchanged chunks get their new metadata without re-embedding
+        (refreshed,) = mock_memory_storage.update_memories_metadata.call_args.args
+        assert [memory.id for memory in refreshed] == ["old-intro"]
+        assert refreshed[0].metadata["file_modified_date"] == "2024-02-01"
+        assert refreshed[0].metadata["hierarchical_path"] == ["Doc", "Introduction"]
+        (payloads,) = mock_vector_storage.update_metadata_batch.call_args.args
+        assert payloads[0][0] == "old-intro"
+        assert payloads[0][1]["file_modified_date"] == "2024-02-01"
+        assert payloads[0][1]["hierarchical_path"] == ["Doc", "Introduction"]
+        assert mock_memory_storage.record_source_manifest.call_args.args[4] == [
+            "old-intro",
+            "old-usage",
+            "new-faq",
+        ]
+
+        mock_memory_storage.delete_memories_by_source_path.return_value = 3
+        result = cognitive_system.atomic_reload_memories_from_source(
+            loader, str(source), force=True
+        )
+        assert "incremental" not in result
+        mock_memory_storage.delete_memories_by_source_path.assert_called_once()
+
+    def test_reload_sources_embeds_across_files(
+        self,
+        tmp_path,
+        cognitive_system,
+        mock_embedding_provider,
+        mock_memory_storage,
+        mock_vector_storage,
+        mock_connection_graph,
+    ):
+        """Parsed files share embedding batches and are written one by one."""
+        from cognitive_memory.loaders.parallel import ParsedSource
+
+        sources = [tmp_path / name for name in ("a.md", "b.md", "broken.md")]
+        for source in sources:
+            source.write_text(f"# {source.stem}")
+        parsed = [
+            ParsedSource(
+                source_path=str(sources[0]),
+                memories=self._make_memories(2),
+                connections=[("loaded-0", "loaded-1", 0.8, "sequential")],
+                parse_time=0.5,
+            ),
+            ParsedSource(
+                source_path=str(sources[1]),
+                memories=self._make_memories(1),
+                parse_time=0.25,
+            ),
+            ParsedSource(source_path=str(sources[2]), error="bad markdown"),
+        ]
+        cognitive_system.config.embedding.load_batch_size = 8
+        mock_embedding_provider.encode_batch.side_effect = lambda texts: np.ones(
+            (len(texts), 384)
+        )
+        mock_memory_storage.get_source_manifest.return_value = None
+        mock_memory_storage.get_memories_by_source_path.return_value = []
+        mock_memory_storage.store_memories_batch.side_effect = lambda memories: [
+            memory.id for memory in memories
+        ]
+        mock_vector_storage.store_vectors_batch.side_effect = lambda items: [
+            item[0] for item in items
+        ]
+        mock_connection_graph.add_connection.return_value = True
+        loader = Mock()
+        loader.validate_source.return_value = True
+
+        with patch(
+            "cognitive_memory.loaders.parallel.parse_sources",
+            return_value=iter(parsed),
+        ) as parse_sources:
+            reload = cognitive_system.reload_sources(
+                loader, [str(source) for source in sources], workers=3
+            )
+
+        assert parse_sources.call_args.args[2] == 3
+        assert [
+            len(call.args[0])
+            for call in mock_embedding_provider.encode_batch.mock_calls
+        ] == [3]
+        assert mock_memory_storage.store_memories_batch.call_count == 2
+        assert [
+            call.args[0]
+            for call in mock_memory_storage.get_memories_by_source_path.mock_calls
+        ] == [str(sources[0]), str(sources[1])]
+        mock_connection_graph.add_connection.assert_called_once_with(
+            "loaded-0", "loaded-1", 0.8, "sequential"
+        )
+        results = reload["results"]
+        assert [result["success"] for result in results] == [True, True, False]
+        assert [result["memories_loaded"] for result in results] == [2, 1, 0]
+        assert "bad markdown" in results[2]["error"]
+        assert reload["stage_timings"]["parse"] == 0.75
+        assert set(reload["stage_timings"]) == {"parse", "embed", "write"}
+
+    def test_reload_sources_parses_in_process_with_one_worker(
+        self,
+        tmp_path,
+        cognitive_system,
+        mock_embedding_provider,
+        mock_memory_storage,
+        mock_vector_storage,
+    ):
+        """A single worker parses in this process and still times each stage."""
+        source = tmp_path / "a.md"
+        source.write_text("# a")
+        mock_embedding_provider.encode_batch.side_effect = lambda texts: np.ones(
+            (len(texts), 384)
+        )
+        mock_memory_storage.get_source_manifest.return_value = None
+        mock_memory_storage.get_memories_by_source_path.return_value = []
+        mock_memory_storage.store_memories_batch.side_effect = lambda memories: [
+            memory.id for memory in memories
+        ]
+        mock_vector_storage.store_vectors_batch.side_effect = lambda items: [
+            item[0] for item in items
+        ]
+        loader = Mock()
+        loader.validate_source.return_value = True
+        loader.load_from_source.return_value = self._make_memories(2)
+        loader.extract_connections.return_value = []
+
+        with patch("cognitive_memory.loaders.parallel.ProcessPoolExecutor") as executor:
+            reload = cognitive_system.reload_sources(loader, [str(source)])
+
+        executor.assert_not_called()
+        loader.load_from_source.assert_called_once_with(str(source))
+        assert reload["results"][0]["memories_loaded"] == 2
+        assert set(reload["stage_timings"]) == {"parse", "embed", "write"}
+
+    def test_reload_sources_records_fingerprint_taken_before_parsing(
+        self,
+        tmp_path,
+        cognitive_system,
+        mock_embedding_provider,
+        mock_memory_storage,
+        mock_vector_storage,
+    ):
+        """A file edited while it is parsed is reloaded again next time."""
+        import hashlib
+
+        from cognitive_memory.loaders.parallel import ParsedSource
+
+        source = tmp_path / "a.md"
+        source.write_text("# before")
+        original_hash = hashlib.sha256(b"# before").hexdigest()
+
+        def parse_and_edit(loader, source_paths, workers, **kwargs):
+            for source_path in source_paths:
+                parsed = ParsedSource(
+                    source_path=source_path, memories=self._make_memories(1)
+                )
+                source.write_text("# after, edited while parsing")
+                yield parsed
+
+        manifests = {}
+
+        def record_source_manifest(source_path, size, mtime, content_hash, memory_ids):
+            manifests[source_path] = {
+                "size": size,
+                "mtime": mtime,
+                "content_hash": content_hash,
+                "memory_ids": memory_ids,
+                "memories_present": len(memory_ids),
+            }
+
+        mock_embedding_provider.encode_batch.side_effect = lambda texts: np.ones(
+            (len(texts), 384)
+        )
+        mock_memory_storage.get_source_manifest.side_effect = manifests.get
+        mock_memory_storage.record_source_manifest.side_effect = record_source_manifest
+        mock_memory_storage.get_memories_by_source_path.return_value = []
+        mock_memory_storage.store_memories_batch.side_effect = lambda memories: [
+            memory.id for memory in memories
+        ]
+        mock_vector_storage.store_vectors_batch.side_effect = lambda items: [
+            item[0] for item in items
+        ]
+        loader = Mock()
+        loader.validate_source.return_value = True
+
+        with patch(
+            "cognitive_memory.loaders.parallel.parse_sources",
+            side_effect=parse_and_edit,
+        ):
+            cognitive_system.reload_sources(loader, [str(source)])
+
+        assert manifests[str(source)]["content_hash"] == original_hash
+
+        with patch(
+            "cognitive_memory.loaders.parallel.parse_sources",
+            return_value=iter(
+                [ParsedSource(source_path=str(source), error="stop here")]
+            ),
+        ) as parse_sources:
+            reload = cognitive_system.reload_sources(loader, [str(source)])
+
+        assert parse_sources.call_args.args[1] == [str(source)]
+        assert not reload["results"][0].get("skipped")
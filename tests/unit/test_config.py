@@ -14,6 +14,7 @@ import yaml
 from cognitive_memory.core.config import (
     SystemConfig,
     detect_project_config,
+    get_monitoring_config,
     get_project_id,
 )
 
@@ -437,3 +438,48 @@ class TestSystemConfigWithProject:
 
             finally:
                 os.chdir(old_cwd)
+
+
+class TestMonitoringConfig:
+    """Test monitoring configuration overrides."""
+
+    @patch.dict(
+        os.environ,
+        {
+            "MONITORING_DEBOUNCE_SECONDS": "not-a-number",
+            "MONITORING_WORKER_MAX_REQUESTS": "50",
+        },
+    )
+    def test_invalid_value_only_resets_its_own_setting(self) -> None:
+        """Test one invalid variable does not discard the others."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = get_monitoring_config(Path(temp_dir))
+            assert config["debounce_seconds"] == 1.0
+            assert config["worker_max_requests"] == 50
+            assert "batch_size" not in config
+
+    def test_batch_settings_from_config_yaml(self) -> None:
+        """Test batch and worker settings can be set in config.yaml."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            heimdall_dir = Path(temp_dir) / ".heimdall"
+            heimdall_dir.mkdir()
+            (heimdall_dir / "config.yaml").write_text(
+                yaml.dump(
+                    {
+                        "monitoring": {
+                            "batch_size": 25,
+                            "debounce_seconds": 0.5,
+                            "worker_max_requests": 100,
+                            "worker_idle_timeout": 60,
+                        }
+                    }
+                )
+            )
+
+            with patch.dict(os.environ, {"MONITORING_WORKER_MAX_REQUESTS": "50"}):
+                config = get_monitoring_config(Path(temp_dir))
+
+            assert config["batch_size"] == 25
+            assert config["debounce_seconds"] == 0.5
+            assert config["worker_max_requests"] == 50
+            assert config["worker_idle_timeout"] == 60.0
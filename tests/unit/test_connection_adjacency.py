@@ -0,0 +1,49 @@
+"""
+Unit tests for ConnectionAdjacency.
+
+Tests the CSR adjacency used to traverse the connection graph in memory.
+"""
+
+import pytest
+
+from cognitive_memory.core.adjacency import ConnectionAdjacency
+
+
+class TestConnectionAdjacency:
+    """Test ConnectionAdjacency construction and lookups."""
+
+    def test_empty(self) -> None:
+        """Test an adjacency without connections."""
+        adjacency = ConnectionAdjacency()
+
+        assert adjacency.edge_count == 0
+        assert adjacency.neighbors("missing") == []
+
+    def test_neighbors_are_undirected_and_sorted(self) -> None:
+        """Test that neighbours are found from both ends, strongest first."""
+        adjacency = ConnectionAdjacency(
+            [("a", "b", 0.3), ("c", "a", 0.9), ("a", "d", 0.6), ("b", "d", 0.5)]
+        )
+
+        assert adjacency.edge_count == 4
+        assert [n for n, _ in adjacency.neighbors("a")] == ["c", "d", "b"]
+        assert [n for n, _ in adjacency.neighbors("d")] == ["a", "b"]
+        assert adjacency.neighbors("c") == [("a", pytest.approx(0.9))]
+
+    def test_min_strength_filters_prefix(self) -> None:
+        """Test that weak connections are excluded by the threshold."""
+        adjacency = ConnectionAdjacency(
+            [("a", "b", 0.3), ("a", "c", 0.9), ("a", "d", 0.6)]
+        )
+
+        assert [n for n, _ in adjacency.neighbors("a", 0.5)] == ["c", "d"]
+        assert adjacency.neighbors("a", 0.95) == []
+
+    def test_duplicate_pairs_keep_strongest(self) -> None:
+        """Test that repeated pairs and self loops collapse to one entry."""
+        adjacency = ConnectionAdjacency(
+            [("a", "b", 0.4), ("b", "a", 0.7), ("a", "b", 0.2), ("a", "a", 1.0)]
+        )
+
+        assert adjacency.edge_count == 1
+        assert adjacency.neighbors("a") == [("b", pytest.approx(0.7))]
@@ -0,0 +1,122 @@
+"""
+Unit tests for associative connection extraction between markdown memories.
+"""
+
+from collections.abc import Iterable, Iterator
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+import pytest
+
+from cognitive_memory.core.config import CognitiveConfig
+from cognitive_memory.core.memory import CognitiveMemory
+from cognitive_memory.loaders.markdown.connection_extractor import (
+    ConnectionExtractor,
+)
+
+TOPICS = ["database", "security", "testing", "deploy"]
+
+
+class FakeDoc(list):
+    """Doc stand-in with a topic-based vector and one token per word."""
+
+    def __init__(self, text: str) -> None:
+        super().__init__(
+            SimpleNamespace(lemma_=word, is_alpha=word.isalpha())
+            for word in text.split()
+        )
+        self.vector = np.array(
+            [text.split().count(topic) for topic in TOPICS], dtype=np.float32
+        )
+        self.vector_norm = float(np.linalg.norm(self.vector))
+
+
+class FakeNLP:
+    """Fake spaCy pipeline that counts every parsed text."""
+
+    pipe_names = ["tok2vec", "tagger", "parser", "ner"]
+
+    def __init__(self) -> None:
+        self.parsed = 0
+
+    def __call__(self, text: str, **kwargs: Any) -> FakeDoc:
+        self.parsed += 1
+        return FakeDoc(text)
+
+    def pipe(self, texts: Iterable[str], **kwargs: Any) -> Iterator[FakeDoc]:
+        for text in texts:
+            self.parsed += 1
+            yield FakeDoc(text)
+
+
+@pytest.fixture
+def nlp() -> FakeNLP:
+    """Fake spaCy pipeline."""
+    return FakeNLP()
+
+
+def make_memories() -> list[CognitiveMemory]:
+    contents = [
+        "database database schema",
+        "database security access",
+        "security security audit",
+        "testing deploy pipeline",
+        "deploy deploy release",
+        "testing testing coverage",
+    ]
+    return [
+        CognitiveMemory(
+            id=f"m{i}",
+            content=content,
+            hierarchy_level=2,
+            metadata={"title": f"Section {i}", "header_level": 2},
+        )
+        for i, content in enumerate(contents)
+    ]
+
+
+def test_each_memory_is_parsed_once(nlp: FakeNLP) -> None:
+    """The pipeline runs once per memory, not once per compared pair."""
+    extractor = ConnectionExtractor(CognitiveConfig(strength_floor=0.0), nlp)
+
+    extractor.extract_connections(make_memories())
+
+    assert nlp.parsed == 6
+
+
+def test_scores_match_pairwise_relevance(nlp: FakeNLP) -> None:
+    """Vectorized associative scores equal the pairwise relevance score."""
+    extractor = ConnectionExtractor(CognitiveConfig(strength_floor=0.0), nlp)
+    memories = make_memories()
+    by_id = {memory.id: memory for memory in memories}
+
+    connections = extractor._extract_associative_connections(
+        memories, extractor._parse_memories(memories)
+    )
+
+    assert len(connections) == 15
+    for source_id, target_id, strength, _ in connections:
+        expected = extractor.config.associative_weight * (
+            extractor.calculate_relevance_score(by_id[source_id], by_id[target_id])
+        )
+        assert strength == pytest.approx(expected, abs=1e-6)
+
+
+def test_candidates_are_pruned_to_most_similar(nlp: FakeNLP) -> None:
+    """Only each memory's top semantic neighbours are scored."""
+    config = CognitiveConfig(strength_floor=0.0, associative_candidates_per_memory=1)
+    extractor = ConnectionExtractor(config, nlp)
+    memories = make_memories()
+
+    connections = extractor._extract_associative_connections(
+        memories, extractor._parse_memories(memories)
+    )
+
+    pairs = {
+        frozenset((source_id, target_id)) for source_id, target_id, _, _ in connections
+    }
+    assert frozenset(("m0", "m1")) in pairs
+    assert frozenset(("m3", "m4")) in pairs
+    assert frozenset(("m0", "m4")) not in pairs
+    assert len(pairs) < 15
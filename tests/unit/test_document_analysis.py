@@ -0,0 +1,83 @@
+"""
+Unit tests for the shared spaCy document analysis of markdown chunks.
+"""
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+import spacy
+
+from cognitive_memory.core.config import CognitiveConfig
+from cognitive_memory.loaders.markdown import (
+    ContentAnalyzer,
+    DocumentAnalysis,
+    MemoryFactory,
+)
+
+TEXTS = [
+    "Install the package and run the tests.",
+    "The storage layer keeps vectors in Qdrant.",
+]
+
+
+@pytest.fixture
+def nlp() -> spacy.Language:
+    """Blank English pipeline, which tokenizes without any model."""
+    return spacy.blank("en")
+
+
+@pytest.fixture
+def analysis(nlp: spacy.Language) -> DocumentAnalysis:
+    """Document analysis with batched parsing."""
+    return DocumentAnalysis(CognitiveConfig(spacy_batch_size=8), nlp)
+
+
+def test_analyzed_docs_are_shared(
+    nlp: spacy.Language, analysis: DocumentAnalysis
+) -> None:
+    """Texts parsed in one batch are not parsed again by their consumers."""
+    with patch.object(nlp, "pipe", wraps=nlp.pipe) as pipe:
+        analysis.analyze(TEXTS + TEXTS[:1])
+        analysis.analyze(TEXTS)
+    pipe.assert_called_once()
+    assert pipe.call_args.kwargs["batch_size"] == 8
+
+    analyzer = ContentAnalyzer(analysis.config, nlp, analysis)
+    with patch.object(type(nlp), "__call__") as parse:
+        doc = analysis.doc(TEXTS[0])
+        analyzer.extract_linguistic_features(TEXTS[0])
+        assert analyzer.count_tokens(TEXTS[1]) == 8
+    parse.assert_not_called()
+    assert analysis.tokens(TEXTS[0]) is doc
+
+
+def test_token_counting_only_tokenizes(
+    nlp: spacy.Language, analysis: DocumentAnalysis
+) -> None:
+    """Counting and truncating unanalyzed text never runs the pipeline."""
+    analyzer = ContentAnalyzer(analysis.config, nlp, analysis)
+    factory = MemoryFactory(analysis.config, analyzer, nlp)
+    text = "One two three. Four five six. Seven eight nine ten."
+
+    def fail(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("pipeline should not run")
+
+    with (
+        patch.object(type(nlp), "__call__", fail),
+        patch.object(nlp, "pipe", fail),
+    ):
+        assert analyzer.count_tokens(text) == 13
+        assert factory.truncate_content(text, 9) == (
+            "One two three. Four five six. Seven..."
+        )
+
+
+def test_unused_components_are_disabled(nlp: spacy.Language) -> None:
+    """The dependency parser and entity recognizer are skipped."""
+    nlp.add_pipe("sentencizer")
+    nlp.add_pipe("ner")
+
+    analysis = DocumentAnalysis(CognitiveConfig(), nlp)
+
+    assert analysis.disabled == ["ner"]
@@ -0,0 +1,196 @@
+"""
+Unit tests for the persistent embedding cache and caching provider wrapper.
+"""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from cognitive_memory.core.lazy import LazyEmbeddingProvider
+from cognitive_memory.encoding.embedding_cache import (
+    CachedEmbeddingProvider,
+    EmbeddingCache,
+)
+from cognitive_memory.main import graceful_shutdown
+from tests.factory_utils import MockEmbeddingProvider
+
+
+class CountingProvider(MockEmbeddingProvider):
+    """Mock provider that records batch calls and exposes model info."""
+
+    def __init__(self) -> None:
+        super().__init__(vector_size=8)
+        self.batch_calls: list[list[str]] = []
+
+    def encode_batch(self, texts: list[str]) -> np.ndarray:
+        self.batch_calls.append(list(texts))
+        return super().encode_batch(texts)
+
+    def get_model_info(self) -> dict[str, str]:
+        return {"model_name": "counting-model"}
+
+    def get_embedding_dimension(self) -> int:
+        return self.vector_size
+
+
+@pytest.fixture
+def cache(temp_dir: Path) -> EmbeddingCache:
+    """Create an embedding cache in a temporary directory."""
+    return EmbeddingCache(temp_dir / "embedding_cache.db", max_entries=100)
+
+
+@pytest.fixture
+def provider() -> CountingProvider:
+    """Create a counting mock provider."""
+    return CountingProvider()
+
+
+class TestEmbeddingCache:
+    """Test EmbeddingCache storage behaviour."""
+
+    def test_round_trip_float32(self, cache: EmbeddingCache) -> None:
+        """Vectors come back as float32 with identical values."""
+        vector = np.arange(8, dtype=np.float64) / 7
+        cache.put_many({"k": vector})
+
+        found = cache.get_many(["k", "missing"])
+
+        assert set(found) == {"k"}
+        assert found["k"].dtype == np.float32
+        np.testing.assert_allclose(found["k"], vector, rtol=1e-6)
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_key_normalizes_whitespace(self) -> None:
+        """Whitespace-only differences map to the same key."""
+        key1 = EmbeddingCache.make_key("model", "hello   world\n")
+        key2 = EmbeddingCache.make_key("model", "  hello world")
+
+        assert key1 == key2
+        assert key1 != EmbeddingCache.make_key("other-model", "hello world")
+
+    def test_lru_eviction(self, temp_dir: Path) -> None:
+        """Least recently used entries are evicted beyond max_entries."""
+        cache = EmbeddingCache(temp_dir / "small.db", max_entries=2)
+        cache.put_many({"a": np.ones(4)})
+        cache.put_many({"b": np.ones(4)})
+        cache.get_many(["a"])  # refresh "a" so "b" is least recently used
+        cache.put_many({"c": np.ones(4)})
+
+        assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+        assert cache.evictions == 1
+
+    def test_lookups_do_not_write(self, temp_dir: Path) -> None:
+        """Access times are buffered and written on the next store or close."""
+        path = temp_dir / "access.db"
+        cache = EmbeddingCache(path)
+        cache.put_many({"k": np.ones(4)})
+        cache._conn.execute("UPDATE embedding_cache SET last_accessed = 0")
+        cache._conn.commit()
+
+        def last_accessed() -> float:
+            return float(
+                cache._conn.execute(
+                    "SELECT last_accessed FROM embedding_cache"
+                ).fetchone()[0]
+            )
+
+        cache.get_many(["k"])
+        assert not cache._conn.in_transaction
+        assert last_accessed() == 0
+
+        cache.put_many({"other": np.ones(4)})
+        assert last_accessed() > 0
+
+        cache._conn.execute("UPDATE embedding_cache SET last_accessed = 0")
+        cache._conn.commit()
+        cache.get_many(["k"])
+        cache.close()
+        reopened = EmbeddingCache(path)
+        assert (
+            reopened._conn.execute(
+                "SELECT last_accessed FROM embedding_cache WHERE key = 'k'"
+            ).fetchone()[0]
+            > 0
+        )
+
+    def test_persists_across_instances(self, temp_dir: Path) -> None:
+        """Entries survive reopening the cache file."""
+        path = temp_dir / "persist.db"
+        EmbeddingCache(path).put_many({"k": np.ones(4)})
+
+        assert "k" in EmbeddingCache(path).get_many(["k"])
+
+
+class TestCachedEmbeddingProvider:
+    """Test CachedEmbeddingProvider wrapper behaviour."""
+
+    def test_encode_uses_cache(
+        self, cache: EmbeddingCache, provider: CountingProvider
+    ) -> None:
+        """Second encode of the same text does not call the model."""
+        cached = CachedEmbeddingProvider(provider, cache)
+
+        first = cached.encode("repeated content")
+        second = cached.encode("repeated   content")
+
+        assert provider.call_count == 1
+        np.testing.assert_allclose(first, second, rtol=1e-6)
+
+    def test_encode_batch_only_encodes_misses(
+        self, cache: EmbeddingCache, provider: CountingProvider
+    ) -> None:
+        """Batch encoding sends only uncached, deduplicated texts to the model."""
+        cached = CachedEmbeddingProvider(provider, cache)
+        cached.encode("alpha")
+
+        result = cached.encode_batch(["alpha", "beta", "", "beta"])
+
+        assert provider.batch_calls == [["beta"]]
+        assert result.shape == (4, 8)
+        assert np.all(result[2] == 0.0)
+        np.testing.assert_allclose(result[1], result[3])
+
+    def test_model_info_includes_cache_stats(
+        self, cache: EmbeddingCache, provider: CountingProvider
+    ) -> None:
+        """Model info is delegated and extended with cache statistics."""
+        cached = CachedEmbeddingProvider(provider, cache)
+        cached.encode("text")
+
+        info = cached.get_model_info()
+
+        assert info["model_name"] == "counting-model"
+        assert info["embedding_cache"]["misses"] == 1
+        assert cached.get_embedding_dimension() == 8
+
+    def test_shutdown_records_hits(
+        self, temp_dir: Path, provider: CountingProvider
+    ) -> None:
+        """Hits are written when the system shuts down, without loading the model."""
+        path = temp_dir / "shutdown.db"
+        seed = EmbeddingCache(path)
+        seed.put_many({EmbeddingCache.make_key("model", "text"): np.ones(8)})
+        seed._conn.execute("UPDATE embedding_cache SET last_accessed = 0")
+        seed.close()
+
+        factory = Mock(return_value=provider)
+        lazy = LazyEmbeddingProvider(factory, model_name="model", embedding_dimension=8)
+        system = Mock()
+        system.embedding_provider = CachedEmbeddingProvider(
+            lazy, EmbeddingCache(path), model_name="model"
+        )
+        system.embedding_provider.encode("text")
+
+        assert graceful_shutdown(system)
+
+        factory.assert_not_called()
+        reopened = EmbeddingCache(path)
+        assert (
+            reopened._conn.execute(
+                "SELECT last_accessed FROM embedding_cache"
+            ).fetchone()[0]
+            > 0
+        )
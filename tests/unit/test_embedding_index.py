@@ -0,0 +1,65 @@
+"""
+Unit tests for the resident EmbeddingIndex used by activation.
+"""
+
+import numpy as np
+
+from cognitive_memory.core.memory import CognitiveMemory
+from cognitive_memory.retrieval.embedding_index import EmbeddingIndex
+
+
+def make_memory(memory_id: str, embedding: list[float] | None) -> CognitiveMemory:
+    """Create a memory with the given embedding."""
+    memory = CognitiveMemory(id=memory_id, content=f"Memory {memory_id}")
+    memory.cognitive_embedding = None if embedding is None else np.array(embedding)
+    return memory
+
+
+class TestEmbeddingIndex:
+    """Test EmbeddingIndex search and incremental updates."""
+
+    def test_search_matches_cosine_ranking(self) -> None:
+        """Search returns memories above threshold sorted by cosine similarity."""
+        index = EmbeddingIndex(
+            [
+                make_memory("a", [1.0, 0.0]),
+                make_memory("b", [1.0, 1.0]),
+                make_memory("c", [-1.0, 0.0]),
+                make_memory("none", None),
+            ]
+        )
+
+        results = index.search(np.array([2.0, 0.0]), threshold=0.5)
+
+        assert len(index) == 3
+        assert [memory.id for memory, _ in results] == ["a", "b"]
+        np.testing.assert_allclose(
+            [score for _, score in results], [1.0, np.sqrt(0.5)], rtol=1e-6
+        )
+
+    def test_max_results_keeps_top_matches(self) -> None:
+        """max_results returns only the highest-scoring matches."""
+        memories = [
+            make_memory(str(i), [1.0, i / 10]) for i in range(10)
+        ]  # similarity decreases with i
+        index = EmbeddingIndex(memories)
+
+        results = index.search(np.array([1.0, 0.0]), max_results=3)
+
+        assert [memory.id for memory, _ in results] == ["0", "1", "2"]
+
+    def test_incremental_add_replace_remove(self) -> None:
+        """Rows can be appended, replaced and removed without a rebuild."""
+        index = EmbeddingIndex([make_memory("a", [1.0, 0.0])])
+        for i in range(20):
+            index.add([make_memory(f"n{i}", [0.0, 1.0])])
+        index.add([make_memory("a", [0.0, 1.0])])
+        index.remove(["n0", "missing"])
+
+        results = index.search(np.array([0.0, 1.0]), threshold=0.99)
+
+        assert len(index) == 20
+        assert "n0" not in index
+        assert {memory.id for memory, _ in results} == {"a"} | {
+            f"n{i}" for i in range(1, 20)
+        }
@@ -300,7 +300,7 @@ class TestGitHistoryMinerExtraction:
 
         multi_commit_repo._convert_commit_to_object = mock_convert
 
-        commits = list(multi_commit_repo.extract_commit_history())
+        commits = list(multi_commit_repo.extract_commit_history(bulk=False))
         # Should have 3 commits (1 failed, 3 succeeded)
         assert len(commits) == 3
 
@@ -381,6 +381,79 @@ class TestGitHistoryMinerExtraction:
         result = multi_commit_repo._convert_commit_to_object(mock_commit)
         assert result is None
 
+    def test_bulk_extraction_matches_per_commit_conversion(self, multi_commit_repo):
+        """Single-pass git log extraction yields the same commits."""
+        bulk = list(multi_commit_repo.extract_commit_history())
+        individual = list(multi_commit_repo.extract_commit_history(bulk=False))
+
+        def changes(commit, with_lines=True):
+            return [
+                (change.file_path, change.change_type)
+                + ((change.lines_added, change.lines_deleted) if with_lines else ())
+                for change in commit.file_changes
+            ]
+
+        assert [commit.hash for commit in bulk] == [
+            commit.hash for commit in individual
+        ]
+        for bulk_commit, commit in zip(bulk, individual, strict=True):
+            assert bulk_commit.message == commit.message
+            assert bulk_commit.timestamp == commit.timestamp
+            assert bulk_commit.parent_hashes == commit.parent_hashes
+            # Initial commits now also carry line counts
+            with_lines = bool(commit.parent_hashes)
+            assert changes(bulk_commit, with_lines) == changes(commit, with_lines)
+        assert changes(bulk[-1]) == [("file1.py", "A", 1, 0)]
+
+    def test_bulk_extraction_renames_binaries_and_merges(self, tmp_path):
+        """Renames, binary files and merges are parsed from git log output."""
+        repo = Repo.init(str(tmp_path))
+        with repo.config_writer() as config:
+            config.set_value("user", "name", "Test User")
+            config.set_value("user", "email", "test@example.com")
+        author = Actor("Test User", "test@example.com")
+        (tmp_path / "old name.txt").write_text("one\ntwo\nthree\n")
+        repo.index.add(["old name.txt"])
+        base = repo.index.commit("Add file", author=author, committer=author)
+
+        repo.git.mv("old name.txt", "new name.txt")
+        (tmp_path / "new name.txt").write_text("one\ntwo\nthree\nfour\n")
+        (tmp_path / "image.bin").write_bytes(b"\x00\x01\x02")
+        repo.index.add(["new name.txt", "image.bin"])
+        repo.index.commit("Rename\n\nWith body", author=author, committer=author)
+
+        main = repo.active_branch
+        branch = repo.create_head("side", base.hexsha)
+        repo.head.reference = branch
+        repo.head.reset(index=True, working_tree=True)
+        (tmp_path / "side.txt").write_text("side\n")
+        repo.index.add(["side.txt"])
+        repo.index.commit("Side change", author=author, committer=author)
+        repo.git.checkout(main.name)
+        repo.git.merge("side", "--no-edit", "-m", "Merge side")
+
+        with GitHistoryMiner(str(tmp_path)) as miner:
+            commits = {
+                commit.message: commit for commit in miner.extract_commit_history()
+            }
+
+        assert len(commits) == 4
+        merge = commits["Merge side"]
+        assert len(merge.parent_hashes) == 2
+        assert [(c.file_path, c.change_type) for c in merge.file_changes] == [
+            ("side.txt", "A")
+        ]
+        rename = commits["Rename\n\nWith body"]
+        assert [
+            (c.file_path, c.change_type, c.lines_added, c.lines_deleted)
+            for c in rename.file_changes
+        ] == [("image.bin", "A", 0, 0), ("new name.txt", "R", 1, 0)]
+
+    def test_extract_commit_history_rejects_option_like_branch(self, multi_commit_repo):
+        """Branch names cannot inject git options."""
+        with pytest.raises(ValueError, match="Invalid branch name"):
+            list(multi_commit_repo.extract_commit_history(branch="--output=/tmp/x"))
+
 
 class TestGitHistoryMinerStats:
     """Test repository statistics methods."""
@@ -267,7 +267,9 @@ class TestGitHistoryMinerIncremental:
         )
 
         with pytest.raises(GitCommandError):
-            list(miner.extract_commit_history(since_commit=commit_hashes[0]))
+            list(
+                miner.extract_commit_history(since_commit=commit_hashes[0], bulk=False)
+            )
 
     @pytest.mark.skipif(not GITPYTHON_AVAILABLE, reason="GitPython not available")
     def test_extract_since_commit_incremental_behavior(self, incremental_repo):
@@ -312,7 +314,7 @@ class TestGitHistoryMinerIncremental:
                 # Should be limited by security max of 10000
                 list(
                     miner.extract_commit_history(
-                        since_commit=since_commit, max_commits=15000
+                        since_commit=since_commit, max_commits=15000, bulk=False
                     )
                 )
 
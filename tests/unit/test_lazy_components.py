@@ -0,0 +1,71 @@
+"""
+Unit tests for lazily constructed embedding providers and vector storage.
+"""
+
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+from cognitive_memory.core.interfaces import EmbeddingProvider, VectorStorage
+from cognitive_memory.core.lazy import LazyEmbeddingProvider, LazyVectorStorage
+from cognitive_memory.factory import check_system_reachability
+
+
+def test_embedding_provider_loads_model_on_first_encode() -> None:
+    """Metadata is available before the model is loaded, which happens once."""
+    provider = Mock(spec=EmbeddingProvider)
+    provider.encode.return_value = np.zeros(384)
+    factory = Mock(return_value=provider)
+
+    lazy = LazyEmbeddingProvider(factory, model_name="model", embedding_dimension=384)
+
+    assert lazy.get_embedding_dimension() == 384
+    assert lazy.get_model_info()["loaded"] is False
+    factory.assert_not_called()
+
+    lazy.encode("first")
+    lazy.encode_batch(["second"])
+
+    factory.assert_called_once()
+    assert lazy.loaded
+    provider.encode_batch.assert_called_once_with(["second"])
+
+
+def test_vector_storage_connects_on_first_use() -> None:
+    """Closing an unused storage never connects to it."""
+    storage = Mock(spec=VectorStorage)
+    factory = Mock(return_value=storage)
+
+    lazy = LazyVectorStorage(factory)
+    lazy.close()
+    factory.assert_not_called()
+
+    lazy.delete_vectors_by_ids(["a"])
+    lazy.delete_vectors_by_ids(["b"])
+
+    factory.assert_called_once()
+    assert storage.delete_vectors_by_ids.call_count == 2
+
+
+def test_reachability_check_does_not_build_lazy_components() -> None:
+    """The fast health check probes Qdrant and the model file without loading."""
+    embedding_factory = Mock()
+    storage_factory = Mock()
+    system = Mock()
+    system.memory_storage = Mock(spec=[])
+    system.embedding_provider = LazyEmbeddingProvider(
+        embedding_factory,
+        model_name="model",
+        embedding_dimension=384,
+        model_path="/nonexistent/model.onnx",
+    )
+    system.vector_storage = LazyVectorStorage(storage_factory)
+
+    with patch("cognitive_memory.factory._probe_qdrant") as probe:
+        status = check_system_reachability(system)
+
+    probe.assert_called_once_with(system.config)
+    assert status["checks"]["vector_storage"].startswith("✓")
+    assert status["checks"]["embedding_model"].startswith("✗")
+    embedding_factory.assert_not_called()
+    storage_factory.assert_not_called()
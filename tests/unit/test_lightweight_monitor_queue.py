@@ -0,0 +1,174 @@
+"""
+Unit tests for event coalescing and batching in the lightweight monitor.
+"""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from cognitive_memory.core.memory import CognitiveMemory
+from cognitive_memory.storage.sqlite_persistence import (
+    DatabaseManager,
+    MemoryMetadataStore,
+)
+from lightweight_monitor import (
+    ChangeType,
+    EventQueue,
+    FileChangeEvent,
+    LightweightMonitor,
+    coalesce_change_types,
+)
+
+
+def make_event(name: str, change_type: ChangeType) -> FileChangeEvent:
+    """Create a file change event for a path."""
+    return FileChangeEvent(
+        path=Path(name), change_type=change_type, timestamp=time.time()
+    )
+
+
+class TestCoalescing:
+    """Test net change computation."""
+
+    @pytest.mark.parametrize(
+        ("previous", "current", "expected"),
+        [
+            (ChangeType.ADDED, ChangeType.MODIFIED, ChangeType.ADDED),
+            (ChangeType.MODIFIED, ChangeType.MODIFIED, ChangeType.MODIFIED),
+            (ChangeType.ADDED, ChangeType.DELETED, ChangeType.DELETED),
+            (ChangeType.MODIFIED, ChangeType.DELETED, ChangeType.DELETED),
+            (ChangeType.DELETED, ChangeType.ADDED, ChangeType.MODIFIED),
+        ],
+    )
+    def test_net_change(
+        self, previous: ChangeType, current: ChangeType, expected: ChangeType
+    ) -> None:
+        """Consecutive changes collapse into the change with the same effect."""
+        assert coalesce_change_types(previous, current) == expected
+
+
+class TestEventQueue:
+    """Test debouncing and batch draining."""
+
+    def test_changes_to_one_path_are_merged(self) -> None:
+        """Repeated saves and a delete collapse into a single pending event."""
+        event_queue = EventQueue(debounce_seconds=0.0)
+        event_queue.put(make_event("a.md", ChangeType.ADDED))
+        event_queue.put(make_event("a.md", ChangeType.MODIFIED))
+        event_queue.put(make_event("b.md", ChangeType.MODIFIED))
+        event_queue.put(make_event("a.md", ChangeType.DELETED))
+
+        assert event_queue.qsize() == 2
+        batch = event_queue.get_batch(10, timeout=0.1)
+        assert [(e.path.name, e.change_type) for e in batch] == [
+            ("b.md", ChangeType.MODIFIED),
+            ("a.md", ChangeType.DELETED),
+        ]
+
+    def test_debounce_delays_release(self) -> None:
+        """Events wait for the quiet period unless debouncing is skipped."""
+        event_queue = EventQueue(debounce_seconds=0.3)
+        event_queue.put(make_event("a.md", ChangeType.MODIFIED))
+        event_queue.put(make_event("scan.md", ChangeType.ADDED), deduplicate=False)
+
+        assert [e.path.name for e in event_queue.get_batch(10, timeout=0.05)] == [
+            "scan.md"
+        ]
+        assert event_queue.get_batch(10, timeout=0.05) == []
+        assert event_queue.get(timeout=1.0).path.name == "a.md"
+
+    def test_batches_respect_size_and_capacity(self) -> None:
+        """Batches are capped and new paths are rejected when full."""
+        event_queue = EventQueue(max_size=3, debounce_seconds=0.0)
+        for name in ("a.md", "b.md", "c.md"):
+            assert event_queue.put(make_event(name, ChangeType.ADDED))
+        assert not event_queue.put(make_event("d.md", ChangeType.ADDED))
+        assert event_queue.put(make_event("a.md", ChangeType.MODIFIED))
+
+        assert len(event_queue.get_batch(2, timeout=0.1)) == 2
+        assert len(event_queue.get_batch(2, timeout=0.1)) == 1
+
+
+class TestBatchCommands:
+    """Test grouping of a batch into ingestion calls."""
+
+    def test_one_command_per_action(self, tmp_path: Path) -> None:
+        """Deletions and loads are each sent in a single call."""
+        monitor = LightweightMonitor(
+            project_root=tmp_path,
+            target_path=tmp_path,
+            lock_file=tmp_path / "monitor.lock",
+        )
+        events = [
+            make_event("a.md", ChangeType.ADDED),
+            make_event("b.md", ChangeType.DELETED),
+            make_event("c.md", ChangeType.MODIFIED),
+            make_event("d.md", ChangeType.DELETED),
+        ]
+
+        with patch.object(
+            monitor, "_execute_subprocess_with_retry", side_effect=[True, False]
+        ) as execute:
+            failed = monitor._handle_file_changes(events)
+
+        assert [call.args[0] for call in execute.call_args_list] == [
+            ["heimdall", "remove-file", "b.md", "d.md"],
+            ["heimdall", "load", "a.md", "c.md"],
+        ]
+        assert failed == 2
+
+    def test_unchanged_files_are_skipped(self, tmp_path: Path) -> None:
+        """Files matching the source manifest never reach an ingestion call."""
+        db_path = tmp_path / "memory.db"
+        store = MemoryMetadataStore(DatabaseManager(str(db_path)))
+        for name in ("same.md", "touched.md", "edited.md"):
+            path = tmp_path / name
+            path.write_text(f"# {name}")
+            store.store_memory(CognitiveMemory(id=name, content=name))
+            stat = path.stat()
+            store.record_source_manifest(
+                str(path),
+                stat.st_size,
+                stat.st_mtime,
+                hashlib.sha256(path.read_bytes()).hexdigest(),
+                [name],
+            )
+        os.utime(tmp_path / "touched.md", (1.0, 1.0))
+        (tmp_path / "edited.md").write_text("# edited.md, now longer")
+
+        monitor = LightweightMonitor(
+            project_root=tmp_path,
+            target_path=tmp_path,
+            lock_file=tmp_path / "monitor.lock",
+            database_path=db_path,
+        )
+        events = [
+            make_event(str(tmp_path / name), change_type)
+            for name, change_type in (
+                ("same.md", ChangeType.ADDED),
+                ("touched.md", ChangeType.MODIFIED),
+                ("edited.md", ChangeType.MODIFIED),
+                ("new.md", ChangeType.ADDED),
+                ("same.md", ChangeType.DELETED),
+            )
+        ]
+
+        with patch.object(
+            monitor, "_execute_subprocess_with_retry", return_value=True
+        ) as execute:
+            assert monitor._handle_file_changes(events) == 0
+
+        assert [call.args[0] for call in execute.call_args_list] == [
+            ["heimdall", "remove-file", str(tmp_path / "same.md")],
+            [
+                "heimdall",
+                "load",
+                str(tmp_path / "edited.md"),
+                str(tmp_path / "new.md"),
+            ],
+        ]
+        assert monitor.stats["files_skipped"] == 2
@@ -14,6 +14,7 @@ from cognitive_memory.core.config import CognitiveConfig
 from cognitive_memory.core.interfaces import MemoryLoader
 from cognitive_memory.core.memory import CognitiveMemory
 from cognitive_memory.loaders.markdown_loader import MarkdownMemoryLoader
+from cognitive_memory.loaders.spacy_models import spacy_models
 
 
 class MockMemoryLoader(MemoryLoader):
@@ -406,6 +407,7 @@ def test_function():
     def test_spacy_loading_error_handling(self, mock_spacy_load, config):
         """Test handling of spaCy loading errors."""
         mock_spacy_load.side_effect = OSError("Model not found")
+        spacy_models.release()
 
         with pytest.raises(OSError):
             MarkdownMemoryLoader(config)
@@ -0,0 +1,108 @@
+"""
+Unit tests for ONNXEmbeddingProvider batching behaviour.
+
+Uses the packaged tokenizer with a fake ONNX session so the tests do not
+require the downloaded model file.
+"""
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+from tokenizers import Tokenizer
+
+from cognitive_memory.encoding.onnx_provider import ONNXEmbeddingProvider
+
+TOKENIZER_FILE = (
+    Path(__file__).parents[2]
+    / "cognitive_memory"
+    / "data"
+    / "models"
+    / "tokenizer"
+    / "tokenizer.json"
+)
+
+
+class FakeSession:
+    """Fake ONNX session that mean-pools token IDs over the attention mask."""
+
+    def __init__(self, embedding_dimension: int) -> None:
+        self.embedding_dimension = embedding_dimension
+        self.calls: list[tuple[int, ...]] = []
+
+    def run(self, output_names: list[str], inputs: dict[str, np.ndarray]) -> list[Any]:
+        input_ids = inputs["input_ids"]
+        attention_mask = inputs["attention_mask"]
+        self.calls.append(input_ids.shape)
+
+        pooled = (input_ids * attention_mask).sum(axis=1) / attention_mask.sum(axis=1)
+        embeddings = np.repeat(pooled[:, None], self.embedding_dimension, axis=1)
+        return [embeddings.astype(np.float32)]
+
+
+@pytest.fixture
+def provider() -> ONNXEmbeddingProvider:
+    """Create a provider with the real tokenizer and a fake session."""
+    instance = ONNXEmbeddingProvider.__new__(ONNXEmbeddingProvider)
+    instance.model_name = "fake-model"
+    instance.max_length = 512
+    instance.embedding_dimension = 4
+    instance.batch_size = 2
+    instance.dynamic_padding = True
+    instance.output_names = ["embeddings"]
+    instance.ort_session = FakeSession(instance.embedding_dimension)
+    instance.tokenizer = Tokenizer.from_file(str(TOKENIZER_FILE))
+    instance.tokenizer.no_padding()
+    return instance
+
+
+TEXTS = [
+    "a much longer sentence about cognitive memory systems and retrieval",
+    "short",
+    "a medium length query text",
+    "tiny",
+    "",
+]
+
+
+class TestDynamicPadding:
+    """Test length-bucketed dynamic padding."""
+
+    def test_single_text_is_not_padded(self, provider: ONNXEmbeddingProvider) -> None:
+        """Single inputs run at their own sequence length."""
+        tokens = provider._tokenize_text("short query")
+
+        assert tokens["input_ids"].shape[1] < provider.max_length
+        assert tokens["attention_mask"].all()
+
+    def test_buckets_pad_to_longest_member(
+        self, provider: ONNXEmbeddingProvider
+    ) -> None:
+        """Each inference call is padded only to its bucket's longest input."""
+        provider.encode_batch(TEXTS)
+
+        calls = provider.ort_session.calls
+        assert len(calls) == 2  # 4 valid texts in buckets of 2
+        assert calls[0][1] <= calls[1][1]
+        assert all(shape[1] < provider.max_length for shape in calls)
+
+    def test_bucketed_results_preserve_order(
+        self, provider: ONNXEmbeddingProvider
+    ) -> None:
+        """Bucketed encoding matches full padding in the original order."""
+        bucketed = provider.encode_batch(TEXTS)
+
+        provider.dynamic_padding = False
+        padded = provider.encode_batch(TEXTS)
+
+        assert bucketed.shape == (len(TEXTS), provider.embedding_dimension)
+        np.testing.assert_allclose(bucketed, padded, rtol=1e-6)
+        assert np.all(bucketed[4] == 0.0)
+
+    def test_full_padding_mode(self, provider: ONNXEmbeddingProvider) -> None:
+        """Disabling dynamic padding pads every input to max_length."""
+        provider.dynamic_padding = False
+        provider.encode_batch(TEXTS[:2])
+
+        assert provider.ort_session.calls == [(2, provider.max_length)]
@@ -0,0 +1,151 @@
+"""
+Unit tests for HierarchicalMemoryStorage batch operations.
+
+The Qdrant client is mocked so the tests do not require a running server.
+"""
+
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+from qdrant_client.http import models
+
+from cognitive_memory.storage.qdrant_storage import HierarchicalMemoryStorage
+
+VECTOR_SIZE = 4
+PROJECT_ID = "testproj_abc12345"
+
+
+@pytest.fixture
+def storage() -> HierarchicalMemoryStorage:
+    """Create hierarchical storage backed by a mock Qdrant client."""
+    with patch("cognitive_memory.storage.qdrant_storage.QdrantClient") as client_cls:
+        client_cls.return_value = Mock()
+        return HierarchicalMemoryStorage(
+            vector_size=VECTOR_SIZE, project_id=PROJECT_ID, upsert_batch_size=2
+        )
+
+
+def make_items(levels: list[int]) -> list[tuple[str, np.ndarray, dict]]:
+    """Create (id, vector, metadata) items at the given hierarchy levels."""
+    return [
+        (f"id-{i}", np.ones(VECTOR_SIZE), {"hierarchy_level": level})
+        for i, level in enumerate(levels)
+    ]
+
+
+class TestStoreVectorsBatch:
+    """Test chunked bulk upserts."""
+
+    def test_groups_by_level_and_chunks(
+        self, storage: HierarchicalMemoryStorage
+    ) -> None:
+        """Points are upserted per collection in chunks of upsert_batch_size."""
+        items = make_items([2, 0, 2, 2, 0])
+
+        stored = storage.store_vectors_batch(items)
+
+        assert stored == [item[0] for item in items]
+        calls = storage.client.upsert.call_args_list
+        assert [
+            (call.kwargs["collection_name"], len(call.kwargs["points"]))
+            for call in calls
+        ] == [
+            (f"{PROJECT_ID}_episodes", 2),
+            (f"{PROJECT_ID}_episodes", 1),
+            (f"{PROJECT_ID}_concepts", 2),
+        ]
+        assert all(call.kwargs["wait"] is True for call in calls)
+
+    def test_reports_failed_ids(self, storage: HierarchicalMemoryStorage) -> None:
+        """Invalid vectors and failed chunks are omitted from the stored IDs."""
+        items = make_items([1, 1, 0])
+        items.append(("bad-dim", np.ones(VECTOR_SIZE + 1), {"hierarchy_level": 0}))
+
+        def upsert(collection_name: str, points: list, wait: bool) -> None:
+            if collection_name.endswith("_contexts"):
+                raise RuntimeError("upsert failed")
+
+        storage.client.upsert.side_effect = upsert
+
+        stored = storage.store_vectors_batch(items)
+
+        assert stored == ["id-2"]
+
+    def test_parallel_no_wait(self, storage: HierarchicalMemoryStorage) -> None:
+        """Chunks can be sent concurrently without waiting for indexing."""
+        items = make_items([2] * 6)
+
+        stored = storage.store_vectors_batch(items, wait=False, parallel=3)
+
+        assert sorted(stored) == sorted(item[0] for item in items)
+        assert storage.client.upsert.call_count == 3
+        assert all(
+            call.kwargs["wait"] is False
+            for call in storage.client.upsert.call_args_list
+        )
+
+
+class TestUpdateMetadataBatch:
+    """Test payload overwrites without vectors."""
+
+    def test_overwrites_payloads_per_collection(
+        self, storage: HierarchicalMemoryStorage
+    ) -> None:
+        """Payloads are overwritten in chunks; failed chunks are omitted."""
+        items = [
+            (f"id-{i}", {"hierarchy_level": level, "title": f"T{i}"})
+            for i, level in enumerate([2, 2, 2, 1])
+        ]
+
+        def batch_update_points(
+            collection_name: str, update_operations: list, wait: bool
+        ) -> None:
+            if collection_name.endswith("_contexts"):
+                raise RuntimeError("update failed")
+
+        storage.client.batch_update_points.side_effect = batch_update_points
+
+        updated = storage.update_metadata_batch(items)
+
+        assert updated == ["id-0", "id-1", "id-2"]
+        calls = storage.client.batch_update_points.call_args_list
+        assert [len(call.kwargs["update_operations"]) for call in calls] == [2, 1, 1]
+        operation = calls[0].kwargs["update_operations"][0]
+        assert isinstance(operation, models.OverwritePayloadOperation)
+        assert operation.overwrite_payload.points == ["id-0"]
+        assert operation.overwrite_payload.payload["title"] == "T0"
+        storage.client.upsert.assert_not_called()
+
+
+class TestBatchDeletion:
+    """Test single-request-per-collection deletion."""
+
+    def test_delete_by_level_targets_matching_collections(
+        self, storage: HierarchicalMemoryStorage
+    ) -> None:
+        """Known levels produce one delete request per level collection."""
+        storage.client.delete.return_value = Mock(status=models.UpdateStatus.COMPLETED)
+
+        deleted = storage.delete_vectors_by_level({0: ["a", "b"], 2: ["c"], 1: []})
+
+        assert deleted == ["a", "b", "c"]
+        calls = storage.client.delete.call_args_list
+        assert [
+            (call.kwargs["collection_name"], call.kwargs["points_selector"].points)
+            for call in calls
+        ] == [
+            (f"{PROJECT_ID}_concepts", ["a", "b"]),
+            (f"{PROJECT_ID}_episodes", ["c"]),
+        ]
+
+    def test_delete_by_ids_sends_one_request_per_collection(
+        self, storage: HierarchicalMemoryStorage
+    ) -> None:
+        """Unknown levels cost three requests regardless of the ID count."""
+        storage.client.delete.return_value = Mock(status=models.UpdateStatus.COMPLETED)
+
+        deleted = storage.delete_vectors_by_ids([f"id-{i}" for i in range(50)])
+
+        assert len(deleted) == 50
+        assert storage.client.delete.call_count == 3
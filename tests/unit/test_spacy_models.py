@@ -0,0 +1,55 @@
+"""
+Unit tests for the process-wide spaCy model registry.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cognitive_memory.loaders.spacy_models import SpacyModelRegistry
+
+
+@pytest.fixture
+def spacy_load() -> Mock:
+    """Patched spacy.load returning a distinct pipeline per call."""
+    with patch("spacy.load", side_effect=lambda name: Mock(name=name)) as load:
+        yield load
+
+
+def test_model_is_loaded_once_and_shared(spacy_load: Mock) -> None:
+    """Every caller gets the same pipeline, loaded on first use."""
+    registry = SpacyModelRegistry()
+    assert registry.loaded_models() == []
+
+    registry.preload("en_core_web_sm")
+    nlp = registry.get("en_core_web_sm")
+
+    assert registry.get("en_core_web_sm") is nlp
+    spacy_load.assert_called_once_with("en_core_web_sm")
+
+
+def test_released_model_is_loaded_again(spacy_load: Mock) -> None:
+    """Releasing drops the cached pipeline; the next get reloads it."""
+    registry = SpacyModelRegistry()
+    first = registry.get("en_core_web_md")
+    registry.get("en_core_web_sm")
+
+    assert registry.release("en_core_web_md") == 1
+    assert registry.release("en_core_web_md") == 0
+    assert registry.loaded_models() == ["en_core_web_sm"]
+
+    assert registry.get("en_core_web_md") is not first
+    assert registry.release() == 2
+
+
+def test_failed_load_is_not_cached() -> None:
+    """A missing model raises on every attempt instead of being cached."""
+    registry = SpacyModelRegistry()
+
+    with patch("spacy.load", side_effect=OSError("Model not found")) as load:
+        for _ in range(2):
+            with pytest.raises(OSError):
+                registry.get("missing_model")
+
+    assert load.call_count == 2
+    assert registry.loaded_models() == []
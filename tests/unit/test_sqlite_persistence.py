@@ -5,22 +5,44 @@ Tests the DatabaseManager, MemoryMetadataStore, and ConnectionGraphStore
 components with proper schema migration handling.
 """
 
+import sqlite3
 import tempfile
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from cognitive_memory.core.memory import CognitiveMemory
 from cognitive_memory.storage.sqlite_persistence import (
+    SQLITE_IN_CHUNK_SIZE,
     ConnectionGraphStore,
     DatabaseManager,
     MemoryMetadataStore,
     create_sqlite_persistence,
+    iter_in_chunks,
 )
 
 
+def test_iter_in_chunks_limits_bound_parameters() -> None:
+    """Values are split into chunks with matching placeholders."""
+    values = [str(i) for i in range(SQLITE_IN_CHUNK_SIZE * 2 + 1)]
+
+    chunks = list(iter_in_chunks(values))
+
+    assert [len(chunk) for chunk, _ in chunks] == [
+        SQLITE_IN_CHUNK_SIZE,
+        SQLITE_IN_CHUNK_SIZE,
+        1,
+    ]
+    assert [value for chunk, _ in chunks for value in chunk] == values
+    assert chunks[-1][1] == "?"
+    assert list(iter_in_chunks([])) == []
+
+
 class TestDatabaseManager:
     """Test DatabaseManager functionality."""
 
@@ -50,6 +72,7 @@ class TestDatabaseManager:
                     "memories",
                     "memory_connections",
                     "retrieval_stats",
+                    "source_manifest",
                 }
 
                 assert expected_tables.issubset(tables)
@@ -78,6 +101,9 @@ class TestDatabaseManager:
                     "004_retrieval_stats",
                     "005_add_embedding_column",
                     "006_source_path_index",
+                    "007_binary_embeddings",
+                    "008_source_manifest",
+                    "009_change_counters",
                 ]
 
                 assert expected_migrations == migrations
@@ -85,6 +111,44 @@ class TestDatabaseManager:
         finally:
             Path(db_path).unlink(missing_ok=True)
 
+    def test_json_embeddings_migrated_to_binary(self):
+        """Test that legacy JSON embeddings are converted in place."""
+        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
+            db_path = tmp.name
+
+        try:
+            db_manager = DatabaseManager(db_path)
+            MemoryMetadataStore(db_manager).store_memory(
+                CognitiveMemory(id="legacy", content="Legacy memory")
+            )
+
+            # Simulate a database written before the binary format existed
+            with db_manager.get_connection() as conn:
+                conn.execute(
+                    "UPDATE memories SET cognitive_embedding = ? WHERE id = ?",
+                    ("[0.5, 1.0, -2.0]", "legacy"),
+                )
+                conn.execute(
+                    "DELETE FROM schema_migrations WHERE version = ?",
+                    ("007_binary_embeddings",),
+                )
+                conn.commit()
+
+            db_manager = DatabaseManager(db_path)
+
+            with db_manager.get_connection() as conn:
+                row = conn.execute(
+                    "SELECT typeof(cognitive_embedding) AS kind FROM memories"
+                ).fetchone()
+                assert row["kind"] == "blob"
+
+            memory = MemoryMetadataStore(db_manager).retrieve_memory("legacy")
+            assert memory.cognitive_embedding.dtype == np.float32
+            np.testing.assert_array_equal(memory.cognitive_embedding, [0.5, 1.0, -2.0])
+
+        finally:
+            Path(db_path).unlink(missing_ok=True)
+
     def test_connection_management(self):
         """Test database connection management."""
         with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
@@ -127,6 +191,72 @@ class TestDatabaseManager:
         finally:
             Path(db_path).unlink(missing_ok=True)
 
+    def test_connections_are_pooled(self):
+        """Test that connections are reused with PRAGMAs applied once."""
+        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
+            db_path = tmp.name
+
+        try:
+            db_manager = DatabaseManager(db_path, mmap_size=1 << 20)
+
+            with db_manager.get_connection() as first:
+                pass
+            with db_manager.get_connection() as second:
+                assert second is first
+                assert second.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+            with db_manager.get_read_connection() as reader:
+                assert reader is not first
+                assert reader.execute("PRAGMA mmap_size").fetchone()[0] == 1 << 20
+                with pytest.raises(sqlite3.OperationalError):
+                    reader.execute("DELETE FROM memories")
+
+            readers = []
+
+            def read_in_thread():
+                with db_manager.get_read_connection() as conn:
+                    readers.append(conn)
+
+            thread = threading.Thread(target=read_in_thread)
+            thread.start()
+            thread.join()
+            assert readers[0] is not reader
+
+            # A reader is closed once its thread has exited
+            with pytest.raises(sqlite3.ProgrammingError):
+                readers[0].execute("SELECT 1")
+            assert list(db_manager._reader_connections.values()) == [reader]
+
+            db_manager.close()
+            with db_manager.get_connection() as reopened:
+                assert reopened is not first
+
+        finally:
+            Path(db_path).unlink(missing_ok=True)
+
+    def test_uncommitted_writes_rolled_back(self):
+        """Test that the shared writer does not leak open transactions."""
+        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
+            db_path = tmp.name
+
+        try:
+            db_manager = DatabaseManager(db_path)
+
+            with db_manager.get_connection() as conn:
+                conn.execute(
+                    "INSERT INTO schema_migrations (version) VALUES ('uncommitted')"
+                )
+
+            with db_manager.get_read_connection() as conn:
+                row = conn.execute(
+                    "SELECT COUNT(*) FROM schema_migrations "
+                    "WHERE version = 'uncommitted'"
+                ).fetchone()
+                assert row[0] == 0
+
+        finally:
+            Path(db_path).unlink(missing_ok=True)
+
 
 class TestMemoryMetadataStore:
     """Test MemoryMetadataStore functionality."""
@@ -285,6 +415,171 @@ class TestMemoryMetadataStore:
         assert episodic_memories[0].memory_type == "episodic"
         assert semantic_memories[0].memory_type == "semantic"
 
+    def test_store_memories_batch(self, memory_store):
+        """Test storing multiple memories in one transaction."""
+        memories = [
+            CognitiveMemory(
+                id=f"batch_memory_{i:03d}",
+                content=f"Batch memory {i}",
+                memory_type="semantic",
+                hierarchy_level=i % 3,
+                dimensions={},
+                timestamp=time.time(),
+                strength=0.5,
+                access_count=0,
+            )
+            for i in range(5)
+        ]
+        memories[0].cognitive_embedding = np.ones(4)
+
+        stored_ids = memory_store.store_memories_batch(memories)
+
+        assert stored_ids == [memory.id for memory in memories]
+        for memory in memories:
+            assert memory_store.retrieve_memory(memory.id) is not None
+        retrieved = memory_store.retrieve_memory("batch_memory_000")
+        np.testing.assert_allclose(retrieved.cognitive_embedding, np.ones(4))
+        assert memory_store.store_memories_batch([]) == []
+
+    def test_level_signature_tracks_changes(self, memory_store, sample_memory):
+        """Test that the level signature changes on writes but not reads."""
+        empty = memory_store.get_level_signature(2)
+
+        memory_store.store_memory(sample_memory)
+        stored = memory_store.get_level_signature(2)
+        assert stored != empty
+
+        memory_store.retrieve_memory(sample_memory.id)
+        assert memory_store.get_level_signature(2) == stored
+        assert memory_store.get_level_signature(0) == (0, None, 0.0)
+
+        sample_memory.strength = 0.1
+        time.sleep(0.01)
+        memory_store.update_memory(sample_memory)
+        assert memory_store.get_level_signature(2) != stored
+
+    def test_get_memory_counts(self, memory_store, sample_memory):
+        """Test aggregate counts without loading memories."""
+        sample_memory.metadata = {"source_type": "documentation"}
+        memory_store.store_memory(sample_memory)
+        memory_store.store_memory(
+            CognitiveMemory(id="concept", content="Concept", hierarchy_level=0)
+        )
+
+        counts = memory_store.get_memory_counts()
+
+        assert counts["total"] == 2
+        assert counts["by_level"] == {0: 1, 1: 0, 2: 1}
+        assert counts["by_source_type"] == {"documentation": 1, "unknown": 1}
+        assert counts["by_consolidation_status"] == {"none": 2}
+        assert sum(counts["by_type"].values()) == 2
+        assert counts["content_bytes"] == len(sample_memory.content) + len("Concept")
+
+    def test_source_manifest(self, memory_store, sample_memory):
+        """Test manifest entries track their memories and are cleared on delete."""
+        sample_memory.metadata = {"source_path": "docs/a.md"}
+        memory_store.store_memory(sample_memory)
+        assert memory_store.get_source_manifest("docs/a.md") is None
+
+        assert memory_store.record_source_manifest(
+            "docs/a.md", 42, 1700000000.5, "abc123", [sample_memory.id, "gone"]
+        )
+        manifest = memory_store.get_source_manifest("docs/a.md")
+        assert manifest == {
+            "size": 42,
+            "mtime": 1700000000.5,
+            "content_hash": "abc123",
+            "memory_ids": [sample_memory.id, "gone"],
+            "memories_present": 1,
+        }
+
+        memory_store.record_source_manifest("docs/empty.md", 0, 1.0, "e3b0", [])
+        assert memory_store.get_source_manifest("docs/empty.md")["memory_ids"] == []
+
+        assert memory_store.delete_memories_by_source_path("docs/a.md") == 1
+        assert memory_store.delete_memories_by_source_path("docs/empty.md") == 0
+        assert memory_store.get_source_manifest("docs/a.md") is None
+        assert memory_store.get_source_manifest("docs/empty.md") is None
+
+    def test_update_memories_metadata(self, memory_store, sample_memory):
+        """Test that metadata updates keep content, embedding and access counts."""
+        sample_memory.cognitive_embedding = np.ones(4, dtype=np.float32)
+        sample_memory.access_count = 7
+        memory_store.store_memory(sample_memory)
+
+        sample_memory.metadata = {"file_modified_date": "2024-02-01"}
+        sample_memory.content = "Not written"
+        missing = CognitiveMemory(id="missing", content="Missing")
+
+        assert memory_store.update_memories_metadata([sample_memory, missing]) == [
+            sample_memory.id
+        ]
+        (stored,) = memory_store.get_memories_by_ids([sample_memory.id])
+        assert stored.metadata == {"file_modified_date": "2024-02-01"}
+        assert stored.content != "Not written"
+        assert stored.access_count == 7
+        np.testing.assert_array_equal(stored.cognitive_embedding, np.ones(4))
+
+    def test_record_memory_accesses(self, memory_store, sample_memory):
+        """Test that batched accesses count like retrievals and change nothing else."""
+        sample_memory.access_count = 2
+        memory_store.store_memory(sample_memory)
+        version = memory_store.get_change_version()
+
+        assert memory_store.record_memory_accesses([sample_memory.id, "missing"]) == 1
+
+        (stored,) = memory_store.get_memories_by_ids([sample_memory.id])
+        assert stored.access_count == 3
+        assert memory_store.get_change_version() == version
+
+    def test_change_version_tracks_changes(self, memory_store, sample_memory):
+        """Test that the change version counts writes but not reads."""
+        empty = memory_store.get_change_version()
+
+        memory_store.store_memory(sample_memory)
+        stored = memory_store.get_change_version()
+        assert stored != empty
+
+        memory_store.retrieve_memory(sample_memory.id)
+        assert memory_store.get_change_version() == stored
+
+        connections = ConnectionGraphStore(memory_store.db_manager)
+        connections.add_connection(sample_memory.id, sample_memory.id, 0.5)
+        assert memory_store.get_change_version() != stored
+
+    def test_get_memories_by_ids(self, memory_store, sample_memory):
+        """Test fetching several memories at once without recording access."""
+        memory_store.store_memory(sample_memory)
+
+        memories = memory_store.get_memories_by_ids(
+            ["missing", sample_memory.id, sample_memory.id]
+        )
+
+        assert [m.id for m in memories] == [sample_memory.id, sample_memory.id]
+        assert memories[0].access_count == sample_memory.access_count
+        again = memory_store.get_memories_by_ids([sample_memory.id])
+        assert again[0].access_count == sample_memory.access_count
+        assert memory_store.get_memories_by_ids([]) == []
+
+    def test_embedding_stored_as_float32_blob(self, memory_store, sample_memory):
+        """Test that embeddings are stored as headered float32 BLOBs."""
+        sample_memory.cognitive_embedding = np.linspace(-1.0, 1.0, 384)
+        memory_store.store_memory(sample_memory)
+
+        with memory_store.db_manager.get_connection() as conn:
+            row = conn.execute(
+                "SELECT cognitive_embedding FROM memories WHERE id = ?",
+                (sample_memory.id,),
+            ).fetchone()
+        assert isinstance(row["cognitive_embedding"], bytes)
+        assert len(row["cognitive_embedding"]) == 8 + 384 * 4
+
+        retrieved = memory_store.retrieve_memory(sample_memory.id)
+        assert retrieved.cognitive_embedding.dtype == np.float32
+        np.testing.assert_allclose(
+            retrieved.cognitive_embedding, sample_memory.cognitive_embedding, rtol=1e-6
+        )
+
 
 class TestConnectionGraphStore:
     """Test ConnectionGraphStore functionality."""
@@ -403,6 +698,86 @@ class TestConnectionGraphStore:
         assert connections_from_0[0].id == memory_ids[1]
         assert connections_from_1[0].id == memory_ids[0]
 
+    def test_adjacency_follows_own_writes(self, connection_store):
+        """Test that the cached adjacency mirrors writes without reloading."""
+        store, memory_ids = connection_store
+        store.add_connection(memory_ids[0], memory_ids[1], 0.8, "associative")
+
+        adjacency = store.get_adjacency()
+        assert adjacency.neighbors(memory_ids[0]) == [
+            (memory_ids[1], pytest.approx(0.8))
+        ]
+
+        store.add_connection(memory_ids[1], memory_ids[2], 0.6, "causal")
+        store.update_connection_strength(memory_ids[0], memory_ids[1], 0.4)
+        store.remove_connection(memory_ids[1], memory_ids[2])
+        store.add_connection(memory_ids[0], memory_ids[1], 0.9, "associative")
+
+        with patch.object(store, "_load_edges") as load_edges:
+            adjacency = store.get_adjacency()
+        load_edges.assert_not_called()
+        assert adjacency.neighbors(memory_ids[1]) == [
+            (memory_ids[0], pytest.approx(0.9))
+        ]
+        assert adjacency.neighbors(memory_ids[2]) == []
+
+    def test_adjacency_reloads_on_external_change(self, connection_store):
+        """Test that changes made by another store trigger a reload."""
+        store, memory_ids = connection_store
+        assert store.get_adjacency().edge_count == 0
+
+        other = ConnectionGraphStore(store.db_manager)
+        other.add_connection(memory_ids[0], memory_ids[2], 0.7, "associative")
+
+        adjacency = store.get_adjacency()
+        assert adjacency.neighbors(memory_ids[2]) == [
+            (memory_ids[0], pytest.approx(0.7))
+        ]
+
+    def test_adjacency_version_ignores_activations(self, connection_store):
+        """Test that only structural changes from other writers reload the copy."""
+        store, memory_ids = connection_store
+        store.add_connection(memory_ids[0], memory_ids[1], 0.8, "associative")
+        store.add_connection(memory_ids[1], memory_ids[2], 0.6, "associative")
+        store.get_adjacency()
+
+        store.record_activations([memory_ids[0]])
+        store.flush_activation_counts()
+        with patch.object(store, "_load_edges") as load_edges:
+            store.get_adjacency()
+        load_edges.assert_not_called()
+
+        # Another process, and connections removed by a cascading delete
+        other_manager = DatabaseManager(str(store.db_manager.db_path))
+        MemoryMetadataStore(other_manager).delete_memory(memory_ids[2])
+        other_manager.close()
+
+        adjacency = store.get_adjacency()
+        assert adjacency.edge_count == 1
+        assert adjacency.neighbors(memory_ids[1]) == [
+            (memory_ids[0], pytest.approx(0.8))
+        ]
+
+    def test_activation_counts_are_batched(self, connection_store):
+        """Test that activation counts are written on flush."""
+        store, memory_ids = connection_store
+        store.add_connection(memory_ids[0], memory_ids[1], 0.8, "associative")
+        store.activation_flush_interval = 60.0
+
+        store.get_connections(memory_ids[0])
+        store.record_activations([memory_ids[0], memory_ids[0]], 0.5)
+
+        def activation_count() -> int:
+            with store.db_manager.get_connection() as conn:
+                return conn.execute(
+                    "SELECT activation_count FROM memory_connections"
+                ).fetchone()[0]
+
+        assert activation_count() == 1
+        assert store.flush_activation_counts() == 2
+        assert activation_count() == 4
+        assert store.flush_activation_counts() == 0
+
 
 class TestSQLitePersistenceIntegration:
     """Integration tests for SQLite persistence components."""
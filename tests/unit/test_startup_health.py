@@ -0,0 +1,103 @@
+"""
+Unit tests for the startup health check modes.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cognitive_memory.core.config import SystemConfig
+from cognitive_memory.core.interfaces import MemoryStorage, VectorStorage
+from cognitive_memory.factory import validate_startup_health
+
+
+@pytest.fixture
+def system(tmp_path: Path) -> Mock:
+    """Mock system whose components pass the reachability checks."""
+    with patch("cognitive_memory.core.config.load_dotenv"):
+        config = SystemConfig.from_env()
+    config.database.path = str(tmp_path / "cognitive_memory.db")
+    config.health_check_mode = "cached"
+    config.health_check_ttl_seconds = 3600
+
+    model_path = tmp_path / "model.onnx"
+    model_path.write_bytes(b"onnx")
+
+    mock = Mock()
+    mock.config = config
+    mock.memory_storage = Mock(spec=MemoryStorage)
+    mock.vector_storage = Mock(spec=VectorStorage)
+    mock.embedding_provider.onnx_provider.model_path = model_path
+    mock.embedding_provider.model_path = None
+    mock.store_experience.return_value = "health-check-id"
+    mock.retrieve_memories.return_value = {"core": [], "peripheral": []}
+    return mock
+
+
+def test_cached_mode_reuses_recent_deep_check(system: Mock) -> None:
+    """The deep check runs once per TTL and is redone when it expires."""
+    assert validate_startup_health(system)["healthy"]
+    assert validate_startup_health(system)["healthy"]
+    system.store_experience.assert_called_once()
+
+    marker_path = Path(system.config.database.path).parent / "health_check.json"
+    marker = json.loads(marker_path.read_text())
+    marker["checked_at"] -= 7200
+    marker_path.write_text(json.dumps(marker))
+
+    status = validate_startup_health(system)
+    assert status["healthy"]
+    assert "embedding_model" in status["checks"]
+    assert system.store_experience.call_count == 2
+
+
+def test_cached_mode_reruns_deep_check_for_other_components(system: Mock) -> None:
+    """A recorded deep check only covers the components it ran against."""
+    validate_startup_health(system)
+    system.config.qdrant.url = "http://elsewhere:6333"
+    validate_startup_health(system)
+
+    assert system.store_experience.call_count == 2
+
+
+def test_failed_deep_check_is_not_cached(system: Mock) -> None:
+    """Unhealthy deep checks are repeated on the next startup."""
+    system.store_experience.return_value = ""
+
+    assert not validate_startup_health(system)["healthy"]
+    assert not validate_startup_health(system)["healthy"]
+    assert system.store_experience.call_count == 2
+
+
+def test_fast_mode_only_checks_reachability(system: Mock) -> None:
+    """Fast mode never stores a test memory."""
+    system.config.health_check_mode = "fast"
+
+    status = validate_startup_health(system)
+
+    assert status["healthy"]
+    system.store_experience.assert_not_called()
+
+
+def test_missing_model_fails_before_deep_check(system: Mock) -> None:
+    """Unreachable components fail the check without touching memories."""
+    Path(system.embedding_provider.onnx_provider.model_path).unlink()
+
+    status = validate_startup_health(system)
+
+    assert not status["healthy"]
+    assert status["checks"]["embedding_model"].startswith("✗")
+    system.store_experience.assert_not_called()
+
+
+def test_deep_mode_always_runs_deep_check(system: Mock) -> None:
+    """Deep mode keeps the original store/retrieve/delete check."""
+    system.config.health_check_mode = "deep"
+
+    validate_startup_health(system)
+    validate_startup_health(system)
+
+    assert system.store_experience.call_count == 2
+    system.delete_memory_by_id.assert_called_with("health-check-id")